@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Throughput and compression ratio benchmark of the MS-OVBA compression."""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Change PYTHONPATH to include olecfrc.
+sys.path.insert(0, ".")
+
+from olecfrc import compression  # pylint: disable=wrong-import-position
+
+
+def _CreateSourceCode(random_generator, data_size):
+    """Creates VBA source code-like data.
+
+    Args:
+      random_generator (random.Random): random number generator.
+      data_size (int): size of the data.
+
+    Returns:
+      bytes: source code-like data.
+    """
+    lines = [
+        b'Attribute VB_Name = "Module1"\r\n',
+        b"Dim value As String\r\n",
+        b"End Sub\r\n",
+        b"For index = 1 To 100\r\n",
+        b"Next index\r\n",
+        b"Sub AutoOpen()\r\n",
+        b"    value = value & Chr(Asc(Mid(data, index, 1)) Xor 42)\r\n",
+    ]
+    data = bytearray()
+    while len(data) < data_size:
+        data.extend(random_generator.choice(lines))
+        if random_generator.random() < 0.1:
+            data.extend(random_generator.randbytes(8).hex().encode("ascii"))
+
+    return bytes(data[:data_size])
+
+
+def _MeasureThroughput(callback, data_size, number_of_iterations):
+    """Measures the throughput of a callback.
+
+    Args:
+      callback (function): callback to measure.
+      data_size (int): size of the uncompressed data.
+      number_of_iterations (int): number of iterations.
+
+    Returns:
+      float: throughput in MiB per second.
+    """
+    start_time = time.perf_counter()
+    for _ in range(number_of_iterations):
+        callback()
+    elapsed_time = time.perf_counter() - start_time
+
+    return (data_size * number_of_iterations) / (elapsed_time * 1024 * 1024)
+
+
+def Main():
+    """Entry point of the benchmark.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Measures the throughput and ratio of MS-OVBA compression."
+    )
+
+    argument_parser.add_argument(
+        "-c",
+        "--chain_length",
+        dest="maximum_chain_length",
+        type=int,
+        default=16,
+        help="maximum number of match candidates compared per position.",
+    )
+
+    argument_parser.add_argument(
+        "-i",
+        "--iterations",
+        dest="number_of_iterations",
+        type=int,
+        default=3,
+        help="number of iterations per measurement.",
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--size",
+        dest="data_size",
+        type=int,
+        default=1024 * 1024,
+        help="size of the uncompressed data.",
+    )
+
+    options = argument_parser.parse_args()
+
+    random_generator = random.Random(options.data_size)
+
+    print(f"Data size\t\t: {options.data_size:d}")
+    print(f"Maximum chain length\t: {options.maximum_chain_length:d}")
+    print("Data\t\t\t: ratio, compression MiB/s, decompression MiB/s")
+
+    for description, data in (
+        ("source code", _CreateSourceCode(random_generator, options.data_size)),
+        ("random\t", os.urandom(options.data_size)),
+        ("zero bytes", bytes(options.data_size)),
+    ):
+        compressed_data = compression.Compress(
+            data, maximum_chain_length=options.maximum_chain_length
+        )
+        ratio = len(compressed_data) / len(data)
+
+        compression_throughput = _MeasureThroughput(
+            lambda data=data: compression.Compress(
+                data, maximum_chain_length=options.maximum_chain_length
+            ),
+            len(data),
+            options.number_of_iterations,
+        )
+        decompression_throughput = _MeasureThroughput(
+            lambda compressed_data=compressed_data: compression.Decompress(
+                compressed_data
+            ),
+            len(data),
+            options.number_of_iterations,
+        )
+
+        print(
+            f"{description:s}\t\t: {ratio:.3f}, {compression_throughput:.2f}, "
+            f"{decompression_throughput:.2f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of mapping structures with dtFabric and generated parsers."""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import struct
+import sys
+import time
+
+# Change PYTHONPATH to include olecfrc.
+sys.path.insert(0, ".")
+
+# pylint: disable=wrong-import-position
+from dtfabric.runtime import data_maps as dtfabric_data_maps
+
+from olecfrc import data_format
+from olecfrc import vba_parsers
+
+
+class _MappingDataFormat(data_format.BinaryDataFormat):
+    """Binary data format of the VBA structures that are benchmarked."""
+
+    _DEFINITION_FILE = "vba.yaml"
+
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+
+def _CreateStructureData():
+    """Creates the data of the benchmarked structures.
+
+    Returns:
+      dict[str, bytes]: data per structure name.
+    """
+    f_stream_entry_data = (
+        struct.pack("<IiIhH", 0x80000008, 1, 32, 0, 23)
+        + b"TextBox1"
+        + struct.pack("<ii", 120, 240)
+    )
+
+    return {
+        "control_header": struct.pack("<BBHI", 0, 4, 12, 0x00000048),
+        "dir_stream_record_header": struct.pack("<HI", 0x0019, 7),
+        "f_stream_entry": struct.pack(
+            "<HHI", 0, 4 + len(f_stream_entry_data), 0x000001E5
+        )
+        + f_stream_entry_data,
+        "morph_data_control_header": struct.pack("<BBHQ", 0, 2, 28, 0x0000000000400100),
+        "project_stream_header": struct.pack(
+            "<IHHIIIIIHHH", 0x00B261CC, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0
+        ),
+        "project_stream_string": struct.pack("<H", 24)
+        + "ThisDocument".encode("utf-16-le")
+        + struct.pack("<III", 1, 2, 3),
+    }
+
+
+def _GetMappingFunctions(name):
+    """Retrieves the functions that map a structure.
+
+    Args:
+      name (str): name of the structure, as defined by the definition file.
+
+    Returns:
+      list[tuple[str, function]]: name of the mapping path and function that
+          maps the structure from its data.
+    """
+    # pylint: disable=protected-access
+    dtfabric_format = _MappingDataFormat(use_generated_parsers=False)
+    generated_format = _MappingDataFormat()
+
+    data_type_map = dtfabric_format._GetDataTypeMap(name)
+    structure_parser = vba_parsers.STRUCTURE_PARSERS[name]
+
+    def _ReadStructureFromByteStream(data):
+        context = dtfabric_data_maps.DataTypeMapContext()
+        return dtfabric_format._ReadStructureFromByteStream(
+            data, 0, data_type_map, name, context=context
+        )
+
+    return [
+        ("MapByteStream", data_type_map.MapByteStream),
+        ("_ReadStructureFromByteStream", _ReadStructureFromByteStream),
+        ("generated parser", lambda data: structure_parser(data, 0)),
+        (
+            "_ReadStructure",
+            lambda data: generated_format._ReadStructure(data, 0, name, name),
+        ),
+    ]
+
+
+def _MeasureMapping(mapping_function, data, number_of_calls, number_of_repeats):
+    """Measures the time of mapping a structure.
+
+    The garbage collector is disabled while measuring, as done by timeit.
+
+    Args:
+      mapping_function (function): function that maps the structure.
+      data (bytes): data of the structure.
+      number_of_calls (int): number of calls per repeat.
+      number_of_repeats (int): number of repeats.
+
+    Returns:
+      list[float]: time in nanoseconds per structure of each repeat.
+    """
+    calls = range(number_of_calls)
+
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        times = []
+        for _ in range(number_of_repeats):
+            start_time = time.perf_counter_ns()
+            for _ in calls:
+                mapping_function(data)
+            times.append((time.perf_counter_ns() - start_time) / number_of_calls)
+
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+    return times
+
+
+def Main():
+    """Entry point of the benchmark.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    structure_data = _CreateStructureData()
+
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Measures the time of mapping structures with the dtFabric data type "
+            "maps and the generated structure parsers."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-j",
+        "--json",
+        dest="json",
+        action="store_true",
+        default=False,
+        help="write the results as JSON instead of text.",
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--number_of_calls",
+        dest="number_of_calls",
+        type=int,
+        default=10000,
+        help="number of calls per repeat.",
+    )
+
+    argument_parser.add_argument(
+        "-r",
+        "--repeats",
+        dest="number_of_repeats",
+        type=int,
+        default=7,
+        help="number of repeats of which the statistics are reported.",
+    )
+
+    argument_parser.add_argument(
+        "-w",
+        "--warmup",
+        dest="number_of_warmup_calls",
+        type=int,
+        default=1000,
+        help="number of calls before measuring, which are not reported.",
+    )
+
+    argument_parser.add_argument(
+        "structures",
+        nargs="*",
+        action="store",
+        metavar="STRUCTURE",
+        default=None,
+        help=(
+            f"names of the structures to benchmark, where all are benchmarked if "
+            f"none are specified: {', '.join(sorted(structure_data.keys())):s}."
+        ),
+    )
+
+    options = argument_parser.parse_args()
+
+    names = options.structures or sorted(structure_data.keys())
+    for name in names:
+        if name not in structure_data:
+            print(f"Unsupported structure: {name:s}")
+            print("")
+            return 1
+
+    if options.number_of_calls < 1 or options.number_of_repeats < 1:
+        print("Number of calls and repeats must be 1 or more.")
+        print("")
+        return 1
+
+    results = []
+    for name in names:
+        data = structure_data[name]
+        baseline_median = None
+        for path, mapping_function in _GetMappingFunctions(name):
+            for _ in range(options.number_of_warmup_calls):
+                mapping_function(data)
+
+            times = _MeasureMapping(
+                mapping_function,
+                data,
+                options.number_of_calls,
+                options.number_of_repeats,
+            )
+            median = statistics.median(times)
+            if baseline_median is None:
+                baseline_median = median
+
+            results.append(
+                {
+                    "maximum": max(times),
+                    "mean": statistics.mean(times),
+                    "median": median,
+                    "minimum": min(times),
+                    "path": path,
+                    "speedup": baseline_median / median,
+                    "standard_deviation": (
+                        statistics.stdev(times) if len(times) > 1 else 0.0
+                    ),
+                    "structure": name,
+                }
+            )
+
+    if options.json:
+        print(
+            json.dumps(
+                {
+                    "number_of_calls": options.number_of_calls,
+                    "number_of_repeats": options.number_of_repeats,
+                    "number_of_warmup_calls": options.number_of_warmup_calls,
+                    "python_implementation": platform.python_implementation(),
+                    "python_version": platform.python_version(),
+                    "results": results,
+                    "unit": "ns/structure",
+                },
+                indent=2,
+            )
+        )
+        return 0
+
+    print(f"Calls per repeat\t: {options.number_of_calls:d}")
+    print(f"Repeats\t\t\t: {options.number_of_repeats:d}")
+    print("Structure, path\t\t: median (minimum, standard deviation) ns/structure")
+
+    for result in results:
+        print(
+            f"{result['structure']:s}, {result['path']:s}\t: {result['median']:.1f} "
+            f"({result['minimum']:.1f}, {result['standard_deviation']:.1f}) "
+            f"x{result['speedup']:.2f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Memory benchmark of the representations of parsed stream entries."""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+# Change PYTHONPATH to include olecfrc.
+sys.path.insert(0, ".")
+
+from olecfrc import records  # pylint: disable=wrong-import-position
+from olecfrc import vba  # pylint: disable=wrong-import-position
+
+
+def _MeasureMemory(callback):
+    """Measures the memory retained by the result of a callback.
+
+    Args:
+      callback (function): callback that builds the representation.
+
+    Returns:
+      int: number of bytes retained by the representation.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = callback()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return size
+
+
+def Main():
+    """Entry point of the benchmark.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Compares the memory usage of parsed stream representations."
+    )
+
+    argument_parser.add_argument(
+        "-d",
+        "--number_of_documents",
+        dest="number_of_documents",
+        type=int,
+        default=10000,
+        help="number of documents that share identifiers.",
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--number_of_strings",
+        dest="number_of_strings",
+        type=int,
+        default=50000,
+        help="number of _VBA_PROJECT strings.",
+    )
+
+    options = argument_parser.parse_args()
+
+    vba_project_stream = vba.VBAProjectStream()
+    data_type_map = (
+        vba_project_stream._GetDataTypeMap(  # pylint: disable=protected-access
+            "project_stream_string"
+        )
+    )
+
+    string_data = []
+    for string_index in range(options.number_of_strings):
+        string = f"Module{string_index:d}".encode("utf-16-le")
+        string_data.append(len(string).to_bytes(2, "little") + string + bytes(12))
+
+    def _BuildStructureObjects():
+        return [data_type_map.MapByteStream(data) for data in string_data]
+
+    def _BuildRecords():
+        project_strings = []
+        for offset, structure in enumerate(_BuildStructureObjects()):
+            project_strings.append(
+                records.ProjectString(
+                    offset=offset,
+                    string=structure.string.decode("utf-16-le"),
+                    unknown1=structure.unknown1,
+                    unknown2=structure.unknown2,
+                    unknown3=structure.unknown3,
+                )
+            )
+        return project_strings
+
+    def _BuildColumnarRecords():
+        columnar_records = records.ColumnarRecords(records.ProjectString)
+        for project_string in _BuildRecords():
+            columnar_records.append(project_string)
+        return columnar_records
+
+    stream_data = b"".join(string_data)
+
+    def _BuildStringTable():
+        string_table = records.ProjectStringTable()
+        string_table.ReadData(stream_data, 0, options.number_of_strings)
+        return string_table
+
+    # Identifiers that recur in the _VBA_PROJECT streams of most documents.
+    identifiers = ["ThisDocument", "Module1", "Module2", "UserForm1", "VBAProject"]
+    identifiers_data = b"".join(
+        len(identifier.encode("utf-16-le")).to_bytes(2, "little")
+        + identifier.encode("utf-16-le")
+        + bytes(12)
+        for identifier in identifiers
+    )
+
+    def _DecodeIdentifiers():
+        decoded_identifiers = []
+        for _ in range(options.number_of_documents):
+            data_offset = 0
+            for _ in identifiers:
+                structure = data_type_map.MapByteStream(identifiers_data[data_offset:])
+                decoded_identifiers.append(structure.string.decode("utf-16-le"))
+                data_offset += 2 + structure.string_size + 12
+        return decoded_identifiers
+
+    def _DecodeInternedIdentifiers():
+        decoded_identifiers = []
+        for _ in range(options.number_of_documents):
+            string_table = records.ProjectStringTable()
+            string_table.ReadData(identifiers_data, 0, len(identifiers))
+            decoded_identifiers.extend(
+                string_table.GetString(index) for index in range(len(string_table))
+            )
+        return decoded_identifiers
+
+    print(f"Number of strings\t: {options.number_of_strings:d}")
+    print("Representation\t\t: bytes retained (bytes per string)")
+
+    for description, callback in (
+        ("dtfabric structures", _BuildStructureObjects),
+        ("__slots__ records", _BuildRecords),
+        ("columnar records", _BuildColumnarRecords),
+        ("string table\t", _BuildStringTable),
+    ):
+        size = _MeasureMemory(callback)
+        per_string = size / options.number_of_strings
+        print(f"{description:s}\t: {size:d} ({per_string:.1f})")
+
+    number_of_identifiers = options.number_of_documents * len(identifiers)
+
+    print("")
+    print(f"Number of documents\t: {options.number_of_documents:d}")
+    print("Identifiers\t\t: bytes retained (bytes per identifier)")
+
+    for description, callback in (
+        ("decoded", _DecodeIdentifiers),
+        ("decoded and interned", _DecodeInternedIdentifiers),
+    ):
+        size = _MeasureMemory(callback)
+        per_identifier = size / number_of_identifiers
+        print(f"{description:s}\t: {size:d} ({per_identifier:.1f})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
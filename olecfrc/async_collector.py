@@ -0,0 +1,192 @@
+"""asyncio collection of Visual Basic for Applications (VBA)."""
+
+import asyncio
+import concurrent.futures
+
+from olecfrc import batch
+
+
+class AsyncCollector:
+    """Collects VBA from documents without blocking the event loop.
+
+    Documents are collected by a thread or process pool executor, where
+    the number of documents being collected is bounded by a semaphore that is
+    shared by all calls of the collector. A document holds its slot until its
+    executor finishes with it, also after it timed out, since the executor
+    cannot interrupt a collection that already started.
+    """
+
+    def __init__(self, concurrency=4, executor=None, timeout=None):
+        """Initializes an asyncio collector.
+
+        Args:
+          concurrency (Optional[int]): maximum number of documents being
+              collected at a time.
+          executor (Optional[concurrent.futures.Executor]): executor to collect
+              the documents, where None represents a thread pool executor that is
+              owned by the collector.
+          timeout (Optional[float]): maximum number of seconds to wait for
+              the collection of a document, where None represents no timeout.
+        """
+        super().__init__()
+        self._concurrency = concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = None
+        self._timeout = timeout
+
+    def _GetSemaphore(self):
+        """Retrieves the semaphore that bounds the number of documents.
+
+        The semaphore is created on first use, so that it belongs to the event
+        loop of the caller.
+
+        Returns:
+          asyncio.Semaphore: semaphore.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        return self._semaphore
+
+    def _Submit(self, source):
+        """Submits a document to the executor.
+
+        The caller must have acquired the semaphore, which is released when
+        the executor finishes with the document.
+
+        Args:
+          source (str|tuple[str, object]): path of the document or name of
+              the document and its data as bytes, memoryview or file-like object.
+
+        Returns:
+          asyncio.Task: task that returns the document result.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._GetSemaphore()
+
+        def _ReleaseSemaphore(unused_future):
+            """Releases the semaphore from the thread that finished the document.
+
+            Args:
+              unused_future (concurrent.futures.Future): future of the document.
+            """
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # The event loop was closed.
+                pass
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._concurrency
+            )
+
+        if isinstance(self._executor, concurrent.futures.ProcessPoolExecutor):
+            source = batch.GetPicklableSource(source)
+
+        try:
+            future = self._executor.submit(batch.CollectDocument, source)
+        except Exception:
+            semaphore.release()
+            raise
+
+        future.add_done_callback(_ReleaseSemaphore)
+
+        return asyncio.ensure_future(self._WaitForResult(source, future))
+
+    async def _WaitForResult(self, source, future):
+        """Waits for the document result of a submitted document.
+
+        A document that timed out is reported with a TimeoutError, while
+        the executor continues to collect it if it already started. Its slot
+        is only released when the executor finishes, so that the semaphore keeps
+        bounding the documents that are actually being collected. Other errors,
+        such as a broken process pool, are reported in the document result as
+        well, so that a single document cannot fail the collection.
+
+        Args:
+          source (str|tuple[str, object]): path of the document or name of
+              the document and its data.
+          future (concurrent.futures.Future): future of the document.
+
+        Returns:
+          DocumentResult: document result.
+        """
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self._timeout
+            )
+        except asyncio.TimeoutError:
+            error = f"Collection did not complete within {self._timeout:.1f} seconds."
+            error_type = "TimeoutError"
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            error = f"{exception!s}"
+            error_type = type(exception).__name__
+
+        if isinstance(source, tuple):
+            source = source[0]
+
+        document_result = batch.DocumentResult(source)
+        document_result.error = error
+        document_result.error_type = error_type
+        return document_result
+
+    async def Close(self):
+        """Closes the collector and shuts down the executor it owns."""
+        if self._owns_executor and self._executor:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+
+    async def Collect(self, sources):
+        """Collects VBA from documents.
+
+        Results are yielded as documents complete. Documents that are still
+        pending when the iteration is stopped or cancelled are cancelled,
+        where documents the executor already started are left to finish.
+
+        Args:
+          sources (iterable[str|tuple[str, object]]): paths of the documents or
+              names of the documents and their data as bytes, memoryview or
+              file-like object.
+
+        Yields:
+          DocumentResult: document result, in order of completion.
+        """
+        semaphore = self._GetSemaphore()
+
+        pending_tasks = set()
+        try:
+            for source in sources:
+                await semaphore.acquire()
+                pending_tasks.add(self._Submit(source))
+
+                done_tasks = {task for task in pending_tasks if task.done()}
+                pending_tasks -= done_tasks
+                for task in done_tasks:
+                    yield task.result()
+
+            while pending_tasks:
+                done_tasks, pending_tasks = await asyncio.wait(
+                    pending_tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done_tasks:
+                    yield task.result()
+
+        finally:
+            for task in pending_tasks:
+                task.cancel()
+
+    async def CollectDocument(self, source):
+        """Collects VBA from a document.
+
+        Args:
+          source (str|tuple[str, object]): path of the document or name of
+              the document and its data as bytes, memoryview or file-like object.
+
+        Returns:
+          DocumentResult: document result.
+        """
+        await self._GetSemaphore().acquire()
+        return await self._Submit(source)
@@ -0,0 +1,464 @@
+"""Batch collection of Visual Basic for Applications (VBA)."""
+
+import functools
+import os
+
+from olecfrc import containers
+from olecfrc import memory_profiler
+from olecfrc import records
+from olecfrc import stream_cache
+from olecfrc import vba
+
+# Format of the results files, as stored in their header or metadata.
+RESULTS_FORMAT = "olecfrc-vba-results"
+
+# Version of the format of the results files.
+RESULTS_FORMAT_VERSION = 1
+
+
+class DocumentResult:
+    """Result of the collection of a document.
+
+    Attributes:
+      data_size (int): size of the document data.
+      duplicate_of (str): path or name of the document with the same content
+          of which the result was reused or None if the document was parsed.
+      error (str): error that occurred during collection or None.
+      error_type (str): type of the error that occurred during collection or
+          None.
+      memory_usage (list[StageMemoryUsage]): memory usage of the stages of
+          the collection, which is empty if memory profiling is not enabled.
+      project_roots (list[VBAProjectRoot]): project roots.
+      source (str): path or name of the document.
+      stage_durations (list[tuple[str, float]]): names of the parsing stages
+          and their duration in seconds.
+      stream_cache_statistics (dict[str, tuple[int, int]]): number of stream
+          cache hits and misses per kind of parser, which is empty if the stream
+          cache is not enabled.
+      stream_found (bool): True if a stream containing VBA was found.
+    """
+
+    def __init__(self, source):
+        """Initializes a document result.
+
+        Args:
+          source (str): path or name of the document.
+        """
+        super().__init__()
+        self.data_size = 0
+        self.duplicate_of = None
+        self.error = None
+        self.error_type = None
+        self.memory_usage = []
+        self.project_roots = []
+        self.source = source
+        self.stage_durations = []
+        self.stream_cache_statistics = {}
+        self.stream_found = False
+
+    def CopyFromDict(self, document_dict):
+        """Copies the document result from a dictionary.
+
+        The text of a form control is restored as its value, since the dictionary
+        does not distinguish between the value and the caption of a control.
+
+        Args:
+          document_dict (dict[str, object]): document result, as returned by
+              CopyToDict.
+        """
+        self.data_size = document_dict["data_size"]
+        self.duplicate_of = document_dict["duplicate_of"]
+        self.error = document_dict["error"]
+        self.error_type = document_dict["error_type"]
+        self.project_roots = []
+        self.source = document_dict["source"]
+        self.stage_durations = [
+            tuple(stage_duration) for stage_duration in document_dict["stage_durations"]
+        ]
+        self.stream_cache_statistics = {
+            kind: tuple(statistics)
+            for kind, statistics in document_dict["stream_cache_statistics"].items()
+        }
+        self.stream_found = document_dict["stream_found"]
+
+        for project_root_dict in document_dict["project_roots"]:
+            project_root = vba.VBAProjectRoot(project_root_dict["path"])
+            project_root.code_page = project_root_dict["code_page"]
+            project_root.container_path = project_root_dict["container_path"]
+            project_root.project_keys = [
+                tuple(project_key) for project_key in project_root_dict["project_keys"]
+            ]
+            project_root.project_name = project_root_dict["project_name"]
+            project_root.strings = [
+                records.ProjectString(string=string)
+                for string in project_root_dict["strings"]
+            ]
+            project_root.version = project_root_dict["version"]
+
+            for form_dict in project_root_dict["forms"]:
+                vba_form = vba.VBAForm(form_dict["name"])
+                vba_form.number_of_controls = form_dict["number_of_controls"]
+
+                for control_dict in form_dict["controls"]:
+                    f_stream_entry = records.FStreamEntry(
+                        clsid_cache_index=control_dict["clsid_cache_index"],
+                        name=control_dict["name"],
+                        o_stream_entry_index=control_dict["o_stream_entry_index"],
+                        o_stream_entry_size=control_dict["o_stream_entry_size"],
+                    )
+                    width, height = control_dict["size"] or (None, None)
+                    o_stream_entry = records.OStreamEntry(
+                        font_name=control_dict["font_name"],
+                        height=height,
+                        value=control_dict["text"],
+                        width=width,
+                    )
+                    position = control_dict["position"]
+                    vba_form.controls.append(
+                        vba.VBAFormControl(
+                            f_stream_entry,
+                            o_stream_entry=o_stream_entry,
+                            position=tuple(position) if position else None,
+                        )
+                    )
+
+                project_root.forms.append(vba_form)
+
+            for module_dict in project_root_dict["modules"]:
+                vba_module = vba.VBAModule(module_dict["name"])
+                vba_module.module_type = module_dict["module_type"]
+                vba_module.source_code = module_dict["source_code"]
+                vba_module.stream_name = module_dict["stream_name"]
+                project_root.modules.append(vba_module)
+
+            self.project_roots.append(project_root)
+
+    def CopyToDict(self):
+        """Copies the document result to a dictionary.
+
+        Returns:
+          dict[str, object]: document result, which can be serialized as JSON.
+        """
+        return {
+            "data_size": self.data_size,
+            "duplicate_of": self.duplicate_of,
+            "error": self.error,
+            "error_type": self.error_type,
+            "project_roots": [
+                {
+                    "code_page": project_root.code_page,
+                    "container_path": project_root.container_path,
+                    "forms": [
+                        {
+                            "controls": [
+                                _CopyFormControlToDict(vba_form_control)
+                                for vba_form_control in vba_form.controls
+                            ],
+                            "name": vba_form.name,
+                            "number_of_controls": vba_form.number_of_controls,
+                        }
+                        for vba_form in project_root.forms
+                    ],
+                    "modules": [
+                        {
+                            "module_type": vba_module.module_type,
+                            "name": vba_module.name,
+                            "source_code": vba_module.source_code,
+                            "stream_name": vba_module.stream_name,
+                        }
+                        for vba_module in project_root.modules
+                    ],
+                    "path": project_root.path,
+                    "project_keys": project_root.project_keys,
+                    "project_name": project_root.project_name,
+                    "strings": [
+                        project_string.string for project_string in project_root.strings
+                    ],
+                    "version": project_root.version,
+                }
+                for project_root in self.project_roots
+            ],
+            "source": self.source,
+            "stage_durations": self.stage_durations,
+            "stream_cache_statistics": self.stream_cache_statistics,
+            "stream_found": self.stream_found,
+        }
+
+
+def _CollectDocument(data, document_result, profiler, process_stream_cache, triage):
+    """Collects VBA from a document into a document result.
+
+    Any error, including one due to a defect in a parser, is recorded in
+    the document result, so that a single document cannot fail a batch.
+
+    Args:
+      data (str or bytes or memoryview or file): path of the document, its data
+          or a file-like object that contains its data.
+      document_result (DocumentResult): document result.
+      profiler (MemoryProfiler): memory profiler or None if memory profiling is
+          not enabled.
+      process_stream_cache (StreamCache): stream cache of the process or None
+          if the stream cache is not enabled.
+      triage (bool): True if only the headers of the streams should be read.
+    """
+    container_extractor = containers.ContainerExtractor()
+    try:
+        document_result.data_size = _GetDataSize(data)
+
+        for container_path, olecf_source in container_extractor.ExtractOLECFDocuments(
+            data
+        ):
+            collector_object = vba.VBACollector(
+                memory_profiler=profiler,
+                stream_cache=process_stream_cache,
+                triage=triage,
+            )
+            collector_object.Collect(olecf_source, None)
+
+            for project_root in collector_object.project_roots:
+                project_root.container_path = container_path
+
+            document_result.project_roots.extend(collector_object.project_roots)
+            document_result.stage_durations.extend(collector_object.stage_durations)
+            if collector_object.stream_found:
+                document_result.stream_found = True
+
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        document_result.error = f"{exception!s}"
+        document_result.error_type = type(exception).__name__
+
+
+def _CopyFormControlToDict(vba_form_control):
+    """Copies a form control to a dictionary.
+
+    Args:
+      vba_form_control (VBAFormControl): form control.
+
+    Returns:
+      dict[str, object]: form control, which can be serialized as JSON.
+    """
+    f_stream_entry = vba_form_control.f_stream_entry
+    return {
+        "clsid_cache_index": f_stream_entry.clsid_cache_index,
+        "control_type": vba_form_control.control_type,
+        "font_name": vba_form_control.font_name,
+        "name": vba_form_control.name,
+        "o_stream_entry_index": f_stream_entry.o_stream_entry_index,
+        "o_stream_entry_size": f_stream_entry.o_stream_entry_size,
+        "position": vba_form_control.position,
+        "size": vba_form_control.size,
+        "text": vba_form_control.text,
+    }
+
+
+def _GetDataSize(data):
+    """Retrieves the size of document data.
+
+    Args:
+      data (str or bytes or memoryview or file): path of the document, its data
+          or a file-like object that contains its data.
+
+    Returns:
+      int: size of the document data.
+
+    Raises:
+      OSError: if the size of the document could not be determined.
+    """
+    if isinstance(data, memoryview):
+        return data.nbytes
+
+    if isinstance(data, (bytearray, bytes)):
+        return len(data)
+
+    if isinstance(data, (str, os.PathLike)):
+        return os.path.getsize(data)
+
+    file_offset = data.tell()
+    try:
+        return data.seek(0, os.SEEK_END)
+    finally:
+        data.seek(file_offset, os.SEEK_SET)
+
+
+def CollectDocument(
+    source,
+    maximum_number_of_cached_streams=0,
+    maximum_stream_cache_size=stream_cache.StreamCache.DEFAULT_MAXIMUM_SIZE,
+    memory_profiling=False,
+    triage=False,
+):
+    """Collects VBA from a document.
+
+    OLE Compound Files in ZIP and OOXML containers, such as the vbaProject.bin
+    member of a .docm file, are collected from memory.
+
+    This function is defined at module level so that it can be used by
+    the workers of a process pool.
+
+    Args:
+      source (str or tuple[str, object]): path of the document or name of
+          the document and its data as bytes, memoryview or file-like object.
+      maximum_number_of_cached_streams (Optional[int]): maximum number of
+          parsed stream results cached by the process across documents, where
+          0 represents no stream cache.
+      maximum_stream_cache_size (Optional[int]): maximum total size of
+          the stream data of which parsed results are cached by the process.
+      memory_profiling (Optional[bool]): True if the memory usage of
+          the collection should be profiled.
+      triage (Optional[bool]): True if only the headers of the streams should
+          be read, to detect VBA projects without reading their modules.
+
+    Returns:
+      DocumentResult: document result.
+    """
+    if isinstance(source, tuple):
+        name, data = source
+    else:
+        name, data = source, source
+
+    document_result = DocumentResult(name)
+
+    process_stream_cache = None
+    statistics_before = {}
+    if maximum_number_of_cached_streams > 0:
+        process_stream_cache = stream_cache.GetProcessStreamCache(
+            maximum_number_of_cached_streams, maximum_stream_cache_size
+        )
+        statistics_before = process_stream_cache.GetStatistics()
+
+    if not memory_profiling:
+        _CollectDocument(data, document_result, None, process_stream_cache, triage)
+
+    else:
+        profiler = memory_profiler.MemoryProfiler()
+        profiler.Start()
+        try:
+            with profiler.ProfileStage("document"):
+                _CollectDocument(
+                    data, document_result, profiler, process_stream_cache, triage
+                )
+
+        finally:
+            profiler.Stop()
+            document_result.memory_usage = profiler.stages
+
+    if process_stream_cache:
+        for kind, (hits, misses) in process_stream_cache.GetStatistics().items():
+            hits_before, misses_before = statistics_before.get(kind, (0, 0))
+            if hits > hits_before or misses > misses_before:
+                document_result.stream_cache_statistics[kind] = (
+                    hits - hits_before,
+                    misses - misses_before,
+                )
+
+    return document_result
+
+
+def GetPicklableSource(source):
+    """Retrieves a source that can be handed to a worker process.
+
+    Args:
+      source (str|tuple[str, object]): path of the document or name of
+          the document and its data as bytes, memoryview or file-like object.
+
+    Returns:
+      str|tuple[str, bytes]: path of the document or name of the document and
+          its data.
+    """
+    if not isinstance(source, tuple):
+        return source
+
+    name, data = source
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    elif not isinstance(data, (bytearray, bytes)):
+        data = data.read()
+
+    return name, data
+
+
+def GetSourcePaths(paths):
+    """Retrieves the paths of the documents to collect from.
+
+    Args:
+      paths (list[str]): paths of documents or directories, where directories
+          are searched recursively.
+
+    Yields:
+      str: path of a document.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for directory_path, directory_names, filenames in os.walk(path):
+            directory_names.sort()
+            for filename in sorted(filenames):
+                yield os.path.join(directory_path, filename)
+
+
+class BatchCollector:
+    """Collects VBA from a batch of documents."""
+
+    def __init__(
+        self,
+        chunk_size=16,
+        maximum_number_of_cached_streams=0,
+        maximum_stream_cache_size=stream_cache.StreamCache.DEFAULT_MAXIMUM_SIZE,
+        memory_profiling=False,
+        number_of_workers=1,
+        triage=False,
+    ):
+        """Initializes a batch collector.
+
+        Args:
+          chunk_size (Optional[int]): number of documents handed to a worker at
+              a time.
+          maximum_number_of_cached_streams (Optional[int]): maximum number of
+              parsed stream results cached by each worker across documents,
+              where 0 represents no stream cache.
+          maximum_stream_cache_size (Optional[int]): maximum total size of
+              the stream data of which parsed results are cached by each worker.
+          memory_profiling (Optional[bool]): True if the memory usage of
+              the collection of each document should be profiled.
+          number_of_workers (Optional[int]): number of worker processes, where
+              1 represents collecting in the current process.
+          triage (Optional[bool]): True if only the headers of the streams should
+              be read, to detect VBA projects without reading their modules.
+        """
+        super().__init__()
+        self._chunk_size = chunk_size
+        self._collect_document = functools.partial(
+            CollectDocument,
+            maximum_number_of_cached_streams=maximum_number_of_cached_streams,
+            maximum_stream_cache_size=maximum_stream_cache_size,
+            memory_profiling=memory_profiling,
+            triage=triage,
+        )
+        self._number_of_workers = number_of_workers
+
+    def Collect(self, sources):
+        """Collects VBA from documents.
+
+        Args:
+          sources (iterable[str|tuple[str, object]]): paths of the documents or
+              names of the documents and their data as bytes, memoryview or
+              file-like object.
+
+        Yields:
+          DocumentResult: document result, in order of completion.
+        """
+        if self._number_of_workers <= 1:
+            for source in sources:
+                yield self._collect_document(source)
+            return
+
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+
+        with multiprocessing.Pool(processes=self._number_of_workers) as pool:
+            yield from pool.imap_unordered(
+                self._collect_document,
+                map(GetPicklableSource, sources),
+                chunksize=self._chunk_size,
+            )
@@ -0,0 +1,150 @@
+"""Checkpoint journal of the completed documents of a batch scan."""
+
+import hashlib
+import os
+
+
+class CheckpointJournal:
+    """Append-only journal of the documents a batch scan has completed.
+
+    The journal consists of a signature followed by fixed-size records that
+    contain a 16-byte BLAKE2b digest of the path of a completed document.
+    Records are buffered and only appended when the journal is flushed, so that
+    checkpointing costs a digest per document and a write per flush.
+    """
+
+    # Signature of a checkpoint journal file.
+    SIGNATURE = b"OLECFRCJ\x01\x00\x00\x00"
+
+    # Size of a digest record.
+    _DIGEST_SIZE = 16
+
+    def __init__(self, path):
+        """Initializes a checkpoint journal.
+
+        Args:
+          path (str): path of the journal file.
+        """
+        super().__init__()
+        self._completed_digests = set()
+        self._file_object = None
+        self._path = path
+        self._pending_records = []
+
+    @property
+    def number_of_completed(self):
+        """int: number of completed documents in the journal."""
+        return len(self._completed_digests)
+
+    def _GetDigest(self, path):
+        """Retrieves the digest of the path of a document.
+
+        Args:
+          path (str): path of the document.
+
+        Returns:
+          bytes: digest of the path.
+        """
+        return hashlib.blake2b(
+            path.encode("utf-8", "surrogateescape"), digest_size=self._DIGEST_SIZE
+        ).digest()
+
+    def _ReadJournal(self):
+        """Reads the digests of the completed documents from the journal file.
+
+        A trailing partial record, from a write that was interrupted, is
+        ignored and overwritten by the next flush.
+
+        Returns:
+          int: size of the journal data that contains complete records.
+
+        Raises:
+          IOError: if the journal file is not supported.
+          OSError: if the journal file is not supported.
+        """
+        with open(self._path, "rb") as file_object:
+            data = file_object.read()
+
+        if not data:
+            return 0
+
+        signature_size = len(self.SIGNATURE)
+        if data[:signature_size] != self.SIGNATURE:
+            raise IOError(f"Unsupported checkpoint journal: {self._path:s}")
+
+        data_size = len(data) - ((len(data) - signature_size) % self._DIGEST_SIZE)
+
+        data_view = memoryview(data)
+        self._completed_digests = {
+            data_view[data_offset : data_offset + self._DIGEST_SIZE].tobytes()
+            for data_offset in range(signature_size, data_size, self._DIGEST_SIZE)
+        }
+        return data_size
+
+    def AddCompleted(self, path):
+        """Marks a document as completed.
+
+        Args:
+          path (str): path of the document.
+        """
+        digest = self._GetDigest(path)
+        if digest not in self._completed_digests:
+            self._completed_digests.add(digest)
+            self._pending_records.append(digest)
+
+    def Close(self):
+        """Flushes and closes the journal."""
+        if self._file_object:
+            self.Flush()
+            self._file_object.close()
+            self._file_object = None
+
+    def Flush(self):
+        """Appends the pending records to the journal file and syncs it."""
+        if self._pending_records:
+            self._file_object.write(b"".join(self._pending_records))
+            self._pending_records = []
+
+            self._file_object.flush()
+            os.fsync(self._file_object.fileno())
+
+    def IsCompleted(self, path):
+        """Determines if a document was completed.
+
+        Args:
+          path (str): path of the document.
+
+        Returns:
+          bool: True if the document was completed.
+        """
+        return self._GetDigest(path) in self._completed_digests
+
+    def Open(self, resume=False):
+        """Opens the journal.
+
+        Args:
+          resume (Optional[bool]): True if the completed documents of an
+              existing journal should be loaded, otherwise the journal is
+              started anew.
+
+        Raises:
+          IOError: if the journal file could not be opened or is not supported.
+          OSError: if the journal file could not be opened or is not supported.
+        """
+        data_size = 0
+        if resume and os.path.exists(self._path):
+            data_size = self._ReadJournal()
+
+        if data_size:
+            self._file_object = open(  # pylint: disable=consider-using-with
+                self._path, "r+b"
+            )
+            self._file_object.truncate(data_size)
+            self._file_object.seek(data_size, os.SEEK_SET)
+        else:
+            self._completed_digests = set()
+            self._file_object = open(  # pylint: disable=consider-using-with
+                self._path, "wb"
+            )
+            self._file_object.write(self.SIGNATURE)
+            self._file_object.flush()
@@ -0,0 +1,245 @@
+"""MS-OVBA compression and decompression."""
+
+from olecfrc import errors
+
+
+def Decompress(compressed_data):
+    """Decompresses a MS-OVBA compressed container.
+
+    Args:
+      compressed_data (bytes): compressed container data.
+
+    Returns:
+      bytes: decompressed data.
+
+    Raises:
+      ParseError: if the compressed data could not be decompressed.
+    """
+    compressed_data_size = len(compressed_data)
+    if not compressed_data_size or compressed_data[0] != 0x01:
+        raise errors.ParseError("Unsupported compressed container signature.")
+
+    decompressed_data = bytearray()
+
+    compressed_data_offset = 1
+    while compressed_data_offset < compressed_data_size:
+        if compressed_data_offset + 2 > compressed_data_size:
+            raise errors.ParseError(
+                f"Truncated chunk header at offset: {compressed_data_offset:d}"
+            )
+
+        chunk_header = int.from_bytes(
+            compressed_data[compressed_data_offset : compressed_data_offset + 2],
+            "little",
+        )
+        if (chunk_header >> 12) & 0x07 != 0x03:
+            raise errors.ParseError(
+                f"Unsupported chunk signature at offset: {compressed_data_offset:d}"
+            )
+
+        chunk_end_offset = min(
+            compressed_data_offset + (chunk_header & 0x0FFF) + 3,
+            compressed_data_size,
+        )
+        compressed_data_offset += 2
+
+        if not chunk_header & 0x8000:
+            decompressed_data.extend(
+                compressed_data[compressed_data_offset : compressed_data_offset + 4096]
+            )
+            compressed_data_offset += 4096
+            continue
+
+        chunk_start_offset = len(decompressed_data)
+
+        while compressed_data_offset < chunk_end_offset:
+            flag_byte = compressed_data[compressed_data_offset]
+            compressed_data_offset += 1
+
+            for bit_index in range(8):
+                if compressed_data_offset >= chunk_end_offset:
+                    break
+
+                if not flag_byte & (1 << bit_index):
+                    decompressed_data.append(compressed_data[compressed_data_offset])
+                    compressed_data_offset += 1
+                    continue
+
+                if compressed_data_offset + 2 > chunk_end_offset:
+                    raise errors.ParseError(
+                        f"Truncated copy token at offset: {compressed_data_offset:d}"
+                    )
+
+                copy_token = compressed_data[compressed_data_offset] | (
+                    compressed_data[compressed_data_offset + 1] << 8
+                )
+                compressed_data_offset += 2
+
+                decompressed_chunk_size = len(decompressed_data) - chunk_start_offset
+                bit_count = max((decompressed_chunk_size - 1).bit_length(), 4)
+                copy_size = (copy_token & (0xFFFF >> bit_count)) + 3
+                copy_offset = (copy_token >> (16 - bit_count)) + 1
+
+                copy_start_offset = len(decompressed_data) - copy_offset
+                if copy_start_offset < chunk_start_offset:
+                    raise errors.ParseError(
+                        f"Invalid copy token offset: {copy_offset:d} at offset: "
+                        f"{compressed_data_offset - 2:d}"
+                    )
+
+                if copy_offset >= copy_size:
+                    decompressed_data.extend(
+                        decompressed_data[
+                            copy_start_offset : copy_start_offset + copy_size
+                        ]
+                    )
+                else:
+                    # The copy overlaps with the data it produces, which repeats
+                    # the last copy offset bytes.
+                    pattern = decompressed_data[copy_start_offset:]
+                    number_of_repeats = (copy_size // copy_offset) + 1
+                    decompressed_data.extend((pattern * number_of_repeats)[:copy_size])
+
+    return bytes(decompressed_data)
+
+
+def _CompressChunk(uncompressed_data, chunk_start, chunk_end, maximum_chain_length):
+    """Compresses a chunk of data into MS-OVBA tokens.
+
+    Matches are found with a hash chain of the 3-byte sequences in the chunk,
+    where the maximum copy size depends on the position in the chunk.
+
+    Args:
+      uncompressed_data (bytes): uncompressed data.
+      chunk_start (int): offset of the start of the chunk in the uncompressed
+          data.
+      chunk_end (int): offset of the end of the chunk in the uncompressed data.
+      maximum_chain_length (int): maximum number of match candidates to compare.
+
+    Returns:
+      bytearray: compressed chunk data, without the chunk header.
+    """
+    chunk_data = bytearray()
+
+    # Most recent position per 3-byte sequence and, per position relative to
+    # the start of the chunk, the previous position of the same sequence.
+    chain_heads = {}
+    previous_positions = [-1] * (chunk_end - chunk_start)
+
+    position = chunk_start
+    while position < chunk_end:
+        flag_byte_offset = len(chunk_data)
+        flag_byte = 0
+        chunk_data.append(0)
+
+        for bit_index in range(8):
+            if position >= chunk_end:
+                break
+
+            difference = position - chunk_start
+            bit_count = max((difference - 1).bit_length(), 4)
+            maximum_copy_size = min((0xFFFF >> bit_count) + 3, chunk_end - position)
+
+            copy_offset = 0
+            copy_size = 0
+            if maximum_copy_size >= 3:
+                candidate = chain_heads.get(
+                    uncompressed_data[position : position + 3], -1
+                )
+                chain_length = 0
+                while candidate >= 0 and chain_length < maximum_chain_length:
+                    # Only compare the candidate if it could be longer than
+                    # the current match.
+                    if (
+                        not copy_size
+                        or uncompressed_data[candidate + copy_size]
+                        == uncompressed_data[position + copy_size]
+                    ):
+                        # Extend the match 8 bytes at a time before comparing
+                        # individual bytes.
+                        match_size = 3
+                        while (
+                            match_size + 8 <= maximum_copy_size
+                            and uncompressed_data[
+                                candidate + match_size : candidate + match_size + 8
+                            ]
+                            == uncompressed_data[
+                                position + match_size : position + match_size + 8
+                            ]
+                        ):
+                            match_size += 8
+
+                        while (
+                            match_size < maximum_copy_size
+                            and uncompressed_data[candidate + match_size]
+                            == uncompressed_data[position + match_size]
+                        ):
+                            match_size += 1
+
+                        if match_size > copy_size:
+                            copy_offset = position - candidate
+                            copy_size = match_size
+                            if copy_size == maximum_copy_size:
+                                break
+
+                    candidate = previous_positions[candidate - chunk_start]
+                    chain_length += 1
+
+            if copy_size:
+                copy_token = ((copy_offset - 1) << (16 - bit_count)) | (copy_size - 3)
+                chunk_data.extend(copy_token.to_bytes(2, "little"))
+                flag_byte |= 1 << bit_index
+                match_end = position + copy_size
+            else:
+                chunk_data.append(uncompressed_data[position])
+                match_end = position + 1
+
+            while position < match_end:
+                sequence = uncompressed_data[position : position + 3]
+                previous_positions[position - chunk_start] = chain_heads.get(
+                    sequence, -1
+                )
+                chain_heads[sequence] = position
+                position += 1
+
+        chunk_data[flag_byte_offset] = flag_byte
+
+    return chunk_data
+
+
+def Compress(uncompressed_data, maximum_chain_length=16):
+    """Compresses data into a MS-OVBA compressed container.
+
+    A chunk that does not compress is stored uncompressed. Since an uncompressed
+    chunk always contains 4096 bytes, an uncompressed last chunk is padded with
+    0-byte values as defined by MS-OVBA.
+
+    Args:
+      uncompressed_data (bytes): uncompressed data.
+      maximum_chain_length (Optional[int]): maximum number of match candidates
+          to compare per position, where a larger value improves the compression
+          ratio at the cost of throughput.
+
+    Returns:
+      bytes: compressed container data.
+    """
+    compressed_data = bytearray(b"\x01")
+
+    uncompressed_data_size = len(uncompressed_data)
+    for chunk_start in range(0, uncompressed_data_size, 4096):
+        chunk_end = min(chunk_start + 4096, uncompressed_data_size)
+
+        chunk_data = _CompressChunk(
+            uncompressed_data, chunk_start, chunk_end, maximum_chain_length
+        )
+        if len(chunk_data) <= 4096:
+            chunk_header = 0xB000 | (len(chunk_data) - 1)
+        else:
+            chunk_data = uncompressed_data[chunk_start:chunk_end]
+            chunk_data += bytes(4096 - len(chunk_data))
+            chunk_header = 0x3FFF
+
+        compressed_data.extend(chunk_header.to_bytes(2, "little"))
+        compressed_data.extend(chunk_data)
+
+    return bytes(compressed_data)
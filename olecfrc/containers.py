@@ -0,0 +1,159 @@
+"""Detection of OLE Compound Files in ZIP and OOXML containers."""
+
+import io
+import os
+
+from olecfrc import errors
+
+# Signature of an OLE Compound File.
+OLECF_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Signature of the local file header of a ZIP archive.
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+
+def _ReadSignature(source):
+    """Reads the signature of a source.
+
+    Args:
+      source (str or bytes or memoryview or file): path of the document, its
+          data or a file-like object that contains its data.
+
+    Returns:
+      bytes: first 8 bytes of the source.
+    """
+    if isinstance(source, (bytearray, bytes, memoryview)):
+        return bytes(source[:8])
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file_object:
+            return file_object.read(8)
+
+    file_offset = source.tell()
+    try:
+        return source.read(8)
+    finally:
+        source.seek(file_offset, os.SEEK_SET)
+
+
+class ContainerExtractor:
+    """Extracts OLE Compound Files from ZIP and OOXML containers.
+
+    Containers, such as .docm, .xlsm or .pptm files, are read in memory, where
+    the OLE Compound File members, such as vbaProject.bin, and nested ZIP
+    archives are decompressed into memory without writing them to disk.
+    """
+
+    # Default maximum depth of nested ZIP archives.
+    DEFAULT_MAXIMUM_DEPTH = 3
+
+    # Default maximum uncompressed size of a ZIP archive member.
+    DEFAULT_MAXIMUM_MEMBER_SIZE = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        maximum_depth=DEFAULT_MAXIMUM_DEPTH,
+        maximum_member_size=DEFAULT_MAXIMUM_MEMBER_SIZE,
+    ):
+        """Initializes a container extractor.
+
+        Args:
+          maximum_depth (Optional[int]): maximum depth of nested ZIP archives.
+          maximum_member_size (Optional[int]): maximum uncompressed size of
+              a ZIP archive member, where larger members are ignored.
+        """
+        super().__init__()
+        self._maximum_depth = maximum_depth
+        self._maximum_member_size = maximum_member_size
+
+    def _ExtractFromZIPArchive(self, source, container_path, depth):
+        """Extracts OLE Compound Files from a ZIP archive.
+
+        Args:
+          source (str or file): path of the ZIP archive or a file-like object
+              that contains its data.
+          container_path (str): path of the ZIP archive within the containers
+              or None if not within a container.
+          depth (int): depth of the ZIP archive.
+
+        Yields:
+          tuple[str, bytes]: path of the OLE Compound File within
+              the containers and its data.
+
+        Raises:
+          ParseError: if the ZIP archive could not be read.
+        """
+        import zipfile  # pylint: disable=import-outside-toplevel
+        import zlib  # pylint: disable=import-outside-toplevel
+
+        try:
+            with zipfile.ZipFile(source) as zip_file:
+                for zip_info in zip_file.infolist():
+                    if (
+                        zip_info.is_dir()
+                        or zip_info.file_size > self._maximum_member_size
+                        or zip_info.flag_bits & 0x1
+                    ):
+                        continue
+
+                    with zip_file.open(zip_info) as file_object:
+                        signature = file_object.read(8)
+
+                    is_zip_archive = signature.startswith(ZIP_SIGNATURE)
+                    if signature != OLECF_SIGNATURE and (
+                        not is_zip_archive or depth >= self._maximum_depth
+                    ):
+                        continue
+
+                    member_path = zip_info.filename
+                    if container_path:
+                        member_path = f"{container_path:s}/{member_path:s}"
+
+                    member_data = zip_file.read(zip_info)
+
+                    if is_zip_archive:
+                        yield from self._ExtractFromZIPArchive(
+                            io.BytesIO(member_data), member_path, depth + 1
+                        )
+                    else:
+                        yield member_path, member_data
+
+        except (
+            EOFError,
+            NotImplementedError,
+            RuntimeError,
+            zipfile.BadZipFile,
+            zlib.error,
+        ) as exception:
+            raise errors.ParseError(
+                f"Unable to read ZIP archive with error: {exception!s}"
+            )
+
+    def ExtractOLECFDocuments(self, source):
+        """Extracts the OLE Compound Files from a source.
+
+        A source that is not a ZIP archive is returned as-is, so that it can be
+        read directly by the collector.
+
+        Args:
+          source (str or bytes or memoryview or file): path of the document, its
+              data or a file-like object that contains its data.
+
+        Yields:
+          tuple[str, object]: path of the OLE Compound File within the containers
+              or None if the source is not a container, and the OLE Compound File
+              as a path, bytes, memoryview or file-like object.
+
+        Raises:
+          OSError: if the source could not be read.
+          ParseError: if a ZIP archive could not be read.
+        """
+        signature = _ReadSignature(source)
+        if not signature.startswith(ZIP_SIGNATURE):
+            yield None, source
+            return
+
+        if isinstance(source, (bytearray, bytes, memoryview)):
+            source = io.BytesIO(source)
+
+        yield from self._ExtractFromZIPArchive(source, None, 1)
@@ -1,13 +1,32 @@
 """Binary data format."""
 
+import functools
+import hashlib
 import os
+import types
 
-from dfdatetime import filetime as dfdatetime_filetime
+from olecfrc import errors
 
-from dtfabric import errors as dtfabric_errors
-from dtfabric.runtime import fabric as dtfabric_fabric
 
-from olecfrc import errors
+@functools.lru_cache(maxsize=None)
+def _ImportDtfabric():
+    """Imports the dtFabric modules.
+
+    dtFabric, and PyYAML on which it depends, are only needed when structures
+    are mapped with the dtFabric data type maps instead of the generated
+    structure parsers, hence they are imported on first use.
+
+    Returns:
+      types.SimpleNamespace: dtFabric data_maps, errors and fabric modules.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dtfabric import errors as dtfabric_errors
+    from dtfabric.runtime import data_maps as dtfabric_data_maps
+    from dtfabric.runtime import fabric as dtfabric_fabric
+
+    return types.SimpleNamespace(
+        data_maps=dtfabric_data_maps, errors=dtfabric_errors, fabric=dtfabric_fabric
+    )
 
 
 class BinaryDataFormat:
@@ -20,18 +39,42 @@ class BinaryDataFormat:
     # at run-time.
     _DEFINITION_FILES_PATH = os.path.dirname(__file__)
 
-    def __init__(self, debug=False, output_writer=None):
+    # Data type fabrics per definition file path, which are shared by
+    # the binary data formats within a process.
+    _DATA_TYPE_FABRICS = {}
+
+    # Generated structure parsers per data type name, which can be overwritten
+    # by a subclass. A generated parser is used instead of the dtFabric data type
+    # map of the same name.
+    _STRUCTURE_PARSERS = None
+
+    # SHA-256 digest of the definition file the structure parsers were generated
+    # from, which can be overwritten by a subclass.
+    _STRUCTURE_PARSERS_DIGEST = None
+
+    # SHA-256 digests of the definition files per path, which are shared by
+    # the binary data formats within a process.
+    _DEFINITION_FILE_DIGESTS = {}
+
+    def __init__(self, debug=False, output_writer=None, use_generated_parsers=True):
         """Initializes a binary data format.
 
         Args:
           debug (Optional[bool]): True if debug information should be written.
           output_writer (Optional[OutputWriter]): output writer.
+          use_generated_parsers (Optional[bool]): True if generated structure
+              parsers should be used when available instead of the dtFabric
+              data type maps.
         """
         super().__init__()
         self._data_type_maps = {}
         self._debug = debug
-        self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+        self._fabric = None
         self._output_writer = output_writer
+        self._structure_parsers = {}
+
+        if use_generated_parsers and self._HasMatchingStructureParsers():
+            self._structure_parsers = self._STRUCTURE_PARSERS
 
     def _DebugPrintData(self, description, data):
         """Prints data for debugging.
@@ -64,6 +107,10 @@ class BinaryDataFormat:
         elif value == 0x7FFFFFFFFFFFFFFF:
             date_time_string = "Never (0x7fffffffffffffff)"
         else:
+            from dfdatetime import (  # pylint: disable=import-outside-toplevel
+                filetime as dfdatetime_filetime,
+            )
+
             date_time = dfdatetime_filetime.Filetime(timestamp=value)
             date_time_string = date_time.CopyToDateTimeString()
             if date_time_string:
@@ -177,14 +224,46 @@ class BinaryDataFormat:
         """
         data_type_map = self._data_type_maps.get(name)
         if not data_type_map:
+            if not self._fabric:
+                self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+
             data_type_map = self._fabric.CreateDataTypeMap(name)
             self._data_type_maps[name] = data_type_map
 
         return data_type_map
 
+    def _HasMatchingStructureParsers(self):
+        """Determines if the generated structure parsers match the definition file.
+
+        The generated structure parsers are only used when the digest they were
+        generated from matches that of the definition file, so that a stale
+        generated module falls back to the dtFabric data type maps. The definition
+        file is hashed at most once per process.
+
+        Returns:
+          bool: True if the generated structure parsers match the definition file.
+        """
+        if not self._DEFINITION_FILE or not self._STRUCTURE_PARSERS:
+            return False
+
+        path = os.path.join(self._DEFINITION_FILES_PATH, self._DEFINITION_FILE)
+        definition_digest = self._DEFINITION_FILE_DIGESTS.get(path, None)
+        if not definition_digest:
+            with open(path, "rb") as file_object:
+                definition_digest = hashlib.sha256(file_object.read()).hexdigest()
+
+            self._DEFINITION_FILE_DIGESTS[path] = definition_digest
+
+        return definition_digest == self._STRUCTURE_PARSERS_DIGEST
+
     def _ReadDefinitionFile(self, filename):
         """Reads a dtFabric definition file.
 
+        The data type fabric is shared within the process, so that the YAML
+        definitions are parsed at most once per process. Since the generated
+        structure parsers are used by default, the definitions are typically
+        only read for debugging or when the generated parsers are disabled.
+
         Args:
           filename (str): name of the dtFabric definition file.
 
@@ -197,10 +276,61 @@ class BinaryDataFormat:
             return None
 
         path = os.path.join(self._DEFINITION_FILES_PATH, filename)
-        with open(path, "rb") as file_object:
-            definition = file_object.read()
+        data_type_fabric = self._DATA_TYPE_FABRICS.get(path, None)
+        if not data_type_fabric:
+            with open(path, "rb") as file_object:
+                definition = file_object.read()
+
+            data_type_fabric = _ImportDtfabric().fabric.DataTypeFabric(
+                yaml_definition=definition
+            )
+            self._DATA_TYPE_FABRICS[path] = data_type_fabric
 
-        return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+        return data_type_fabric
+
+    def _ReadStructure(self, byte_stream, byte_offset, name, description):
+        """Reads a structure from a byte stream.
+
+        The generated structure parser is used when available, otherwise the
+        structure is mapped with the dtFabric data type map.
+
+        Args:
+          byte_stream (bytes): byte stream.
+          byte_offset (int): offset of the structure in the byte stream.
+          name (str): name of the data type as defined by the definition file.
+          description (str): description of the structure.
+
+        Returns:
+          tuple[object, int]: structure values object and size of the structure.
+
+        Raises:
+          ParseError: if the structure cannot be read.
+          ValueError: if the byte stream is missing.
+        """
+        structure_parser = self._structure_parsers.get(name, None)
+        if not structure_parser:
+            data_type_map = self._GetDataTypeMap(name)
+            context = _ImportDtfabric().data_maps.DataTypeMapContext()
+
+            structure_values = self._ReadStructureFromByteStream(
+                byte_stream[byte_offset:],
+                byte_offset,
+                data_type_map,
+                description,
+                context=context,
+            )
+            return structure_values, context.byte_size
+
+        if not byte_stream:
+            raise ValueError("Missing byte stream.")
+
+        try:
+            return structure_parser(byte_stream, byte_offset)
+        except errors.ParseError as exception:
+            raise errors.ParseError(
+                f"Unable to map {description:s} data at offset: 0x{byte_offset:08x} "
+                f"with error: {exception!s}"
+            )
 
     def _ReadStructureFromByteStream(
         self, byte_stream, file_offset, data_type_map, description, context=None
@@ -228,6 +358,8 @@ class BinaryDataFormat:
         if not data_type_map:
             raise ValueError("Missing data type map.")
 
+        dtfabric_errors = _ImportDtfabric().errors
+
         try:
             return data_type_map.MapByteStream(byte_stream, context=context)
         except (
@@ -0,0 +1,153 @@
+"""Process pool for the decompression of large MS-OVBA compressed containers."""
+
+from olecfrc import compression
+
+
+def _DecompressSharedMemory(shared_memory_name, data_offset, data_size):
+    """Decompresses a compressed container stored in shared memory.
+
+    This function is defined at module level so that it can be used by
+    the workers of a process pool.
+
+    Args:
+      shared_memory_name (str): name of the shared memory block.
+      data_offset (int): offset of the compressed container in the shared memory
+          block.
+      data_size (int): size of the compressed container.
+
+    Returns:
+      bytes: decompressed data.
+
+    Raises:
+      ParseError: if the compressed data could not be decompressed.
+    """
+    from multiprocessing import (  # pylint: disable=import-outside-toplevel
+        shared_memory,
+    )
+
+    shared_memory_block = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        compressed_data = shared_memory_block.buf[data_offset : data_offset + data_size]
+        try:
+            return compression.Decompress(compressed_data)
+        finally:
+            compressed_data.release()
+
+    finally:
+        shared_memory_block.close()
+
+
+class DecompressionPool:
+    """Process pool for the decompression of large compressed containers.
+
+    Compressed containers of at least the threshold size are copied into a
+    single shared memory block and decompressed by the workers, so that the
+    compressed data is not pickled. Smaller containers are decompressed
+    in-process while the workers are busy.
+    """
+
+    # Default compressed size from which a container is decompressed by
+    # a worker.
+    DEFAULT_THRESHOLD = 64 * 1024
+
+    def __init__(self, number_of_workers=2, threshold=DEFAULT_THRESHOLD):
+        """Initializes a decompression pool.
+
+        Args:
+          number_of_workers (Optional[int]): number of worker processes.
+          threshold (Optional[int]): compressed size from which a container is
+              decompressed by a worker.
+        """
+        super().__init__()
+        self._number_of_workers = number_of_workers
+        self._pool = None
+        self._threshold = threshold
+
+    def Close(self):
+        """Closes the pool and stops the worker processes."""
+        if self._pool:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def Decompress(self, compressed_data_list):
+        """Decompresses compressed containers.
+
+        Args:
+          compressed_data_list (list[bytes]): compressed containers.
+
+        Returns:
+          list[bytes]: decompressed data, in order of the compressed containers.
+
+        Raises:
+          ParseError: if the compressed data could not be decompressed.
+        """
+        large_indexes = [
+            index
+            for index, compressed_data in enumerate(compressed_data_list)
+            if len(compressed_data) >= self._threshold
+        ]
+        if self._number_of_workers < 2 or not large_indexes:
+            return [
+                compression.Decompress(compressed_data)
+                for compressed_data in compressed_data_list
+            ]
+
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from multiprocessing import resource_tracker
+        from multiprocessing import shared_memory
+
+        if not self._pool:
+            # Start the resource tracker before the workers, so that the workers
+            # share it instead of each tracking, and releasing, the shared memory
+            # they attach to.
+            resource_tracker.ensure_running()
+
+            self._pool = multiprocessing.Pool(  # pylint: disable=consider-using-with
+                processes=self._number_of_workers
+            )
+
+        shared_memory_size = sum(
+            len(compressed_data_list[index]) for index in large_indexes
+        )
+        shared_memory_block = shared_memory.SharedMemory(
+            create=True, size=shared_memory_size
+        )
+        async_results = {}
+        try:
+            data_offset = 0
+            for index in large_indexes:
+                compressed_data = compressed_data_list[index]
+                data_size = len(compressed_data)
+                shared_memory_block.buf[data_offset : data_offset + data_size] = (
+                    compressed_data
+                )
+                async_results[index] = self._pool.apply_async(
+                    _DecompressSharedMemory,
+                    (shared_memory_block.name, data_offset, data_size),
+                )
+                data_offset += data_size
+
+            decompressed_data_list = []
+            for index, compressed_data in enumerate(compressed_data_list):
+                async_result = async_results.get(index, None)
+                if async_result:
+                    decompressed_data_list.append(None)
+                else:
+                    decompressed_data_list.append(
+                        compression.Decompress(compressed_data)
+                    )
+
+            for index, async_result in async_results.items():
+                decompressed_data_list[index] = async_result.get()
+
+        finally:
+            # Wait for the workers to detach before the shared memory is released.
+            for async_result in async_results.values():
+                async_result.wait()
+
+            shared_memory_block.close()
+            shared_memory_block.unlink()
+
+        return decompressed_data_list
@@ -0,0 +1,473 @@
+"""Content-hash deduplication of the documents of a batch scan."""
+
+import collections
+import copy
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+
+from olecfrc import batch
+from olecfrc import stream_cache
+
+# Size of the reads used to hash the content of a document.
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+def _CollectDocumentWithDigest(source, digest, **kwargs):
+    """Collects VBA from a document and passes along its content digest.
+
+    This function is defined at module level so that it can be used by
+    the workers of a process pool.
+
+    Args:
+      source (str or tuple[str, bytes]): path of the document or name of
+          the document and its data.
+      digest (bytes): content digest of the document.
+      kwargs (dict[str, object]): keyword arguments of CollectDocument.
+
+    Returns:
+      tuple[bytes, DocumentResult]: content digest and result of the document.
+    """
+    return digest, batch.CollectDocument(source, **kwargs)
+
+
+def GetContentDigest(source):
+    """Calculates the content digest of a document.
+
+    The document is read in large buffered reads into a single buffer, so that
+    hashing does not allocate per read.
+
+    Args:
+      source (str or tuple[str, object]): path of the document or name of
+          the document and its data as bytes, memoryview or file-like object.
+
+    Returns:
+      bytes: SHA-256 digest of the content of the document.
+
+    Raises:
+      IOError: if the document could not be read.
+      OSError: if the document could not be read.
+    """
+    data = source[1] if isinstance(source, tuple) else source
+
+    if isinstance(data, (bytearray, bytes, memoryview)):
+        return hashlib.sha256(data).digest()
+
+    hash_context = hashlib.sha256()
+    read_buffer = bytearray(_READ_BUFFER_SIZE)
+    read_buffer_view = memoryview(read_buffer)
+
+    if isinstance(data, (str, os.PathLike)):
+        with open(data, "rb", buffering=0) as file_object:
+            read_count = file_object.readinto(read_buffer)
+            while read_count:
+                hash_context.update(read_buffer_view[:read_count])
+                read_count = file_object.readinto(read_buffer)
+
+    else:
+        file_offset = data.tell()
+        try:
+            read_data = data.read(_READ_BUFFER_SIZE)
+            while read_data:
+                hash_context.update(read_data)
+                read_data = data.read(_READ_BUFFER_SIZE)
+        finally:
+            data.seek(file_offset, os.SEEK_SET)
+
+    return hash_context.digest()
+
+
+class HashStore:
+    """Persistent store of document results per content digest.
+
+    Only results without an error are stored, so that transient errors are not
+    persisted. The results are stored as JSON, so that a hash store from
+    an untrusted source cannot execute code when it is read.
+    """
+
+    # Format of the hash store, as stored in its metadata.
+    FORMAT = "olecfrc-hash-store"
+
+    # Version of the format of the hash store.
+    FORMAT_VERSION = 2
+
+    # Default number of document results written before they are committed.
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE):
+        """Initializes a hash store.
+
+        Args:
+          path (str): path of the SQLite database file of the store.
+          batch_size (Optional[int]): number of document results written before
+              they are committed.
+        """
+        super().__init__()
+        self._batch_size = batch_size
+        self._connection = None
+        self._number_of_uncommitted_results = 0
+        self._path = path
+
+    def _CheckFormat(self):
+        """Checks if the format of an existing store is supported.
+
+        Returns:
+          bool: True if the store is new or its format is supported.
+
+        Raises:
+          sqlite3.Error: if the metadata could not be read.
+        """
+        cursor = self._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+        table_names = {row[0] for row in cursor.fetchall()}
+        if not table_names:
+            return True
+
+        if "metadata" not in table_names:
+            return False
+
+        cursor = self._connection.execute("SELECT key, value FROM metadata")
+        metadata = dict(cursor.fetchall())
+        return (
+            metadata.get("format", None) == self.FORMAT
+            and metadata.get("format_version", None) == f"{self.FORMAT_VERSION:d}"
+        )
+
+    def Close(self):
+        """Closes the store."""
+        if self._connection:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+            self._number_of_uncommitted_results = 0
+
+    def GetDocumentResult(self, digest):
+        """Retrieves a document result by the content digest of the document.
+
+        Args:
+          digest (bytes): content digest of the document.
+
+        Returns:
+          DocumentResult: document result or None if not available or if
+              the stored document result is not valid.
+        """
+        cursor = self._connection.execute(
+            "SELECT document_result FROM document_results WHERE digest = ?", (digest,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        try:
+            document_dict = json.loads(row[0])
+            document_result = batch.DocumentResult(None)
+            document_result.CopyFromDict(document_dict)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+        return document_result
+
+    def Open(self):
+        """Opens the store.
+
+        Returns:
+          bool: True if successful or False if not, such as when the store has
+              an unsupported format.
+        """
+        try:
+            self._connection = sqlite3.connect(self._path)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+
+            if not self._CheckFormat():
+                self._connection.close()
+                self._connection = None
+                return False
+
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                [
+                    ("format", self.FORMAT),
+                    ("format_version", f"{self.FORMAT_VERSION:d}"),
+                ],
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS document_results "
+                "(digest BLOB PRIMARY KEY, document_result TEXT)"
+            )
+            self._connection.commit()
+
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    def WriteDocumentResult(self, digest, document_result):
+        """Writes a document result.
+
+        The document results are committed in batches, and when the store is
+        closed.
+
+        Args:
+          digest (bytes): content digest of the document.
+          document_result (DocumentResult): document result.
+        """
+        if document_result.error:
+            return
+
+        document_dict = document_result.CopyToDict()
+        document_dict["stage_durations"] = []
+        document_dict["stream_cache_statistics"] = {}
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO document_results VALUES (?, ?)",
+            (digest, json.dumps(document_dict)),
+        )
+
+        self._number_of_uncommitted_results += 1
+        if self._number_of_uncommitted_results >= self._batch_size:
+            self._connection.commit()
+            self._number_of_uncommitted_results = 0
+
+
+class DeduplicatingBatchCollector:
+    """Collects VBA from a batch of documents, parsing identical content once.
+
+    The content of each document is hashed before it is handed to a worker.
+    A document with the same content as a document seen earlier in the run, or
+    stored in the hash store, reuses that result instead of being parsed again,
+    where a document with the same content as a document being parsed waits
+    for its result.
+
+    Attributes:
+      number_of_documents (int): number of documents collected.
+      number_of_duplicates (int): number of documents that reused the result
+          of a document with the same content.
+      number_of_hash_store_hits (int): number of duplicates that reused
+          a result from the hash store.
+    """
+
+    # Default maximum number of results kept for reuse in memory.
+    DEFAULT_MAXIMUM_NUMBER_OF_CACHED_RESULTS = 4096
+
+    def __init__(
+        self,
+        hash_store=None,
+        maximum_number_of_cached_results=DEFAULT_MAXIMUM_NUMBER_OF_CACHED_RESULTS,
+        maximum_number_of_cached_streams=0,
+        maximum_stream_cache_size=stream_cache.StreamCache.DEFAULT_MAXIMUM_SIZE,
+        memory_profiling=False,
+        number_of_workers=1,
+        triage=False,
+    ):
+        """Initializes a deduplicating batch collector.
+
+        Args:
+          hash_store (Optional[HashStore]): persistent store of document results,
+              where None represents deduplication within the run only.
+          maximum_number_of_cached_results (Optional[int]): maximum number of
+              results kept for reuse in memory, where the least recently used
+              results are evicted first.
+          maximum_number_of_cached_streams (Optional[int]): maximum number of
+              parsed stream results cached by each worker across documents,
+              where 0 represents no stream cache.
+          maximum_stream_cache_size (Optional[int]): maximum total size of
+              the stream data of which parsed results are cached by each worker.
+          memory_profiling (Optional[bool]): True if the memory usage of
+              the collection of each document should be profiled.
+          number_of_workers (Optional[int]): number of worker processes, where
+              1 represents collecting in the current process.
+          triage (Optional[bool]): True if only the headers of the streams should
+              be read, to detect VBA projects without reading their modules.
+        """
+        super().__init__()
+        self._cached_results = collections.OrderedDict()
+        self._collect_arguments = {
+            "maximum_number_of_cached_streams": maximum_number_of_cached_streams,
+            "maximum_stream_cache_size": maximum_stream_cache_size,
+            "memory_profiling": memory_profiling,
+            "triage": triage,
+        }
+        self._hash_store = hash_store
+        self._maximum_number_of_cached_results = maximum_number_of_cached_results
+        self._number_of_workers = number_of_workers
+        # Names of the documents waiting for the result of a document with
+        # the same content, per content digest of the document being parsed.
+        self._pending_names = {}
+
+        self.number_of_documents = 0
+        self.number_of_duplicates = 0
+        self.number_of_hash_store_hits = 0
+
+    def _CacheResult(self, digest, document_result):
+        """Caches a document result for reuse.
+
+        Args:
+          digest (bytes): content digest of the document.
+          document_result (DocumentResult): document result.
+        """
+        self._cached_results[digest] = document_result
+        self._cached_results.move_to_end(digest)
+        if len(self._cached_results) > self._maximum_number_of_cached_results:
+            self._cached_results.popitem(last=False)
+
+    def _GetReusableResult(self, digest):
+        """Retrieves a result of a document with the same content.
+
+        Args:
+          digest (bytes): content digest of the document.
+
+        Returns:
+          DocumentResult: document result or None if not available.
+        """
+        document_result = self._cached_results.get(digest, None)
+        if document_result:
+            self._cached_results.move_to_end(digest)
+            return document_result
+
+        if self._hash_store:
+            document_result = self._hash_store.GetDocumentResult(digest)
+            if document_result:
+                self.number_of_hash_store_hits += 1
+                self._CacheResult(digest, document_result)
+
+        return document_result
+
+    def _HandleResult(self, digest, document_result):
+        """Handles the result of a parsed document.
+
+        Args:
+          digest (bytes): content digest of the document or None if
+              the content could not be hashed.
+          document_result (DocumentResult): document result.
+
+        Yields:
+          DocumentResult: result of the document and of the documents with
+              the same content that were waiting for it.
+        """
+        self.number_of_documents += 1
+        yield document_result
+
+        if digest is None:
+            return
+
+        self._CacheResult(digest, document_result)
+        if self._hash_store:
+            self._hash_store.WriteDocumentResult(digest, document_result)
+
+        for name in self._pending_names.pop(digest, []):
+            yield self._ReuseResult(document_result, name)
+
+    def _ReuseResult(self, document_result, name):
+        """Reuses the result of a document with the same content.
+
+        Args:
+          document_result (DocumentResult): result of the document with the same
+              content.
+          name (str): path or name of the document.
+
+        Returns:
+          DocumentResult: document result.
+        """
+        self.number_of_documents += 1
+        self.number_of_duplicates += 1
+
+        reused_document_result = copy.copy(document_result)
+        reused_document_result.duplicate_of = document_result.source
+        reused_document_result.memory_usage = []
+        reused_document_result.source = name
+        reused_document_result.stage_durations = []
+        reused_document_result.stream_cache_statistics = {}
+        return reused_document_result
+
+    def Collect(self, sources):
+        """Collects VBA from documents.
+
+        Args:
+          sources (iterable[str|tuple[str, object]]): paths of the documents or
+              names of the documents and their data as bytes, memoryview or
+              file-like object.
+
+        Yields:
+          DocumentResult: document result, in order of completion.
+        """
+        pool = None
+        if self._number_of_workers > 1:
+            import multiprocessing  # pylint: disable=import-outside-toplevel
+
+            pool = multiprocessing.Pool(  # pylint: disable=consider-using-with
+                processes=self._number_of_workers
+            )
+
+        # Bound the number of documents handed to the workers, so that sources
+        # are hashed only slightly ahead of the workers.
+        maximum_number_in_flight = self._number_of_workers * 4
+        number_in_flight = 0
+        results_queue = queue.SimpleQueue()
+
+        try:
+            for source in sources:
+                name = source[0] if isinstance(source, tuple) else source
+
+                try:
+                    digest = GetContentDigest(source)
+                except (IOError, OSError):
+                    # Collect the document without deduplication, which reports
+                    # the error.
+                    digest = None
+
+                if digest is not None:
+                    if digest in self._pending_names:
+                        self._pending_names[digest].append(name)
+                        continue
+
+                    document_result = self._GetReusableResult(digest)
+                    if document_result:
+                        yield self._ReuseResult(document_result, name)
+                        continue
+
+                    self._pending_names[digest] = []
+
+                if not pool:
+                    document_result = batch.CollectDocument(
+                        source, **self._collect_arguments
+                    )
+                    yield from self._HandleResult(digest, document_result)
+                    continue
+
+                pool.apply_async(
+                    _CollectDocumentWithDigest,
+                    (batch.GetPicklableSource(source), digest),
+                    self._collect_arguments,
+                    callback=results_queue.put,
+                    error_callback=results_queue.put,
+                )
+                number_in_flight += 1
+
+                while number_in_flight >= maximum_number_in_flight or (
+                    number_in_flight and not results_queue.empty()
+                ):
+                    result = results_queue.get()
+                    number_in_flight -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    yield from self._HandleResult(*result)
+
+            while number_in_flight:
+                result = results_queue.get()
+                number_in_flight -= 1
+                if isinstance(result, BaseException):
+                    raise result
+
+                yield from self._HandleResult(*result)
+
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
@@ -5,5 +5,9 @@ class Error(Exception):
     """The error interface."""
 
 
+class BackpressureError(Error):
+    """Error that is raised when a request is rejected because a queue is full."""
+
+
 class ParseError(Error):
     """Error that is raised when value data cannot be parsed."""
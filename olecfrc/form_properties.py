@@ -0,0 +1,282 @@
+"""Microsoft Forms (MS-OFORMS) property data of form controls.
+
+The properties of a form control, and of its site in the form, are stored in
+a data block followed by an extra data block, where a property mask indicates
+which properties are stored. Since the layout of these blocks depends on
+the property mask, they cannot be described by a structure definition and are
+read by this module instead.
+"""
+
+import struct
+
+from olecfrc import errors
+
+# Property value type of a string, of which the size and compression flag are
+# stored in the data block and the string in the extra data block.
+PROPERTY_TYPE_STRING = "string"
+
+# Structures of property values that are stored in the data block.
+_DATA_BLOCK_VALUE_STRUCTS = {
+    "int16": struct.Struct("<h"),
+    "int32": struct.Struct("<i"),
+    "uint8": struct.Struct("<B"),
+    "uint16": struct.Struct("<H"),
+    "uint32": struct.Struct("<I"),
+}
+
+# Structures of property values that are stored in the extra data block,
+# such as the position of a control as left and top, or its size as width and
+# height, in HIMETRIC units.
+_EXTRA_DATA_BLOCK_VALUE_STRUCTS = {
+    "position": struct.Struct("<ii"),
+    "size": struct.Struct("<II"),
+}
+
+_STRING_SIZE = struct.Struct("<I")
+
+# Properties of a form, which are the bit in the property mask, the name and
+# the value type, in order of storage. Only the properties that precede
+# the boolean properties are defined, since the other properties are not used.
+FORM_PROPERTIES = (
+    (1, "back_color", "uint32"),
+    (2, "fore_color", "uint32"),
+    (3, "next_available_identifier", "uint32"),
+    (6, "boolean_properties", "uint32"),
+)
+
+# Bit of the form boolean properties that indicates the form does not contain
+# a site class information table.
+FORM_FLAG_DONT_SAVE_CLASS_TABLE = 0x00008000
+
+# Property mask bits of a form that indicate which stream data is stored.
+FORM_PROPERTY_MOUSE_ICON = 0x00008000
+FORM_PROPERTY_FONT = 0x00100000
+FORM_PROPERTY_PICTURE = 0x00200000
+
+# Properties of a site of a control in a form.
+SITE_PROPERTIES = (
+    (0, "name", PROPERTY_TYPE_STRING),
+    (1, "tag", PROPERTY_TYPE_STRING),
+    (2, "identifier", "int32"),
+    (3, "help_context_identifier", "int32"),
+    (4, "bit_flags", "uint32"),
+    (5, "object_stream_size", "uint32"),
+    (6, "tab_index", "int16"),
+    (7, "clsid_cache_index", "uint16"),
+    (8, "position", "position"),
+    (9, "group_identifier", "uint16"),
+    (11, "control_tip_text", PROPERTY_TYPE_STRING),
+    (12, "runtime_license_key", PROPERTY_TYPE_STRING),
+    (13, "control_source", PROPERTY_TYPE_STRING),
+    (14, "row_source", PROPERTY_TYPE_STRING),
+)
+
+# Properties of a command button.
+COMMAND_BUTTON_PROPERTIES = (
+    (0, "fore_color", "uint32"),
+    (1, "back_color", "uint32"),
+    (2, "various_property_bits", "uint32"),
+    (3, "caption", PROPERTY_TYPE_STRING),
+    (4, "picture_position", "uint32"),
+    (5, "size", "size"),
+    (6, "mouse_pointer", "uint8"),
+    (7, "picture", "uint16"),
+    (8, "accelerator", "uint16"),
+    (10, "mouse_icon", "uint16"),
+)
+
+# Property mask bits of the pictures of a command button, in order of storage
+# in the stream data.
+COMMAND_BUTTON_PICTURES = (7, 10)
+
+# Properties of a label.
+LABEL_PROPERTIES = (
+    (0, "fore_color", "uint32"),
+    (1, "back_color", "uint32"),
+    (2, "various_property_bits", "uint32"),
+    (3, "caption", PROPERTY_TYPE_STRING),
+    (4, "picture_position", "uint32"),
+    (5, "size", "size"),
+    (6, "mouse_pointer", "uint8"),
+    (7, "border_color", "uint32"),
+    (8, "border_style", "uint16"),
+    (9, "special_effect", "uint16"),
+    (10, "picture", "uint16"),
+    (11, "accelerator", "uint16"),
+    (12, "mouse_icon", "uint16"),
+)
+
+# Property mask bits of the pictures of a label, in order of storage in
+# the stream data.
+LABEL_PICTURES = (10, 12)
+
+# Properties of a MorphData control, which is the storage format of check
+# boxes, combo boxes, list boxes, option buttons, text boxes and toggle buttons.
+MORPH_DATA_PROPERTIES = (
+    (0, "various_property_bits", "uint32"),
+    (1, "back_color", "uint32"),
+    (2, "fore_color", "uint32"),
+    (3, "maximum_length", "uint32"),
+    (4, "border_style", "uint8"),
+    (5, "scroll_bars", "uint8"),
+    (6, "display_style", "uint8"),
+    (7, "mouse_pointer", "uint8"),
+    (8, "size", "size"),
+    (9, "password_character", "uint16"),
+    (10, "list_width", "uint32"),
+    (11, "bound_column", "uint16"),
+    (12, "text_column", "int16"),
+    (13, "column_count", "int16"),
+    (14, "list_rows", "uint16"),
+    (15, "number_of_column_info", "uint16"),
+    (16, "match_entry", "uint8"),
+    (17, "list_style", "uint8"),
+    (18, "show_drop_button_when", "uint8"),
+    (20, "drop_button_style", "uint8"),
+    (21, "multi_select", "uint8"),
+    (22, "value", PROPERTY_TYPE_STRING),
+    (23, "caption", PROPERTY_TYPE_STRING),
+    (24, "picture_position", "uint32"),
+    (25, "border_color", "uint32"),
+    (26, "special_effect", "uint32"),
+    (27, "mouse_icon", "uint16"),
+    (28, "picture", "uint16"),
+    (29, "accelerator", "uint16"),
+    (32, "group_name", PROPERTY_TYPE_STRING),
+)
+
+# Property mask bits of the pictures of a MorphData control, in order of
+# storage in the stream data.
+MORPH_DATA_PICTURES = (27, 28)
+
+# Properties of the text properties, which contain the font of a control.
+TEXT_PROPERTIES = (
+    (0, "font_name", PROPERTY_TYPE_STRING),
+    (1, "font_effects", "uint32"),
+    (2, "font_height", "uint32"),
+    (4, "font_character_set", "uint8"),
+    (5, "font_pitch_and_family", "uint8"),
+    (6, "paragraph_align", "uint8"),
+    (7, "font_weight", "uint16"),
+)
+
+
+def _AlignOffset(offset, base_offset, alignment):
+    """Aligns an offset relative to a base offset.
+
+    Args:
+      offset (int): offset.
+      base_offset (int): base offset, such as the start of the data block.
+      alignment (int): alignment in bytes.
+
+    Returns:
+      int: aligned offset.
+    """
+    remainder = (offset - base_offset) % alignment
+    if remainder:
+        offset += alignment - remainder
+    return offset
+
+
+def DecodeString(data, size_with_compression_flag):
+    """Decodes a string with a size and compression flag.
+
+    Args:
+      data (bytes): string data.
+      size_with_compression_flag (int): size of the string, where the upper bit
+          indicates the string is stored in a single byte per character instead
+          of UTF-16 little-endian.
+
+    Returns:
+      str: decoded string.
+    """
+    if size_with_compression_flag & 0x80000000:
+        return data.decode("cp1252", errors="replace")
+    return data.decode("utf-16-le", errors="replace")
+
+
+def ReadPropertyData(data, data_offset, end_offset, property_mask, properties):
+    """Reads the data block and extra data block of properties.
+
+    Values in the data block are aligned to their size, and the data block and
+    the strings in the extra data block are padded to a multiple of 4 bytes,
+    relative to the start of the data block.
+
+    Args:
+      data (bytes): data.
+      data_offset (int): offset of the data block in the data.
+      end_offset (int): offset in the data where the property data ends.
+      property_mask (int): property mask, which indicates which properties are
+          stored.
+      properties (tuple[tuple[int, str, str]]): bit in the property mask, name
+          and value type of the properties, in order of storage.
+
+    Returns:
+      tuple[dict[str, object], int]: property values per name and offset in
+          the data that follows the extra data block.
+
+    Raises:
+      ParseError: if the property data could not be read.
+    """
+    end_offset = min(end_offset, len(data))
+
+    values = {}
+    string_sizes = {}
+
+    block_offset = data_offset
+    for bit, name, value_type in properties:
+        if not property_mask & (1 << bit):
+            continue
+
+        if value_type == PROPERTY_TYPE_STRING:
+            value_struct = _STRING_SIZE
+        else:
+            value_struct = _DATA_BLOCK_VALUE_STRUCTS.get(value_type, None)
+            if not value_struct:
+                continue
+
+        block_offset = _AlignOffset(block_offset, data_offset, value_struct.size)
+        if block_offset + value_struct.size > end_offset:
+            raise errors.ParseError(
+                f"Property: {name:s} at offset: 0x{block_offset:08x} exceeds data"
+            )
+
+        (value,) = value_struct.unpack_from(data, block_offset)
+        block_offset += value_struct.size
+
+        if value_type == PROPERTY_TYPE_STRING:
+            string_sizes[name] = value
+        else:
+            values[name] = value
+
+    block_offset = _AlignOffset(block_offset, data_offset, 4)
+
+    for bit, name, value_type in properties:
+        if not property_mask & (1 << bit):
+            continue
+
+        if value_type == PROPERTY_TYPE_STRING:
+            string_size = string_sizes[name] & 0x7FFFFFFF
+            if block_offset + string_size > end_offset:
+                raise errors.ParseError(
+                    f"Property: {name:s} at offset: 0x{block_offset:08x} exceeds "
+                    f"data"
+                )
+
+            values[name] = DecodeString(
+                data[block_offset : block_offset + string_size], string_sizes[name]
+            )
+            block_offset = _AlignOffset(block_offset + string_size, data_offset, 4)
+
+        elif value_type in _EXTRA_DATA_BLOCK_VALUE_STRUCTS:
+            value_struct = _EXTRA_DATA_BLOCK_VALUE_STRUCTS[value_type]
+            if block_offset + value_struct.size > end_offset:
+                raise errors.ParseError(
+                    f"Property: {name:s} at offset: 0x{block_offset:08x} exceeds "
+                    f"data"
+                )
+
+            values[name] = value_struct.unpack_from(data, block_offset)
+            block_offset += value_struct.size
+
+    return values, block_offset
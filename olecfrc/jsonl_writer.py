@@ -0,0 +1,125 @@
+"""JSON Lines writer of Visual Basic for Applications (VBA) collection results."""
+
+import json
+import os
+
+import olecfrc
+
+from olecfrc import batch
+
+
+class JSONLWriter:
+    """JSON Lines writer of VBA collection results.
+
+    The first line of the file is a header that describes the results, such as
+    the shards of the scan, followed by a line per document result.
+    """
+
+    # Size of the reads used to find the end of the last complete line.
+    _READ_BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, path, append=False, shards=None):
+        """Initializes a JSON Lines writer.
+
+        Args:
+          path (str): path of the JSON Lines file.
+          append (Optional[bool]): True if results should be appended to
+              an existing file, such as when a scan is resumed, where a trailing
+              partial line of the file is removed first.
+          shards (Optional[list[Shard]]): shards of the scan the results are of,
+              where None represents an unsharded scan.
+        """
+        super().__init__()
+        self._append = append
+        self._file_object = None
+        self._path = path
+        self._shards = shards or []
+
+    def _TruncatePartialLine(self):
+        """Truncates a trailing partial line of an existing file.
+
+        A partial line remains when a scan was interrupted while writing
+        a record, and would corrupt the record appended after it.
+
+        Raises:
+          OSError: if the file could not be truncated.
+        """
+        try:
+            file_object = open(self._path, "r+b")  # pylint: disable=consider-using-with
+        except FileNotFoundError:
+            return
+
+        with file_object:
+            end_offset = file_object.seek(0, os.SEEK_END)
+            while end_offset > 0:
+                read_offset = max(end_offset - self._READ_BUFFER_SIZE, 0)
+                file_object.seek(read_offset, os.SEEK_SET)
+                data = file_object.read(end_offset - read_offset)
+
+                newline_offset = data.rfind(b"\n")
+                if newline_offset >= 0:
+                    end_offset = read_offset + newline_offset + 1
+                    break
+
+                end_offset = read_offset
+
+            file_object.truncate(end_offset)
+
+    def Close(self):
+        """Closes the writer."""
+        if self._file_object:
+            self._file_object.close()
+            self._file_object = None
+
+    def Flush(self):
+        """Flushes the written results to the file."""
+        self._file_object.flush()
+        os.fsync(self._file_object.fileno())
+
+    def Open(self):
+        """Opens the writer.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        header = {
+            "record_type": "header",
+            "format": batch.RESULTS_FORMAT,
+            "format_version": batch.RESULTS_FORMAT_VERSION,
+            "olecfrc_version": olecfrc.__version__,
+            "shards": [f"{shard!s}" for shard in self._shards],
+        }
+        try:
+            if self._append:
+                self._TruncatePartialLine()
+
+            self._file_object = open(  # pylint: disable=consider-using-with
+                self._path, "a" if self._append else "w", encoding="utf-8"
+            )
+            if not self._file_object.tell():
+                self.WriteRecord(header)
+
+        except OSError:
+            self.Close()
+            return False
+
+        return True
+
+    def WriteDocumentResult(self, document_result):
+        """Writes a document result.
+
+        Args:
+          document_result (DocumentResult): document result.
+        """
+        record = {"record_type": "document"}
+        record.update(document_result.CopyToDict())
+        self.WriteRecord(record)
+
+    def WriteRecord(self, record):
+        """Writes a record.
+
+        Args:
+          record (dict[str, object]): record, which can be serialized as JSON.
+        """
+        self._file_object.write(json.dumps(record))
+        self._file_object.write("\n")
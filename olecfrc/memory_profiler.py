@@ -0,0 +1,181 @@
+"""Memory profiling of the collection of Visual Basic for Applications (VBA)."""
+
+import contextlib
+import statistics
+import tracemalloc
+
+
+class StageMemoryUsage:
+    """Memory usage of a stage of the collection.
+
+    Attributes:
+      name (str): name of the stage.
+      peak_size (int): peak size of the memory allocated during the stage,
+          relative to the start of the stage.
+      size (int): size of the memory allocated during the stage that was not
+          released at the end of the stage.
+      top_allocations (list[tuple[str, int]]): source locations that allocated
+          the most memory during the stage, as "filename:line_number", and
+          the size they allocated.
+    """
+
+    def __init__(self, name):
+        """Initializes a stage memory usage.
+
+        Args:
+          name (str): name of the stage.
+        """
+        super().__init__()
+        self.name = name
+        self.peak_size = 0
+        self.size = 0
+        self.top_allocations = []
+
+
+class MemoryProfiler:
+    """Profiles the memory usage of stages of the collection with tracemalloc.
+
+    Only memory allocated through the Python memory allocators is traced, such
+    as the bytes objects returned by pyolecf, but not memory that libolecf
+    allocates internally.
+
+    Attributes:
+      stages (list[StageMemoryUsage]): memory usage of the completed stages, in
+          order of completion.
+    """
+
+    # Filters of allocations that are not attributed to a stage.
+    _SNAPSHOT_FILTERS = [
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ]
+
+    def __init__(self, number_of_allocation_sites=5):
+        """Initializes a memory profiler.
+
+        Args:
+          number_of_allocation_sites (Optional[int]): number of top allocation
+              sites to record per stage, where 0 represents none.
+        """
+        super().__init__()
+        self._number_of_allocation_sites = number_of_allocation_sites
+        self._started_tracing = False
+        # Peak sizes, as traced memory, of the stages being profiled.
+        self._peak_sizes = []
+
+        self.stages = []
+
+    def _TakeSnapshot(self):
+        """Takes a snapshot of the traced allocations.
+
+        Returns:
+          tracemalloc.Snapshot: snapshot or None if no allocation sites are
+              recorded.
+        """
+        if not self._number_of_allocation_sites:
+            return None
+
+        return tracemalloc.take_snapshot().filter_traces(self._SNAPSHOT_FILTERS)
+
+    @contextlib.contextmanager
+    def ProfileStage(self, name):
+        """Profiles the memory usage of a stage.
+
+        Stages can be nested, where the peak size of a stage includes that of
+        its nested stages.
+
+        Args:
+          name (str): name of the stage.
+
+        Yields:
+          StageMemoryUsage: memory usage of the stage, which is set when
+              the stage completes.
+        """
+        stage_memory_usage = StageMemoryUsage(name)
+
+        start_snapshot = self._TakeSnapshot()
+
+        # Retain the peak of the enclosing stage before the peak is reset.
+        traced_size, traced_peak_size = tracemalloc.get_traced_memory()
+        if self._peak_sizes:
+            self._peak_sizes[-1] = max(self._peak_sizes[-1], traced_peak_size)
+
+        tracemalloc.reset_peak()
+        self._peak_sizes.append(traced_size)
+        try:
+            yield stage_memory_usage
+
+        finally:
+            end_size, traced_peak_size = tracemalloc.get_traced_memory()
+            peak_size = max(self._peak_sizes.pop(), traced_peak_size)
+            if self._peak_sizes:
+                self._peak_sizes[-1] = max(self._peak_sizes[-1], peak_size)
+
+            stage_memory_usage.peak_size = peak_size - traced_size
+            stage_memory_usage.size = end_size - traced_size
+
+            if start_snapshot:
+                end_snapshot = self._TakeSnapshot()
+                statistics_diff = end_snapshot.compare_to(start_snapshot, "lineno")
+                stage_memory_usage.top_allocations = [
+                    (
+                        f"{statistic.traceback[0].filename:s}:"
+                        f"{statistic.traceback[0].lineno:d}",
+                        statistic.size_diff,
+                    )
+                    for statistic in statistics_diff[: self._number_of_allocation_sites]
+                    if statistic.size_diff > 0
+                ]
+
+            self.stages.append(stage_memory_usage)
+
+    def Start(self):
+        """Starts tracing memory allocations, if not already tracing."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def Stop(self):
+        """Stops tracing memory allocations, if started by the profiler."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def GetOutliers(memory_usages, factor=2.0, maximum_number_of_outliers=10):
+    """Retrieves the documents with an outlying peak memory usage.
+
+    Args:
+      memory_usages (list[tuple[str, list[StageMemoryUsage]]]): paths or names
+          of the documents and the memory usage of the stages of their
+          collection.
+      factor (Optional[float]): factor of the median peak size from which
+          the peak size of a document is considered an outlier.
+      maximum_number_of_outliers (Optional[int]): maximum number of outliers.
+
+    Returns:
+      list[tuple[str, StageMemoryUsage]]: paths or names of the documents and
+          the memory usage of their document stage, in order of decreasing peak
+          size.
+    """
+    document_usages = [
+        (source, stage_memory_usage)
+        for source, stages in memory_usages
+        for stage_memory_usage in stages
+        if stage_memory_usage.name == "document"
+    ]
+    if not document_usages:
+        return []
+
+    median_peak_size = statistics.median(
+        stage_memory_usage.peak_size for _, stage_memory_usage in document_usages
+    )
+    document_usages.sort(
+        key=lambda document_usage: document_usage[1].peak_size, reverse=True
+    )
+    return [
+        (source, stage_memory_usage)
+        for source, stage_memory_usage in document_usages[:maximum_number_of_outliers]
+        if stage_memory_usage.peak_size >= factor * median_peak_size
+    ]
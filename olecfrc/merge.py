@@ -0,0 +1,324 @@
+"""Merging of the results of the shards of a scan."""
+
+import json
+import sqlite3
+
+from olecfrc import batch
+from olecfrc import errors
+from olecfrc import jsonl_writer
+from olecfrc import sharding
+from olecfrc import sqlite_writer
+
+# Signature of a SQLite database file.
+SQLITE_SIGNATURE = b"SQLite format 3\x00"
+
+
+class ResultsMerger:
+    """Merges the JSON Lines or SQLite results of the shards of a scan.
+
+    Documents are considered duplicates when they have the same source, for
+    example when a shard was scanned more than once, where the first result is
+    kept.
+
+    Attributes:
+      number_of_documents (int): number of documents in the merged results.
+      number_of_duplicates (int): number of duplicate documents that were
+          skipped.
+      shards (list[Shard]): shards of the merged results, which can contain
+          the same shard more than once.
+    """
+
+    def __init__(self):
+        """Initializes a results merger."""
+        super().__init__()
+        self.number_of_documents = 0
+        self.number_of_duplicates = 0
+        self.shards = []
+
+    def _GetFormat(self, path):
+        """Determines the format of a results file.
+
+        Args:
+          path (str): path of the results file.
+
+        Returns:
+          str: format of the results file, either "jsonl" or "sqlite".
+
+        Raises:
+          ParseError: if the format of the results file is not supported.
+        """
+        with open(path, "rb") as file_object:
+            signature = file_object.read(len(SQLITE_SIGNATURE))
+
+        if signature == SQLITE_SIGNATURE:
+            return "sqlite"
+
+        if signature.startswith(b"{"):
+            return "jsonl"
+
+        raise errors.ParseError(f"Unsupported results file: {path:s}")
+
+    def _GetShards(self, shards_string):
+        """Retrieves shards from their string representation.
+
+        Args:
+          shards_string (list[str]): shards as "I/N".
+
+        Returns:
+          list[Shard]: shards.
+
+        Raises:
+          ParseError: if a shard is not supported.
+        """
+        try:
+            return [sharding.Shard.FromString(shard) for shard in shards_string]
+        except ValueError as exception:
+            raise errors.ParseError(f"{exception!s}")
+
+    def _GetUniqueShards(self):
+        """Retrieves the unique shards of the merged results.
+
+        Returns:
+          list[Shard]: unique shards, in order of index.
+        """
+        return sorted(
+            set(self.shards),
+            key=lambda shard: (shard.number_of_shards, shard.index),
+        )
+
+    def _MergeJSONL(self, input_paths, output_path):
+        """Merges JSON Lines results.
+
+        Args:
+          input_paths (list[str]): paths of the JSON Lines results files.
+          output_path (str): path of the merged JSON Lines results file.
+
+        Raises:
+          ParseError: if a results file is not supported.
+        """
+        for path in input_paths:
+            with open(path, "r", encoding="utf-8") as file_object:
+                header = self._ReadJSONLRecord(path, file_object.readline())
+
+            if (
+                header.get("record_type", None) != "header"
+                or header.get("format", None) != batch.RESULTS_FORMAT
+            ):
+                raise errors.ParseError(f"Missing results header in: {path:s}")
+
+            self.shards.extend(self._GetShards(header.get("shards", None) or []))
+
+        sources = set()
+
+        results_writer = jsonl_writer.JSONLWriter(
+            output_path, shards=self._GetUniqueShards()
+        )
+        if not results_writer.Open():
+            raise IOError(f"Unable to open results file: {output_path:s}")
+
+        try:
+            for path in input_paths:
+                with open(path, "r", encoding="utf-8") as file_object:
+                    file_object.readline()
+
+                    for line in file_object:
+                        record = self._ReadJSONLRecord(path, line)
+                        if record.get("record_type", None) != "document":
+                            continue
+
+                        source = record.get("source", None)
+                        if source in sources:
+                            self.number_of_duplicates += 1
+                            continue
+
+                        sources.add(source)
+                        results_writer.WriteRecord(record)
+                        self.number_of_documents += 1
+
+        finally:
+            results_writer.Close()
+
+    def _MergeSQLite(self, input_paths, output_path):
+        """Merges SQLite results.
+
+        The rows of each shard database are copied with INSERT ... SELECT, where
+        the identifiers of the documents and project roots are offset past
+        those already in the merged database.
+
+        Args:
+          input_paths (list[str]): paths of the SQLite results databases.
+          output_path (str): path of the merged SQLite results database.
+
+        Raises:
+          ParseError: if a results database is not supported.
+        """
+        for path in input_paths:
+            connection = sqlite3.connect(f"file:{path:s}?mode=ro", uri=True)
+            try:
+                cursor = connection.execute(
+                    "SELECT value FROM metadata WHERE key = 'shards'"
+                )
+                row = cursor.fetchone()
+            except sqlite3.Error:
+                raise errors.ParseError(f"Missing results metadata in: {path:s}")
+            finally:
+                connection.close()
+
+            if row and row[0]:
+                self.shards.extend(self._GetShards(row[0].split(",")))
+
+        results_writer = sqlite_writer.SQLiteWriter(
+            output_path, shards=self._GetUniqueShards()
+        )
+        if not results_writer.Open():
+            raise IOError(f"Unable to open results database: {output_path:s}")
+        results_writer.Close()
+
+        connection = sqlite3.connect(output_path, isolation_level=None)
+        try:
+            column_names_per_table = {}
+            for table_name in (
+                "documents",
+                "project_roots",
+                "project_keys",
+                "form_controls",
+                "modules",
+                "project_strings",
+            ):
+                cursor = connection.execute(f"PRAGMA table_info({table_name:s})")
+                column_names_per_table[table_name] = [row[1] for row in cursor]
+
+            for path in input_paths:
+                connection.execute("ATTACH DATABASE ? AS shard", (path,))
+                try:
+                    connection.execute("BEGIN")
+                    self._MergeSQLiteShard(connection, column_names_per_table)
+                    connection.execute("COMMIT")
+
+                except sqlite3.Error as exception:
+                    connection.execute("ROLLBACK")
+                    raise errors.ParseError(
+                        f"Unable to merge: {path:s} with error: {exception!s}"
+                    )
+
+                finally:
+                    connection.execute("DETACH DATABASE shard")
+
+        finally:
+            connection.close()
+
+    def _MergeSQLiteShard(self, connection, column_names_per_table):
+        """Merges the SQLite results of the attached shard database.
+
+        Args:
+          connection (sqlite3.Connection): connection to the merged database,
+              with the shard database attached as "shard".
+          column_names_per_table (dict[str, list[str]]): names of the columns
+              per table.
+        """
+        cursor = connection.execute("SELECT COALESCE(MAX(id), 0) FROM main.documents")
+        document_offset = cursor.fetchone()[0]
+        cursor = connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM main.project_roots"
+        )
+        project_root_offset = cursor.fetchone()[0]
+
+        offsets = {
+            "document_id": document_offset,
+            "id": None,
+            "project_root_id": project_root_offset,
+        }
+
+        for table_name, column_names in column_names_per_table.items():
+            offsets["id"] = (
+                document_offset if table_name == "documents" else project_root_offset
+            )
+            select_expressions = ", ".join(
+                [
+                    (
+                        f"{column_name:s} + {offsets[column_name]:d}"
+                        if column_name in offsets
+                        else column_name
+                    )
+                    for column_name in column_names
+                ]
+            )
+
+            if table_name == "documents":
+                # Keep the first document per source that is not in the merged
+                # database yet.
+                where_clause = (
+                    "id IN (SELECT MIN(id) FROM shard.documents GROUP BY source) "
+                    "AND source NOT IN (SELECT source FROM main.documents)"
+                )
+            elif table_name == "project_roots":
+                where_clause = (
+                    f"document_id + {document_offset:d} IN "
+                    f"(SELECT id FROM main.documents WHERE id > {document_offset:d})"
+                )
+            else:
+                where_clause = (
+                    f"project_root_id + {project_root_offset:d} IN "
+                    f"(SELECT id FROM main.project_roots "
+                    f"WHERE id > {project_root_offset:d})"
+                )
+
+            cursor = connection.execute(
+                f"INSERT INTO main.{table_name:s} SELECT {select_expressions:s} "
+                f"FROM shard.{table_name:s} WHERE {where_clause:s}"
+            )
+
+            if table_name == "documents":
+                number_of_documents = cursor.rowcount
+                cursor = connection.execute("SELECT COUNT(*) FROM shard.documents")
+                self.number_of_documents += number_of_documents
+                self.number_of_duplicates += cursor.fetchone()[0] - number_of_documents
+
+    def _ReadJSONLRecord(self, path, line):
+        """Reads a JSON Lines record.
+
+        Args:
+          path (str): path of the JSON Lines results file.
+          line (str): line that contains the record.
+
+        Returns:
+          dict[str, object]: record.
+
+        Raises:
+          ParseError: if the record could not be read.
+        """
+        try:
+            record = json.loads(line)
+        except ValueError as exception:
+            raise errors.ParseError(
+                f"Unable to read record in: {path:s} with error: {exception!s}"
+            )
+
+        if not isinstance(record, dict):
+            raise errors.ParseError(f"Unsupported record in: {path:s}")
+
+        return record
+
+    def Merge(self, input_paths, output_path):
+        """Merges results files of the same format.
+
+        Args:
+          input_paths (list[str]): paths of the JSON Lines or SQLite results
+              files.
+          output_path (str): path of the merged results file, which is written
+              in the format of the input files.
+
+        Raises:
+          IOError: if the merged results file could not be written.
+          OSError: if the merged results file could not be written.
+          ParseError: if a results file is not supported or the results files
+              are of different formats.
+        """
+        results_formats = {self._GetFormat(path) for path in input_paths}
+        if len(results_formats) != 1:
+            raise errors.ParseError("Unable to merge results of different formats.")
+
+        if results_formats.pop() == "sqlite":
+            self._MergeSQLite(input_paths, output_path)
+        else:
+            self._MergeJSONL(input_paths, output_path)
@@ -0,0 +1,316 @@
+"""Metrics of the collection in the Prometheus text exposition format."""
+
+import bisect
+import os
+import tempfile
+import threading
+
+
+def _FormatLabels(label_names, label_values, extra_label=None):
+    """Formats labels.
+
+    Args:
+      label_names (tuple[str]): names of the labels.
+      label_values (tuple[str]): values of the labels.
+      extra_label (Optional[tuple[str, str]]): name and value of an additional
+          label, such as the upper bound of a histogram bucket.
+
+    Returns:
+      str: formatted labels, such as '{stage="modules"}', or an empty string if
+          there are no labels.
+    """
+    labels = list(zip(label_names, label_values))
+    if extra_label:
+        labels.append(extra_label)
+
+    if not labels:
+        return ""
+
+    formatted_labels = ",".join(
+        [f'{name:s}="{_EscapeLabelValue(value):s}"' for name, value in labels]
+    )
+    return f"{{{formatted_labels:s}}}"
+
+
+def _EscapeLabelValue(value):
+    """Escapes a label value.
+
+    Args:
+      value (str): label value.
+
+    Returns:
+      str: escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _FormatValue(value):
+    """Formats a sample value.
+
+    Args:
+      value (float|int): sample value.
+
+    Returns:
+      str: formatted sample value.
+    """
+    if isinstance(value, int):
+        return f"{value:d}"
+
+    return f"{value!r}"
+
+
+class Counter:
+    """Counter, a value that only increases.
+
+    A counter is not thread-safe by itself, where the registry that contains
+    it serializes the updates.
+    """
+
+    TYPE = "counter"
+
+    def __init__(self, name, description, label_names=()):
+        """Initializes a counter.
+
+        Args:
+          name (str): name of the metric.
+          description (str): description of the metric.
+          label_names (Optional[tuple[str]]): names of the labels.
+        """
+        super().__init__()
+        self._values = {}
+        self.description = description
+        self.label_names = label_names
+        self.name = name
+
+    def GetSamples(self):
+        """Retrieves the samples of the counter.
+
+        Yields:
+          str: sample in text exposition format.
+        """
+        if not self.label_names and not self._values:
+            yield f"{self.name:s} 0"
+
+        for label_values, value in sorted(self._values.items()):
+            labels = _FormatLabels(self.label_names, label_values)
+            yield f"{self.name:s}{labels:s} {_FormatValue(value):s}"
+
+    def Increment(self, value=1, label_values=()):
+        """Increments the counter.
+
+        Args:
+          value (Optional[float|int]): value to increment the counter with.
+          label_values (Optional[tuple[str]]): values of the labels.
+        """
+        self._values[label_values] = self._values.get(label_values, 0) + value
+
+
+class Histogram:
+    """Histogram, counts of observed values in pre-defined buckets.
+
+    The buckets are allocated once per combination of label values, so that
+    observing a value only increments a count. A histogram is not thread-safe
+    by itself, where the registry that contains it serializes the updates.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(self, name, description, buckets, label_names=()):
+        """Initializes a histogram.
+
+        Args:
+          name (str): name of the metric.
+          description (str): description of the metric.
+          buckets (tuple[float]): upper bounds of the buckets in increasing
+              order, without the implicit +Inf bucket.
+          label_names (Optional[tuple[str]]): names of the labels.
+        """
+        super().__init__()
+        self._buckets = buckets
+        # Per combination of label values, the non-cumulative counts per bucket,
+        # where the last bucket is +Inf, and the sum of the observed values.
+        self._counts = {}
+        self._sums = {}
+        self.description = description
+        self.label_names = label_names
+        self.name = name
+
+    def GetSamples(self):
+        """Retrieves the samples of the histogram.
+
+        Yields:
+          str: sample in text exposition format.
+        """
+        for label_values, counts in sorted(self._counts.items()):
+            cumulative_count = 0
+            for upper_bound, count in zip(self._buckets, counts):
+                cumulative_count += count
+                labels = _FormatLabels(
+                    self.label_names, label_values, ("le", f"{upper_bound:g}")
+                )
+                yield f"{self.name:s}_bucket{labels:s} {cumulative_count:d}"
+
+            cumulative_count += counts[-1]
+            labels = _FormatLabels(self.label_names, label_values, ("le", "+Inf"))
+            yield f"{self.name:s}_bucket{labels:s} {cumulative_count:d}"
+
+            labels = _FormatLabels(self.label_names, label_values)
+            sum_value = _FormatValue(self._sums[label_values])
+            yield f"{self.name:s}_sum{labels:s} {sum_value:s}"
+            yield f"{self.name:s}_count{labels:s} {cumulative_count:d}"
+
+    def Observe(self, value, label_values=()):
+        """Observes a value.
+
+        Args:
+          value (float): observed value.
+          label_values (Optional[tuple[str]]): values of the labels.
+        """
+        counts = self._counts.get(label_values, None)
+        if counts is None:
+            counts = [0] * (len(self._buckets) + 1)
+            self._counts[label_values] = counts
+            self._sums[label_values] = 0.0
+
+        counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sums[label_values] += value
+
+
+class CollectorMetrics:
+    """Metrics of the collection of VBA.
+
+    Attributes:
+      bytes_read (Counter): number of bytes of the documents read.
+      documents_scanned (Counter): number of documents scanned.
+      documents_with_vba (Counter): number of documents that contain VBA.
+      errors (Counter): number of documents that could not be collected per
+          error type.
+      stage_duration (Histogram): duration of the parsing stages in seconds.
+    """
+
+    # Upper bounds of the buckets of the duration of a parsing stage in seconds.
+    STAGE_DURATION_BUCKETS = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+    )
+
+    def __init__(self):
+        """Initializes collector metrics."""
+        super().__init__()
+        self._lock = threading.Lock()
+
+        self.bytes_read = Counter(
+            "olecfrc_bytes_read_total", "Number of bytes of the documents read."
+        )
+        self.documents_scanned = Counter(
+            "olecfrc_documents_scanned_total", "Number of documents scanned."
+        )
+        self.documents_with_vba = Counter(
+            "olecfrc_documents_with_vba_total", "Number of documents that contain VBA."
+        )
+        self.errors = Counter(
+            "olecfrc_errors_total",
+            "Number of documents that could not be collected.",
+            label_names=("error_type",),
+        )
+        self.stage_duration = Histogram(
+            "olecfrc_stage_duration_seconds",
+            "Duration of the parsing stages in seconds.",
+            self.STAGE_DURATION_BUCKETS,
+            label_names=("stage",),
+        )
+
+    def GetTextFormat(self):
+        """Retrieves the metrics in the Prometheus text exposition format.
+
+        Returns:
+          str: metrics in text exposition format.
+        """
+        lines = []
+        with self._lock:
+            for metric in sorted(
+                (
+                    self.bytes_read,
+                    self.documents_scanned,
+                    self.documents_with_vba,
+                    self.errors,
+                    self.stage_duration,
+                ),
+                key=lambda metric: metric.name,
+            ):
+                lines.append(f"# HELP {metric.name:s} {metric.description:s}")
+                lines.append(f"# TYPE {metric.name:s} {metric.TYPE:s}")
+                lines.extend(metric.GetSamples())
+
+        lines.append("")
+        return "\n".join(lines)
+
+    def RecordDocument(
+        self, data_size, error_type=None, stage_durations=None, stream_found=False
+    ):
+        """Records the collection of a document.
+
+        Args:
+          data_size (int): size of the document data.
+          error_type (Optional[str]): type of the error that occurred during
+              collection or None.
+          stage_durations (Optional[list[tuple[str, float]]]): names of
+              the parsing stages and their duration in seconds.
+          stream_found (Optional[bool]): True if a stream containing VBA was
+              found.
+        """
+        with self._lock:
+            self.documents_scanned.Increment()
+            self.bytes_read.Increment(data_size)
+            if error_type:
+                self.errors.Increment(label_values=(error_type,))
+            if stream_found:
+                self.documents_with_vba.Increment()
+
+            for name, duration in stage_durations or []:
+                self.stage_duration.Observe(duration, label_values=(name,))
+
+    def RecordDocumentResult(self, document_result):
+        """Records the collection of a document from its document result.
+
+        Args:
+          document_result (DocumentResult): document result.
+        """
+        self.RecordDocument(
+            document_result.data_size,
+            error_type=document_result.error_type,
+            stage_durations=document_result.stage_durations,
+            stream_found=document_result.stream_found,
+        )
+
+    def WriteFile(self, path):
+        """Writes the metrics to a file in the text exposition format.
+
+        The file is replaced atomically, so that a scraper, such as the node
+        exporter textfile collector, never reads a partially written file.
+
+        Args:
+          path (str): path of the file.
+        """
+        text = self.GetTextFormat()
+
+        directory_path = os.path.dirname(os.path.abspath(path))
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory_path, prefix=".metrics", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file_object:
+                file_object.write(text)
+            os.replace(temporary_path, path)
+
+        except Exception:
+            os.remove(temporary_path)
+            raise
@@ -2,8 +2,6 @@
 
 import abc
 
-from dfdatetime import filetime as dfdatetime_filetime
-
 from olecfrc import hexdump
 
 
@@ -213,6 +211,10 @@ class StdoutOutputWriter(OutputWriter):
         elif value == 0x7FFFFFFFFFFFFFFF:
             date_time_string = "Never (0x7fffffffffffffff)"
         else:
+            from dfdatetime import (  # pylint: disable=import-outside-toplevel
+                filetime as dfdatetime_filetime,
+            )
+
             date_time = dfdatetime_filetime.Filetime(timestamp=value)
             date_time_string = date_time.CopyToDateTimeString()
             if date_time_string:
@@ -0,0 +1,564 @@
+"""Compact record types of parsed stream entries."""
+
+import array
+import struct
+import sys
+
+from olecfrc import errors
+
+# Use the smallest array type code that can hold 32-bit values.
+_INTEGER_TYPECODE = "I" if array.array("I").itemsize >= 4 else "L"
+
+
+class StreamRecord:
+    """Stream record interface.
+
+    Records use __slots__ so that they do not carry a per-instance __dict__ and do
+    not keep references to the underlying stream data.
+    """
+
+    __slots__ = ()
+
+    # Names of the attributes that contain integer values.
+    INTEGER_ATTRIBUTES = ()
+
+    # Names of the attributes that contain string values.
+    STRING_ATTRIBUTES = ()
+
+    def __eq__(self, other):
+        """Determines if the record is equal to another record.
+
+        Args:
+          other (object): other object.
+
+        Returns:
+          bool: True if the records are equal.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return all(
+            getattr(self, attribute_name) == getattr(other, attribute_name)
+            for attribute_name in self.__slots__
+        )
+
+    def __repr__(self):
+        """Retrieves a string representation of the record.
+
+        Returns:
+          str: string representation of the record.
+        """
+        values = ", ".join(
+            f"{attribute_name:s}={getattr(self, attribute_name)!r}"
+            for attribute_name in self.__slots__
+        )
+        return f"{self.__class__.__name__:s}({values:s})"
+
+
+class FStreamEntry(StreamRecord):
+    """f stream entry, which contains the site of a control.
+
+    Attributes:
+      clsid_cache_index (int): index of the class identifier (CLSID) of
+          the control in the class identifier cache or None if not stored.
+      name (str): name of the control or None if not stored.
+      o_stream_entry_index (int): index of the corresponding o stream entry or
+          None if the control has no o stream entry.
+      o_stream_entry_size (int): size of the corresponding o stream entry or
+          None if not stored.
+      offset (int): offset of the entry relative to the start of the stream.
+      property_mask (int): property mask, which indicates which properties are
+          stored in the entry.
+      size (int): size of the entry, without the 4 bytes of the version and
+          the size itself.
+      version (int): version.
+    """
+
+    __slots__ = (
+        "clsid_cache_index",
+        "name",
+        "o_stream_entry_index",
+        "o_stream_entry_size",
+        "offset",
+        "property_mask",
+        "size",
+        "version",
+    )
+
+    INTEGER_ATTRIBUTES = (
+        "clsid_cache_index",
+        "o_stream_entry_index",
+        "o_stream_entry_size",
+        "offset",
+        "property_mask",
+        "size",
+        "version",
+    )
+
+    STRING_ATTRIBUTES = ("name",)
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        clsid_cache_index=None,
+        name=None,
+        o_stream_entry_index=None,
+        o_stream_entry_size=None,
+        offset=None,
+        property_mask=None,
+        size=None,
+        version=None,
+    ):
+        """Initializes a f stream entry.
+
+        Args:
+          clsid_cache_index (Optional[int]): index of the class identifier
+              (CLSID) of the control in the class identifier cache.
+          name (Optional[str]): name of the control.
+          o_stream_entry_index (Optional[int]): index of the corresponding o
+              stream entry.
+          o_stream_entry_size (Optional[int]): size of the corresponding o stream
+              entry.
+          offset (Optional[int]): offset of the entry relative to the start of
+              the stream.
+          property_mask (Optional[int]): property mask, which indicates which
+              properties are stored in the entry.
+          size (Optional[int]): size of the entry, without the 4 bytes of
+              the version and the size itself.
+          version (Optional[int]): version.
+        """
+        super().__init__()
+        self.clsid_cache_index = clsid_cache_index
+        self.name = name
+        self.o_stream_entry_index = o_stream_entry_index
+        self.o_stream_entry_size = o_stream_entry_size
+        self.offset = offset
+        self.property_mask = property_mask
+        self.size = size
+        self.version = version
+
+
+class OStreamEntry(StreamRecord):
+    """o stream entry, which contains the properties of a control.
+
+    Attributes:
+      caption (str): caption or None if not stored.
+      font_name (str): font name or None if not stored.
+      group_name (str): name of the group of an option button or None if not
+          stored.
+      height (int): height of the control in HIMETRIC units or None if not
+          stored.
+      offset (int): offset of the entry relative to the start of the stream.
+      size (int): size of the entry.
+      value (str): value or None if not stored.
+      width (int): width of the control in HIMETRIC units or None if not stored.
+    """
+
+    __slots__ = (
+        "caption",
+        "font_name",
+        "group_name",
+        "height",
+        "offset",
+        "size",
+        "value",
+        "width",
+    )
+
+    INTEGER_ATTRIBUTES = ("height", "offset", "size", "width")
+
+    STRING_ATTRIBUTES = ("caption", "font_name", "group_name", "value")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        caption=None,
+        font_name=None,
+        group_name=None,
+        height=None,
+        offset=None,
+        size=None,
+        value=None,
+        width=None,
+    ):
+        """Initializes an o stream entry.
+
+        Args:
+          caption (Optional[str]): caption.
+          font_name (Optional[str]): font name.
+          group_name (Optional[str]): name of the group of an option button.
+          height (Optional[int]): height of the control in HIMETRIC units.
+          offset (Optional[int]): offset of the entry relative to the start of
+              the stream.
+          size (Optional[int]): size of the entry.
+          value (Optional[str]): value.
+          width (Optional[int]): width of the control in HIMETRIC units.
+        """
+        super().__init__()
+        self.caption = caption
+        self.font_name = font_name
+        self.group_name = group_name
+        self.height = height
+        self.offset = offset
+        self.size = size
+        self.value = value
+        self.width = width
+
+
+class ProjectString(StreamRecord):
+    """_VBA_PROJECT stream string.
+
+    Attributes:
+      offset (int): offset of the string relative to the start of the stream.
+      string (str): string.
+      unknown1 (int): unknown.
+      unknown2 (int): unknown.
+      unknown3 (int): unknown.
+    """
+
+    __slots__ = ("offset", "string", "unknown1", "unknown2", "unknown3")
+
+    INTEGER_ATTRIBUTES = ("offset", "unknown1", "unknown2", "unknown3")
+
+    STRING_ATTRIBUTES = ("string",)
+
+    def __init__(
+        self, offset=None, string=None, unknown1=None, unknown2=None, unknown3=None
+    ):
+        """Initializes a _VBA_PROJECT stream string.
+
+        Args:
+          offset (Optional[int]): offset of the string relative to the start of
+              the stream.
+          string (Optional[str]): string.
+          unknown1 (Optional[int]): unknown.
+          unknown2 (Optional[int]): unknown.
+          unknown3 (Optional[int]): unknown.
+        """
+        super().__init__()
+        self.offset = offset
+        self.string = string
+        self.unknown1 = unknown1
+        self.unknown2 = unknown2
+        self.unknown3 = unknown3
+
+
+class ColumnarRecords:
+    """Columnar container of stream records.
+
+    Integer attributes are stored in one array.array per attribute and string
+    attributes are stored UTF-8 encoded in a single shared buffer, which is
+    considerably more compact than a list of record objects for large streams.
+    Which attribute values are set is stored in a bitmap per attribute, so that
+    a value of None is preserved. Records are materialized on access.
+    """
+
+    def __init__(self, record_class):
+        """Initializes a columnar container.
+
+        Args:
+          record_class (type): stream record class, such as ProjectString.
+        """
+        super().__init__()
+        self._integer_columns = {
+            attribute_name: array.array(_INTEGER_TYPECODE)
+            for attribute_name in record_class.INTEGER_ATTRIBUTES
+        }
+        self._number_of_records = 0
+        self._presence_bitmaps = {
+            attribute_name: bytearray()
+            for attribute_name in (
+                record_class.INTEGER_ATTRIBUTES + record_class.STRING_ATTRIBUTES
+            )
+        }
+        self._record_class = record_class
+        self._string_buffer = bytearray()
+        self._string_end_offsets = {
+            attribute_name: array.array("Q")
+            for attribute_name in record_class.STRING_ATTRIBUTES
+        }
+        self._string_start_offsets = {
+            attribute_name: array.array("Q")
+            for attribute_name in record_class.STRING_ATTRIBUTES
+        }
+
+    def __getitem__(self, index):
+        """Retrieves a record.
+
+        Args:
+          index (int): index of the record.
+
+        Returns:
+          StreamRecord: record.
+
+        Raises:
+          IndexError: if the index is out of bounds.
+        """
+        if index < 0:
+            index += self._number_of_records
+        if index < 0 or index >= self._number_of_records:
+            raise IndexError("Record index out of bounds.")
+
+        values = {
+            attribute_name: self.GetInteger(index, attribute_name)
+            for attribute_name in self._integer_columns
+        }
+        for attribute_name in self._string_end_offsets:
+            values[attribute_name] = self.GetString(index, attribute_name)
+
+        return self._record_class(**values)
+
+    def __iter__(self):
+        """Retrieves the records.
+
+        Yields:
+          StreamRecord: record.
+        """
+        for index in range(self._number_of_records):
+            yield self[index]
+
+    def __len__(self):
+        """Retrieves the number of records.
+
+        Returns:
+          int: number of records.
+        """
+        return self._number_of_records
+
+    def _IsPresent(self, index, attribute_name):
+        """Determines if an attribute value of a record is set.
+
+        Args:
+          index (int): index of the record.
+          attribute_name (str): name of the attribute.
+
+        Returns:
+          bool: True if the attribute value is set, False if it is None.
+        """
+        bitmap = self._presence_bitmaps[attribute_name]
+        return bool(bitmap[index >> 3] & (1 << (index & 7)))
+
+    def _SetPresent(self, index, attribute_name):
+        """Marks an attribute value of a record as set.
+
+        Args:
+          index (int): index of the record.
+          attribute_name (str): name of the attribute.
+        """
+        self._presence_bitmaps[attribute_name][index >> 3] |= 1 << (index & 7)
+
+    def append(self, record):  # pylint: disable=invalid-name
+        """Appends a record.
+
+        Args:
+          record (StreamRecord): record.
+        """
+        index = self._number_of_records
+        if not index % 8:
+            for bitmap in self._presence_bitmaps.values():
+                bitmap.append(0)
+
+        for attribute_name, column in self._integer_columns.items():
+            value = getattr(record, attribute_name)
+            if value is None:
+                column.append(0)
+            else:
+                column.append(value)
+                self._SetPresent(index, attribute_name)
+
+        for attribute_name in self._record_class.STRING_ATTRIBUTES:
+            string = getattr(record, attribute_name)
+            self._string_start_offsets[attribute_name].append(len(self._string_buffer))
+            if string is not None:
+                self._string_buffer.extend(string.encode("utf-8"))
+                self._SetPresent(index, attribute_name)
+            self._string_end_offsets[attribute_name].append(len(self._string_buffer))
+
+        self._number_of_records += 1
+
+    def GetInteger(self, index, attribute_name):
+        """Retrieves an integer attribute value without materializing the record.
+
+        Args:
+          index (int): index of the record.
+          attribute_name (str): name of the integer attribute.
+
+        Returns:
+          int: attribute value or None if not set.
+        """
+        if not self._IsPresent(index, attribute_name):
+            return None
+        return self._integer_columns[attribute_name][index]
+
+    def GetString(self, index, attribute_name):
+        """Retrieves a string attribute value without materializing the record.
+
+        Args:
+          index (int): index of the record.
+          attribute_name (str): name of the string attribute.
+
+        Returns:
+          str: attribute value or None if not set.
+        """
+        if not self._IsPresent(index, attribute_name):
+            return None
+
+        start_offset = self._string_start_offsets[attribute_name][index]
+        end_offset = self._string_end_offsets[attribute_name][index]
+        return self._string_buffer[start_offset:end_offset].decode("utf-8")
+
+
+class ProjectStringTable:
+    """_VBA_PROJECT stream string table.
+
+    The table is read in a single pass that records only the offsets of
+    the strings, where a string is decoded when it is accessed. Decoded strings
+    are interned, so that identifiers that recur across documents, such as
+    "ThisDocument" or "Module1", share a single object.
+
+    A string has the layout of the project_stream_string structure in vba.yaml.
+    Unlike the other structures, it is not read with _ReadStructure, since that
+    would map every string of the table when it is read. The layout is checked
+    against the dtFabric data type map by the tests.
+    """
+
+    _STRING_SIZE = struct.Struct("<H")
+
+    _STRING_VALUES = struct.Struct("<III")
+
+    def __init__(self):
+        """Initializes a string table."""
+        super().__init__()
+        self._base_offset = 0
+        self._data = b""
+        self._offsets = array.array("Q")
+
+    def __getitem__(self, index):
+        """Retrieves a string.
+
+        Args:
+          index (int): index of the string.
+
+        Returns:
+          ProjectString: string.
+
+        Raises:
+          IndexError: if the index is out of bounds.
+        """
+        data_offset = self._offsets[index] - self._base_offset
+        (string_size,) = self._STRING_SIZE.unpack_from(self._data, data_offset)
+        data_offset += self._STRING_SIZE.size
+
+        unknown1, unknown2, unknown3 = self._STRING_VALUES.unpack_from(
+            self._data, data_offset + string_size
+        )
+        return ProjectString(
+            offset=self._offsets[index],
+            string=self.GetString(index),
+            unknown1=unknown1,
+            unknown2=unknown2,
+            unknown3=unknown3,
+        )
+
+    def __iter__(self):
+        """Retrieves the strings.
+
+        Yields:
+          ProjectString: string.
+        """
+        for index in range(len(self._offsets)):
+            yield self[index]
+
+    def __len__(self):
+        """Retrieves the number of strings.
+
+        Returns:
+          int: number of strings.
+        """
+        return len(self._offsets)
+
+    def GetOffset(self, index):
+        """Retrieves the offset of a string without decoding it.
+
+        Args:
+          index (int): index of the string.
+
+        Returns:
+          int: offset of the string relative to the start of the stream.
+
+        Raises:
+          IndexError: if the index is out of bounds.
+        """
+        return self._offsets[index]
+
+    def GetString(self, index):
+        """Retrieves a decoded string without materializing its record.
+
+        Args:
+          index (int): index of the string.
+
+        Returns:
+          str: interned string.
+
+        Raises:
+          IndexError: if the index is out of bounds.
+        """
+        data_offset = self._offsets[index] - self._base_offset
+        (string_size,) = self._STRING_SIZE.unpack_from(self._data, data_offset)
+        data_offset += self._STRING_SIZE.size
+
+        string = self._data[data_offset : data_offset + string_size].decode(
+            "utf-16-le", errors="replace"
+        )
+        return sys.intern(string)
+
+    def ReadData(self, stream_data, stream_offset, number_of_strings):
+        """Reads the string table from the stream data.
+
+        Only the part of the stream data that contains the strings is retained.
+
+        Args:
+          stream_data (bytes): _VBA_PROJECT stream data.
+          stream_offset (int): offset of the first string relative to the start
+              of the stream.
+          number_of_strings (int): number of strings.
+
+        Returns:
+          int: offset relative to the start of the stream that follows the last
+              string.
+
+        Raises:
+          ParseError: if the string table is truncated.
+        """
+        offsets = array.array("Q")
+        string_size_struct_size = self._STRING_SIZE.size
+        string_values_size = self._STRING_VALUES.size
+        stream_data_size = len(stream_data)
+
+        first_stream_offset = stream_offset
+        for _ in range(number_of_strings):
+            if stream_offset + string_size_struct_size > stream_data_size:
+                raise errors.ParseError(
+                    f"Truncated _VBA_PROJECT stream string at offset: "
+                    f"0x{stream_offset:08x}"
+                )
+
+            (string_size,) = self._STRING_SIZE.unpack_from(stream_data, stream_offset)
+            next_stream_offset = (
+                stream_offset
+                + string_size_struct_size
+                + string_size
+                + string_values_size
+            )
+            if next_stream_offset > stream_data_size:
+                raise errors.ParseError(
+                    f"Truncated _VBA_PROJECT stream string at offset: "
+                    f"0x{stream_offset:08x}"
+                )
+
+            offsets.append(stream_offset)
+            stream_offset = next_stream_offset
+
+        self._base_offset = first_stream_offset
+        self._data = bytes(stream_data[first_stream_offset:stream_offset])
+        self._offsets = offsets
+
+        return stream_offset
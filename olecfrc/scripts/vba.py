@@ -2,9 +2,18 @@
 """Script to extract Visual Basic for Applications (VBA)."""
 
 import argparse
+import contextlib
 import logging
+import os
 import sys
+import time
 
+from olecfrc import batch
+from olecfrc import checkpoint
+from olecfrc import containers
+from olecfrc import memory_profiler
+from olecfrc import metrics
+from olecfrc import sharding
 from olecfrc import vba
 
 
@@ -32,6 +41,357 @@ class StdoutWriter:
         print(text)
 
 
+def _CollectBatch(options):
+    """Collects VBA from a batch of documents.
+
+    Args:
+      options (argparse.Namespace): command line options.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    shards = [options.shard] if options.shard else None
+
+    results_writers = []
+    if options.jsonl_path:
+        # pylint: disable=import-outside-toplevel
+        from olecfrc import jsonl_writer
+
+        results_writer = jsonl_writer.JSONLWriter(
+            options.jsonl_path, append=options.resume, shards=shards
+        )
+        if not results_writer.Open():
+            print(f"Unable to open JSON Lines file: {options.jsonl_path:s}")
+            print("")
+            return 1
+
+        results_writers.append(results_writer)
+
+    if options.sqlite_path:
+        # pylint: disable=import-outside-toplevel
+        from olecfrc import sqlite_writer
+
+        results_writer = sqlite_writer.SQLiteWriter(
+            options.sqlite_path, append=options.resume, shards=shards
+        )
+        if not results_writer.Open():
+            print(f"Unable to open SQLite database: {options.sqlite_path:s}")
+            print("")
+            for results_writer in results_writers:
+                results_writer.Close()
+            return 1
+
+        results_writers.append(results_writer)
+
+    checkpoint_journal = None
+    if options.checkpoint_path:
+        checkpoint_journal = checkpoint.CheckpointJournal(options.checkpoint_path)
+        try:
+            checkpoint_journal.Open(resume=options.resume)
+        except (IOError, OSError) as exception:
+            print(
+                f"Unable to open checkpoint journal: {options.checkpoint_path:s} "
+                f"with error: {exception!s}"
+            )
+            print("")
+            for results_writer in results_writers:
+                results_writer.Close()
+            return 1
+
+        if options.resume:
+            logging.info(
+                (
+                    f"Resuming with {checkpoint_journal.number_of_completed:d} "
+                    f"completed documents."
+                )
+            )
+    checkpoint_time = time.monotonic()
+
+    source_paths = _GetSourcePaths(options)
+    if checkpoint_journal:
+        source_paths = (
+            path for path in source_paths if not checkpoint_journal.IsCompleted(path)
+        )
+
+    # pylint: disable=import-outside-toplevel
+    from olecfrc import deduplication
+
+    hash_store = None
+    if options.hash_store_path:
+        hash_store = deduplication.HashStore(options.hash_store_path)
+        if not hash_store.Open():
+            print(f"Unable to open hash store: {options.hash_store_path:s}")
+            print("")
+            for results_writer in results_writers:
+                results_writer.Close()
+            if checkpoint_journal:
+                checkpoint_journal.Close()
+            return 1
+
+    if options.deduplicate or hash_store:
+        batch_collector = deduplication.DeduplicatingBatchCollector(
+            hash_store=hash_store,
+            maximum_number_of_cached_streams=options.stream_cache_entries,
+            maximum_stream_cache_size=options.stream_cache_size * 1024 * 1024,
+            memory_profiling=options.memory_report,
+            number_of_workers=options.number_of_workers,
+            triage=options.triage,
+        )
+    else:
+        batch_collector = batch.BatchCollector(
+            maximum_number_of_cached_streams=options.stream_cache_entries,
+            maximum_stream_cache_size=options.stream_cache_size * 1024 * 1024,
+            memory_profiling=options.memory_report,
+            number_of_workers=options.number_of_workers,
+            triage=options.triage,
+        )
+
+    collector_metrics = None
+    if options.metrics_path:
+        collector_metrics = metrics.CollectorMetrics()
+    metrics_write_time = time.monotonic()
+
+    memory_usages = []
+    number_of_documents = 0
+    number_of_errors = 0
+    number_of_documents_with_vba = 0
+    stream_cache_statistics = {}
+
+    try:
+        for document_result in batch_collector.Collect(source_paths):
+            number_of_documents += 1
+            if document_result.error:
+                number_of_errors += 1
+                logging.warning(
+                    (
+                        f"Unable to collect from: {document_result.source:s} "
+                        f"with error: {document_result.error:s}"
+                    )
+                )
+            elif document_result.stream_found:
+                number_of_documents_with_vba += 1
+
+            for kind, (hits, misses) in document_result.stream_cache_statistics.items():
+                total_hits, total_misses = stream_cache_statistics.get(kind, (0, 0))
+                stream_cache_statistics[kind] = (
+                    total_hits + hits,
+                    total_misses + misses,
+                )
+
+            if options.memory_report:
+                memory_usages.append(
+                    (document_result.source, document_result.memory_usage)
+                )
+
+            for results_writer in results_writers:
+                results_writer.WriteDocumentResult(document_result)
+
+            if checkpoint_journal:
+                checkpoint_journal.AddCompleted(document_result.source)
+                if time.monotonic() - checkpoint_time >= options.checkpoint_interval:
+                    # Flush the results before the journal marks them completed.
+                    for results_writer in results_writers:
+                        results_writer.Flush()
+                    checkpoint_journal.Flush()
+                    checkpoint_time = time.monotonic()
+
+            if collector_metrics:
+                collector_metrics.RecordDocumentResult(document_result)
+                if time.monotonic() - metrics_write_time >= options.metrics_interval:
+                    collector_metrics.WriteFile(options.metrics_path)
+                    metrics_write_time = time.monotonic()
+
+    finally:
+        for results_writer in results_writers:
+            results_writer.Close()
+        if checkpoint_journal:
+            checkpoint_journal.Close()
+        if hash_store:
+            hash_store.Close()
+        if collector_metrics:
+            collector_metrics.WriteFile(options.metrics_path)
+
+    print(f"Number of documents\t\t: {number_of_documents:d}")
+    print(f"Number of documents with VBA\t: {number_of_documents_with_vba:d}")
+    print(f"Number of errors\t\t: {number_of_errors:d}")
+
+    if isinstance(batch_collector, deduplication.DeduplicatingBatchCollector):
+        hit_rate = 0.0
+        if number_of_documents:
+            hit_rate = (100.0 * batch_collector.number_of_duplicates) / (
+                number_of_documents
+            )
+        print(
+            f"Number of duplicates\t\t: {batch_collector.number_of_duplicates:d} "
+            f"({hit_rate:.1f}%)"
+        )
+        print(
+            f"Number of hash store hits\t: "
+            f"{batch_collector.number_of_hash_store_hits:d}"
+        )
+
+    if options.stream_cache_entries > 0:
+        print("")
+        _PrintStreamCacheReport(stream_cache_statistics)
+
+    if options.memory_report:
+        print("")
+        _PrintMemoryReport(memory_usages)
+
+    return 0
+
+
+def _GetSourcePaths(options):
+    """Retrieves the paths of the documents to collect from.
+
+    Args:
+      options (argparse.Namespace): command line options.
+
+    Yields:
+      str: path of a document, which is assigned to the shard if the scan is
+          sharded.
+    """
+    paths = list(options.sources)
+    if options.sources_file_path:
+        with open(options.sources_file_path, "r", encoding="utf-8") as file_object:
+            paths.extend(line.rstrip("\r\n") for line in file_object if line.strip())
+
+    for path in batch.GetSourcePaths(paths):
+        if not options.shard or options.shard.ContainsPath(path):
+            yield path
+
+
+def _PrintMemoryReport(memory_usages):
+    """Prints a report of the memory usage of the collection.
+
+    Args:
+      memory_usages (list[tuple[str, list[StageMemoryUsage]]]): paths or names
+          of the documents and the memory usage of the stages of their
+          collection.
+    """
+    maximum_stage_usages = {}
+    for source, stages in memory_usages:
+        for stage_memory_usage in stages:
+            maximum_stage_usage = maximum_stage_usages.get(
+                stage_memory_usage.name, None
+            )
+            if (
+                not maximum_stage_usage
+                or stage_memory_usage.peak_size > maximum_stage_usage[1].peak_size
+            ):
+                maximum_stage_usages[stage_memory_usage.name] = (
+                    source,
+                    stage_memory_usage,
+                )
+
+    print("Maximum peak memory per stage:")
+    for name, (source, stage_memory_usage) in sorted(maximum_stage_usages.items()):
+        peak_size = stage_memory_usage.peak_size / 1024
+        print(f"{name:s}\t: {peak_size:.1f} KiB in {source:s}")
+    print("")
+
+    outliers = memory_profiler.GetOutliers(memory_usages)
+    if not outliers:
+        print("No memory usage outliers found.")
+        return
+
+    print("Memory usage outliers:")
+    for source, stage_memory_usage in outliers:
+        peak_size = stage_memory_usage.peak_size / 1024
+        print(f"{source:s}\t: {peak_size:.1f} KiB peak")
+        for location, size in stage_memory_usage.top_allocations:
+            print(f"\t{location:s}\t: {size / 1024:.1f} KiB")
+
+
+def _PrintStreamCacheReport(stream_cache_statistics):
+    """Prints a report of the stream cache hit rates.
+
+    Args:
+      stream_cache_statistics (dict[str, tuple[int, int]]): number of stream
+          cache hits and misses per kind of parser.
+    """
+    print("Stream cache hit rate per kind:")
+    for kind, (hits, misses) in sorted(stream_cache_statistics.items()):
+        hit_rate = (100.0 * hits) / (hits + misses)
+        print(f"{kind:s}\t: {hits:d} of {hits + misses:d} ({hit_rate:.1f}%)")
+
+
+def _QueryIndex(options):
+    """Queries a document by the offsets stored in its sidecar index.
+
+    Args:
+      options (argparse.Namespace): command line options.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    # pylint: disable=import-outside-toplevel
+    from olecfrc import errors
+    from olecfrc import sidecar_index
+
+    try:
+        with sidecar_index.IndexedDocument(
+            options.sources[0],
+            cache_directory=options.index_directory,
+            verify_digest=options.index_verify_digest,
+        ) as indexed_document:
+            index_status = "built" if indexed_document.index_built else "reused"
+            print(f"Sidecar index: {indexed_document.index_path:s} ({index_status:s})")
+
+            if options.module_name:
+                source_code = indexed_document.GetModuleSourceCode(options.module_name)
+                if source_code is None:
+                    print(f"Missing module: {options.module_name:s}")
+                    return 1
+
+                print(source_code)
+
+    except (IOError, OSError, errors.ParseError) as exception:
+        print(f"Unable to query sidecar index with error: {exception!s}")
+        return 1
+
+    return 0
+
+
+def _Serve(options):
+    """Runs the scanning service until interrupted.
+
+    Args:
+      options (argparse.Namespace): command line options.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    # pylint: disable=import-outside-toplevel
+    from olecfrc import service
+
+    scan_service = service.ScanService(
+        maximum_queue_size=options.maximum_queue_size,
+        number_of_workers=options.number_of_workers,
+    )
+
+    if options.socket_path:
+        server = service.ScanUnixHTTPServer(options.socket_path, scan_service)
+        server_location = options.socket_path
+    else:
+        server = service.ScanHTTPServer(("127.0.0.1", options.port), scan_service)
+        server_location = f"http://127.0.0.1:{server.server_address[1]:d}"
+
+    scan_service.Start()
+    logging.info(f"Serving on: {server_location:s}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        scan_service.Stop()
+        if options.socket_path:
+            os.remove(options.socket_path)
+
+    return 0
+
+
 def Main():
     """Entry point of console script to extract VBA.
 
@@ -42,6 +402,28 @@ def Main():
         description=("Extracts VBA from an OLE Compound File.")
     )
 
+    argument_parser.add_argument(
+        "--checkpoint",
+        dest="checkpoint_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a journal to periodically record the completed documents "
+            "in, in batch mode."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpoint_interval",
+        action="store",
+        type=float,
+        metavar="SECONDS",
+        default=5.0,
+        help="number of seconds between checkpoints.",
+    )
+
     argument_parser.add_argument(
         "-d",
         "--debug",
@@ -52,17 +434,313 @@ def Main():
     )
 
     argument_parser.add_argument(
-        "source",
-        nargs="?",
+        "--deduplicate",
+        dest="deduplicate",
+        action="store_true",
+        default=False,
+        help=(
+            "hash the content of the documents in batch mode and reuse the result "
+            "of a document with the same content instead of parsing it again."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--decompression-workers",
+        dest="number_of_decompression_workers",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=0,
+        help=(
+            "number of worker processes to decompress large modules of a single "
+            "document in parallel."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--hash-store",
+        dest="hash_store_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a persistent store of results per content hash to reuse "
+            "across runs, which implies --deduplicate."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--index",
+        dest="index",
+        action="store_true",
+        default=False,
+        help=(
+            "query the document by the offsets stored in its sidecar index, "
+            "which is built next to the document, or in the index directory, "
+            "if it is missing or no longer matches the document."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--index-directory",
+        dest="index_directory",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the directory to store the sidecar index files in.",
+    )
+
+    argument_parser.add_argument(
+        "--index-verify-digest",
+        dest="index_verify_digest",
+        action="store_true",
+        default=False,
+        help=(
+            "verify the digest of the entire content of the document before its "
+            "sidecar index is reused, which reads the entire document, instead "
+            "of only its size, modification time, header and directory sectors "
+            "and stream sizes."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--jsonl",
+        dest="jsonl_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a JSON Lines file to write the results to.",
+    )
+
+    argument_parser.add_argument(
+        "--memory-report",
+        dest="memory_report",
+        action="store_true",
+        default=False,
+        help=(
+            "profile the memory usage per document and parsing stage with "
+            "tracemalloc and print a report of the outliers."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--metrics-file",
+        dest="metrics_path",
         action="store",
         metavar="PATH",
         default=None,
-        help="path of the OLE Compound File.",
+        help=(
+            "path of a file to periodically write metrics to, in the Prometheus "
+            "text exposition format, in batch mode. The scanning service serves "
+            "its metrics on /metrics instead."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--metrics-interval",
+        dest="metrics_interval",
+        action="store",
+        type=float,
+        metavar="SECONDS",
+        default=15.0,
+        help="number of seconds between writes of the metrics file.",
+    )
+
+    argument_parser.add_argument(
+        "--module",
+        dest="module_name",
+        action="store",
+        metavar="NAME",
+        default=None,
+        help="name of the module of which to print the source code with --index.",
+    )
+
+    argument_parser.add_argument(
+        "--port",
+        dest="port",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=8080,
+        help="localhost port the scanning service listens on.",
+    )
+
+    argument_parser.add_argument(
+        "--queue-size",
+        dest="maximum_queue_size",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=64,
+        help=(
+            "maximum number of requests queued by the scanning service, where "
+            "further requests are rejected."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        default=False,
+        help=(
+            "skip the documents completed according to the checkpoint journal "
+            "and append to the results."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--serve",
+        dest="serve",
+        action="store_true",
+        default=False,
+        help=(
+            "run a scanning service that accepts documents over HTTP on a Unix "
+            "domain socket or localhost port."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--shard",
+        dest="shard",
+        action="store",
+        metavar="I/N",
+        default=None,
+        help=(
+            "only collect from the documents assigned to shard I of N, such as "
+            "2/4, by a hash of their path. Every node must be provided the same "
+            "paths, such as a shared file list, to assign them consistently."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the Unix domain socket the scanning service listens on.",
+    )
+
+    argument_parser.add_argument(
+        "--sources-file",
+        dest="sources_file_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a file with the paths to collect from, one per line.",
+    )
+
+    argument_parser.add_argument(
+        "--sqlite",
+        dest="sqlite_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a SQLite database to write the results to.",
+    )
+
+    argument_parser.add_argument(
+        "--stream-cache-entries",
+        dest="stream_cache_entries",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=0,
+        help=(
+            "maximum number of parsed streams, such as _VBA_PROJECT, dir and "
+            "module streams, that each worker caches by content hash to reuse "
+            "across documents in batch mode, where 0 disables the cache."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--stream-cache-size",
+        dest="stream_cache_size",
+        action="store",
+        type=int,
+        metavar="MIB",
+        default=64,
+        help="maximum total size of the streams cached by each worker in MiB.",
+    )
+
+    argument_parser.add_argument(
+        "--triage",
+        dest="triage",
+        action="store_true",
+        default=False,
+        help=(
+            "only read the headers of the streams, to quickly detect documents "
+            "with VBA and the version of their projects, without reading "
+            "the modules, strings and form controls."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--workers",
+        dest="number_of_workers",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=1,
+        help=(
+            "number of worker processes to use in batch mode or by the scanning "
+            "service."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "sources",
+        nargs="*",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of the OLE Compound File or ZIP or OOXML container, where "
+            "multiple paths or a directory are collected in batch mode."
+        ),
     )
 
     options = argument_parser.parse_args()
 
-    if not options.source:
+    if options.serve:
+        logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+        return _Serve(options)
+
+    if options.shard:
+        try:
+            options.shard = sharding.Shard.FromString(options.shard)
+        except ValueError as exception:
+            print(f"{exception!s}")
+            print("")
+            return 1
+
+    if options.index and (len(options.sources) != 1 or options.sources_file_path):
+        print("Sidecar index requires a single document.")
+        print("")
+        return 1
+
+    if options.module_name and not options.index:
+        print("Module requires a sidecar index.")
+        print("")
+        return 1
+
+    if options.index_verify_digest and not options.index:
+        print("Verifying the digest requires a sidecar index.")
+        print("")
+        return 1
+
+    if options.triage and options.hash_store_path:
+        print("Triage cannot be combined with a hash store.")
+        print("")
+        return 1
+
+    if options.resume and not options.checkpoint_path:
+        print("Resume requires a checkpoint journal.")
+        print("")
+        return 1
+
+    if not options.sources and not options.sources_file_path:
         print("Source value is missing.")
         print("")
         argument_parser.print_help()
@@ -71,6 +749,23 @@ def Main():
 
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
+    if options.index:
+        return _QueryIndex(options)
+
+    if (
+        len(options.sources) != 1
+        or os.path.isdir(options.sources[0])
+        or options.checkpoint_path
+        or options.deduplicate
+        or options.hash_store_path
+        or options.jsonl_path
+        or options.metrics_path
+        or options.shard
+        or options.sqlite_path
+        or options.stream_cache_entries
+    ):
+        return _CollectBatch(options)
+
     output_writer = StdoutWriter()
 
     if not output_writer.Open():
@@ -78,13 +773,69 @@ def Main():
         print("")
         return 1
 
-    collector_object = vba.VBACollector(debug=options.debug)
-    collector_object.Collect(options.source, output_writer)
+    decompression_pool = None
+    if options.number_of_decompression_workers > 1:
+        # pylint: disable=import-outside-toplevel
+        from olecfrc import decompression_pool as olecfrc_decompression_pool
+
+        decompression_pool = olecfrc_decompression_pool.DecompressionPool(
+            number_of_workers=options.number_of_decompression_workers
+        )
+
+    document_stage = contextlib.nullcontext()
+    profiler = None
+    if options.memory_report:
+        profiler = memory_profiler.MemoryProfiler()
+        profiler.Start()
+        document_stage = profiler.ProfileStage("document")
+
+    collector_object = vba.VBACollector(
+        debug=options.debug,
+        decompression_pool=decompression_pool,
+        memory_profiler=profiler,
+        triage=options.triage,
+    )
+    container_extractor = containers.ContainerExtractor()
+    stream_found = False
+    try:
+        with document_stage:
+            for _, olecf_source in container_extractor.ExtractOLECFDocuments(
+                options.sources[0]
+            ):
+                collector_object.Collect(olecf_source, output_writer)
+                if collector_object.stream_found:
+                    stream_found = True
+
+                if options.triage:
+                    for project_root in collector_object.project_roots:
+                        # An empty path represents the root storage.
+                        path = project_root.path or "\\"
+                        version = project_root.version
+                        version_string = "N/A" if version is None else f"{version:d}"
+                        output_writer.WriteText(
+                            f"VBA project: {path:s} (version: {version_string:s})"
+                        )
+                        for vba_form in project_root.forms:
+                            output_writer.WriteText(
+                                f"\tForm: {vba_form.name:s} (controls: "
+                                f"{vba_form.number_of_controls:d})"
+                            )
+
+    finally:
+        if decompression_pool:
+            decompression_pool.Close()
+        if profiler:
+            profiler.Stop()
+
     output_writer.Close()
 
-    if not collector_object.stream_found:
+    if not stream_found:
         print("No VBA stream found.")
 
+    if profiler:
+        print("")
+        _PrintMemoryReport([(options.sources[0], profiler.stages)])
+
     return 0
 
 
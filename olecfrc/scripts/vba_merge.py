@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Script to merge the VBA collection results of the shards of a scan."""
+
+import argparse
+import logging
+import sys
+
+from olecfrc import errors
+from olecfrc import merge
+from olecfrc import sharding
+
+
+def Main():
+    """Entry point of console script to merge VBA collection results.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Merges the JSON Lines or SQLite VBA collection results of the shards "
+            "of a scan."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-o",
+        "--output",
+        dest="output_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the merged results file.",
+    )
+
+    argument_parser.add_argument(
+        "sources",
+        nargs="+",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a JSON Lines or SQLite results file of a shard.",
+    )
+
+    options = argument_parser.parse_args()
+
+    if not options.output_path:
+        print("Output value is missing.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    results_merger = merge.ResultsMerger()
+    try:
+        results_merger.Merge(options.sources, options.output_path)
+    except (IOError, OSError, errors.ParseError) as exception:
+        print(f"Unable to merge results with error: {exception!s}")
+        print("")
+        return 1
+
+    shards = sorted(
+        set(results_merger.shards),
+        key=lambda shard: (shard.number_of_shards, shard.index),
+    )
+    if len(shards) != len(results_merger.shards):
+        logging.warning("Results of the same shard were merged more than once.")
+
+    try:
+        missing_shards = sharding.GetMissingShards(shards)
+    except ValueError as exception:
+        logging.warning(f"{exception!s}")
+        missing_shards = []
+
+    if missing_shards:
+        missing_shards_string = ", ".join([f"{shard!s}" for shard in missing_shards])
+        logging.warning(f"Missing shards: {missing_shards_string:s}")
+
+    shards_string = ", ".join([f"{shard!s}" for shard in shards]) or "N/A"
+    print(f"Shards\t\t\t: {shards_string:s}")
+    print(f"Number of documents\t: {results_merger.number_of_documents:d}")
+    print(f"Number of duplicates\t: {results_merger.number_of_duplicates:d}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
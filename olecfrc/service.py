@@ -0,0 +1,438 @@
+"""Long-lived scanning service of Visual Basic for Applications (VBA)."""
+
+import http.server
+import json
+import logging
+import multiprocessing
+import socketserver
+import threading
+import time
+import urllib.parse
+
+from olecfrc import batch
+from olecfrc import errors
+from olecfrc import metrics
+
+# Default maximum size of a request body.
+DEFAULT_MAXIMUM_REQUEST_SIZE = 256 * 1024 * 1024
+
+
+def _InitializeWorker():
+    """Initializes a worker process.
+
+    The modules that are otherwise imported on first use are imported when
+    the worker starts, so that the first request a worker handles does not pay
+    for them.
+    """
+    # pylint: disable=import-outside-toplevel,unused-import
+    import zipfile  # noqa: F401
+
+    import pyolecf  # noqa: F401
+
+
+def ScanDocument(source):
+    """Scans a document.
+
+    This function is defined at module level so that it can be used by
+    the workers of a process pool.
+
+    Errors that are not handled by the collection, for example due to a defect
+    in a parser, are reported in the document result, so that a single document
+    cannot fail the request or the worker.
+
+    Args:
+      source (str|tuple[str, bytes]): path of the document or name of
+          the document and its data.
+
+    Returns:
+      dict[str, object]: document result, which can be serialized as JSON.
+    """
+    try:
+        document_result = batch.CollectDocument(source)
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        name = source[0] if isinstance(source, tuple) else source
+        document_result = batch.DocumentResult(name)
+        document_result.error = f"{exception!s}"
+        document_result.error_type = type(exception).__name__
+
+    return document_result.CopyToDict()
+
+
+class ScanService:
+    """Scanning service with a pool of warm worker processes.
+
+    The number of requests that are queued or being scanned is bounded, where
+    requests beyond the bound are rejected instead of queued, so that callers
+    can back off. A request that timed out keeps its slot until its worker has
+    finished the scan, so that the bound also applies to abandoned scans.
+
+    Attributes:
+      metrics (CollectorMetrics): metrics of the scanned documents.
+    """
+
+    def __init__(self, maximum_queue_size=64, number_of_workers=1, timeout=60.0):
+        """Initializes a scanning service.
+
+        Args:
+          maximum_queue_size (Optional[int]): maximum number of requests that
+              are queued or being scanned.
+          number_of_workers (Optional[int]): number of worker processes, where
+              0 represents scanning in the thread handling the request.
+          timeout (Optional[float]): maximum number of seconds to wait for
+              the result of a scan.
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._maximum_queue_size = maximum_queue_size
+        self._number_of_documents_with_vba = 0
+        self._number_of_errors = 0
+        self._number_of_queued_requests = 0
+        self._number_of_rejected_requests = 0
+        self._number_of_requests = 0
+        self._number_of_timeouts = 0
+        self._number_of_workers = number_of_workers
+        self._pool = None
+        self._queue_semaphore = threading.BoundedSemaphore(maximum_queue_size)
+        self._start_time = None
+        self._timeout = timeout
+
+        self.metrics = metrics.CollectorMetrics()
+
+    def _ReleaseQueueSlot(self, unused_result=None):
+        """Releases the queue slot of a request.
+
+        This function is also used as callback of the pool, so that the slot of
+        a request that timed out is only released when its worker has finished
+        the scan.
+
+        Args:
+          unused_result (Optional[object]): result or exception of the scan.
+        """
+        with self._lock:
+            self._number_of_queued_requests -= 1
+        self._queue_semaphore.release()
+
+    def GetStatistics(self):
+        """Retrieves statistics of the service.
+
+        Returns:
+          dict[str, object]: statistics, which can be serialized as JSON.
+        """
+        uptime = 0.0
+        if self._start_time is not None:
+            uptime = time.monotonic() - self._start_time
+
+        with self._lock:
+            return {
+                "maximum_queue_size": self._maximum_queue_size,
+                "number_of_documents_with_vba": self._number_of_documents_with_vba,
+                "number_of_errors": self._number_of_errors,
+                "number_of_queued_requests": self._number_of_queued_requests,
+                "number_of_rejected_requests": self._number_of_rejected_requests,
+                "number_of_requests": self._number_of_requests,
+                "number_of_timeouts": self._number_of_timeouts,
+                "number_of_workers": self._number_of_workers,
+                "uptime": uptime,
+            }
+
+    def Scan(self, source):
+        """Scans a document.
+
+        Args:
+          source (str|tuple[str, bytes]): path of the document or name of
+              the document and its data.
+
+        Returns:
+          dict[str, object]: document result, which can be serialized as JSON.
+
+        Raises:
+          BackpressureError: if the queue is full.
+          TimeoutError: if the scan did not complete within the timeout.
+        """
+        # pylint: disable=consider-using-with
+        is_queued = self._queue_semaphore.acquire(blocking=False)
+        if not is_queued:
+            with self._lock:
+                self._number_of_rejected_requests += 1
+            raise errors.BackpressureError("Scan queue is full.")
+
+        with self._lock:
+            self._number_of_queued_requests += 1
+            self._number_of_requests += 1
+
+        if not self._pool:
+            try:
+                document_result = ScanDocument(source)
+            finally:
+                self._ReleaseQueueSlot()
+
+        else:
+            async_result = None
+            try:
+                async_result = self._pool.apply_async(
+                    ScanDocument,
+                    (source,),
+                    callback=self._ReleaseQueueSlot,
+                    error_callback=self._ReleaseQueueSlot,
+                )
+            finally:
+                if not async_result:
+                    self._ReleaseQueueSlot()
+
+            try:
+                document_result = async_result.get(timeout=self._timeout)
+            except multiprocessing.TimeoutError:
+                with self._lock:
+                    self._number_of_timeouts += 1
+                raise TimeoutError("Scan did not complete within the timeout.")
+
+        self.metrics.RecordDocument(
+            document_result["data_size"],
+            error_type=document_result["error_type"],
+            stage_durations=document_result["stage_durations"],
+            stream_found=document_result["stream_found"],
+        )
+
+        with self._lock:
+            if document_result["error"]:
+                self._number_of_errors += 1
+            elif document_result["stream_found"]:
+                self._number_of_documents_with_vba += 1
+
+        return document_result
+
+    def Start(self):
+        """Starts the worker processes."""
+        if self._number_of_workers > 0 and not self._pool:
+            self._pool = multiprocessing.Pool(  # pylint: disable=consider-using-with
+                initializer=_InitializeWorker, processes=self._number_of_workers
+            )
+
+        self._start_time = time.monotonic()
+
+    def Stop(self):
+        """Stops the worker processes."""
+        if self._pool:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+class ScanRequestHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP request handler of the scanning service.
+
+    The following requests are supported:
+
+      GET /health: returns the status of the service.
+      GET /metrics: returns metrics in the Prometheus text exposition format.
+      GET /stats: returns statistics of the service.
+      POST /scan: scans the document in the request body, where the name of
+          the document can be provided with the "name" query parameter, or
+          scans the document of which the path is provided as {"path": PATH}
+          when the content type is application/json.
+    """
+
+    # The following methods and attributes are part of the request handler
+    # interface and do not follow our naming conventions, where attributes,
+    # such as close_connection, are defined by handle_one_request().
+    # pylint: disable=attribute-defined-outside-init,invalid-name
+
+    protocol_version = "HTTP/1.1"
+
+    server_version = "olecfrc"
+
+    def _GetContentLength(self):
+        """Retrieves the content length of the request.
+
+        Returns:
+          int: content length, where 0 represents a request without
+              a Content-Length header, or None if the Content-Length header is
+              not a non-negative decimal integer.
+        """
+        content_length = self.headers.get("Content-Length", None)
+        if content_length is None:
+            return 0
+
+        content_length = content_length.strip()
+        if not content_length.isascii() or not content_length.isdigit():
+            return None
+
+        return int(content_length, 10)
+
+    def _ReadScanSource(self, url, content_length):
+        """Reads the source to scan from the request.
+
+        Args:
+          url (urllib.parse.SplitResult): URL of the request.
+          content_length (int): content length of the request.
+
+        Returns:
+          str|tuple[str, bytes]: path of the document or name of the document
+              and its data, or None if the request is invalid.
+        """
+        request_body = self.rfile.read(content_length)
+
+        content_type = self.headers.get("Content-Type", None) or ""
+        if not content_type.startswith("application/json"):
+            query = urllib.parse.parse_qs(url.query)
+            name = query.get("name", ["<request>"])[0]
+            return name, request_body
+
+        try:
+            request = json.loads(request_body)
+        except ValueError:
+            return None
+
+        path = None
+        if isinstance(request, dict):
+            path = request.get("path", None)
+
+        if not isinstance(path, str):
+            return None
+
+        return path
+
+    def _SendJSON(self, status_code, value, headers=None):
+        """Sends a JSON response.
+
+        Args:
+          status_code (int): HTTP status code.
+          value (object): value to serialize as JSON.
+          headers (Optional[dict[str, str]]): additional response headers.
+        """
+        response_body = json.dumps(value).encode("utf-8")
+        self._SendResponse(status_code, "application/json", response_body, headers)
+
+    def _SendResponse(self, status_code, content_type, response_body, headers=None):
+        """Sends a response.
+
+        Args:
+          status_code (int): HTTP status code.
+          content_type (str): content type of the response body.
+          response_body (bytes): response body.
+          headers (Optional[dict[str, str]]): additional response headers.
+        """
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", f"{len(response_body):d}")
+        for header_name, header_value in (headers or {}).items():
+            self.send_header(header_name, header_value)
+        self.end_headers()
+
+        self.wfile.write(response_body)
+
+    def do_GET(self):
+        """Handles a GET request."""
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/health":
+            self._SendJSON(200, {"status": "ok"})
+
+        elif url.path == "/metrics":
+            text = self.server.scan_service.metrics.GetTextFormat()
+            self._SendResponse(
+                200, "text/plain; version=0.0.4; charset=utf-8", text.encode("utf-8")
+            )
+
+        elif url.path == "/stats":
+            self._SendJSON(200, self.server.scan_service.GetStatistics())
+
+        else:
+            self._SendJSON(404, {"error": "Unsupported path."})
+
+    def do_POST(self):
+        """Handles a POST request."""
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/scan":
+            self._SendJSON(404, {"error": "Unsupported path."})
+            return
+
+        content_length = self._GetContentLength()
+        if content_length is None:
+            # The request body cannot be skipped without a valid length.
+            self.close_connection = True
+            self._SendJSON(400, {"error": "Invalid Content-Length."})
+            return
+
+        if content_length > self.server.maximum_request_size:
+            self.close_connection = True
+            self._SendJSON(413, {"error": "Request too large."})
+            return
+
+        source = self._ReadScanSource(url, content_length)
+        if source is None:
+            self._SendJSON(400, {"error": 'Expected a JSON object with a "path".'})
+            return
+
+        try:
+            document_result = self.server.scan_service.Scan(source)
+        except errors.BackpressureError as exception:
+            self._SendJSON(503, {"error": f"{exception!s}"}, {"Retry-After": "1"})
+            return
+        except TimeoutError as exception:
+            self._SendJSON(504, {"error": f"{exception!s}"})
+            return
+
+        self._SendJSON(200, document_result)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Logs a message.
+
+        Args:
+          format (str): format string of the message.
+          args (list[object]): arguments of the format string.
+        """
+        logging.debug(format, *args)
+
+
+class ScanHTTPServer(http.server.ThreadingHTTPServer):
+    """Scanning service HTTP server that listens on a TCP port.
+
+    Attributes:
+      maximum_request_size (int): maximum size of a request body.
+      scan_service (ScanService): scanning service.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        scan_service,
+        maximum_request_size=DEFAULT_MAXIMUM_REQUEST_SIZE,
+    ):
+        """Initializes a HTTP server.
+
+        Args:
+          server_address (tuple[str, int]): host and port to listen on.
+          scan_service (ScanService): scanning service.
+          maximum_request_size (Optional[int]): maximum size of a request body.
+        """
+        super().__init__(server_address, ScanRequestHandler)
+        self.maximum_request_size = maximum_request_size
+        self.scan_service = scan_service
+
+
+class ScanUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Scanning service HTTP server that listens on a Unix domain socket.
+
+    Attributes:
+      maximum_request_size (int): maximum size of a request body.
+      scan_service (ScanService): scanning service.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path,
+        scan_service,
+        maximum_request_size=DEFAULT_MAXIMUM_REQUEST_SIZE,
+    ):
+        """Initializes a HTTP server.
+
+        Args:
+          socket_path (str): path of the Unix domain socket to listen on.
+          scan_service (ScanService): scanning service.
+          maximum_request_size (Optional[int]): maximum size of a request body.
+        """
+        super().__init__(socket_path, ScanRequestHandler)
+        self.maximum_request_size = maximum_request_size
+        self.scan_service = scan_service
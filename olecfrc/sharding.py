@@ -0,0 +1,156 @@
+"""Deterministic sharding of the documents of a scan over multiple nodes."""
+
+import hashlib
+import os
+
+
+class Shard:
+    """Shard of a scan.
+
+    Attributes:
+      index (int): index of the shard, where 1 represents the first shard.
+      number_of_shards (int): number of shards of the scan.
+    """
+
+    def __init__(self, index, number_of_shards):
+        """Initializes a shard.
+
+        Args:
+          index (int): index of the shard, where 1 represents the first shard.
+          number_of_shards (int): number of shards of the scan.
+
+        Raises:
+          ValueError: if the index or number of shards is out of bounds.
+        """
+        if number_of_shards < 1:
+            raise ValueError(f"Unsupported number of shards: {number_of_shards:d}")
+
+        if index < 1 or index > number_of_shards:
+            raise ValueError(
+                f"Shard index: {index:d} out of bounds 1 - {number_of_shards:d}"
+            )
+
+        super().__init__()
+        self.index = index
+        self.number_of_shards = number_of_shards
+
+    def __eq__(self, other):
+        """Determines if the shard is equal to another shard.
+
+        Args:
+          other (object): other shard.
+
+        Returns:
+          bool: True if the shards are equal.
+        """
+        return (
+            isinstance(other, Shard)
+            and self.index == other.index
+            and self.number_of_shards == other.number_of_shards
+        )
+
+    def __hash__(self):
+        """Retrieves a hash of the shard.
+
+        Returns:
+          int: hash of the shard.
+        """
+        return hash((self.index, self.number_of_shards))
+
+    def __str__(self):
+        """Retrieves a string representation of the shard.
+
+        Returns:
+          str: shard as "I/N".
+        """
+        return f"{self.index:d}/{self.number_of_shards:d}"
+
+    @classmethod
+    def FromString(cls, shard_string):
+        """Creates a shard from a string.
+
+        Args:
+          shard_string (str): shard as "I/N", such as "2/4" for the second of
+              4 shards.
+
+        Returns:
+          Shard: shard.
+
+        Raises:
+          ValueError: if the string is not a supported shard.
+        """
+        index_string, separator, number_of_shards_string = shard_string.partition("/")
+        if not separator:
+            raise ValueError(f"Unsupported shard: {shard_string:s}, expected I/N")
+
+        try:
+            index = int(index_string, 10)
+            number_of_shards = int(number_of_shards_string, 10)
+        except ValueError:
+            raise ValueError(f"Unsupported shard: {shard_string:s}, expected I/N")
+
+        return cls(index, number_of_shards)
+
+    def ContainsPath(self, path):
+        """Determines if a path is assigned to the shard.
+
+        A path is assigned by a hash of the normalized path, which is stable
+        across processes, machines and Python versions, so that every node
+        with the same list of paths assigns the same paths to a shard.
+
+        Args:
+          path (str): path of a document.
+
+        Returns:
+          bool: True if the path is assigned to the shard.
+        """
+        return GetShardIndex(path, self.number_of_shards) == self.index
+
+
+def GetMissingShards(shards):
+    """Determines the shards that are missing from a set of shards.
+
+    Args:
+      shards (list[Shard]): shards.
+
+    Returns:
+      list[Shard]: missing shards, in order of index.
+
+    Raises:
+      ValueError: if the shards are of scans with a different number of shards.
+    """
+    if not shards:
+        return []
+
+    numbers_of_shards = {shard.number_of_shards for shard in shards}
+    if len(numbers_of_shards) > 1:
+        numbers_of_shards_string = ", ".join(
+            [f"{number_of_shards:d}" for number_of_shards in sorted(numbers_of_shards)]
+        )
+        raise ValueError(
+            f"Shards of scans with different number of shards: "
+            f"{numbers_of_shards_string:s}"
+        )
+
+    number_of_shards = numbers_of_shards.pop()
+    indexes = {shard.index for shard in shards}
+    return [
+        Shard(index, number_of_shards)
+        for index in range(1, number_of_shards + 1)
+        if index not in indexes
+    ]
+
+
+def GetShardIndex(path, number_of_shards):
+    """Retrieves the index of the shard a path is assigned to.
+
+    Args:
+      path (str): path of a document.
+      number_of_shards (int): number of shards.
+
+    Returns:
+      int: index of the shard, where 1 represents the first shard.
+    """
+    normalized_path = os.path.normpath(path).encode("utf-8", "surrogateescape")
+    digest = hashlib.sha256(normalized_path).digest()
+    return (int.from_bytes(digest[:8], "big") % number_of_shards) + 1
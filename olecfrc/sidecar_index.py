@@ -0,0 +1,977 @@
+"""Sidecar index files of the Visual Basic for Applications (VBA) streams."""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from olecfrc import compression
+from olecfrc import deduplication
+from olecfrc import errors
+from olecfrc import vba
+
+# Kinds of index tables, where the key of a table identifies the item it indexes.
+#
+# PROJECT: key is the path of the project storage, values are the code page.
+# STREAM: key is the path of a stream, values are the size of the stream.
+# MODULE: key is the project path and module name, label is the name of
+#     the module stream, values are the offset of the compressed source code.
+# F_STREAM_ENTRIES: key is the path of a form storage, values are the offset
+#     and size of each f stream entry.
+# O_STREAM_ENTRIES: key is the path of a form storage, values are the offset
+#     and size of each o stream entry.
+# CONTROL: key is the form path and control name, values are the index of
+#     the f stream entry of the control, followed by the index of its o stream
+#     entry if the control has one.
+# STRING_TABLE: key is the path of the project storage, values are the offset
+#     of each string in the _VBA_PROJECT stream.
+TABLE_KIND_PROJECT = 1
+TABLE_KIND_STREAM = 2
+TABLE_KIND_MODULE = 3
+TABLE_KIND_F_STREAM_ENTRIES = 4
+TABLE_KIND_O_STREAM_ENTRIES = 5
+TABLE_KIND_CONTROL = 6
+TABLE_KIND_STRING_TABLE = 7
+
+# Extension of a sidecar index file stored next to the document.
+SIDECAR_INDEX_EXTENSION = ".olecfrc-index"
+
+
+def _WriteSidecarIndex(
+    path, document_size, modification_time, structure_digest, digest, tables
+):
+    """Writes a sidecar index file.
+
+    The file is replaced atomically, so that a reader never maps a partially
+    written index.
+
+    Args:
+      path (str): path of the sidecar index file.
+      document_size (int): size of the document.
+      modification_time (int): modification time of the document in
+          nanoseconds since the epoch.
+      structure_digest (bytes): SHA-256 digest of the header and directory
+          sectors of the document.
+      digest (bytes): SHA-256 digest of the content of the document.
+      tables (list[tuple[int, str, str, list[int]]]): kind, key, label and
+          values of the index tables.
+    """
+    header_size = SidecarIndex.HEADER.size
+    descriptors_size = SidecarIndex.TABLE_DESCRIPTOR.size * len(tables)
+
+    encoded_tables = [
+        (kind, key.encode("utf-8"), label.encode("utf-8"), values)
+        for kind, key, label, values in tables
+    ]
+
+    names_offset = header_size + descriptors_size
+    names_size = sum(len(key) + len(label) for _, key, label, _ in encoded_tables)
+
+    # The values are 64-bit aligned.
+    values_offset = (names_offset + names_size + 7) & ~7
+
+    descriptors = []
+    names = []
+    values_data = []
+    for kind, key, label, values in encoded_tables:
+        descriptors.append(
+            SidecarIndex.TABLE_DESCRIPTOR.pack(
+                kind, len(key), len(label), len(values), names_offset, values_offset
+            )
+        )
+        names.extend([key, label])
+        values_data.append(struct.pack(f"<{len(values):d}Q", *values))
+
+        names_offset += len(key) + len(label)
+        values_offset += 8 * len(values)
+
+    header = SidecarIndex.HEADER.pack(
+        SidecarIndex.SIGNATURE,
+        SidecarIndex.FORMAT_VERSION,
+        len(tables),
+        document_size,
+        modification_time,
+        structure_digest,
+        digest,
+    )
+    names_data = b"".join(names)
+    padding_size = (-(header_size + descriptors_size + len(names_data))) % 8
+
+    directory_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory_path, exist_ok=True)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory_path, prefix=".olecfrc-index", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file_object:
+            file_object.write(header)
+            file_object.write(b"".join(descriptors))
+            file_object.write(names_data)
+            file_object.write(b"\x00" * padding_size)
+            file_object.write(b"".join(values_data))
+        os.replace(temporary_path, path)
+
+    except Exception:
+        os.remove(temporary_path)
+        raise
+
+
+def _GetStructureDigest(document_path):
+    """Calculates the digest of the header and directory sectors of a document.
+
+    Only the header sector, the FAT sectors needed to follow the directory
+    sector chain and the directory sectors are read, such that the digest is
+    cheap to calculate regardless of the size of the document. Since
+    the directory contains the sizes and first sectors of all the streams,
+    the digest changes when the layout of the streams changes.
+
+    Args:
+      document_path (str): path of the document.
+
+    Returns:
+      bytes: SHA-256 digest of the header and directory sectors.
+
+    Raises:
+      OSError: if the document could not be read.
+    """
+    hash_context = hashlib.sha256()
+
+    with open(document_path, "rb") as file_object:
+        header_data = file_object.read(512)
+        hash_context.update(header_data)
+        if len(header_data) < 512:
+            return hash_context.digest()
+
+        (sector_shift,) = struct.unpack_from("<H", header_data, 30)
+        sector_size = 1 << min(max(sector_shift, 7), 16)
+        (directory_sector,) = struct.unpack_from("<I", header_data, 48)
+        difat_sector, number_of_difat_sectors = struct.unpack_from(
+            "<II", header_data, 68
+        )
+        fat_sectors = list(struct.unpack_from("<109I", header_data, 76))
+
+        def _ReadSector(sector_number):
+            file_object.seek((sector_number + 1) * sector_size, os.SEEK_SET)
+            return file_object.read(sector_size)
+
+        entries_per_sector = sector_size // 4
+        fat_sector_data = {}
+
+        # Sector numbers of 0xfffffffa and above are special values, such as
+        # the end of chain marker.
+        maximum_number_of_sectors = os.fstat(file_object.fileno()).st_size // (
+            sector_size
+        )
+        for _ in range(maximum_number_of_sectors):
+            if directory_sector >= 0xFFFFFFFA:
+                break
+
+            hash_context.update(_ReadSector(directory_sector))
+
+            fat_index, entry_index = divmod(directory_sector, entries_per_sector)
+            while fat_index >= len(fat_sectors) and number_of_difat_sectors > 0:
+                if difat_sector >= 0xFFFFFFFA:
+                    break
+
+                difat_data = _ReadSector(difat_sector)
+                if len(difat_data) < sector_size:
+                    break
+
+                fat_sectors.extend(
+                    struct.unpack_from(f"<{entries_per_sector - 1:d}I", difat_data, 0)
+                )
+                (difat_sector,) = struct.unpack_from("<I", difat_data, sector_size - 4)
+                number_of_difat_sectors -= 1
+
+            if fat_index >= len(fat_sectors):
+                break
+
+            if fat_index not in fat_sector_data:
+                fat_sector_data[fat_index] = _ReadSector(fat_sectors[fat_index])
+
+            data = fat_sector_data[fat_index]
+            if 4 * entry_index + 4 > len(data):
+                break
+
+            (directory_sector,) = struct.unpack_from("<I", data, 4 * entry_index)
+
+    return hash_context.digest()
+
+
+def BuildSidecarIndex(document_path, index_path):
+    """Builds the sidecar index of a document.
+
+    The streams of the document are parsed once, after which the offsets of
+    the module source code, f and o stream entries and strings are stored, so
+    that repeated queries read only the needed entries.
+
+    Args:
+      document_path (str): path of the document.
+      index_path (str): path of the sidecar index file.
+
+    Raises:
+      IOError: if the document could not be read.
+      OSError: if the document could not be read or the index not written.
+      ParseError: if a stream of the document could not be parsed.
+    """
+    stat_object = os.stat(document_path)
+    structure_digest = _GetStructureDigest(document_path)
+    digest = deduplication.GetContentDigest(document_path)
+
+    tables = []
+    olecf_file = vba.OpenOLECFFile(document_path)
+    try:
+        for project_path in vba.GetProjectRootPaths(olecf_file.root_item, ""):
+            tables.extend(_GetProjectTables(olecf_file, project_path))
+
+    finally:
+        olecf_file.close()
+
+    _WriteSidecarIndex(
+        index_path,
+        stat_object.st_size,
+        stat_object.st_mtime_ns,
+        structure_digest,
+        digest,
+        tables,
+    )
+
+
+def _GetProjectTables(olecf_file, project_path):
+    """Retrieves the index tables of a project.
+
+    Args:
+      olecf_file (pyolecf.file): OLECF file.
+      project_path (str): path of the storage that contains the project.
+
+    Returns:
+      list[tuple[int, str, str, list[int]]]: kind, key, label and values of
+          the index tables.
+
+    Raises:
+      ParseError: if a stream of the project could not be parsed.
+    """
+    tables = []
+    stream_paths = []
+
+    with vba.VBAProject(olecf_file=olecf_file, path=project_path) as vba_project:
+        project_info = vba_project.project_info
+
+        code_page = 0
+        if project_info:
+            code_page = project_info.code_page or 0
+            stream_paths.append(f"{project_path:s}\\VBA\\dir")
+
+            for vba_module in project_info.modules:
+                tables.append(
+                    (
+                        TABLE_KIND_MODULE,
+                        f"{project_path:s}\\{vba_module.name:s}",
+                        vba_module.stream_name,
+                        [vba_module.text_offset],
+                    )
+                )
+                stream_paths.append(
+                    f"{project_path:s}\\VBA\\{vba_module.stream_name:s}"
+                )
+
+        tables.insert(0, (TABLE_KIND_PROJECT, project_path, "", [code_page]))
+
+        for vba_form in vba_project.forms:
+            form_path = f"{project_path:s}\\{vba_form.name:s}"
+            stream_paths.extend([f"{form_path:s}\\f", f"{form_path:s}\\o"])
+
+            f_stream_values = []
+            control_keys = set()
+            for entry_index, f_stream_entry in enumerate(vba_form.f_stream_entries):
+                # The size of a f stream entry excludes its 32-bit size value.
+                f_stream_values.extend([f_stream_entry.offset, 4 + f_stream_entry.size])
+
+                # Controls without a name cannot be looked up and only the first
+                # of controls with the same name is indexed.
+                if f_stream_entry.name is None:
+                    continue
+
+                control_key = f"{form_path:s}\\{f_stream_entry.name:s}"
+                if control_key not in control_keys:
+                    control_keys.add(control_key)
+
+                    control_values = [entry_index]
+                    if f_stream_entry.o_stream_entry_index is not None:
+                        control_values.append(f_stream_entry.o_stream_entry_index)
+
+                    tables.append((TABLE_KIND_CONTROL, control_key, "", control_values))
+
+            o_stream_values = []
+            if vba_form.o_stream:
+                for entry_offset, entry_size in zip(
+                    vba_form.o_stream.entry_offsets, vba_form.o_stream.entry_sizes
+                ):
+                    o_stream_values.extend([entry_offset, entry_size])
+
+            tables.append((TABLE_KIND_F_STREAM_ENTRIES, form_path, "", f_stream_values))
+            tables.append((TABLE_KIND_O_STREAM_ENTRIES, form_path, "", o_stream_values))
+
+        performance_cache = vba_project.performance_cache
+        if performance_cache:
+            stream_paths.append(f"{project_path:s}\\VBA\\_VBA_PROJECT")
+            tables.append(
+                (
+                    TABLE_KIND_STRING_TABLE,
+                    project_path,
+                    "",
+                    [
+                        performance_cache.strings.GetOffset(string_index)
+                        for string_index in range(len(performance_cache.strings))
+                    ],
+                )
+            )
+
+    for stream_path in stream_paths:
+        olecf_item = olecf_file.get_item_by_path(stream_path)
+        if olecf_item:
+            tables.append((TABLE_KIND_STREAM, stream_path, "", [olecf_item.size]))
+
+    return tables
+
+
+def GetSidecarIndexPath(document_path, cache_directory=None):
+    """Retrieves the path of the sidecar index file of a document.
+
+    Args:
+      document_path (str): path of the document.
+      cache_directory (Optional[str]): path of the directory in which
+          the sidecar index files are stored, where None represents storing
+          the index next to the document.
+
+    Returns:
+      str: path of the sidecar index file.
+    """
+    if not cache_directory:
+        return f"{document_path:s}{SIDECAR_INDEX_EXTENSION:s}"
+
+    absolute_path = os.path.abspath(document_path)
+    path_digest = hashlib.sha256(absolute_path.encode("utf-8")).hexdigest()
+    return os.path.join(cache_directory, f"{path_digest:s}{SIDECAR_INDEX_EXTENSION:s}")
+
+
+class SidecarIndex:
+    """Sidecar index file that is memory-mapped to look up entries.
+
+    The index file consists of:
+    * a header, which contains the size, modification time, SHA-256 digest of
+      the header and directory sectors and SHA-256 digest of the content of
+      the document the index was built from;
+    * a table descriptor per index table;
+    * the UTF-8 encoded keys and labels of the index tables;
+    * the 64-bit values of the index tables.
+
+    Only the header and the table descriptors are read when the index is opened,
+    where the values are unpacked from the mapping when they are looked up.
+
+    Attributes:
+      document_digest (bytes): SHA-256 digest of the content of the document.
+      document_structure_digest (bytes): SHA-256 digest of the header and
+          directory sectors of the document.
+      document_modification_time (int): modification time of the document in
+          nanoseconds since the epoch.
+      document_size (int): size of the document.
+    """
+
+    FORMAT_VERSION = 3
+
+    # Signature, format version, number of tables, document size, modification
+    # time, structure digest and content digest.
+    HEADER = struct.Struct("<8sIIQq32s32s")
+
+    SIGNATURE = b"OLECFRCI"
+
+    # Kind, key size, label size, number of values, names offset and values
+    # offset.
+    TABLE_DESCRIPTOR = struct.Struct("<IHHQQQ")
+
+    _VALUE = struct.Struct("<Q")
+
+    def __init__(self):
+        """Initializes a sidecar index."""
+        super().__init__()
+        self._file_object = None
+        self._mapping = None
+        self._tables = {}
+
+        self.document_digest = None
+        self.document_modification_time = None
+        self.document_size = None
+        self.document_structure_digest = None
+
+    def __enter__(self):
+        """Enters a with statement.
+
+        Returns:
+          SidecarIndex: sidecar index.
+        """
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        """Exits a with statement.
+
+        Args:
+          exception_type (type): type of the exception or None.
+          value (Exception): exception or None.
+          traceback (traceback): traceback of the exception or None.
+        """
+        self.Close()
+
+    def Close(self):
+        """Closes the sidecar index."""
+        if self._mapping:
+            self._mapping.close()
+            self._mapping = None
+
+        if self._file_object:
+            self._file_object.close()
+            self._file_object = None
+
+        self._tables = {}
+
+    def GetKeys(self, kind):
+        """Retrieves the keys of the index tables of a specific kind.
+
+        Args:
+          kind (int): kind of index table, such as TABLE_KIND_MODULE.
+
+        Returns:
+          list[str]: keys in order of the index.
+        """
+        return [
+            table_key for table_kind, table_key in self._tables if table_kind == kind
+        ]
+
+    def GetLabel(self, kind, key):
+        """Retrieves the label of an index table.
+
+        Args:
+          kind (int): kind of index table, such as TABLE_KIND_MODULE.
+          key (str): key of the index table.
+
+        Returns:
+          str: label or None if the index does not contain the table.
+        """
+        table = self._tables.get((kind, key), None)
+        if not table:
+            return None
+
+        return table[0]
+
+    def GetNumberOfValues(self, kind, key):
+        """Retrieves the number of values of an index table.
+
+        Args:
+          kind (int): kind of index table, such as TABLE_KIND_MODULE.
+          key (str): key of the index table.
+
+        Returns:
+          int: number of values or 0 if the index does not contain the table.
+        """
+        table = self._tables.get((kind, key), None)
+        if not table:
+            return 0
+
+        return table[1]
+
+    def GetValue(self, kind, key, value_index=0):
+        """Retrieves a value of an index table.
+
+        Args:
+          kind (int): kind of index table, such as TABLE_KIND_MODULE.
+          key (str): key of the index table.
+          value_index (Optional[int]): index of the value.
+
+        Returns:
+          int: value or None if the index does not contain the table.
+
+        Raises:
+          IndexError: if the value index is out of bounds.
+        """
+        table = self._tables.get((kind, key), None)
+        if not table:
+            return None
+
+        _, number_of_values, values_offset = table
+        if value_index < 0 or value_index >= number_of_values:
+            raise IndexError(f"Value index: {value_index:d} out of bounds.")
+
+        return self._VALUE.unpack_from(self._mapping, values_offset + 8 * value_index)[
+            0
+        ]
+
+    def GetValues(self, kind, key):
+        """Retrieves the values of an index table.
+
+        Args:
+          kind (int): kind of index table, such as TABLE_KIND_MODULE.
+          key (str): key of the index table.
+
+        Returns:
+          tuple[int]: values or None if the index does not contain the table.
+        """
+        table = self._tables.get((kind, key), None)
+        if not table:
+            return None
+
+        _, number_of_values, values_offset = table
+        return struct.unpack_from(
+            f"<{number_of_values:d}Q", self._mapping, values_offset
+        )
+
+    def HasMatchingStreamSizes(self, olecf_file):
+        """Determines if the sizes of the indexed streams match a document.
+
+        Args:
+          olecf_file (pyolecf.file): OLECF file of the document.
+
+        Returns:
+          bool: True if every indexed stream exists and has the indexed size.
+        """
+        for stream_path in self.GetKeys(TABLE_KIND_STREAM):
+            olecf_item = olecf_file.get_item_by_path(stream_path)
+            if not olecf_item or olecf_item.size != self.GetValue(
+                TABLE_KIND_STREAM, stream_path
+            ):
+                return False
+
+        return True
+
+    def IsValid(self, document_path, verify_digest=False):
+        """Determines if the index is valid for a document.
+
+        The size and modification time of the document and the digest of its
+        header and directory sectors are compared, which only reads a few
+        sectors of the document.
+
+        Args:
+          document_path (str): path of the document.
+          verify_digest (Optional[bool]): True if the digest of the entire
+              content of the document should be verified as well, which reads
+              the entire document.
+
+        Returns:
+          bool: True if the index was built from the current content of
+              the document.
+
+        Raises:
+          OSError: if the document could not be read.
+        """
+        stat_object = os.stat(document_path)
+        if (
+            stat_object.st_size != self.document_size
+            or stat_object.st_mtime_ns != self.document_modification_time
+        ):
+            return False
+
+        if _GetStructureDigest(document_path) != self.document_structure_digest:
+            return False
+
+        if not verify_digest:
+            return True
+
+        return deduplication.GetContentDigest(document_path) == self.document_digest
+
+    def Open(self, path):
+        """Opens a sidecar index file.
+
+        Args:
+          path (str): path of the sidecar index file.
+
+        Raises:
+          OSError: if the sidecar index file could not be opened.
+          ParseError: if the sidecar index file is not supported.
+          ValueError: if the sidecar index file is empty.
+        """
+        self._file_object = open(path, "rb")  # pylint: disable=consider-using-with
+        try:
+            self._mapping = mmap.mmap(
+                self._file_object.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self._ReadTables()
+
+        except (OSError, ValueError, errors.ParseError):
+            self.Close()
+            raise
+
+    def _ReadTables(self):
+        """Reads the header and the table descriptors.
+
+        Raises:
+          ParseError: if the header or table descriptors are not supported.
+        """
+        mapping_size = len(self._mapping)
+        if mapping_size < self.HEADER.size:
+            raise errors.ParseError("Truncated sidecar index header.")
+
+        (
+            signature,
+            format_version,
+            number_of_tables,
+            self.document_size,
+            self.document_modification_time,
+            self.document_structure_digest,
+            self.document_digest,
+        ) = self.HEADER.unpack_from(self._mapping, 0)
+
+        if signature != self.SIGNATURE:
+            raise errors.ParseError("Unsupported sidecar index signature.")
+
+        if format_version != self.FORMAT_VERSION:
+            raise errors.ParseError(
+                f"Unsupported sidecar index format version: {format_version:d}."
+            )
+
+        descriptor_offset = self.HEADER.size
+        if descriptor_offset + number_of_tables * self.TABLE_DESCRIPTOR.size > (
+            mapping_size
+        ):
+            raise errors.ParseError("Truncated sidecar index table descriptors.")
+
+        for _ in range(number_of_tables):
+            (
+                kind,
+                key_size,
+                label_size,
+                number_of_values,
+                names_offset,
+                values_offset,
+            ) = self.TABLE_DESCRIPTOR.unpack_from(self._mapping, descriptor_offset)
+            descriptor_offset += self.TABLE_DESCRIPTOR.size
+
+            label_offset = names_offset + key_size
+            if (
+                label_offset + label_size > mapping_size
+                or values_offset + 8 * number_of_values > mapping_size
+            ):
+                raise errors.ParseError("Truncated sidecar index table.")
+
+            key = self._mapping[names_offset:label_offset].decode(
+                "utf-8", errors="replace"
+            )
+            label = self._mapping[label_offset : label_offset + label_size].decode(
+                "utf-8", errors="replace"
+            )
+            self._tables[(kind, key)] = (label, number_of_values, values_offset)
+
+
+class IndexedDocument:
+    """Document that is queried by the offsets stored in its sidecar index.
+
+    The sidecar index is built when it is missing or no longer matches
+    the document, after which queries read only the entries they need from
+    the OLE Compound File. For example:
+
+      with sidecar_index.IndexedDocument("document.doc") as indexed_document:
+        print(indexed_document.GetModuleSourceCode("Module1"))
+
+    Attributes:
+      index_built (bool): True if the sidecar index was (re)built when
+          the document was opened.
+      index_path (str): path of the sidecar index file.
+    """
+
+    def __init__(self, path, cache_directory=None, verify_digest=False):
+        """Initializes an indexed document.
+
+        Args:
+          path (str): path of the document.
+          cache_directory (Optional[str]): path of the directory in which
+              the sidecar index files are stored, where None represents storing
+              the index next to the document.
+          verify_digest (Optional[bool]): True if the digest of the entire
+              content of the document should be verified before an existing
+              index is used, in addition to its size, modification time,
+              header and directory sectors and stream sizes, which reads
+              the entire document.
+        """
+        super().__init__()
+        self._olecf_file = None
+        self._path = path
+        self._sidecar_index = None
+        self._verify_digest = verify_digest
+
+        self.index_built = False
+        self.index_path = GetSidecarIndexPath(path, cache_directory=cache_directory)
+
+    def __enter__(self):
+        """Enters a with statement.
+
+        Returns:
+          IndexedDocument: indexed document.
+        """
+        self.Open()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        """Exits a with statement.
+
+        Args:
+          exception_type (type): type of the exception or None.
+          value (Exception): exception or None.
+          traceback (traceback): traceback of the exception or None.
+        """
+        self.Close()
+
+    @property
+    def project_paths(self):
+        """list[str]: paths of the storages that contain the projects."""
+        return self._sidecar_index.GetKeys(TABLE_KIND_PROJECT)
+
+    def _GetProjectPath(self, project_path):
+        """Retrieves the path of a project.
+
+        Args:
+          project_path (str): path of the storage that contains the project,
+              where None represents the first project.
+
+        Returns:
+          str: path of the storage that contains the project or None if
+              the document does not contain a project.
+        """
+        if project_path is not None:
+            return project_path
+
+        return next(iter(self.project_paths), None)
+
+    def _OpenSidecarIndex(self):
+        """Opens the sidecar index if it exists and matches the document.
+
+        Returns:
+          SidecarIndex: sidecar index or None if not available.
+        """
+        if not os.path.exists(self.index_path):
+            return None
+
+        index = SidecarIndex()
+        try:
+            index.Open(self.index_path)
+        except (OSError, ValueError, errors.ParseError):
+            return None
+
+        if not index.IsValid(
+            self._path, verify_digest=self._verify_digest
+        ) or not index.HasMatchingStreamSizes(self._olecf_file):
+            index.Close()
+            return None
+
+        return index
+
+    def Close(self):
+        """Closes the document and its sidecar index."""
+        if self._olecf_file:
+            self._olecf_file.close()
+            self._olecf_file = None
+
+        if self._sidecar_index:
+            self._sidecar_index.Close()
+            self._sidecar_index = None
+
+    def GetFormControl(self, form_name, control_name, project_path=None):
+        """Retrieves a form control.
+
+        Only the f stream entry of the control and its o stream entry are read.
+
+        Args:
+          form_name (str): name of the storage of the form.
+          control_name (str): name of the control.
+          project_path (Optional[str]): path of the storage that contains
+              the project, where None represents the first project.
+
+        Returns:
+          VBAFormControl: form control or None if not available.
+
+        Raises:
+          ParseError: if an entry of the form could not be parsed.
+        """
+        project_path = self._GetProjectPath(project_path)
+        if project_path is None:
+            return None
+
+        form_path = f"{project_path:s}\\{form_name:s}"
+        control_key = f"{form_path:s}\\{control_name:s}"
+        entry_index = self._sidecar_index.GetValue(TABLE_KIND_CONTROL, control_key)
+        if entry_index is None:
+            return None
+
+        olecf_f_item = self._olecf_file.get_item_by_path(f"{form_path:s}\\f")
+        if not olecf_f_item:
+            return None
+
+        offset = self._sidecar_index.GetValue(
+            TABLE_KIND_F_STREAM_ENTRIES, form_path, 2 * entry_index
+        )
+        size = self._sidecar_index.GetValue(
+            TABLE_KIND_F_STREAM_ENTRIES, form_path, 2 * entry_index + 1
+        )
+        f_stream_entry, entry_data = vba.FStream().ReadEntry(olecf_f_item, offset, size)
+
+        # The index of the o stream entry is determined by the preceding f stream
+        # entries and is stored with the index of the f stream entry.
+        o_entry_index = None
+        if self._sidecar_index.GetNumberOfValues(TABLE_KIND_CONTROL, control_key) > 1:
+            o_entry_index = self._sidecar_index.GetValue(
+                TABLE_KIND_CONTROL, control_key, 1
+            )
+            f_stream_entry.o_stream_entry_index = o_entry_index
+
+        o_stream_entry = None
+        olecf_o_item = self._olecf_file.get_item_by_path(f"{form_path:s}\\o")
+        if (
+            olecf_o_item
+            and o_entry_index is not None
+            and 2 * o_entry_index
+            < self._sidecar_index.GetNumberOfValues(
+                TABLE_KIND_O_STREAM_ENTRIES, form_path
+            )
+        ):
+            o_stream_entry = vba.OStream().ReadEntry(
+                olecf_o_item,
+                self._sidecar_index.GetValue(
+                    TABLE_KIND_O_STREAM_ENTRIES, form_path, 2 * o_entry_index
+                ),
+                self._sidecar_index.GetValue(
+                    TABLE_KIND_O_STREAM_ENTRIES, form_path, 2 * o_entry_index + 1
+                ),
+                f_stream_entry.clsid_cache_index,
+            )
+
+        return vba.VBAFormControl(
+            f_stream_entry,
+            o_stream_entry=o_stream_entry,
+            f_stream_data=entry_data,
+            f_stream_data_offset=offset,
+        )
+
+    def GetModuleSourceCode(self, module_name, project_path=None):
+        """Retrieves the source code of a module.
+
+        Only the compressed source code of the module is read.
+
+        Args:
+          module_name (str): name of the module.
+          project_path (Optional[str]): path of the storage that contains
+              the project, where None represents the first project.
+
+        Returns:
+          str: source code or None if not available.
+
+        Raises:
+          ParseError: if the source code could not be decompressed.
+        """
+        project_path = self._GetProjectPath(project_path)
+        if project_path is None:
+            return None
+
+        module_key = f"{project_path:s}\\{module_name:s}"
+        text_offset = self._sidecar_index.GetValue(TABLE_KIND_MODULE, module_key)
+        if text_offset is None:
+            return None
+
+        stream_name = self._sidecar_index.GetLabel(TABLE_KIND_MODULE, module_key)
+        olecf_item = self._olecf_file.get_item_by_path(
+            f"{project_path:s}\\VBA\\{stream_name:s}"
+        )
+        if not olecf_item or text_offset > olecf_item.size:
+            return None
+
+        compressed_data = olecf_item.read_buffer_at_offset(
+            olecf_item.size - text_offset, text_offset
+        )
+        code_page = self._sidecar_index.GetValue(TABLE_KIND_PROJECT, project_path)
+
+        return vba.DecodeProjectString(
+            compression.Decompress(compressed_data), code_page or None
+        )
+
+    def GetNumberOfStrings(self, project_path=None):
+        """Retrieves the number of strings in the _VBA_PROJECT stream.
+
+        Args:
+          project_path (Optional[str]): path of the storage that contains
+              the project, where None represents the first project.
+
+        Returns:
+          int: number of strings.
+        """
+        project_path = self._GetProjectPath(project_path)
+        if project_path is None:
+            return 0
+
+        return self._sidecar_index.GetNumberOfValues(
+            TABLE_KIND_STRING_TABLE, project_path
+        )
+
+    def GetString(self, string_index, project_path=None):
+        """Retrieves a string of the _VBA_PROJECT stream.
+
+        Only the string is read.
+
+        Args:
+          string_index (int): index of the string.
+          project_path (Optional[str]): path of the storage that contains
+              the project, where None represents the first project.
+
+        Returns:
+          str: string or None if not available.
+
+        Raises:
+          IndexError: if the string index is out of bounds.
+        """
+        project_path = self._GetProjectPath(project_path)
+        if project_path is None:
+            return None
+
+        offset = self._sidecar_index.GetValue(
+            TABLE_KIND_STRING_TABLE, project_path, string_index
+        )
+        if offset is None:
+            return None
+
+        olecf_item = self._olecf_file.get_item_by_path(
+            f"{project_path:s}\\VBA\\_VBA_PROJECT"
+        )
+        if not olecf_item:
+            return None
+
+        string_size_data = olecf_item.read_buffer_at_offset(2, offset)
+        string_size = int.from_bytes(string_size_data, "little")
+        string_data = olecf_item.read_buffer_at_offset(string_size, offset + 2)
+
+        return sys.intern(string_data.decode("utf-16-le", errors="replace"))
+
+    def Open(self):
+        """Opens the document and its sidecar index.
+
+        The sidecar index is built if it is missing or no longer matches
+        the document.
+
+        Raises:
+          IOError: if the document could not be read.
+          OSError: if the document could not be read or the index not written.
+          ParseError: if a stream of the document could not be parsed.
+          ValueError: if the written index is empty.
+        """
+        self.index_built = False
+        self._olecf_file = vba.OpenOLECFFile(self._path)
+
+        try:
+            self._sidecar_index = self._OpenSidecarIndex()
+            if not self._sidecar_index:
+                BuildSidecarIndex(self._path, self.index_path)
+                self.index_built = True
+
+                self._sidecar_index = SidecarIndex()
+                self._sidecar_index.Open(self.index_path)
+
+        except (IOError, OSError, ValueError, errors.ParseError):
+            self.Close()
+            raise
@@ -0,0 +1,298 @@
+"""SQLite writer of Visual Basic for Applications (VBA) collection results."""
+
+import os
+import sqlite3
+
+import olecfrc
+
+from olecfrc import batch
+
+
+class SQLiteWriter:
+    """SQLite writer of VBA collection results.
+
+    The results are stored in a normalized schema. To keep the writer from
+    becoming a bottleneck, rows are buffered and written with executemany in
+    large transactions, the database uses the write-ahead log (WAL) journal mode
+    and indexes are only created when the writer is closed.
+
+    The metadata table describes the results, such as the shards of the scan.
+    """
+
+    _TABLE_DEFINITIONS = {
+        "metadata": (
+            "key TEXT PRIMARY KEY",
+            "value TEXT",
+        ),
+        "documents": (
+            "id INTEGER PRIMARY KEY",
+            "source TEXT",
+            "stream_found INTEGER",
+            "error TEXT",
+        ),
+        "project_roots": (
+            "id INTEGER PRIMARY KEY",
+            "document_id INTEGER",
+            "container_path TEXT",
+            "path TEXT",
+            "project_name TEXT",
+            "code_page INTEGER",
+        ),
+        "project_keys": (
+            "project_root_id INTEGER",
+            "key TEXT",
+            "value TEXT",
+        ),
+        "form_controls": (
+            "project_root_id INTEGER",
+            "form_name TEXT",
+            "control_index INTEGER",
+            "name TEXT",
+            "control_type TEXT",
+            "o_stream_entry_index INTEGER",
+            "o_stream_entry_size INTEGER",
+            "data TEXT",
+            "font_name TEXT",
+        ),
+        "modules": (
+            "project_root_id INTEGER",
+            "module_index INTEGER",
+            "name TEXT",
+            "stream_name TEXT",
+            "module_type TEXT",
+            "source_code TEXT",
+        ),
+        "project_strings": (
+            "project_root_id INTEGER",
+            "string_index INTEGER",
+            "string TEXT",
+        ),
+    }
+
+    _INDEX_DEFINITIONS = (
+        ("documents", "source"),
+        ("project_roots", "document_id"),
+        ("project_keys", "project_root_id"),
+        ("form_controls", "project_root_id"),
+        ("modules", "project_root_id"),
+        ("modules", "name"),
+        ("project_strings", "project_root_id"),
+        ("project_strings", "string"),
+    )
+
+    def __init__(self, path, append=False, batch_size=50000, shards=None):
+        """Initializes a SQLite writer.
+
+        Args:
+          path (str): path of the SQLite database file.
+          append (Optional[bool]): True if results should be appended to
+              an existing database, such as when a scan is resumed, where
+              an existing database is otherwise recreated.
+          batch_size (Optional[int]): number of rows that are buffered before
+              they are written in a single transaction.
+          shards (Optional[list[Shard]]): shards of the scan the results are of,
+              where None represents an unsharded scan.
+        """
+        super().__init__()
+        self._append = append
+        self._batch_size = batch_size
+        self._connection = None
+        self._next_document_identifier = 1
+        self._next_project_root_identifier = 1
+        self._number_of_buffered_rows = 0
+        self._path = path
+        self._rows = {table_name: [] for table_name in self._TABLE_DEFINITIONS}
+        self._shards = shards or []
+
+    def _Flush(self):
+        """Writes the buffered rows in a single transaction."""
+        if not self._number_of_buffered_rows:
+            return
+
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            for table_name, rows in self._rows.items():
+                if rows:
+                    column_placeholders = ", ".join(
+                        ["?"] * len(self._TABLE_DEFINITIONS[table_name])
+                    )
+                    cursor.executemany(
+                        f"INSERT INTO {table_name:s} VALUES ({column_placeholders:s})",
+                        rows,
+                    )
+                    rows.clear()
+
+            cursor.execute("COMMIT")
+
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK")
+            raise
+
+        self._number_of_buffered_rows = 0
+
+    def _GetNextIdentifier(self, table_name):
+        """Retrieves the next free identifier of a table.
+
+        Args:
+          table_name (str): name of the table.
+
+        Returns:
+          int: next free identifier.
+        """
+        cursor = self._connection.execute(f"SELECT MAX(id) FROM {table_name:s}")
+        maximum_identifier = cursor.fetchone()[0]
+        return (maximum_identifier or 0) + 1
+
+    def Close(self):
+        """Closes the writer.
+
+        Buffered rows are written and the indexes are created.
+        """
+        if not self._connection:
+            return
+
+        self._Flush()
+
+        for table_name, column_name in self._INDEX_DEFINITIONS:
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table_name:s}_{column_name:s}_index "
+                f"ON {table_name:s} ({column_name:s})"
+            )
+
+        self._connection.close()
+        self._connection = None
+
+    def Flush(self):
+        """Writes the buffered rows."""
+        self._Flush()
+
+    def Open(self):
+        """Opens the writer.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        if not self._append:
+            for path in (self._path, f"{self._path:s}-shm", f"{self._path:s}-wal"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    return False
+
+        try:
+            self._connection = sqlite3.connect(self._path, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._connection.execute("PRAGMA temp_store = MEMORY")
+
+            for table_name, column_definitions in self._TABLE_DEFINITIONS.items():
+                column_definitions = ", ".join(column_definitions)
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table_name:s} "
+                    f"({column_definitions:s})"
+                )
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                [
+                    ("format", batch.RESULTS_FORMAT),
+                    ("format_version", f"{batch.RESULTS_FORMAT_VERSION:d}"),
+                    ("olecfrc_version", olecfrc.__version__),
+                    ("shards", ",".join([f"{shard!s}" for shard in self._shards])),
+                ],
+            )
+
+            self._next_document_identifier = self._GetNextIdentifier("documents")
+            self._next_project_root_identifier = self._GetNextIdentifier(
+                "project_roots"
+            )
+
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    def WriteDocumentResult(self, document_result):
+        """Writes a document result.
+
+        Args:
+          document_result (DocumentResult): document result.
+        """
+        document_identifier = self._next_document_identifier
+        self._next_document_identifier += 1
+
+        self._rows["documents"].append(
+            (
+                document_identifier,
+                document_result.source,
+                int(document_result.stream_found),
+                document_result.error,
+            )
+        )
+        number_of_rows = 1
+
+        for project_root in document_result.project_roots:
+            project_root_identifier = self._next_project_root_identifier
+            self._next_project_root_identifier += 1
+
+            self._rows["project_roots"].append(
+                (
+                    project_root_identifier,
+                    document_identifier,
+                    project_root.container_path,
+                    project_root.path,
+                    project_root.project_name,
+                    project_root.code_page,
+                )
+            )
+            self._rows["project_keys"].extend(
+                (project_root_identifier, key, value)
+                for key, value in project_root.project_keys
+            )
+
+            for vba_form in project_root.forms:
+                for control_index, vba_form_control in enumerate(vba_form.controls):
+                    f_stream_entry = vba_form_control.f_stream_entry
+                    self._rows["form_controls"].append(
+                        (
+                            project_root_identifier,
+                            vba_form.name,
+                            control_index,
+                            vba_form_control.name,
+                            vba_form_control.control_type,
+                            f_stream_entry.o_stream_entry_index,
+                            f_stream_entry.o_stream_entry_size,
+                            vba_form_control.text,
+                            vba_form_control.font_name,
+                        )
+                    )
+                    number_of_rows += 1
+
+            self._rows["modules"].extend(
+                (
+                    project_root_identifier,
+                    module_index,
+                    vba_module.name,
+                    vba_module.stream_name,
+                    vba_module.module_type,
+                    vba_module.source_code,
+                )
+                for module_index, vba_module in enumerate(project_root.modules)
+            )
+            self._rows["project_strings"].extend(
+                (project_root_identifier, string_index, project_string.string)
+                for string_index, project_string in enumerate(project_root.strings)
+            )
+            number_of_rows += (
+                1
+                + len(project_root.project_keys)
+                + len(project_root.modules)
+                + len(project_root.strings)
+            )
+
+        self._number_of_buffered_rows += number_of_rows
+        if self._number_of_buffered_rows >= self._batch_size:
+            self._Flush()
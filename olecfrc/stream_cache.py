@@ -0,0 +1,138 @@
+"""Cache of parsed stream results keyed by the content of the stream."""
+
+import collections
+import hashlib
+
+
+class StreamCache:
+    """Memory-bounded least recently used (LRU) cache of parsed stream results.
+
+    Results are keyed by the kind of parser and a digest of the stream data, so
+    that byte-identical streams, such as those of documents created from the
+    same template, are parsed once. The size of a result is accounted as
+    the size of the stream data it was parsed from.
+    """
+
+    # Default maximum number of entries.
+    DEFAULT_MAXIMUM_NUMBER_OF_ENTRIES = 1024
+
+    # Default maximum total size of the entries.
+    DEFAULT_MAXIMUM_SIZE = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        maximum_number_of_entries=DEFAULT_MAXIMUM_NUMBER_OF_ENTRIES,
+        maximum_size=DEFAULT_MAXIMUM_SIZE,
+    ):
+        """Initializes a stream cache.
+
+        Args:
+          maximum_number_of_entries (Optional[int]): maximum number of entries.
+          maximum_size (Optional[int]): maximum total size of the entries.
+        """
+        super().__init__()
+        self._entries = collections.OrderedDict()
+        self._hits = collections.Counter()
+        self._misses = collections.Counter()
+        self._size = 0
+
+        self.maximum_number_of_entries = maximum_number_of_entries
+        self.maximum_size = maximum_size
+
+    def GetKey(self, kind, stream_data):
+        """Retrieves the key of a stream.
+
+        Args:
+          kind (str): kind of parser, such as "VBAProjectStream".
+          stream_data (bytes): stream data.
+
+        Returns:
+          tuple[str, bytes]: key of the stream.
+        """
+        return kind, hashlib.blake2b(stream_data, digest_size=16).digest()
+
+    def GetStatistics(self):
+        """Retrieves the hit and miss counts per kind of parser.
+
+        Returns:
+          dict[str, tuple[int, int]]: number of hits and misses per kind of parser.
+        """
+        return {
+            kind: (self._hits[kind], self._misses[kind])
+            for kind in sorted(set(self._hits) | set(self._misses))
+        }
+
+    def GetValue(self, key):
+        """Retrieves a cached result.
+
+        Args:
+          key (tuple[str, bytes]): key of the stream.
+
+        Returns:
+          object: cached result or None if not cached.
+        """
+        entry = self._entries.get(key, None)
+        if entry is None:
+            self._misses[key[0]] += 1
+            return None
+
+        self._hits[key[0]] += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def SetValue(self, key, value, size):
+        """Caches a result.
+
+        Results that are larger than the maximum total size are not cached.
+
+        Args:
+          key (tuple[str, bytes]): key of the stream.
+          value (object): result.
+          size (int): size of the stream data the result was parsed from.
+        """
+        if size > self.maximum_size or not self.maximum_number_of_entries:
+            return
+
+        previous_entry = self._entries.pop(key, None)
+        if previous_entry:
+            self._size -= previous_entry[1]
+
+        self._entries[key] = (value, size)
+        self._size += size
+
+        while (
+            len(self._entries) > self.maximum_number_of_entries
+            or self._size > self.maximum_size
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+
+# Stream cache of the current process, which is shared by the collections in
+# a worker process.
+_PROCESS_STREAM_CACHE = None
+
+
+def GetProcessStreamCache(maximum_number_of_entries, maximum_size):
+    """Retrieves the stream cache of the current process.
+
+    Args:
+      maximum_number_of_entries (int): maximum number of entries.
+      maximum_size (int): maximum total size of the entries.
+
+    Returns:
+      StreamCache: stream cache of the current process.
+    """
+    global _PROCESS_STREAM_CACHE  # pylint: disable=global-statement
+
+    if (
+        _PROCESS_STREAM_CACHE is None
+        or _PROCESS_STREAM_CACHE.maximum_number_of_entries != maximum_number_of_entries
+        or _PROCESS_STREAM_CACHE.maximum_size != maximum_size
+    ):
+        _PROCESS_STREAM_CACHE = StreamCache(
+            maximum_number_of_entries=maximum_number_of_entries,
+            maximum_size=maximum_size,
+        )
+
+    return _PROCESS_STREAM_CACHE
@@ -1,30 +1,266 @@
 """Visual Basic for Applications (VBA) collector."""
 
-import uuid
-
-import pyolecf
-
-from dtfabric import errors as dtfabric_errors
-
+import array
+import contextlib
+import copy
+import functools
+import io
+import os
+import time
+
+from olecfrc import compression
 from olecfrc import data_format
 from olecfrc import errors
+from olecfrc import form_properties
 from olecfrc import hexdump
+from olecfrc import records
+from olecfrc import vba_parsers
+
+# Maximum depth of storages that is searched for project roots.
+_MAXIMUM_PROJECT_ROOT_DEPTH = 4
 
 
 class FStream(data_format.BinaryDataFormat):
-    """Class that defines a f stream."""
+    """Class that defines a f stream.
+
+    The f stream contains a form control, as defined by MS-OFORMS, which is
+    followed by the sites of the controls on the form.
+
+    Attributes:
+      entries (list[FStreamEntry]|ColumnarRecords): entries, which contain
+          the sites of the controls.
+      number_of_sites (int): number of sites, as stored in the header.
+      stream_data (bytes): stream data, which is retained for decoding control
+          properties on demand.
+    """
 
     _DEFINITION_FILE = "vba.yaml"
 
-    def __init__(self, debug=False):
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+    # Class identifier (CLSID) of a standard font: 0be35203-8f91-11ce-9de3-
+    # 00aa004bb851, as stored in little-endian.
+    _CLSID_STD_FONT = (
+        b"\x03\x52\xe3\x0b\x91\x8f\xce\x11\x9d\xe3\x00\xaa\x00\x4b\xb8\x51"
+    )
+
+    # Class identifier (CLSID) of text properties: afc20920-da4e-11ce-b943-
+    # 00aa006887b4, as stored in little-endian.
+    _CLSID_TEXT_PROPS = (
+        b"\x20\x09\xc2\xaf\x4e\xda\xce\x11\xb9\x43\x00\xaa\x00\x68\x87\xb4"
+    )
+
+    # Supported major version of the form control.
+    _FORM_CONTROL_MAJOR_VERSION = 4
+
+    def __init__(self, columnar=False, debug=False, use_generated_parsers=True):
         """Initializes a stream.
 
         Args:
+          columnar (Optional[bool]): True if the entries should be stored in
+              a columnar container, which is more compact for large streams.
           debug (Optional[bool]): True if debug information should be printed.
+          use_generated_parsers (Optional[bool]): True if the generated structure
+              parsers should be used instead of the dtFabric data type maps.
         """
-        super().__init__()
+        super().__init__(use_generated_parsers=use_generated_parsers)
+        self._columnar = columnar
         self._debug = debug
 
+        self.entries = []
+        self.number_of_sites = 0
+        self.stream_data = b""
+
+    def _ReadEntry(self, data, data_offset, stream_offset):
+        """Reads an entry.
+
+        Args:
+          data (bytes): data that contains the entry.
+          data_offset (int): offset of the entry in the data.
+          stream_offset (int): offset of the entry relative to the start of
+              the stream.
+
+        Returns:
+          tuple[object, dict[str, object], FStreamEntry]: f stream entry
+              structure values, site property values and entry.
+
+        Raises:
+          ParseError: if the entry could not be parsed.
+        """
+        entry_struct, _ = self._ReadStructure(
+            data, data_offset, "f_stream_entry", "f stream entry"
+        )
+
+        property_values, _ = form_properties.ReadPropertyData(
+            entry_struct.data,
+            0,
+            len(entry_struct.data),
+            entry_struct.property_mask,
+            form_properties.SITE_PROPERTIES,
+        )
+
+        f_stream_entry = records.FStreamEntry(
+            clsid_cache_index=property_values.get("clsid_cache_index", None),
+            name=property_values.get("name", None),
+            o_stream_entry_size=property_values.get("object_stream_size", None),
+            offset=stream_offset,
+            property_mask=entry_struct.property_mask,
+            size=entry_struct.size,
+            version=entry_struct.version,
+        )
+        return entry_struct, property_values, f_stream_entry
+
+    def _ReadHeaderData(self, stream_data):
+        """Reads the header from the stream data.
+
+        The header consists of the form control, its font and pictures, the site
+        class information table and the number of sites.
+
+        Args:
+          stream_data (bytes): stream data.
+
+        Returns:
+          tuple[object, int]: form control header structure values and offset of
+              the site depths and types relative to the start of the stream.
+
+        Raises:
+          ParseError: if the header could not be parsed.
+        """
+        header_struct, _ = self._ReadStructure(
+            stream_data, 0, "control_header", "f stream form control header"
+        )
+        if header_struct.major_version != self._FORM_CONTROL_MAJOR_VERSION:
+            raise errors.ParseError(
+                f"Unsupported form control version: "
+                f"{header_struct.major_version:d}.{header_struct.minor_version:d}"
+            )
+
+        # The size of the form control excludes the versions and the size.
+        stream_offset = 4 + header_struct.data_size
+
+        property_values, _ = form_properties.ReadPropertyData(
+            stream_data,
+            8,
+            stream_offset,
+            header_struct.property_mask,
+            form_properties.FORM_PROPERTIES,
+        )
+
+        if self._debug:
+            print("f stream header data:")
+            print(hexdump.Hexdump(stream_data[:stream_offset]))
+
+            print(f"Minor version\t\t\t\t\t\t\t: {header_struct.minor_version:d}")
+            print(f"Major version\t\t\t\t\t\t\t: {header_struct.major_version:d}")
+            print(f"Data size\t\t\t\t\t\t\t: {header_struct.data_size:d}")
+            print(
+                f"Property mask\t\t\t\t\t\t\t: " f"0x{header_struct.property_mask:08x}"
+            )
+            for name, value in sorted(property_values.items()):
+                print(f"{name:s}\t\t\t\t\t\t: {value!s}")
+            print("")
+
+        if header_struct.property_mask & form_properties.FORM_PROPERTY_MOUSE_ICON:
+            stream_offset = self._SkipGuidAndPicture(stream_data, stream_offset)
+
+        if header_struct.property_mask & form_properties.FORM_PROPERTY_FONT:
+            stream_offset = self._SkipGuidAndFont(stream_data, stream_offset)
+
+        if header_struct.property_mask & form_properties.FORM_PROPERTY_PICTURE:
+            stream_offset = self._SkipGuidAndPicture(stream_data, stream_offset)
+
+        boolean_properties = property_values.get("boolean_properties", 0)
+        if not boolean_properties & form_properties.FORM_FLAG_DONT_SAVE_CLASS_TABLE:
+            class_table_struct, data_size = self._ReadStructure(
+                stream_data,
+                stream_offset,
+                "class_table_header",
+                "f stream site class information table header",
+            )
+            stream_offset += data_size
+
+            for _ in range(class_table_struct.number_of_class_infos):
+                class_info_struct, data_size = self._ReadStructure(
+                    stream_data,
+                    stream_offset,
+                    "site_class_info_header",
+                    "f stream site class information header",
+                )
+                stream_offset += data_size + class_info_struct.data_size
+
+        sites_header_struct, data_size = self._ReadStructure(
+            stream_data, stream_offset, "f_stream_sites_header", "f stream sites header"
+        )
+        stream_offset += data_size
+
+        self.number_of_sites = sites_header_struct.number_of_sites
+
+        if self._debug:
+            print(f"Number of sites\t\t\t\t\t\t\t: {self.number_of_sites:d}")
+            print(
+                f"Sites data size\t\t\t\t\t\t\t: "
+                f"{sites_header_struct.sites_data_size:d}"
+            )
+            print("")
+
+        return header_struct, stream_offset
+
+    def _SkipGuidAndFont(self, stream_data, stream_offset):
+        """Skips a font and its class identifier (CLSID).
+
+        Args:
+          stream_data (bytes): stream data.
+          stream_offset (int): offset of the font relative to the start of
+              the stream.
+
+        Returns:
+          int: offset relative to the start of the stream that follows the font.
+
+        Raises:
+          ParseError: if the font could not be parsed.
+        """
+        class_identifier = stream_data[stream_offset : stream_offset + 16]
+        stream_offset += 16
+
+        if class_identifier == self._CLSID_STD_FONT:
+            _, data_size = self._ReadStructure(
+                stream_data, stream_offset, "std_font", "f stream font"
+            )
+        elif class_identifier == self._CLSID_TEXT_PROPS:
+            text_props_struct, _ = self._ReadStructure(
+                stream_data, stream_offset, "control_header", "f stream text properties"
+            )
+            data_size = 4 + text_props_struct.data_size
+        else:
+            raise errors.ParseError(
+                f"Unsupported font class identifier at offset: "
+                f"0x{stream_offset - 16:08x}"
+            )
+
+        return stream_offset + data_size
+
+    def _SkipGuidAndPicture(self, stream_data, stream_offset):
+        """Skips a picture and its class identifier (CLSID).
+
+        Args:
+          stream_data (bytes): stream data.
+          stream_offset (int): offset of the picture relative to the start of
+              the stream.
+
+        Returns:
+          int: offset relative to the start of the stream that follows
+              the picture.
+
+        Raises:
+          ParseError: if the picture could not be parsed.
+        """
+        picture_struct, data_size = self._ReadStructure(
+            stream_data, stream_offset, "guid_and_picture_header", "f stream picture"
+        )
+        return stream_offset + data_size + picture_struct.data_size
+
     def Read(self, olecf_item):
         """Reads the stream from the OLECF item.
 
@@ -37,91 +273,128 @@ class FStream(data_format.BinaryDataFormat):
         Raises:
           ParseError: if the stream data could not be parsed.
         """
-        stream_data = olecf_item.read()
+        return self.ReadData(olecf_item.read())
 
-        data_type_map = self._GetDataTypeMap("f_stream_header")
+    def ReadEntry(self, olecf_item, offset, size):
+        """Reads a single entry from the OLECF item.
 
-        try:
-            header_struct = data_type_map.MapByteStream(stream_data)
-        except (
-            dtfabric_errors.ByteStreamTooSmallError,
-            dtfabric_errors.MappingError,
-        ) as exception:
-            raise errors.ParseError(exception)
+        Only the data of the entry is read, such as when its offset is known from
+        a sidecar index. The index of the o stream entry of the control is
+        determined by the preceding entries and is not set.
 
-        stream_offset = data_type_map.GetByteSize()
+        Args:
+          olecf_item (pyolecf.stream): OLECF item.
+          offset (int): offset of the entry relative to the start of the stream.
+          size (int): size of the entry.
 
-        if self._debug:
-            print("f stream header data:")
-            print(hexdump.Hexdump(stream_data[:stream_offset]))
+        Returns:
+          tuple[FStreamEntry, bytes]: entry and entry data.
 
-        if self._debug:
-            print(f"Unknown1\t\t\t\t\t\t\t: 0x{header_struct.unknown1:08x}")
-            print(f"Unknown2\t\t\t\t\t\t\t: 0x{header_struct.unknown2:08x}")
-            print(f"Unknown3\t\t\t\t\t\t\t: 0x{header_struct.unknown3:08x}")
-            print(f"Unknown4\t\t\t\t\t\t\t: 0x{header_struct.unknown4:08x}")
-            print(f"Unknown5\t\t\t\t\t\t\t: 0x{header_struct.unknown5:08x}")
-            print(f"Unknown6\t\t\t\t\t\t\t: 0x{header_struct.unknown6:08x}")
-            print(f"Unknown7\t\t\t\t\t\t\t: 0x{header_struct.unknown7:08x}")
-            print(f"Unknown8\t\t\t\t\t\t\t: 0x{header_struct.unknown8:08x}")
-            print(f"Unknown9\t\t\t\t\t\t\t: 0x{header_struct.unknown9:08x}")
-            print(f"Unknown10\t\t\t\t\t\t\t: 0x{header_struct.unknown10:08x}")
-            print(f"Unknown11\t\t\t\t\t\t\t: 0x{header_struct.unknown11:08x}")
+        Raises:
+          ParseError: if the entry could not be parsed.
+        """
+        entry_data = olecf_item.read_buffer_at_offset(size, offset)
+        _, _, f_stream_entry = self._ReadEntry(entry_data, 0, offset)
+        return f_stream_entry, entry_data
 
-            # CLSID of StdFont: 0be35203-8f91-11ce-9de3-00aa004bb851
-            uuid_value = uuid.UUID(bytes_le=header_struct.unknown12)
-            print(f"Unknown12\t\t\t\t\t\t\t: {uuid_value!s}")
+    def ReadHeader(self, olecf_item):
+        """Reads only the header of the stream from the OLECF item.
 
-            print("")
+        The header is read without the sites of the controls.
 
-        data_type_map = self._GetDataTypeMap("f_stream_entry")
+        Args:
+          olecf_item (pyolecf.item): OLECF item.
 
-        while stream_offset < olecf_item.size:
-            try:
-                entry_struct = data_type_map.MapByteStream(stream_data[stream_offset:])
-            except (
-                dtfabric_errors.ByteStreamTooSmallError,
-                dtfabric_errors.MappingError,
-            ) as exception:
-                raise errors.ParseError(exception)
+        Returns:
+          object: form control header structure values.
 
-            next_stream_offset = stream_offset + 2 + entry_struct.size + 2
+        Raises:
+          ParseError: if the header could not be parsed.
+        """
+        header_struct, _ = self._ReadHeaderData(olecf_item.read())
+        return header_struct
 
-            if self._debug:
-                print("f stream entry data:")
-                print(hexdump.Hexdump(stream_data[stream_offset:next_stream_offset]))
+    def ReadData(self, stream_data):
+        """Reads the stream from its data.
 
-            if self._debug:
-                print(f"Unknown7\t\t\t\t\t\t\t: 0x{entry_struct.unknown7:08x}")
-                print(f"Unknown8\t\t\t\t\t\t\t: 0x{entry_struct.unknown8:08x}")
-                print(f"Unknown9\t\t\t\t\t\t\t: 0x{entry_struct.unknown9:04x}")
+        Args:
+          stream_data (bytes): stream data.
 
-                print(f"Size\t\t\t\t\t\t\t\t: {entry_struct.size:d}")
+        Returns:
+          bool: True if the stream was successfully read.
 
-                print(f"Unknown1\t\t\t\t\t\t\t: 0x{entry_struct.unknown1:08x}")
-                print(f"Unknown2\t\t\t\t\t\t\t: 0x{entry_struct.unknown2:08x}")
-                print(f"Unknown3\t\t\t\t\t\t\t: {entry_struct.unknown3:d}")
-                print(
-                    (
-                        f"O stream entry size\t\t\t\t\t\t: "
-                        f"{entry_struct.o_stream_entry_size:0d}"
-                    )
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+        if self._columnar:
+            self.entries = records.ColumnarRecords(records.FStreamEntry)
+        else:
+            self.entries = []
+
+        self.stream_data = stream_data
+
+        _, stream_offset = self._ReadHeaderData(stream_data)
+
+        # Every site has a depth and type, where consecutive sites of the same
+        # depth and type can be stored as a count. The site depths and types are
+        # padded to a multiple of 4 bytes.
+        depths_start_offset = stream_offset
+        stream_data_size = len(stream_data)
+        number_of_sites = 0
+        while number_of_sites < self.number_of_sites:
+            if stream_offset + 2 > stream_data_size:
+                raise errors.ParseError(
+                    f"Truncated f stream site depth and type at offset: "
+                    f"0x{stream_offset:08x}"
                 )
-                print(
-                    (
-                        f"O stream entry index\t\t\t\t\t\t: "
-                        f"{entry_struct.o_stream_entry_index:d}"
+
+            type_or_count = stream_data[stream_offset + 1]
+            stream_offset += 2
+
+            if type_or_count & 0x80:
+                type_or_count &= 0x7F
+                if not type_or_count:
+                    raise errors.ParseError(
+                        f"Unsupported f stream site count at offset: "
+                        f"0x{stream_offset - 1:08x}"
                     )
-                )
-                print(f"Unknown6\t\t\t\t\t\t\t: 0x{entry_struct.unknown6:04x}")
+                number_of_sites += type_or_count
+                stream_offset += 1
+            else:
+                number_of_sites += 1
+
+        padding_size = (stream_offset - depths_start_offset) % 4
+        if padding_size:
+            stream_offset += 4 - padding_size
+
+        o_stream_entry_index = 0
+        for _ in range(self.number_of_sites):
+            entry_struct, property_values, f_stream_entry = self._ReadEntry(
+                stream_data, stream_offset, stream_offset
+            )
 
-                # TODO: fix this.
-                try:
-                    variable_name = entry_struct.variable_name.decode("cp1252")
-                    print(f"Variable name\t\t\t\t\t\t\t: {variable_name:s}")
-                except UnicodeEncodeError:
-                    pass
+            # The o stream contains the data of the controls with an object
+            # stream size, in the order of their sites.
+            if f_stream_entry.o_stream_entry_size:
+                f_stream_entry.o_stream_entry_index = o_stream_entry_index
+                o_stream_entry_index += 1
+
+            self.entries.append(f_stream_entry)
 
+            next_stream_offset = stream_offset + 4 + entry_struct.size
+
+            if self._debug:
+                print("f stream entry data:")
+                print(hexdump.Hexdump(stream_data[stream_offset:next_stream_offset]))
+
+                print(f"Version\t\t\t\t\t\t\t\t: {entry_struct.version:d}")
+                print(f"Size\t\t\t\t\t\t\t\t: {entry_struct.size:d}")
+                print(
+                    f"Property mask\t\t\t\t\t\t\t: "
+                    f"0x{entry_struct.property_mask:08x}"
+                )
+                for name, value in sorted(property_values.items()):
+                    print(f"{name:s}\t\t\t\t\t\t: {value!s}")
                 print("")
 
             stream_offset = next_stream_offset
@@ -130,24 +403,210 @@ class FStream(data_format.BinaryDataFormat):
 
 
 class OStream(data_format.BinaryDataFormat):
-    """Class that defines an o stream."""
+    """Class that defines an o stream.
+
+    The o stream contains the properties of the controls of a form, as defined
+    by MS-OFORMS, in order of their sites in the f stream. Since the size and
+    control type of an entry are stored in the corresponding site, only
+    the offsets and sizes of the entries are read, where an entry is read when
+    it is accessed, so that only the entries of the controls that are inspected
+    are read.
+
+    Attributes:
+      entry_offsets (array.array): offsets of the entries relative to the start
+          of the stream, in order of the entries.
+      entry_sizes (array.array): sizes of the entries, in order of the entries.
+      stream_data (bytes): stream data, which is retained for reading entries on
+          access.
+    """
 
     _DEFINITION_FILE = "vba.yaml"
 
-    def __init__(self, debug=False):
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+    _COMMAND_BUTTON_CONTROL = (
+        "control_header",
+        form_properties.COMMAND_BUTTON_PROPERTIES,
+        form_properties.COMMAND_BUTTON_PICTURES,
+    )
+
+    _LABEL_CONTROL = (
+        "control_header",
+        form_properties.LABEL_PROPERTIES,
+        form_properties.LABEL_PICTURES,
+    )
+
+    _MORPH_DATA_CONTROL = (
+        "morph_data_control_header",
+        form_properties.MORPH_DATA_PROPERTIES,
+        form_properties.MORPH_DATA_PICTURES,
+    )
+
+    # Name of the header structure, properties and property mask bits of
+    # the pictures per class identifier (CLSID) cache index of the controls of
+    # which the properties are read. The properties of other controls, such as
+    # images, scroll bars, spin buttons and tab strips, are not read.
+    _CONTROLS = {
+        15: _MORPH_DATA_CONTROL,
+        17: _COMMAND_BUTTON_CONTROL,
+        21: _LABEL_CONTROL,
+        23: _MORPH_DATA_CONTROL,
+        24: _MORPH_DATA_CONTROL,
+        25: _MORPH_DATA_CONTROL,
+        26: _MORPH_DATA_CONTROL,
+        27: _MORPH_DATA_CONTROL,
+        28: _MORPH_DATA_CONTROL,
+    }
+
+    def __init__(self, debug=False, use_generated_parsers=True):
         """Initializes a stream.
 
         Args:
           debug (Optional[bool]): True if debug information should be printed.
+          use_generated_parsers (Optional[bool]): True if the generated structure
+              parsers should be used instead of the dtFabric data type maps.
         """
-        super().__init__()
+        super().__init__(use_generated_parsers=use_generated_parsers)
         self._debug = debug
 
-    def Read(self, olecf_item):
+        self.entry_offsets = array.array("L")
+        self.entry_sizes = array.array("L")
+        self.stream_data = b""
+
+    def _ReadEntry(self, data, data_offset, stream_offset, size, clsid_cache_index):
+        """Reads an entry.
+
+        The entry consists of the control, the pictures of the control and its
+        text properties, which contain the font.
+
+        Args:
+          data (bytes): data that contains the entry.
+          data_offset (int): offset of the entry in the data.
+          stream_offset (int): offset of the entry relative to the start of
+              the stream.
+          size (int): size of the entry.
+          clsid_cache_index (int): index of the class identifier (CLSID) of
+              the control in the class identifier cache.
+
+        Returns:
+          OStreamEntry: entry.
+
+        Raises:
+          ParseError: if the entry could not be parsed.
+        """
+        o_stream_entry = records.OStreamEntry(offset=stream_offset, size=size)
+
+        header_name, properties, picture_bits = self._CONTROLS.get(
+            clsid_cache_index, (None, None, None)
+        )
+        if not header_name:
+            return o_stream_entry
+
+        end_offset = data_offset + size
+
+        header_struct, header_size = self._ReadStructure(
+            data, data_offset, header_name, "o stream control header"
+        )
+        property_mask = header_struct.property_mask
+
+        # The size of the control excludes the versions and the size.
+        next_data_offset = data_offset + 4 + header_struct.data_size
+
+        property_values, _ = form_properties.ReadPropertyData(
+            data,
+            data_offset + header_size,
+            min(next_data_offset, end_offset),
+            property_mask,
+            properties,
+        )
+
+        for picture_bit in picture_bits:
+            if property_mask & (1 << picture_bit):
+                picture_struct, data_size = self._ReadStructure(
+                    data,
+                    next_data_offset,
+                    "guid_and_picture_header",
+                    "o stream picture",
+                )
+                next_data_offset += data_size + picture_struct.data_size
+
+        text_props_struct, header_size = self._ReadStructure(
+            data, next_data_offset, "control_header", "o stream text properties"
+        )
+        text_property_values, _ = form_properties.ReadPropertyData(
+            data,
+            next_data_offset + header_size,
+            min(next_data_offset + 4 + text_props_struct.data_size, end_offset),
+            text_props_struct.property_mask,
+            form_properties.TEXT_PROPERTIES,
+        )
+        next_data_offset += 4 + text_props_struct.data_size
+
+        if next_data_offset > end_offset:
+            raise errors.ParseError(
+                f"o stream entry at offset: 0x{stream_offset:08x} exceeds its size: "
+                f"{size:d}"
+            )
+
+        o_stream_entry.caption = property_values.get("caption", None)
+        o_stream_entry.font_name = text_property_values.get("font_name", None)
+        o_stream_entry.group_name = property_values.get("group_name", None)
+        o_stream_entry.value = property_values.get("value", None)
+        o_stream_entry.width, o_stream_entry.height = property_values.get(
+            "size", (None, None)
+        )
+
+        if self._debug:
+            print("o stream entry data:")
+            print(hexdump.Hexdump(data[data_offset:end_offset]))
+
+            print(f"Minor version\t\t\t\t\t\t\t: {header_struct.minor_version:d}")
+            print(f"Major version\t\t\t\t\t\t\t: {header_struct.major_version:d}")
+            print(f"Data size\t\t\t\t\t\t\t: {header_struct.data_size:d}")
+            print(f"Property mask\t\t\t\t\t\t\t: 0x{property_mask:08x}")
+            for name, value in sorted(property_values.items()):
+                print(f"{name:s}\t\t\t\t\t\t: {value!s}")
+            for name, value in sorted(text_property_values.items()):
+                print(f"{name:s}\t\t\t\t\t\t: {value!s}")
+            print("")
+
+        return o_stream_entry
+
+    def GetEntryByIndex(self, entry_index, clsid_cache_index):
+        """Retrieves an entry by index.
+
+        Args:
+          entry_index (int): index of the entry.
+          clsid_cache_index (int): index of the class identifier (CLSID) of
+              the control in the class identifier cache, as stored in its site.
+
+        Returns:
+          OStreamEntry: entry or None if not available.
+
+        Raises:
+          ParseError: if the entry could not be parsed.
+        """
+        if entry_index < 0 or entry_index >= len(self.entry_offsets):
+            return None
+
+        entry_offset = self.entry_offsets[entry_index]
+        return self._ReadEntry(
+            self.stream_data,
+            entry_offset,
+            entry_offset,
+            self.entry_sizes[entry_index],
+            clsid_cache_index,
+        )
+
+    def Read(self, olecf_item, entry_sizes):
         """Reads the stream from the OLECF item.
 
         Args:
           olecf_item (pyolecf.item): OLECF item.
+          entry_sizes (list[int]): sizes of the entries, as stored in the sites
+              in the f stream.
 
         Returns:
           bool: True if the stream was successfully read.
@@ -155,95 +614,125 @@ class OStream(data_format.BinaryDataFormat):
         Raises:
           ParseError: if the stream data could not be parsed.
         """
-        stream_data = olecf_item.read()
+        return self.ReadData(olecf_item.read(), entry_sizes)
 
-        data_type_map1 = self._GetDataTypeMap("o_entry_part1")
-        data_type_map2 = self._GetDataTypeMap("o_entry_part2")
+    def ReadEntry(self, olecf_item, offset, size, clsid_cache_index):
+        """Reads a single entry from the OLECF item.
 
-        stream_offset = 0
-        while stream_offset < olecf_item.size:
-            try:
-                entry_part1_struct = data_type_map1.MapByteStream(
-                    stream_data[stream_offset:]
-                )
-            except (
-                dtfabric_errors.ByteStreamTooSmallError,
-                dtfabric_errors.MappingError,
-            ) as exception:
-                raise errors.ParseError(exception)
+        Only the data of the entry is read, such as when its offset is known from
+        a sidecar index.
 
-            entry_part_size = (7 * 4) + len(entry_part1_struct.data) + 1
-            padding_size = entry_part_size % 4
-            if padding_size != 0:
-                padding_size = 4 - padding_size
+        Args:
+          olecf_item (pyolecf.stream): OLECF item.
+          offset (int): offset of the entry relative to the start of the stream.
+          size (int): size of the entry.
+          clsid_cache_index (int): index of the class identifier (CLSID) of
+              the control in the class identifier cache, as stored in its site.
 
-            next_stream_offset = stream_offset + entry_part_size + padding_size
+        Returns:
+          OStreamEntry: entry.
 
-            try:
-                entry_part2_struct = data_type_map2.MapByteStream(
-                    stream_data[next_stream_offset:]
-                )
-            except (
-                dtfabric_errors.ByteStreamTooSmallError,
-                dtfabric_errors.MappingError,
-            ) as exception:
-                raise errors.ParseError(exception)
+        Raises:
+          ParseError: if the entry could not be parsed.
+        """
+        entry_data = olecf_item.read_buffer_at_offset(size, offset)
+        return self._ReadEntry(entry_data, 0, offset, size, clsid_cache_index)
 
-            entry_part_size = (5 * 4) + len(entry_part2_struct.font_name) + 1
-            padding_size = entry_part_size % 4
-            if padding_size != 0:
-                padding_size = 4 - padding_size
+    def ReadData(self, stream_data, entry_sizes):
+        """Reads the stream from its data.
 
-            next_stream_offset += entry_part_size + padding_size
+        Args:
+          stream_data (bytes): stream data.
+          entry_sizes (list[int]): sizes of the entries, as stored in the sites
+              in the f stream.
 
-            if self._debug:
-                print("o stream entry data:")
-                print(hexdump.Hexdump(stream_data[stream_offset:next_stream_offset]))
+        Returns:
+          bool: True if the stream was successfully read.
 
-            # TODO: add debug info.
-            if self._debug:
-                print(f"Unknown1\t\t\t\t\t\t\t: 0x{entry_part1_struct.unknown1:08x}")
-                print(f"Unknown2\t\t\t\t\t\t\t: 0x{entry_part1_struct.unknown2:08x}")
-                print(f"Unknown3\t\t\t\t\t\t\t: 0x{entry_part1_struct.unknown3:08x}")
-                print(f"Unknown4\t\t\t\t\t\t\t: 0x{entry_part1_struct.unknown4:08x}")
-                data_size = entry_part1_struct.data_size & 0x7FFFFFFF
-                print(
-                    (
-                        f"Data size\t\t\t\t\t\t\t: {data_size:d} "
-                        f"(0x{entry_part1_struct.data_size:08x})"
-                    )
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+        self.entry_offsets = array.array("L")
+        self.entry_sizes = array.array("L")
+        self.stream_data = stream_data
+
+        stream_data_size = len(stream_data)
+        stream_offset = 0
+
+        for entry_size in entry_sizes:
+            if stream_offset + entry_size > stream_data_size:
+                raise errors.ParseError(
+                    f"o stream entry at offset: 0x{stream_offset:08x} with "
+                    f"size: {entry_size:d} exceeds stream size: "
+                    f"{stream_data_size:d}"
                 )
-                print(f"Unknown6\t\t\t\t\t\t\t: 0x{entry_part1_struct.unknown6:08x}")
-                print(f"Data\t\t\t\t\t\t\t\t: {entry_part1_struct.data:s}")
-                # TODO: alignment padding.
-                print(f"Unknown7\t\t\t\t\t\t\t: 0x{entry_part2_struct.unknown7:08x}")
-                print(f"Unknown8\t\t\t\t\t\t\t: 0x{entry_part2_struct.unknown8:08x}")
-                print(f"Unknown9\t\t\t\t\t\t\t: 0x{entry_part2_struct.unknown9:08x}")
-                print(f"Unknown10\t\t\t\t\t\t\t: 0x{entry_part2_struct.unknown10:08x}")
-                print(f"Unknown11\t\t\t\t\t\t\t: 0x{entry_part2_struct.unknown11:08x}")
-                print(f"Font name\t\t\t\t\t\t\t: {entry_part2_struct.font_name:s}")
-                # TODO: alignment padding.
-                print("")
 
-            stream_offset = next_stream_offset
+            self.entry_offsets.append(stream_offset)
+            self.entry_sizes.append(entry_size)
+
+            stream_offset += entry_size
 
         return True
 
 
 class VBAProjectStream(data_format.BinaryDataFormat):
-    """Class that defines a _VBA_PROJECT (Performance Cache) stream."""
+    """Class that defines a _VBA_PROJECT (Performance Cache) stream.
+
+    Attributes:
+      strings (ProjectStringTable|ColumnarRecords): strings.
+      version (int): version of the VBA project or None if not available.
+    """
 
     _DEFINITION_FILE = "vba.yaml"
 
-    def __init__(self, debug=False):
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+    # Size of the _VBA_PROJECT stream header.
+    _HEADER_SIZE = 34
+
+    def __init__(self, columnar=False, debug=False, use_generated_parsers=True):
         """Initializes a stream.
 
         Args:
+          columnar (Optional[bool]): True if the strings should be decoded into
+              a columnar container instead of a string table that decodes them
+              on access.
           debug (Optional[bool]): True if debug information should be printed.
+          use_generated_parsers (Optional[bool]): True if the generated structure
+              parsers should be used instead of the dtFabric data type maps.
         """
-        super().__init__()
+        super().__init__(use_generated_parsers=use_generated_parsers)
+        self._columnar = columnar
         self._debug = debug
 
+        self.strings = records.ProjectStringTable()
+        self.version = None
+
+    def _ReadHeaderData(self, stream_data):
+        """Reads the header of the stream from its data.
+
+        Args:
+          stream_data (bytes): stream data, which can contain only the header.
+
+        Returns:
+          tuple[object, int]: _VBA_PROJECT stream header structure values and
+              size of the header.
+
+        Raises:
+          ParseError: if the header could not be parsed.
+        """
+        header_struct, header_size = self._ReadStructure(
+            stream_data, 0, "project_stream_header", "_VBA_PROJECT stream header"
+        )
+
+        # The lower 16 bits of the first value contain the 0x61cc signature and
+        # the upper 16 bits the version, as defined by MS-OVBA.
+        self.version = header_struct.unknown1 >> 16
+
+        return header_struct, header_size
+
     def Read(self, olecf_item):
         """Reads the stream from the OLECF item.
 
@@ -256,23 +745,43 @@ class VBAProjectStream(data_format.BinaryDataFormat):
         Raises:
           ParseError: if the stream data could not be parsed.
         """
-        stream_data = olecf_item.read()
+        return self.ReadData(olecf_item.read())
+
+    def ReadHeader(self, olecf_item):
+        """Reads only the header of the stream from the OLECF item.
+
+        The strings and the remainder of the performance cache are not read,
+        hence this is considerably cheaper than Read() for large streams.
+
+        Args:
+          olecf_item (pyolecf.item): OLECF item.
+
+        Returns:
+          object: _VBA_PROJECT stream header structure values.
+
+        Raises:
+          ParseError: if the header could not be parsed.
+        """
+        header_struct, _ = self._ReadHeaderData(olecf_item.read(self._HEADER_SIZE))
+        return header_struct
+
+    def ReadData(self, stream_data):
+        """Reads the stream from its data.
+
+        Args:
+          stream_data (bytes): stream data.
+
+        Returns:
+          bool: True if the stream was successfully read.
 
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
         if self._debug:
             print("_VBA_PROJECT stream data:")
             print(hexdump.Hexdump(stream_data))
 
-        data_type_map = self._GetDataTypeMap("project_stream_header")
-
-        try:
-            header_struct = data_type_map.MapByteStream(stream_data)
-        except (
-            dtfabric_errors.ByteStreamTooSmallError,
-            dtfabric_errors.MappingError,
-        ) as exception:
-            raise errors.ParseError(exception)
-
-        stream_data_offset = data_type_map.GetByteSize()
+        header_struct, stream_data_offset = self._ReadHeaderData(stream_data)
 
         if self._debug:
             print(f"Unknown1\t\t\t\t\t\t\t: 0x{header_struct.unknown1:08x}")
@@ -293,128 +802,1151 @@ class VBAProjectStream(data_format.BinaryDataFormat):
             print(f"Unknown11\t\t\t\t\t\t\t: {header_struct.unknown11:d}")
             print("")
 
-        for string_index in range(header_struct.number_of_strings):
-            data_type_map = self._GetDataTypeMap("project_stream_string")
+        string_table = records.ProjectStringTable()
+        string_table.ReadData(
+            stream_data, stream_data_offset, header_struct.number_of_strings
+        )
 
-            try:
-                string_struct = data_type_map.MapByteStream(
-                    stream_data[stream_data_offset:]
+        if self._debug:
+            for string_index, project_string in enumerate(string_table):
+                print(
+                    f"String: {string_index:d}\t\t\t\t\t\t\t: {project_string.string:s}"
                 )
-            except (
-                dtfabric_errors.ByteStreamTooSmallError,
-                dtfabric_errors.MappingError,
-            ) as exception:
-                raise errors.ParseError(exception)
+                print(f"Unknown1\t\t\t\t\t\t\t: 0x{project_string.unknown1:08x}")
+                print(f"Unknown2\t\t\t\t\t\t\t: 0x{project_string.unknown2:08x}")
+                print(f"Unknown3\t\t\t\t\t\t\t: 0x{project_string.unknown3:08x}")
+            print("")
+
+        if self._columnar:
+            self.strings = records.ColumnarRecords(records.ProjectString)
+            for project_string in string_table:
+                self.strings.append(project_string)
+        else:
+            self.strings = string_table
+
+        return True
+
+
+class DirStream(data_format.BinaryDataFormat):
+    """Class that defines a dir (VBA project information) stream.
+
+    Attributes:
+      code_page (int): code page of the project or None if not available.
+      modules (list[VBAModule]): modules.
+      project_name (str): name of the project or None if not available.
+    """
+
+    _DEFINITION_FILE = "vba.yaml"
 
-            value_string = string_struct.string.decode("utf-16-le")
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+    _MODULE_TYPES = {0x0021: "procedural", 0x0022: "document"}
+
+    def __init__(self, debug=False, use_generated_parsers=True):
+        """Initializes a stream.
+
+        Args:
+          debug (Optional[bool]): True if debug information should be printed.
+          use_generated_parsers (Optional[bool]): True if the generated structure
+              parsers should be used instead of the dtFabric data type maps.
+        """
+        super().__init__(use_generated_parsers=use_generated_parsers)
+        self._debug = debug
+
+        self.code_page = None
+        self.modules = []
+        self.project_name = None
+
+    def _DecodeString(self, data):
+        """Decodes a string stored in the code page of the project.
+
+        Args:
+          data (bytes): encoded string.
+
+        Returns:
+          str: decoded string.
+        """
+        return DecodeProjectString(data, self.code_page)
+
+    def Read(self, olecf_item):
+        """Reads the stream from the OLECF item.
+
+        Args:
+          olecf_item (pyolecf.item): OLECF item.
+
+        Returns:
+          bool: True if the stream was successfully read.
+
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+        return self.ReadData(olecf_item.read())
+
+    def ReadData(self, stream_data):
+        """Reads the stream from its data.
+
+        Args:
+          stream_data (bytes): stream data, which is compressed.
+
+        Returns:
+          bool: True if the stream was successfully read.
+
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+        stream_data = compression.Decompress(stream_data)
+
+        if self._debug:
+            print("dir stream data:")
+            print(hexdump.Hexdump(stream_data))
+
+        self.code_page = None
+        self.modules = []
+        self.project_name = None
+
+        vba_module = None
+        stream_data_size = len(stream_data)
+        stream_offset = 0
+        while stream_offset < stream_data_size:
+            record_header, record_header_size = self._ReadStructure(
+                stream_data,
+                stream_offset,
+                "dir_stream_record_header",
+                "dir stream record header",
+            )
+            stream_offset += record_header_size
+
+            record_type = record_header.record_type
+            record_data_size = record_header.data_size
+
+            # The data size of the PROJECTVERSION record is a reserved value that
+            # does not include the major and minor version.
+            if record_type == 0x0009:
+                record_data_size = 6
+
+            record_data = stream_data[stream_offset : stream_offset + record_data_size]
+            if len(record_data) != record_data_size:
+                raise errors.ParseError(
+                    f"Truncated dir stream record: 0x{record_type:04x} at offset: "
+                    f"{stream_offset - record_header_size:d}"
+                )
+
+            stream_offset += record_data_size
 
             if self._debug:
-                print(
-                    (
-                        f"String: {string_index:d} size\t\t\t\t\t\t\t: "
-                        f"{string_struct.string_size:d}"
+                print(f"Record type\t\t\t\t\t\t\t: 0x{record_type:04x}")
+                print(f"Data size\t\t\t\t\t\t\t: {record_data_size:d}")
+                print("")
+
+            if record_type == 0x0003:
+                self.code_page = int.from_bytes(record_data, "little")
+
+            elif record_type == 0x0004:
+                self.project_name = self._DecodeString(record_data)
+
+            elif record_type == 0x0010:
+                break
+
+            elif record_type == 0x0019:
+                vba_module = VBAModule(name=self._DecodeString(record_data))
+                self.modules.append(vba_module)
+
+            elif vba_module:
+                if record_type == 0x001A:
+                    vba_module.stream_name = self._DecodeString(record_data)
+
+                elif record_type == 0x0031:
+                    vba_module.text_offset = int.from_bytes(record_data, "little")
+
+                elif record_type == 0x0032:
+                    vba_module.stream_name = record_data.decode(
+                        "utf-16-le", errors="replace"
                     )
+
+                elif record_type == 0x0047:
+                    vba_module.name = record_data.decode("utf-16-le", errors="replace")
+
+                elif record_type in self._MODULE_TYPES:
+                    vba_module.module_type = self._MODULE_TYPES[record_type]
+
+                elif record_type == 0x002B:
+                    vba_module = None
+
+        return True
+
+
+class VBAForm:
+    """Visual Basic for Applications (VBA) form.
+
+    Attributes:
+      controls (list[VBAFormControl]): controls.
+      f_stream_entries (list[FStreamEntry]): f stream entries.
+      name (str): name of the storage of the form.
+      number_of_controls (int): number of controls, as stored in the header of
+          the f stream, or None if not available.
+      o_stream (OStream): o stream, of which the entries are read on access,
+          or None if not available.
+    """
+
+    def __init__(self, name):
+        """Initializes a form.
+
+        Args:
+          name (str): name of the storage of the form.
+        """
+        super().__init__()
+        self.controls = []
+        self.f_stream_entries = []
+        self.name = name
+        self.number_of_controls = None
+        self.o_stream = None
+
+
+class VBAFormControl:
+    """Visual Basic for Applications (VBA) form control.
+
+    The properties of the control are decoded from its f and o stream entries on
+    first access, so that only the controls that are inspected are decoded.
+
+    Attributes:
+      caption (str): caption or None if not available.
+      control_tip_text (str): control tip text or None if not available.
+      control_type (str): control type, such as "TextBox", or None if not known.
+      f_stream_entry (FStreamEntry): f stream entry of the control.
+      font_name (str): font name or None if not available.
+      group_name (str): name of the group of an option button or None if not
+          available.
+      name (str): name of the control.
+      o_stream_entry (OStreamEntry): o stream entry of the control or None if
+          not available.
+      position (tuple[int, int]): left and top position of the control in
+          HIMETRIC units or None if not available.
+      size (tuple[int, int]): width and height of the control in HIMETRIC units
+          or None if not available.
+      tag (str): tag or None if not available.
+      text (str): value or otherwise caption or None if not available.
+      value (str): value or None if not available.
+    """
+
+    # Control types per class identifier (CLSID) cache index, as defined by
+    # MS-OFORMS.
+    _CONTROL_TYPES = {
+        7: "Form",
+        12: "Image",
+        14: "Frame",
+        15: "MorphData",
+        16: "SpinButton",
+        17: "CommandButton",
+        18: "TabStrip",
+        21: "Label",
+        23: "TextBox",
+        24: "ListBox",
+        25: "ComboBox",
+        26: "CheckBox",
+        27: "OptionButton",
+        28: "ToggleButton",
+        47: "ScrollBar",
+        57: "MultiPage",
+    }
+
+    __slots__ = (
+        "_control_tip_text",
+        "_control_type",
+        "_decoded",
+        "_f_stream_data",
+        "_f_stream_data_offset",
+        "_o_stream",
+        "_o_stream_entry",
+        "_position",
+        "_tag",
+        "f_stream_entry",
+    )
+
+    def __init__(
+        self,
+        f_stream_entry,
+        o_stream_entry=None,
+        f_stream_data=None,
+        f_stream_data_offset=0,
+        o_stream=None,
+        position=None,
+    ):
+        """Initializes a form control.
+
+        Args:
+          f_stream_entry (FStreamEntry): f stream entry of the control.
+          o_stream_entry (Optional[OStreamEntry]): o stream entry of the control.
+          f_stream_data (Optional[bytes]): data of the f stream that contains
+              the entry of the control.
+          f_stream_data_offset (Optional[int]): offset of the f stream data
+              relative to the start of the stream, such as the offset of
+              the entry when the data contains only the entry.
+          o_stream (Optional[OStream]): o stream that contains the entry of
+              the control, which is read on first access, when no o stream entry
+              is provided.
+          position (Optional[tuple[int, int]]): left and top position of
+              the control in HIMETRIC units, when no f stream data is provided.
+        """
+        super().__init__()
+        self._control_tip_text = None
+        self._control_type = None
+        self._decoded = False
+        self._f_stream_data = f_stream_data
+        self._f_stream_data_offset = f_stream_data_offset
+        self._o_stream = o_stream
+        self._o_stream_entry = o_stream_entry
+        self._position = position
+        self._tag = None
+        self.f_stream_entry = f_stream_entry
+
+    @property
+    def caption(self):
+        """str: caption or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry:
+            return None
+        return o_stream_entry.caption
+
+    @property
+    def control_tip_text(self):
+        """str: control tip text or None if not available."""
+        if not self._decoded:
+            self._Decode()
+        return self._control_tip_text
+
+    @property
+    def control_type(self):
+        """str: control type, such as "TextBox", or None if not known."""
+        if not self._decoded:
+            self._Decode()
+        return self._control_type
+
+    @property
+    def font_name(self):
+        """str: font name or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry:
+            return None
+        return o_stream_entry.font_name
+
+    @property
+    def group_name(self):
+        """str: name of the group of an option button or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry:
+            return None
+        return o_stream_entry.group_name
+
+    @property
+    def name(self):
+        """str: name of the control."""
+        return self.f_stream_entry.name
+
+    @property
+    def o_stream_entry(self):
+        """OStreamEntry: o stream entry of the control or None if not available."""
+        if self._o_stream:
+            o_stream_entry_index = self.f_stream_entry.o_stream_entry_index
+            if o_stream_entry_index is not None:
+                try:
+                    self._o_stream_entry = self._o_stream.GetEntryByIndex(
+                        o_stream_entry_index, self.f_stream_entry.clsid_cache_index
+                    )
+                except errors.ParseError:
+                    self._o_stream_entry = None
+
+            # The o stream is shared by all controls of the form and is no
+            # longer needed by this control.
+            self._o_stream = None
+
+        return self._o_stream_entry
+
+    @property
+    def position(self):
+        """tuple[int, int]: left and top position or None if not available."""
+        if not self._decoded:
+            self._Decode()
+        return self._position
+
+    @property
+    def size(self):
+        """tuple[int, int]: width and height or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry or o_stream_entry.width is None:
+            return None
+        return o_stream_entry.width, o_stream_entry.height
+
+    @property
+    def tag(self):
+        """str: tag or None if not available."""
+        if not self._decoded:
+            self._Decode()
+        return self._tag
+
+    @property
+    def text(self):
+        """str: value or otherwise caption or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry:
+            return None
+        if o_stream_entry.value is not None:
+            return o_stream_entry.value
+        return o_stream_entry.caption
+
+    @property
+    def value(self):
+        """str: value or None if not available."""
+        o_stream_entry = self.o_stream_entry
+        if not o_stream_entry:
+            return None
+        return o_stream_entry.value
+
+    def _Decode(self):
+        """Decodes the properties of the site of the control."""
+        f_stream_entry = self.f_stream_entry
+
+        self._control_type = self._CONTROL_TYPES.get(
+            f_stream_entry.clsid_cache_index, None
+        )
+
+        if self._f_stream_data:
+            # The site properties follow the version, size and property mask of
+            # the entry.
+            entry_offset = f_stream_entry.offset - self._f_stream_data_offset
+            try:
+                property_values, _ = form_properties.ReadPropertyData(
+                    self._f_stream_data,
+                    entry_offset + 8,
+                    entry_offset + 4 + f_stream_entry.size,
+                    f_stream_entry.property_mask,
+                    form_properties.SITE_PROPERTIES,
                 )
-                print(f"String: {string_index:d}\t\t\t\t\t\t\t: {value_string:s}")
-                print(f"Unknown1\t\t\t\t\t\t\t: 0x{string_struct.unknown1:08x}")
-                print(f"Unknown2\t\t\t\t\t\t\t: 0x{string_struct.unknown2:08x}")
-                print(f"Unknown3\t\t\t\t\t\t\t: 0x{string_struct.unknown3:08x}")
+            except errors.ParseError:
+                property_values = {}
+
+            self._control_tip_text = property_values.get("control_tip_text", None)
+            self._position = property_values.get("position", None)
+            self._tag = property_values.get("tag", None)
+
+        # The stream data is shared by all controls of the form and is no
+        # longer needed by this control.
+        self._decoded = True
+        self._f_stream_data = None
+
+
+class VBAModule:
+    """Visual Basic for Applications (VBA) module.
+
+    Attributes:
+      module_type (str): module type, such as "document" or "procedural".
+      name (str): name.
+      source_code (str): source code or None if not available.
+      stream_name (str): name of the module stream.
+      text_offset (int): offset of the compressed source code in the module
+          stream.
+    """
+
+    def __init__(self, name=None):
+        """Initializes a module.
+
+        Args:
+          name (Optional[str]): name.
+        """
+        super().__init__()
+        self.module_type = None
+        self.name = name
+        self.source_code = None
+        self.stream_name = name
+        self.text_offset = 0
+
+
+class VBAProjectRoot:
+    """Visual Basic for Applications (VBA) project root.
+
+    Attributes:
+      code_page (int): code page of the project or None if not available.
+      container_path (str): path of the OLE Compound File within the ZIP or
+          OOXML containers of the document or None if not within a container.
+      forms (list[VBAForm]): forms.
+      modules (list[VBAModule]): modules.
+      path (str): path of the storage that contains the project, where an empty
+          string represents the root storage.
+      project_keys (list[tuple[str, str]]): keys and values in the PROJECT
+          stream.
+      project_name (str): name of the project or None if not available.
+      strings (ProjectStringTable|list[ProjectString]): strings in
+          the _VBA_PROJECT stream.
+      version (int): version of the VBA project, as stored in the _VBA_PROJECT
+          stream, or None if not available.
+    """
+
+    def __init__(self, path):
+        """Initializes a project root.
+
+        Args:
+          path (str): path of the storage that contains the project.
+        """
+        super().__init__()
+        self.code_page = None
+        self.container_path = None
+        self.forms = []
+        self.modules = []
+        self.path = path
+        self.project_keys = []
+        self.project_name = None
+        self.strings = []
+        self.version = None
+
+
+def DecodeProjectString(data, code_page):
+    """Decodes a string stored in the code page of a project.
+
+    Args:
+      data (bytes): encoded string.
+      code_page (int): code page of the project or None if not available.
+
+    Returns:
+      str: decoded string.
+    """
+    encoding = f"cp{code_page:d}" if code_page else "cp1252"
+    try:
+        return data.decode(encoding, errors="replace")
+    except LookupError:
+        return data.decode("cp1252", errors="replace")
+
+
+def GetProjectRootPaths(olecf_item, path, depth=0):
+    """Retrieves the paths of storages that contain a VBA project.
+
+    Args:
+      olecf_item (pyolecf.item): OLECF item of a storage.
+      path (str): path of the storage, where an empty string represents the root
+          storage.
+      depth (Optional[int]): depth of the storage.
+
+    Yields:
+      str: path of a storage that contains a VBA project.
+    """
+    olecf_vba_item = olecf_item.get_sub_item_by_name("VBA")
+    if olecf_vba_item and olecf_item.get_sub_item_by_name("PROJECT"):
+        yield path
+
+    if depth < _MAXIMUM_PROJECT_ROOT_DEPTH:
+        for olecf_sub_item in olecf_item.sub_items:
+            if olecf_sub_item.number_of_sub_items and olecf_sub_item.name != "VBA":
+                yield from GetProjectRootPaths(
+                    olecf_sub_item, f"{path:s}\\{olecf_sub_item.name:s}", depth + 1
+                )
+
+
+def OpenOLECFFile(source):
+    """Opens an OLE Compound File.
+
+    Args:
+      source (str or bytes or memoryview or file): path of the OLE compound
+          file, its data or a file-like object that contains its data.
+
+    Returns:
+      pyolecf.file: OLECF file.
+
+    Raises:
+      IOError: if the OLE Compound File could not be opened.
+      OSError: if the OLE Compound File could not be opened.
+    """
+    import pyolecf  # pylint: disable=import-outside-toplevel
+
+    olecf_file = pyolecf.file()
+    if isinstance(source, (str, os.PathLike)):
+        olecf_file.open(os.fspath(source))
+    else:
+        if isinstance(source, (bytearray, bytes, memoryview)):
+            source = io.BytesIO(source)
+        olecf_file.open_file_object(source)
+
+    return olecf_file
+
+
+class VBAProject:
+    """Visual Basic for Applications (VBA) project that reads its streams on demand.
+
+    The OLE Compound File is kept open while the project is open, where each
+    property parses its stream on first access and memoizes the result, so that
+    only the streams that are used are read. For example:
+
+      with vba.VBAProject("document.doc") as vba_project:
+        for vba_module in vba_project.modules:
+          print(vba_module.source_code)
+
+    Attributes:
+      path (str): path of the storage that contains the project, where an empty
+          string represents the root storage, or None if the project has not
+          been opened.
+    """
+
+    def __init__(
+        self,
+        source=None,
+        debug=False,
+        decompression_pool=None,
+        olecf_file=None,
+        path=None,
+        profile_stage=None,
+        stream_cache=None,
+    ):
+        """Initializes a project.
+
+        Args:
+          source (Optional[str or bytes or memoryview or file]): path of the OLE
+              compound file, its data or a file-like object that contains its
+              data.
+          debug (Optional[bool]): True if debug information should be printed.
+          decompression_pool (Optional[DecompressionPool]): pool used to
+              decompress large modules in parallel, where None represents
+              in-process decompression.
+          olecf_file (Optional[pyolecf.file]): OLECF file that is already open,
+              which is used instead of the source and is not closed with
+              the project.
+          path (Optional[str]): path of the storage that contains the project,
+              where None represents the first project found.
+          profile_stage (Optional[function]): function that is called with
+              the name of a parsing stage and returns a context manager that
+              profiles it, where None represents no profiling.
+          stream_cache (Optional[StreamCache]): cache of parsed stream results
+              that is shared across documents, where None represents parsing
+              every stream. The cache is not used when debug information is
+              printed.
+        """
+        super().__init__()
+        self._debug = debug
+        self._decompression_pool = decompression_pool
+        self._is_olecf_file_owned = olecf_file is None
+        self._olecf_file = olecf_file
+        self._profile_stage = profile_stage
+        self._source = source
+        self._stream_cache = None if debug else stream_cache
+
+        self.path = path
 
-            stream_data_offset += 14 + string_struct.string_size
+    def __enter__(self):
+        """Enters a with statement.
 
+        Returns:
+          VBAProject: project.
+        """
+        self.Open()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        """Exits a with statement.
+
+        Args:
+          exception_type (type): type of the exception or None.
+          value (Exception): exception or None.
+          traceback (traceback): traceback of the exception or None.
+        """
+        self.Close()
+
+    @functools.cached_property
+    def forms(self):
+        """list[VBAForm]: forms."""
+        return [
+            self._ReadForm(value)
+            for key, value in self.project_keys
+            if key == "BaseClass"
+        ]
+
+    @functools.cached_property
+    def modules(self):
+        """list[VBAModule]: modules, including their source code."""
+        if not self.project_info:
+            return []
+
+        # The source code of the modules is set per project, hence the modules of
+        # a cached dir stream are copied.
+        vba_modules = [
+            copy.copy(vba_module) for vba_module in self.project_info.modules
+        ]
+        with self._ProfileStage("modules"):
+            self._ReadModules(vba_modules, self.project_info.code_page)
+
+        return vba_modules
+
+    @functools.cached_property
+    def performance_cache(self):
+        """VBAProjectStream: _VBA_PROJECT stream or None if not available."""
+        olecf_item = self._GetItem("VBA\\_VBA_PROJECT")
+        if not olecf_item:
+            return None
+
+        with self._ProfileStage("VBAProjectStream"):
+            return self._ReadStream(VBAProjectStream, olecf_item)
+
+    @functools.cached_property
+    def project_info(self):
+        """DirStream: dir stream, which contains the code page, name and modules
+        of the project, or None if not available."""
+        olecf_item = self._GetItem("VBA\\dir")
+        if not olecf_item:
+            return None
+
+        with self._ProfileStage("DirStream"):
+            return self._ReadStream(DirStream, olecf_item)
+
+    @functools.cached_property
+    def project_keys(self):
+        """list[tuple[str, str]]: keys and values in the PROJECT stream."""
+        code_page = None
+        if self.project_info:
+            code_page = self.project_info.code_page
+
+        return self._ReadProjectKeys(code_page)
+
+    @property
+    def stream_found(self):
+        """bool: True if the project contains a _VBA_PROJECT stream."""
+        return self._GetItem("VBA\\_VBA_PROJECT") is not None
+
+    def _GetCachedStreamResult(self, kind, stream_data, parse_function):
+        """Retrieves the result of parsing a stream, from the cache if available.
+
+        Args:
+          kind (str): kind of parser, such as "VBAProjectStream".
+          stream_data (bytes): stream data.
+          parse_function (function): function that parses the stream data and
+              returns the result.
+
+        Returns:
+          object: result of parsing the stream.
+
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+        if not self._stream_cache:
+            return parse_function(stream_data)
+
+        key = self._stream_cache.GetKey(kind, stream_data)
+        result = self._stream_cache.GetValue(key)
+        if result is None:
+            result = parse_function(stream_data)
+            self._stream_cache.SetValue(key, result, len(stream_data))
+
+        return result
+
+    def _GetItem(self, relative_path):
+        """Retrieves an item of the project.
+
+        Args:
+          relative_path (str): path of the item relative to the storage that
+              contains the project.
+
+        Returns:
+          pyolecf.item: OLECF item or None if not available.
+
+        Raises:
+          IOError: if the project has not been opened.
+        """
+        if not self._olecf_file:
+            raise IOError("Project not opened.")
+
+        return self._olecf_file.get_item_by_path(f"{self.path:s}\\{relative_path:s}")
+
+    def _ProfileStage(self, name):
+        """Profiles a parsing stage.
+
+        Args:
+          name (str): name of the stage.
+
+        Returns:
+          contextlib.AbstractContextManager: context manager of the stage.
+        """
+        if not self._profile_stage:
+            return contextlib.nullcontext()
+
+        return self._profile_stage(name)
+
+    def _ReadForm(self, name):
+        """Reads a form.
+
+        The f stream is read first, since it contains the sizes of the o stream
+        entries. The controls in the f stream are joined with their o stream
+        entries by index, where an o stream entry is read when it is accessed.
+
+        Args:
+          name (str): name of the storage of the form.
+
+        Returns:
+          VBAForm: form.
+
+        Raises:
+          ParseError: if a stream of the form could not be parsed.
+        """
+        vba_form = VBAForm(name)
+
+        olecf_f_item = self._GetItem(f"{name:s}\\f")
+        if not olecf_f_item:
+            return vba_form
+
+        with self._ProfileStage("FStream"):
+            f_stream = self._ReadStream(FStream, olecf_f_item)
+        vba_form.f_stream_entries = f_stream.entries
+        vba_form.number_of_controls = f_stream.number_of_sites
+
+        olecf_o_item = self._GetItem(f"{name:s}\\o")
+        if olecf_o_item:
+            entry_sizes = [
+                f_stream_entry.o_stream_entry_size
+                for f_stream_entry in f_stream.entries
+                if f_stream_entry.o_stream_entry_index is not None
+            ]
+
+            # The o stream is not cached, since its entries are delimited by
+            # the f stream and only their offsets are read.
+            with self._ProfileStage("OStream"):
+                vba_form.o_stream = OStream(debug=self._debug)
+                vba_form.o_stream.Read(olecf_o_item, entry_sizes)
+
+        for f_stream_entry in f_stream.entries:
+            vba_form.controls.append(
+                VBAFormControl(
+                    f_stream_entry,
+                    f_stream_data=f_stream.stream_data,
+                    o_stream=vba_form.o_stream,
+                )
+            )
+
+        return vba_form
+
+    def _ReadFormHeader(self, name):
+        """Reads only the header of a form, without its controls.
+
+        The number of controls of the form is read from the header.
+
+        Args:
+          name (str): name of the storage of the form.
+
+        Returns:
+          VBAForm: form or None if the storage does not contain a f stream.
+
+        Raises:
+          ParseError: if the header of the f stream could not be parsed.
+        """
+        olecf_f_item = self._GetItem(f"{name:s}\\f")
+        if not olecf_f_item:
+            return None
+
+        f_stream = FStream(debug=self._debug)
+        with self._ProfileStage("FStream"):
+            f_stream.ReadHeader(olecf_f_item)
+
+        vba_form = VBAForm(name)
+        vba_form.number_of_controls = f_stream.number_of_sites
+        return vba_form
+
+    def _ReadModules(self, vba_modules, code_page):
+        """Reads the source code of modules.
+
+        Args:
+          vba_modules (list[VBAModule]): modules.
+          code_page (int): code page of the project or None if not available.
+
+        Raises:
+          ParseError: if a module stream could not be decompressed.
+        """
+        compressed_data_list = []
+        read_vba_modules = []
+        for vba_module in vba_modules:
+            olecf_module_item = self._GetItem(f"VBA\\{vba_module.stream_name:s}")
+            if not olecf_module_item:
+                continue
+
+            stream_data = olecf_module_item.read()
+            compressed_data_list.append(stream_data[vba_module.text_offset :])
+            read_vba_modules.append(vba_module)
+
+        source_code_list = [None] * len(compressed_data_list)
+        cache_keys = [None] * len(compressed_data_list)
+        if self._stream_cache:
+            for index, compressed_data in enumerate(compressed_data_list):
+                cache_keys[index] = self._stream_cache.GetKey("module", compressed_data)
+                source_code_list[index] = self._stream_cache.GetValue(cache_keys[index])
+
+        # Only the modules that are not cached are decompressed.
+        uncached_indexes = [
+            index
+            for index, source_code in enumerate(source_code_list)
+            if source_code is None
+        ]
+        uncached_data_list = [compressed_data_list[index] for index in uncached_indexes]
+
+        if self._decompression_pool:
+            decompressed_data_list = self._decompression_pool.Decompress(
+                uncached_data_list
+            )
+        else:
+            decompressed_data_list = [
+                compression.Decompress(compressed_data)
+                for compressed_data in uncached_data_list
+            ]
+
+        for index, source_code in zip(uncached_indexes, decompressed_data_list):
+            source_code_list[index] = source_code
+            if self._stream_cache:
+                self._stream_cache.SetValue(
+                    cache_keys[index], source_code, len(source_code)
+                )
+
+        for vba_module, source_code in zip(read_vba_modules, source_code_list):
+            vba_module.source_code = DecodeProjectString(source_code, code_page)
+
+    def _ReadProjectKeys(self, code_page):
+        """Reads the keys and values in the PROJECT stream.
+
+        Args:
+          code_page (int): code page of the project or None if not available.
+
+        Returns:
+          list[tuple[str, str]]: keys and values.
+        """
+        olecf_project_item = self._GetItem("PROJECT")
+        if not olecf_project_item:
+            return []
+
+        stream_data = olecf_project_item.read(olecf_project_item.size)
         if self._debug:
-            print("")
+            # ID="{%GUID%}"
+            # Document=ThisDocument/&H00000000
+            # Package={%GUID%}
+            # BaseClass=%IDENTIFIER%
+            # HelpFile=""
+            # Name="Project"
+            # HelpContextID="0"
+            # VersionCompatible32="393222000"
+            # CMG="%IDENTIFIER%"
+            # DPB="%IDENTIFIER%"
+            # GC="%IDENTIFIER%"
+
+            print("PROJECT stream data:")
+            print(stream_data)
+
+        project_keys = []
+        for line in stream_data.split(b"\n"):
+            key, separator, value = line.strip().partition(b"=")
+            if separator:
+                project_keys.append(
+                    (
+                        DecodeProjectString(key, code_page),
+                        DecodeProjectString(value, code_page),
+                    )
+                )
 
-        return True
+        return project_keys
+
+    def _ReadStream(self, stream_class, olecf_item):
+        """Reads a stream, from the cache if available.
+
+        Args:
+          stream_class (type): stream class, such as VBAProjectStream.
+          olecf_item (pyolecf.item): OLECF item of the stream.
+
+        Returns:
+          BinaryDataFormat: stream, which must not be modified since it can be
+              shared across documents.
+
+        Raises:
+          ParseError: if the stream data could not be parsed.
+        """
+
+        def _ParseStream(stream_data):
+            stream_object = stream_class(debug=self._debug)
+            stream_object.ReadData(stream_data)
+            return stream_object
+
+        return self._GetCachedStreamResult(
+            stream_class.__name__, olecf_item.read(), _ParseStream
+        )
+
+    def Close(self):
+        """Closes the project.
+
+        The memoized results remain available after the project is closed.
+        """
+        if self._olecf_file and self._is_olecf_file_owned:
+            self._olecf_file.close()
+        self._olecf_file = None
+
+    def GetProjectRoot(self, triage=False):
+        """Retrieves the project root, which contains the results of all streams.
+
+        Args:
+          triage (Optional[bool]): True if only the headers of the streams should
+              be read, to detect the project and its version without reading
+              the modules, strings and form controls.
+
+        Returns:
+          VBAProjectRoot: project root.
+
+        Raises:
+          ParseError: if a stream of the project could not be parsed.
+        """
+        project_root = VBAProjectRoot(self.path)
+
+        if triage:
+            project_root.project_keys = self._ReadProjectKeys(None)
+            for key, value in project_root.project_keys:
+                if key == "BaseClass":
+                    vba_form = self._ReadFormHeader(value)
+                    if vba_form:
+                        project_root.forms.append(vba_form)
+
+            olecf_item = self._GetItem("VBA\\_VBA_PROJECT")
+            if olecf_item:
+                vba_project_stream = VBAProjectStream(debug=self._debug)
+                with self._ProfileStage("VBAProjectStream"):
+                    vba_project_stream.ReadHeader(olecf_item)
+                project_root.version = vba_project_stream.version
+
+            return project_root
+
+        if self.project_info:
+            project_root.code_page = self.project_info.code_page
+            project_root.modules = self.modules
+            project_root.project_name = self.project_info.project_name
+
+        project_root.forms = self.forms
+        project_root.project_keys = self.project_keys
+
+        if self.performance_cache:
+            project_root.strings = self.performance_cache.strings
+            project_root.version = self.performance_cache.version
+
+        return project_root
+
+    def Open(self):
+        """Opens the project.
+
+        Raises:
+          IOError: if the OLE Compound File could not be opened.
+          OSError: if the OLE Compound File could not be opened.
+          ParseError: if the OLE Compound File does not contain a VBA project.
+        """
+        if not self._olecf_file:
+            self._olecf_file = OpenOLECFFile(self._source)
+            self._is_olecf_file_owned = True
+
+        if self.path is None:
+            self.path = next(GetProjectRootPaths(self._olecf_file.root_item, ""), None)
+            if self.path is None:
+                self.Close()
+                raise errors.ParseError("Missing VBA project.")
 
 
 class VBACollector:
     """Class that defines a Visual Basic for Applications (VBA) collector.
 
     Attributes:
-      steam_found (bool): True if a stream containing VBA was found.
+      project_roots (list[VBAProjectRoot]): project roots.
+      stage_durations (list[tuple[str, float]]): names of the parsing stages
+          and their duration in seconds.
+      stream_found (bool): True if a stream containing VBA was found.
     """
 
-    def __init__(self, debug=False):
+    def __init__(
+        self,
+        debug=False,
+        decompression_pool=None,
+        memory_profiler=None,
+        stream_cache=None,
+        triage=False,
+    ):
         """Initializes a collector.
 
         Args:
           debug (Optional[bool]): True if debug information should be printed.
+          decompression_pool (Optional[DecompressionPool]): pool used to
+              decompress large modules in parallel, where None represents
+              in-process decompression.
+          memory_profiler (Optional[MemoryProfiler]): profiler of the memory
+              usage of the parsing stages, where None represents no profiling.
+          stream_cache (Optional[StreamCache]): cache of parsed stream results
+              that is shared across documents, where None represents parsing
+              every stream. The cache is not used when debug information is
+              printed.
+          triage (Optional[bool]): True if only the headers of the streams should
+              be read, to detect VBA projects and their versions without reading
+              the modules, strings and form controls.
         """
         super().__init__()
         self._debug = debug
+        self._decompression_pool = decompression_pool
+        self._memory_profiler = memory_profiler
+        self._stream_cache = stream_cache
+        self._triage = triage
 
+        self.project_roots = []
+        self.stage_durations = []
         self.stream_found = False
 
+    @contextlib.contextmanager
+    def _ProfileStage(self, name):
+        """Profiles the duration and, if enabled, memory usage of a parsing stage.
+
+        Args:
+          name (str): name of the stage.
+
+        Yields:
+          None: once the stage has started.
+        """
+        start_time = time.perf_counter()
+        try:
+            if not self._memory_profiler:
+                yield
+            else:
+                with self._memory_profiler.ProfileStage(name):
+                    yield
+
+        finally:
+            self.stage_durations.append((name, time.perf_counter() - start_time))
+
     def Collect(self, source, output_writer):
         """Collects VBA.
 
         Args:
-          source (str): path of the OLE compound file.
+          source (str or bytes or memoryview or file): path of the OLE compound
+              file, its data or a file-like object that contains its data.
           output_writer (OutputWriter): output writer.
+
+        Raises:
+          ParseError: if a stream of a project could not be parsed.
         """
         # TODO: remove this once output_writer is used.
         _ = output_writer
 
+        self.project_roots = []
+        self.stage_durations = []
         self.stream_found = False
 
-        olecf_file = pyolecf.file()
-        olecf_file.open(source)
+        with self._ProfileStage("pyolecf"):
+            olecf_file = OpenOLECFFile(source)
 
         try:
-            olecf_macros_project_item = olecf_file.get_item_by_path("\\Macros\\PROJECT")
-            if not olecf_macros_project_item:
-                return
-
-            stream_data = olecf_macros_project_item.read(olecf_macros_project_item.size)
-            if self._debug:
-                # ID="{%GUID%}"
-                # Document=ThisDocument/&H00000000
-                # Package={%GUID%}
-                # BaseClass=%IDENTIFIER%
-                # HelpFile=""
-                # Name="Project"
-                # HelpContextID="0"
-                # VersionCompatible32="393222000"
-                # CMG="%IDENTIFIER%"
-                # DPB="%IDENTIFIER%"
-                # GC="%IDENTIFIER%"
-
-                print("PROJECT stream data:")
-                print(stream_data)
-
-            base_class = None
-            for line in stream_data.split(b"\n"):
-                line = line.strip()
-                if line.startswith(b"BaseClass="):
-                    _, _, base_class = line.rpartition(b"=")
-
-            if base_class:
-                olecf_f_item = olecf_file.get_item_by_path(
-                    f"\\Macros\\{base_class:s}\\f"
-                )
-                if olecf_f_item:
-                    f_stream = FStream(debug=self._debug)
-                    f_stream.Read(olecf_f_item)
-
-                olecf_o_item = olecf_file.get_item_by_path(
-                    f"\\Macros\\{base_class:s}\\o"
+            for path in GetProjectRootPaths(olecf_file.root_item, ""):
+                vba_project = VBAProject(
+                    debug=self._debug,
+                    decompression_pool=self._decompression_pool,
+                    olecf_file=olecf_file,
+                    path=path,
+                    profile_stage=self._ProfileStage,
+                    stream_cache=self._stream_cache,
                 )
-                if olecf_o_item:
-                    o_stream = OStream(debug=self._debug)
-                    o_stream.Read(olecf_o_item)
+                with vba_project:
+                    if vba_project.stream_found:
+                        self.stream_found = True
 
-            olecf_vba_project_item = olecf_file.get_item_by_path(
-                "\\Macros\\VBA\\_VBA_PROJECT"
-            )
-            if olecf_vba_project_item:
-                self.stream_found = True
-
-                vba_project_stream = VBAProjectStream(debug=self._debug)
-                vba_project_stream.Read(olecf_vba_project_item)
+                    project_root = vba_project.GetProjectRoot(triage=self._triage)
 
-            # olecf_vba_item.get_sub_item_by_name('dir')
-            # MS-OVBA: 2.4.1 Compression and Decompression
+                self.project_roots.append(project_root)
 
         finally:
             olecf_file.close()
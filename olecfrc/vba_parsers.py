@@ -0,0 +1,564 @@
+"""Structure parsers generated from vba.yaml, do not edit."""
+
+# This file is generated by utils/generate_parsers.py, regenerate it
+# when the definition file changes.
+
+# pylint: disable=attribute-defined-outside-init
+
+import struct
+
+from olecfrc import errors
+
+# SHA-256 digest of the definition file the parsers are generated from.
+DEFINITION_DIGEST = "9a95586d2cf96d53bd41edbb6d5c4d0a92348f590a8c109de0336b01283c734d"
+
+_CONTROL_HEADER_STRUCT0 = struct.Struct("<BBHI")
+_MORPH_DATA_CONTROL_HEADER_STRUCT0 = struct.Struct("<BBHQ")
+_STD_FONT_STRUCT0 = struct.Struct("<BHBHIB")
+_GUID_AND_PICTURE_HEADER_STRUCT0 = struct.Struct("<16sII")
+_SITE_CLASS_INFO_HEADER_STRUCT0 = struct.Struct("<HH")
+_CLASS_TABLE_HEADER_STRUCT0 = struct.Struct("<H")
+_F_STREAM_SITES_HEADER_STRUCT0 = struct.Struct("<II")
+_F_STREAM_ENTRY_STRUCT0 = struct.Struct("<HHI")
+_PROJECT_STREAM_HEADER_STRUCT0 = struct.Struct("<IHHIIIIIHHH")
+_PROJECT_STREAM_STRING_STRUCT0 = struct.Struct("<H")
+_PROJECT_STREAM_STRING_STRUCT2 = struct.Struct("<III")
+_DIR_STREAM_RECORD_HEADER_STRUCT0 = struct.Struct("<HI")
+
+
+class ControlHeaderStructure:
+    """control_header structure values."""
+
+    __slots__ = (
+        "minor_version",
+        "major_version",
+        "data_size",
+        "property_mask",
+    )
+
+
+def ParseControlHeader(byte_stream, byte_offset=0):
+    """Parses a control_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[ControlHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = ControlHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.minor_version,
+            structure_values.major_version,
+            structure_values.data_size,
+            structure_values.property_mask,
+        ) = _CONTROL_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _CONTROL_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse control_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class MorphDataControlHeaderStructure:
+    """morph_data_control_header structure values."""
+
+    __slots__ = (
+        "minor_version",
+        "major_version",
+        "data_size",
+        "property_mask",
+    )
+
+
+def ParseMorphDataControlHeader(byte_stream, byte_offset=0):
+    """Parses a morph_data_control_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[MorphDataControlHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = MorphDataControlHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.minor_version,
+            structure_values.major_version,
+            structure_values.data_size,
+            structure_values.property_mask,
+        ) = _MORPH_DATA_CONTROL_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _MORPH_DATA_CONTROL_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse morph_data_control_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class StdFontStructure:
+    """std_font structure values."""
+
+    __slots__ = (
+        "version",
+        "character_set",
+        "flags",
+        "weight",
+        "height",
+        "face_name_size",
+        "face_name",
+    )
+
+
+def ParseStdFont(byte_stream, byte_offset=0):
+    """Parses a std_font structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[StdFontStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = StdFontStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.version,
+            structure_values.character_set,
+            structure_values.flags,
+            structure_values.weight,
+            structure_values.height,
+            structure_values.face_name_size,
+        ) = _STD_FONT_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _STD_FONT_STRUCT0.size
+
+        data_size = structure_values.face_name_size
+        if data_size < 0 or data_offset + data_size > len(byte_stream):
+            raise errors.ParseError(
+                f"Invalid std_font.face_name size: {data_size:d} at offset: "
+                f"{data_offset:d}"
+            )
+        structure_values.face_name = byte_stream[data_offset : data_offset + data_size]
+        data_offset += data_size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse std_font at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class GuidAndPictureHeaderStructure:
+    """guid_and_picture_header structure values."""
+
+    __slots__ = (
+        "class_identifier",
+        "preamble",
+        "data_size",
+    )
+
+
+def ParseGuidAndPictureHeader(byte_stream, byte_offset=0):
+    """Parses a guid_and_picture_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[GuidAndPictureHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = GuidAndPictureHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.class_identifier,
+            structure_values.preamble,
+            structure_values.data_size,
+        ) = _GUID_AND_PICTURE_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _GUID_AND_PICTURE_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse guid_and_picture_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class SiteClassInfoHeaderStructure:
+    """site_class_info_header structure values."""
+
+    __slots__ = (
+        "version",
+        "data_size",
+    )
+
+
+def ParseSiteClassInfoHeader(byte_stream, byte_offset=0):
+    """Parses a site_class_info_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[SiteClassInfoHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = SiteClassInfoHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.version,
+            structure_values.data_size,
+        ) = _SITE_CLASS_INFO_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _SITE_CLASS_INFO_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse site_class_info_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class ClassTableHeaderStructure:
+    """class_table_header structure values."""
+
+    __slots__ = ("number_of_class_infos",)
+
+
+def ParseClassTableHeader(byte_stream, byte_offset=0):
+    """Parses a class_table_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[ClassTableHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = ClassTableHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (structure_values.number_of_class_infos,) = (
+            _CLASS_TABLE_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        )
+        data_offset += _CLASS_TABLE_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse class_table_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class FStreamSitesHeaderStructure:
+    """f_stream_sites_header structure values."""
+
+    __slots__ = (
+        "number_of_sites",
+        "sites_data_size",
+    )
+
+
+def ParseFStreamSitesHeader(byte_stream, byte_offset=0):
+    """Parses a f_stream_sites_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[FStreamSitesHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = FStreamSitesHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.number_of_sites,
+            structure_values.sites_data_size,
+        ) = _F_STREAM_SITES_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _F_STREAM_SITES_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse f_stream_sites_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class FStreamEntryStructure:
+    """f_stream_entry structure values."""
+
+    __slots__ = (
+        "version",
+        "size",
+        "property_mask",
+        "data",
+    )
+
+
+def ParseFStreamEntry(byte_stream, byte_offset=0):
+    """Parses a f_stream_entry structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[FStreamEntryStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = FStreamEntryStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.version,
+            structure_values.size,
+            structure_values.property_mask,
+        ) = _F_STREAM_ENTRY_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _F_STREAM_ENTRY_STRUCT0.size
+
+        data_size = structure_values.size - 4
+        if data_size < 0 or data_offset + data_size > len(byte_stream):
+            raise errors.ParseError(
+                f"Invalid f_stream_entry.data size: {data_size:d} at offset: "
+                f"{data_offset:d}"
+            )
+        structure_values.data = byte_stream[data_offset : data_offset + data_size]
+        data_offset += data_size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse f_stream_entry at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class ProjectStreamHeaderStructure:
+    """project_stream_header structure values."""
+
+    __slots__ = (
+        "unknown1",
+        "unknown2",
+        "unknown3",
+        "unknown4",
+        "unknown5",
+        "unknown6",
+        "unknown7",
+        "unknown8",
+        "unknown9",
+        "number_of_strings",
+        "unknown11",
+    )
+
+
+def ParseProjectStreamHeader(byte_stream, byte_offset=0):
+    """Parses a project_stream_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[ProjectStreamHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = ProjectStreamHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.unknown1,
+            structure_values.unknown2,
+            structure_values.unknown3,
+            structure_values.unknown4,
+            structure_values.unknown5,
+            structure_values.unknown6,
+            structure_values.unknown7,
+            structure_values.unknown8,
+            structure_values.unknown9,
+            structure_values.number_of_strings,
+            structure_values.unknown11,
+        ) = _PROJECT_STREAM_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _PROJECT_STREAM_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse project_stream_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class ProjectStreamStringStructure:
+    """project_stream_string structure values."""
+
+    __slots__ = (
+        "string_size",
+        "string",
+        "unknown1",
+        "unknown2",
+        "unknown3",
+    )
+
+
+def ParseProjectStreamString(byte_stream, byte_offset=0):
+    """Parses a project_stream_string structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[ProjectStreamStringStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = ProjectStreamStringStructure()
+    data_offset = byte_offset
+    try:
+        (structure_values.string_size,) = _PROJECT_STREAM_STRING_STRUCT0.unpack_from(
+            byte_stream, data_offset
+        )
+        data_offset += _PROJECT_STREAM_STRING_STRUCT0.size
+
+        data_size = structure_values.string_size
+        if data_size < 0 or data_offset + data_size > len(byte_stream):
+            raise errors.ParseError(
+                f"Invalid project_stream_string.string size: {data_size:d} at offset: "
+                f"{data_offset:d}"
+            )
+        structure_values.string = byte_stream[data_offset : data_offset + data_size]
+        data_offset += data_size
+
+        (
+            structure_values.unknown1,
+            structure_values.unknown2,
+            structure_values.unknown3,
+        ) = _PROJECT_STREAM_STRING_STRUCT2.unpack_from(byte_stream, data_offset)
+        data_offset += _PROJECT_STREAM_STRING_STRUCT2.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse project_stream_string at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+class DirStreamRecordHeaderStructure:
+    """dir_stream_record_header structure values."""
+
+    __slots__ = (
+        "record_type",
+        "data_size",
+    )
+
+
+def ParseDirStreamRecordHeader(byte_stream, byte_offset=0):
+    """Parses a dir_stream_record_header structure.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset of the structure in the byte stream.
+
+    Returns:
+      tuple[DirStreamRecordHeaderStructure, int]: structure values and size
+          of the structure.
+
+    Raises:
+      ParseError: if the structure cannot be parsed.
+    """
+    structure_values = DirStreamRecordHeaderStructure()
+    data_offset = byte_offset
+    try:
+        (
+            structure_values.record_type,
+            structure_values.data_size,
+        ) = _DIR_STREAM_RECORD_HEADER_STRUCT0.unpack_from(byte_stream, data_offset)
+        data_offset += _DIR_STREAM_RECORD_HEADER_STRUCT0.size
+
+    except (UnicodeDecodeError, struct.error) as exception:
+        raise errors.ParseError(
+            "Unable to parse dir_stream_record_header at offset: "
+            f"{byte_offset:d} with error: {exception!s}"
+        )
+
+    return structure_values, data_offset - byte_offset
+
+
+STRUCTURE_PARSERS = {
+    "control_header": ParseControlHeader,
+    "morph_data_control_header": ParseMorphDataControlHeader,
+    "std_font": ParseStdFont,
+    "guid_and_picture_header": ParseGuidAndPictureHeader,
+    "site_class_info_header": ParseSiteClassInfoHeader,
+    "class_table_header": ParseClassTableHeader,
+    "f_stream_sites_header": ParseFStreamSitesHeader,
+    "f_stream_entry": ParseFStreamEntry,
+    "project_stream_header": ParseProjectStreamHeader,
+    "project_stream_string": ParseProjectStreamString,
+    "dir_stream_record_header": ParseDirStreamRecordHeader,
+}
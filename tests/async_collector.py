@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Tests for the asyncio collection of VBA."""
+
+import asyncio
+import concurrent.futures
+import io
+import threading
+import unittest
+
+from olecfrc import async_collector
+
+from tests import test_lib
+
+
+class BlockingBytesIO(io.BytesIO):
+    """In-memory file-like object of which reads block until an event is set."""
+
+    def __init__(self, data, event):
+        """Initializes an in-memory file-like object.
+
+        Args:
+          data (bytes): data.
+          event (threading.Event): event that unblocks the reads.
+        """
+        super().__init__(data)
+        self._event = event
+
+    def read(self, size=-1):
+        """Reads data once the event is set.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where -1 represents
+              all remaining data.
+
+        Returns:
+          bytes: data read.
+        """
+        self._event.wait()
+        return super().read(size)
+
+
+class BrokenExecutor(concurrent.futures.Executor):
+    """Executor of which the submitted calls fail as with a broken pool."""
+
+    def submit(self, fn, /, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Submits a call.
+
+        Args:
+          fn (function): function to call.
+          args (list[object]): positional arguments of the function.
+          kwargs (dict[str, object]): keyword arguments of the function.
+
+        Returns:
+          concurrent.futures.Future: future of the call, which has failed.
+        """
+        future = concurrent.futures.Future()
+        future.set_exception(
+            concurrent.futures.BrokenExecutor("A worker terminated abruptly.")
+        )
+        return future
+
+
+class AsyncCollectorTest(test_lib.BaseTestCase):
+    """Tests for the asyncio collector."""
+
+    def _CreateSources(self, number_of_documents):
+        """Creates sources for testing.
+
+        Args:
+          number_of_documents (int): number of documents.
+
+        Returns:
+          list[tuple[str, bytes]]: names of the documents and their data.
+        """
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+        return [
+            (f"document{index:d}.doc", document_data)
+            for index in range(number_of_documents)
+        ]
+
+    def testCollect(self):
+        """Tests the Collect function."""
+        sources = self._CreateSources(8)
+        sources.append(("unsupported.txt", b"This is not an OLE Compound File."))
+
+        async def _Collect(collector_object):
+            try:
+                return [
+                    document_result
+                    async for document_result in collector_object.Collect(sources)
+                ]
+            finally:
+                await collector_object.Close()
+
+        for executor in (None, concurrent.futures.ProcessPoolExecutor(max_workers=2)):
+            try:
+                collector_object = async_collector.AsyncCollector(
+                    concurrency=3, executor=executor
+                )
+                document_results = sorted(
+                    asyncio.run(_Collect(collector_object)),
+                    key=lambda document_result: document_result.source,
+                )
+            finally:
+                if executor:
+                    executor.shutdown()
+
+            self.assertEqual(len(document_results), 9)
+            for document_result in document_results[:8]:
+                self.assertTrue(document_result.stream_found)
+                self.assertEqual(
+                    document_result.project_roots[0].modules[0].name, "Module1"
+                )
+
+            self.assertIsNotNone(document_results[8].error)
+
+    def testCollectWithCancellation(self):
+        """Tests the Collect function with the iteration stopped early."""
+        sources = self._CreateSources(8)
+
+        async def _Collect(collector_object):
+            try:
+                document_results = collector_object.Collect(sources)
+                document_result = await anext(document_results)
+                await document_results.aclose()
+
+                # The slots of the cancelled documents must be released.
+                return document_result, await asyncio.wait_for(
+                    collector_object.CollectDocument(sources[0]), timeout=10.0
+                )
+            finally:
+                await collector_object.Close()
+
+        collector_object = async_collector.AsyncCollector(concurrency=2)
+        document_result, other_document_result = asyncio.run(_Collect(collector_object))
+
+        self.assertTrue(document_result.stream_found)
+        self.assertTrue(other_document_result.stream_found)
+
+    def testCollectDocumentWithBrokenExecutor(self):
+        """Tests the CollectDocument function with a broken executor."""
+        # pylint: disable=protected-access
+        sources = self._CreateSources(1)
+
+        async def _Collect(collector_object):
+            return await collector_object.CollectDocument(sources[0])
+
+        collector_object = async_collector.AsyncCollector(
+            concurrency=1, executor=BrokenExecutor()
+        )
+        document_result = asyncio.run(_Collect(collector_object))
+
+        self.assertEqual(document_result.source, "document0.doc")
+        self.assertEqual(document_result.error, "A worker terminated abruptly.")
+        self.assertEqual(document_result.error_type, "BrokenExecutor")
+
+        # The slot of the document is released.
+        self.assertFalse(collector_object._GetSemaphore().locked())
+
+    def testCollectDocumentWithTimeout(self):
+        """Tests the CollectDocument function with a timeout."""
+        sources = self._CreateSources(1)
+
+        event = threading.Event()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            # Keep the only worker busy so that the document does not start.
+            executor.submit(event.wait)
+
+            async def _Collect(collector_object):
+                return await collector_object.CollectDocument(sources[0])
+
+            collector_object = async_collector.AsyncCollector(
+                executor=executor, timeout=0.01
+            )
+            try:
+                document_result = asyncio.run(_Collect(collector_object))
+            finally:
+                event.set()
+
+        self.assertEqual(document_result.source, "document0.doc")
+        self.assertIsNotNone(document_result.error)
+        self.assertEqual(document_result.error_type, "TimeoutError")
+        self.assertFalse(document_result.stream_found)
+
+    def testCollectDocumentWithTimeoutStarted(self):
+        """Tests the CollectDocument function with a timeout of a started document."""
+        event = threading.Event()
+        source = ("document.doc", BlockingBytesIO(b"text", event))
+
+        async def _Collect(collector_object):
+            # pylint: disable=protected-access
+            try:
+                document_result = await collector_object.CollectDocument(source)
+
+                # The started document holds its slot until it is collected.
+                semaphore = collector_object._GetSemaphore()
+                is_locked = semaphore.locked()
+
+                event.set()
+                await asyncio.wait_for(semaphore.acquire(), timeout=10.0)
+
+            finally:
+                event.set()
+                await collector_object.Close()
+
+            return document_result, is_locked
+
+        collector_object = async_collector.AsyncCollector(concurrency=1, timeout=0.05)
+        document_result, is_locked = asyncio.run(_Collect(collector_object))
+
+        self.assertEqual(document_result.error_type, "TimeoutError")
+        self.assertTrue(is_locked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Tests for the batch collection of VBA."""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from olecfrc import batch
+
+from tests import test_lib
+
+
+class _FailingFileObject(io.BytesIO):
+    """File-like object of which reads fail with an unexpected error."""
+
+    def read(self, size=-1):
+        """Reads data.
+
+        Args:
+          size (Optional[int]): number of bytes to read.
+
+        Raises:
+          RuntimeError: always.
+        """
+        raise RuntimeError("Unable to read")
+
+
+class BatchCollectorTest(test_lib.BaseTestCase):
+    """Tests for the batch collector."""
+
+    def _CreateDOCMData(self, olecf_data):
+        """Creates .docm data for testing.
+
+        Args:
+          olecf_data (bytes): data of the vbaProject.bin member.
+
+        Returns:
+          bytes: .docm data.
+        """
+        file_object = io.BytesIO()
+        with zipfile.ZipFile(file_object, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("word/document.xml", b"<?xml version='1.0'?>")
+            zip_file.writestr("word/vbaProject.bin", olecf_data)
+
+        return file_object.getvalue()
+
+    def testCollect(self):
+        """Tests the Collect function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            for filename in ("document1.doc", "document2.doc"):
+                path = os.path.join(temporary_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(document_data)
+
+            path = os.path.join(temporary_directory, "unsupported.txt")
+            with open(path, "wb") as file_object:
+                file_object.write(b"This is not an OLE Compound File.")
+
+            sources = list(batch.GetSourcePaths([temporary_directory]))
+            self.assertEqual(len(sources), 3)
+
+            for number_of_workers in (1, 2):
+                batch_collector = batch.BatchCollector(
+                    number_of_workers=number_of_workers
+                )
+                document_results = sorted(
+                    batch_collector.Collect(sources),
+                    key=lambda document_result: document_result.source,
+                )
+
+                self.assertEqual(len(document_results), 3)
+                self.assertTrue(document_results[0].stream_found)
+                self.assertEqual(
+                    document_results[1].project_roots[0].modules[0].name, "Module1"
+                )
+                self.assertIsNotNone(document_results[2].error)
+
+    def testCollectFromMemory(self):
+        """Tests the Collect function with in-memory documents."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        sources = [
+            ("document1.doc", document_data),
+            ("document2.doc", memoryview(document_data)),
+            ("document3.doc", io.BytesIO(document_data)),
+            ("document4.docm", self._CreateDOCMData(document_data)),
+            ("unsupported.txt", b"This is not an OLE Compound File."),
+        ]
+
+        for number_of_workers in (1, 2):
+            for _, data in sources:
+                if isinstance(data, io.BytesIO):
+                    data.seek(0)
+
+            batch_collector = batch.BatchCollector(number_of_workers=number_of_workers)
+            document_results = sorted(
+                batch_collector.Collect(sources),
+                key=lambda document_result: document_result.source,
+            )
+
+            self.assertEqual(
+                [document_result.source for document_result in document_results],
+                [
+                    "document1.doc",
+                    "document2.doc",
+                    "document3.doc",
+                    "document4.docm",
+                    "unsupported.txt",
+                ],
+            )
+            for document_result in document_results[:4]:
+                self.assertTrue(document_result.stream_found)
+
+            project_root = document_results[3].project_roots[0]
+            self.assertEqual(project_root.container_path, "word/vbaProject.bin")
+            self.assertEqual(project_root.modules[0].name, "Module1")
+
+            self.assertIsNotNone(document_results[4].error)
+            self.assertEqual(document_results[4].error_type, "OSError")
+
+            self.assertEqual(document_results[0].data_size, len(document_data))
+            stage_names = [name for name, _ in document_results[0].stage_durations]
+            self.assertIn("modules", stage_names)
+
+    def testCollectDocumentWithUnexpectedError(self):
+        """Tests the CollectDocument function with an unexpected error."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        document_result = batch.CollectDocument(
+            ("document.doc", _FailingFileObject(document_data))
+        )
+
+        self.assertEqual(document_result.error, "Unable to read")
+        self.assertEqual(document_result.error_type, "RuntimeError")
+        self.assertEqual(document_result.data_size, len(document_data))
+
+    def testCollectWithStreamCache(self):
+        """Tests the Collect function with a stream cache."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        batch_collector = batch.BatchCollector(maximum_number_of_cached_streams=16)
+        document_results = list(
+            batch_collector.Collect(
+                [("document1.doc", document_data), ("document2.doc", document_data)]
+            )
+        )
+
+        hits, _ = document_results[1].stream_cache_statistics["module"]
+        self.assertEqual(hits, 1)
+        self.assertEqual(
+            document_results[1].project_roots[0].modules[0].source_code,
+            "Sub AutoOpen()\r\nEnd Sub\r\n",
+        )
+
+    def testCollectWithMemoryProfiling(self):
+        """Tests the Collect function with memory profiling."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        batch_collector = batch.BatchCollector(memory_profiling=True)
+        document_results = list(
+            batch_collector.Collect([("document.doc", document_data)])
+        )
+
+        stage_names = {
+            stage_memory_usage.name
+            for stage_memory_usage in document_results[0].memory_usage
+        }
+        self.assertEqual(
+            stage_names,
+            {"DirStream", "VBAProjectStream", "document", "modules", "pyolecf"},
+        )
+        self.assertEqual(document_results[0].memory_usage[-1].name, "document")
+        self.assertGreater(document_results[0].memory_usage[-1].peak_size, 0)
+
+
+class DocumentResultTest(test_lib.BaseTestCase):
+    """Tests for the document result."""
+
+    def testCopyFromDict(self):
+        """Tests the CopyFromDict function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"},
+            forms={"UserForm1": [("TextBox1", "payload", "Tahoma")]},
+            strings=["Module1"],
+        )
+
+        document_result = batch.CollectDocument(("document.doc", document_data))
+        document_dict = json.loads(json.dumps(document_result.CopyToDict()))
+
+        copied_document_result = batch.DocumentResult(None)
+        copied_document_result.CopyFromDict(document_dict)
+
+        copied_document_dict = copied_document_result.CopyToDict()
+        self.assertEqual(json.loads(json.dumps(copied_document_dict)), document_dict)
+
+        project_root = copied_document_result.project_roots[0]
+        self.assertEqual(project_root.modules[0].name, "Module1")
+        self.assertEqual(project_root.strings[0].string, "Module1")
+
+        vba_form_control = project_root.forms[0].controls[0]
+        self.assertEqual(vba_form_control.control_type, "TextBox")
+        self.assertEqual(vba_form_control.f_stream_entry.o_stream_entry_index, 0)
+        self.assertEqual(vba_form_control.position, (120, 240))
+        self.assertEqual(vba_form_control.size, (2400, 600))
+        self.assertEqual(vba_form_control.text, "payload")
+
+    def testCopyToDict(self):
+        """Tests the CopyToDict function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        document_result = batch.CollectDocument(("document.doc", document_data))
+        document_dict = document_result.CopyToDict()
+
+        self.assertEqual(document_dict["source"], "document.doc")
+        self.assertTrue(document_dict["stream_found"])
+        self.assertIsNone(document_dict["error"])
+
+        project_root_dict = document_dict["project_roots"][0]
+        self.assertIsNone(project_root_dict["container_path"])
+        self.assertEqual(project_root_dict["modules"][0]["name"], "Module1")
+
+        json_string = json.dumps(document_dict)
+        self.assertEqual(json.loads(json_string)["source"], "document.doc")
+
+
+if __name__ == "__main__":
+    unittest.main()
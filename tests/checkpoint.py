@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tests for the checkpoint journal of a batch scan."""
+
+import os
+import tempfile
+import unittest
+
+from olecfrc import checkpoint
+
+from tests import test_lib
+
+
+class CheckpointJournalTest(test_lib.BaseTestCase):
+    """Tests for the checkpoint journal."""
+
+    def testResume(self):
+        """Tests resuming from a checkpoint journal."""
+        signature_size = len(checkpoint.CheckpointJournal.SIGNATURE)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "scan.checkpoint")
+
+            checkpoint_journal = checkpoint.CheckpointJournal(path)
+            checkpoint_journal.Open()
+            checkpoint_journal.AddCompleted("document1.doc")
+            checkpoint_journal.AddCompleted("document2.doc")
+            checkpoint_journal.AddCompleted("document1.doc")
+            checkpoint_journal.Flush()
+            checkpoint_journal.AddCompleted("document3.doc")
+            checkpoint_journal.Close()
+
+            self.assertEqual(os.path.getsize(path), signature_size + (3 * 16))
+
+            # Simulate a record that was partially written.
+            with open(path, "ab") as file_object:
+                file_object.write(b"\xff" * 7)
+
+            checkpoint_journal = checkpoint.CheckpointJournal(path)
+            checkpoint_journal.Open(resume=True)
+            self.assertEqual(checkpoint_journal.number_of_completed, 3)
+            self.assertTrue(checkpoint_journal.IsCompleted("document1.doc"))
+            self.assertTrue(checkpoint_journal.IsCompleted("document3.doc"))
+            self.assertFalse(checkpoint_journal.IsCompleted("document4.doc"))
+
+            checkpoint_journal.AddCompleted("document4.doc")
+            checkpoint_journal.Close()
+
+            self.assertEqual(os.path.getsize(path), signature_size + (4 * 16))
+
+            checkpoint_journal = checkpoint.CheckpointJournal(path)
+            checkpoint_journal.Open(resume=True)
+            self.assertEqual(checkpoint_journal.number_of_completed, 4)
+            checkpoint_journal.Close()
+
+            # Without resume the journal is started anew.
+            checkpoint_journal = checkpoint.CheckpointJournal(path)
+            checkpoint_journal.Open()
+            self.assertEqual(checkpoint_journal.number_of_completed, 0)
+            checkpoint_journal.Close()
+
+            self.assertEqual(os.path.getsize(path), signature_size)
+
+    def testResumeWithUnsupportedJournal(self):
+        """Tests resuming from an unsupported checkpoint journal."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "scan.checkpoint")
+            with open(path, "wb") as file_object:
+                file_object.write(b"This is not a checkpoint journal.")
+
+            checkpoint_journal = checkpoint.CheckpointJournal(path)
+            with self.assertRaises(IOError):
+                checkpoint_journal.Open(resume=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
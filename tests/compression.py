@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for the MS-OVBA compression and decompression."""
+
+import random
+import unittest
+
+from olecfrc import compression
+from olecfrc import errors
+
+from tests import test_lib
+
+
+class CompressionTest(test_lib.BaseTestCase):
+    """Tests for the MS-OVBA compression and decompression."""
+
+    # Example of MS-OVBA section 3.2.2.
+    _UNCOMPRESSED_DATA = b"abcdefghijklmnopqrstuv."
+
+    _COMPRESSED_DATA = bytes.fromhex(
+        "0119b000616263646566676800696a6b6c6d6e6f70007172737475762e"
+    )
+
+    def _CreateTestData(self, random_generator, data_size):
+        """Creates source code-like test data.
+
+        Args:
+          random_generator (random.Random): random number generator.
+          data_size (int): size of the data.
+
+        Returns:
+          bytes: test data.
+        """
+        words = [
+            b"Attribute VB_Name = ",
+            b"Dim value As String\r\n",
+            b"End Sub\r\n",
+            b"MsgBox ",
+            b"Sub AutoOpen()\r\n",
+        ]
+        data = bytearray()
+        while len(data) < data_size:
+            if random_generator.random() < 0.8:
+                data.extend(random_generator.choice(words))
+            else:
+                data.extend(random_generator.randbytes(random_generator.randint(1, 5)))
+
+        return bytes(data[:data_size])
+
+    def testCompress(self):
+        """Tests the Compress function."""
+        compressed_data = compression.Compress(self._UNCOMPRESSED_DATA)
+        self.assertEqual(compressed_data, self._COMPRESSED_DATA)
+
+        compressed_data = compression.Compress(b"")
+        self.assertEqual(compressed_data, b"\x01")
+
+        compressed_data = compression.Compress(b"a" * 16)
+        self.assertEqual(compressed_data, bytes.fromhex("0103b002610c00"))
+
+    def testCompressRoundTrip(self):
+        """Tests that compressed data decompresses into the original data."""
+        random_generator = random.Random(4096)
+
+        data_sizes = list(range(1, 80))
+        for chunk_boundary in (4096, 8192, 12288):
+            data_sizes.extend(range(chunk_boundary - 3, chunk_boundary + 4))
+        data_sizes.extend(random_generator.randint(80, 65536) for _ in range(16))
+
+        for data_size in data_sizes:
+            for data in (
+                self._CreateTestData(random_generator, data_size),
+                bytes(data_size),
+                bytes(range(256)) * (data_size // 256) + bytes(data_size % 256),
+            ):
+                compressed_data = compression.Compress(data)
+                self.assertEqual(compression.Decompress(compressed_data), data)
+
+    def testCompressUncompressedChunks(self):
+        """Tests the Compress function with data that does not compress."""
+        random_generator = random.Random(8192)
+
+        data = random_generator.randbytes(8192)
+        compressed_data = compression.Compress(data)
+        self.assertEqual(len(compressed_data), 1 + (2 * (2 + 4096)))
+        self.assertEqual(compression.Decompress(compressed_data), data)
+
+        # An uncompressed last chunk is padded to 4096 bytes.
+        data = random_generator.randbytes(4000)
+        compressed_data = compression.Compress(data)
+        self.assertEqual(compressed_data[1:3], b"\xff\x3f")
+        self.assertEqual(compression.Decompress(compressed_data), data + bytes(96))
+
+        # Data that does not compress but fits in a compressed last chunk.
+        data = random_generator.randbytes(3640)
+        compressed_data = compression.Compress(data)
+        self.assertEqual(compression.Decompress(compressed_data), data)
+
+    def testDecompress(self):
+        """Tests the Decompress function."""
+        decompressed_data = compression.Decompress(self._COMPRESSED_DATA)
+        self.assertEqual(decompressed_data, self._UNCOMPRESSED_DATA)
+
+        decompressed_data = compression.Decompress(self._CompressLiterals(b"a" * 5000))
+        self.assertEqual(decompressed_data, b"a" * 5000)
+
+        with self.assertRaises(errors.ParseError):
+            compression.Decompress(b"")
+
+        with self.assertRaises(errors.ParseError):
+            compression.Decompress(b"\x02" + self._COMPRESSED_DATA[1:])
+
+        with self.assertRaises(errors.ParseError):
+            compression.Decompress(self._COMPRESSED_DATA[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
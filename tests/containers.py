@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the detection of OLE Compound Files in containers."""
+
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+from olecfrc import containers
+from olecfrc import errors
+
+from tests import test_lib
+
+
+class ContainerExtractorTest(test_lib.BaseTestCase):
+    """Tests for the container extractor."""
+
+    def _CreateZIPArchiveData(self, members):
+        """Creates ZIP archive data for testing.
+
+        Args:
+          members (dict[str, bytes]): data per member path.
+
+        Returns:
+          bytes: ZIP archive data.
+        """
+        file_object = io.BytesIO()
+        with zipfile.ZipFile(file_object, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for path, data in members.items():
+                zip_file.writestr(path, data)
+
+        return file_object.getvalue()
+
+    def testExtractOLECFDocuments(self):
+        """Tests the ExtractOLECFDocuments function."""
+        olecf_data = self._CreateVBADocumentData(path="")
+
+        container_extractor = containers.ContainerExtractor()
+
+        # Test a source that is not a container.
+        documents = list(container_extractor.ExtractOLECFDocuments(olecf_data))
+        self.assertEqual(documents, [(None, olecf_data)])
+
+        zip_data = self._CreateZIPArchiveData(
+            {
+                "[Content_Types].xml": b"<?xml version='1.0'?><Types/>",
+                "word/document.xml": b"<?xml version='1.0'?><document/>",
+                "word/vbaProject.bin": olecf_data,
+            }
+        )
+
+        for source in (zip_data, memoryview(zip_data), io.BytesIO(zip_data)):
+            documents = list(container_extractor.ExtractOLECFDocuments(source))
+            self.assertEqual(documents, [("word/vbaProject.bin", olecf_data)])
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "document.docm")
+            with open(path, "wb") as file_object:
+                file_object.write(zip_data)
+
+            documents = list(container_extractor.ExtractOLECFDocuments(path))
+            self.assertEqual(documents, [("word/vbaProject.bin", olecf_data)])
+
+    def testExtractOLECFDocumentsNested(self):
+        """Tests the ExtractOLECFDocuments function with nested archives."""
+        olecf_data = self._CreateVBADocumentData(path="")
+
+        zip_data = self._CreateZIPArchiveData({"xl/vbaProject.bin": olecf_data})
+        zip_data = self._CreateZIPArchiveData({"invoice.xlsm": zip_data})
+        zip_data = self._CreateZIPArchiveData({"archive.zip": zip_data})
+
+        container_extractor = containers.ContainerExtractor(maximum_depth=3)
+        documents = list(container_extractor.ExtractOLECFDocuments(zip_data))
+        self.assertEqual(
+            documents, [("archive.zip/invoice.xlsm/xl/vbaProject.bin", olecf_data)]
+        )
+
+        container_extractor = containers.ContainerExtractor(maximum_depth=2)
+        documents = list(container_extractor.ExtractOLECFDocuments(zip_data))
+        self.assertEqual(documents, [])
+
+        container_extractor = containers.ContainerExtractor(maximum_member_size=1024)
+        documents = list(container_extractor.ExtractOLECFDocuments(zip_data))
+        self.assertEqual(documents, [])
+
+    def testExtractOLECFDocumentsWithCorruptArchive(self):
+        """Tests the ExtractOLECFDocuments function with a corrupt archive."""
+        container_extractor = containers.ContainerExtractor()
+
+        with self.assertRaises(errors.ParseError):
+            list(container_extractor.ExtractOLECFDocuments(b"PK\x03\x04corrupt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
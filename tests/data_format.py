@@ -9,6 +9,7 @@ from dtfabric.runtime import fabric as dtfabric_fabric
 
 from olecfrc import data_format
 from olecfrc import errors
+from olecfrc import vba_parsers
 
 from tests import test_lib
 
@@ -75,6 +76,22 @@ class ErrorDataTypeMap(dtfabric_data_maps.DataTypeMap):
         )
 
 
+class TestDataFormat(data_format.BinaryDataFormat):
+    """Binary data format with generated structure parsers for testing."""
+
+    _DEFINITION_FILE = "vba.yaml"
+
+    _STRUCTURE_PARSERS = vba_parsers.STRUCTURE_PARSERS
+
+    _STRUCTURE_PARSERS_DIGEST = vba_parsers.DEFINITION_DIGEST
+
+
+class StaleTestDataFormat(TestDataFormat):
+    """Binary data format with stale generated structure parsers for testing."""
+
+    _STRUCTURE_PARSERS_DIGEST = "0" * 64
+
+
 class BinaryDataFormatTest(test_lib.BaseTestCase):
     """Binary data format tests."""
 
@@ -173,7 +190,45 @@ members:
         self.assertEqual(output_writer.output, expected_output)
 
     # TODO: add tests for _GetDataTypeMap
-    # TODO: add tests for _ReadDefinitionFile
+
+    def testHasMatchingStructureParsers(self):
+        """Tests the _HasMatchingStructureParsers function."""
+        test_format = data_format.BinaryDataFormat()
+        self.assertFalse(test_format._HasMatchingStructureParsers())
+
+        test_format = TestDataFormat()
+        self.assertTrue(test_format._HasMatchingStructureParsers())
+        self.assertIs(test_format._structure_parsers, vba_parsers.STRUCTURE_PARSERS)
+
+        # Stale generated structure parsers are not used.
+        test_format = StaleTestDataFormat()
+        self.assertFalse(test_format._HasMatchingStructureParsers())
+        self.assertEqual(test_format._structure_parsers, {})
+
+        structure_values, structure_size = test_format._ReadStructure(
+            b"\x01\x00\x04\x00\x00\x00",
+            0,
+            "dir_stream_record_header",
+            "dir stream record header",
+        )
+        self.assertEqual(structure_values.record_type, 1)
+        self.assertEqual(structure_size, 6)
+
+    def testReadDefinitionFile(self):
+        """Tests the _ReadDefinitionFile function."""
+        test_format = data_format.BinaryDataFormat()
+
+        data_type_fabric = test_format._ReadDefinitionFile("vba.yaml")
+        self.assertIsInstance(data_type_fabric, dtfabric_fabric.DataTypeFabric)
+
+        data_type_map = data_type_fabric.CreateDataTypeMap("uint32")
+        self.assertIsNotNone(data_type_map)
+
+        # Test that the data type fabric is shared within the process.
+        test_format = data_format.BinaryDataFormat()
+        self.assertIs(test_format._ReadDefinitionFile("vba.yaml"), data_type_fabric)
+
+        self.assertIsNone(test_format._ReadDefinitionFile(None))
 
     def testReadStructureFromByteStream(self):
         """Tests the _ReadStructureFromByteStream function."""
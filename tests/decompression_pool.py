@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for the decompression pool."""
+
+import unittest
+
+from olecfrc import decompression_pool
+from olecfrc import errors
+
+from tests import test_lib
+
+
+class DecompressionPoolTest(test_lib.BaseTestCase):
+    """Tests for the decompression pool."""
+
+    def testDecompress(self):
+        """Tests the Decompress function."""
+        uncompressed_data_list = [
+            b'Attribute VB_Name = "Module1"\r\n' * 512,
+            b"Sub AutoOpen()\r\nEnd Sub\r\n",
+            b'Attribute VB_Name = "Module2"\r\n' * 1024,
+        ]
+        compressed_data_list = [
+            self._CompressLiterals(uncompressed_data)
+            for uncompressed_data in uncompressed_data_list
+        ]
+
+        pool = decompression_pool.DecompressionPool(number_of_workers=2, threshold=1024)
+        try:
+            decompressed_data_list = pool.Decompress(compressed_data_list)
+            self.assertEqual(decompressed_data_list, uncompressed_data_list)
+
+            # Test reusing the pool.
+            decompressed_data_list = pool.Decompress(compressed_data_list[1:])
+            self.assertEqual(decompressed_data_list, uncompressed_data_list[1:])
+
+            with self.assertRaises(errors.ParseError):
+                pool.Decompress([b"\x02" + compressed_data_list[0][1:]])
+
+        finally:
+            pool.Close()
+
+        pool = decompression_pool.DecompressionPool(number_of_workers=1)
+        decompressed_data_list = pool.Decompress(compressed_data_list)
+        self.assertEqual(decompressed_data_list, uncompressed_data_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for the content-hash deduplication of a batch scan."""
+
+import hashlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from olecfrc import batch
+from olecfrc import deduplication
+
+from tests import test_lib
+
+
+class DeduplicationTest(test_lib.BaseTestCase):
+    """Tests for the deduplication functions."""
+
+    def testGetContentDigest(self):
+        """Tests the GetContentDigest function."""
+        data = bytes(range(256)) * 8192
+        expected_digest = hashlib.sha256(data).digest()
+
+        self.assertEqual(deduplication.GetContentDigest(data), expected_digest)
+        self.assertEqual(
+            deduplication.GetContentDigest(("document.doc", memoryview(data))),
+            expected_digest,
+        )
+
+        file_object = io.BytesIO(data)
+        self.assertEqual(
+            deduplication.GetContentDigest(("document.doc", file_object)),
+            expected_digest,
+        )
+        self.assertEqual(file_object.tell(), 0)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "document.doc")
+            with open(path, "wb") as file_object:
+                file_object.write(data)
+
+            self.assertEqual(deduplication.GetContentDigest(path), expected_digest)
+
+
+class HashStoreTest(test_lib.BaseTestCase):
+    """Tests for the hash store."""
+
+    def testGetAndWriteDocumentResult(self):
+        """Tests the GetDocumentResult and WriteDocumentResult functions."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"},
+            forms={"UserForm1": [("TextBox1", "payload", "Tahoma")]},
+        )
+        document_result = batch.CollectDocument(("document.doc", document_data))
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "hashes.db")
+
+            hash_store = deduplication.HashStore(path, batch_size=1)
+            self.assertTrue(hash_store.Open())
+            try:
+                hash_store.WriteDocumentResult(b"digest", document_result)
+
+                # The document result is committed once the batch is full.
+                with sqlite3.connect(path) as connection:
+                    cursor = connection.execute("SELECT COUNT(*) FROM document_results")
+                    self.assertEqual(cursor.fetchone()[0], 1)
+
+                self.assertIsNone(hash_store.GetDocumentResult(b"other"))
+                stored_document_result = hash_store.GetDocumentResult(b"digest")
+            finally:
+                hash_store.Close()
+
+        self.assertIsNotNone(stored_document_result)
+        self.assertEqual(stored_document_result.source, "document.doc")
+
+        project_root = stored_document_result.project_roots[0]
+        self.assertEqual(project_root.modules[0].name, "Module1")
+        self.assertEqual(project_root.forms[0].controls[0].text, "payload")
+
+    def testOpenWithUnsupportedFormat(self):
+        """Tests the Open function with a store of an unsupported format."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "hashes.db")
+
+            # A store of a previous format, without metadata.
+            with sqlite3.connect(path) as connection:
+                connection.execute(
+                    "CREATE TABLE document_results "
+                    "(digest BLOB PRIMARY KEY, document_result BLOB)"
+                )
+            connection.close()
+
+            hash_store = deduplication.HashStore(path)
+            self.assertFalse(hash_store.Open())
+
+
+class DeduplicatingBatchCollectorTest(test_lib.BaseTestCase):
+    """Tests for the deduplicating batch collector."""
+
+    def _CreateSources(self):
+        """Creates sources for testing.
+
+        Returns:
+          list[tuple[str, bytes]]: names of the documents and their data.
+        """
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+        other_document_data = self._CreateVBADocumentData(
+            modules={"Module2": "Sub AutoClose()\r\nEnd Sub\r\n"}
+        )
+        sources = [(f"document{index:d}.doc", document_data) for index in range(1, 6)]
+        sources.append(("other.doc", other_document_data))
+        sources.append(("unsupported.txt", b"This is not an OLE Compound File."))
+        return sources
+
+    def testCollect(self):
+        """Tests the Collect function."""
+        sources = self._CreateSources()
+
+        for number_of_workers in (1, 2):
+            batch_collector = deduplication.DeduplicatingBatchCollector(
+                number_of_workers=number_of_workers
+            )
+            document_results = sorted(
+                batch_collector.Collect(sources),
+                key=lambda document_result: document_result.source,
+            )
+
+            self.assertEqual(len(document_results), 7)
+            self.assertEqual(batch_collector.number_of_documents, 7)
+            self.assertEqual(batch_collector.number_of_duplicates, 4)
+            self.assertEqual(batch_collector.number_of_hash_store_hits, 0)
+
+            duplicates_of = {
+                document_result.duplicate_of for document_result in document_results[:5]
+            }
+            self.assertEqual(len(duplicates_of), 2)
+            self.assertIn(None, duplicates_of)
+
+            for document_result in document_results[:5]:
+                self.assertTrue(document_result.stream_found)
+                self.assertEqual(
+                    document_result.project_roots[0].modules[0].name, "Module1"
+                )
+
+            self.assertEqual(document_results[5].source, "other.doc")
+            self.assertEqual(
+                document_results[5].project_roots[0].modules[0].name, "Module2"
+            )
+            self.assertIsNotNone(document_results[6].error)
+
+    def testCollectWithHashStore(self):
+        """Tests the Collect function with a hash store."""
+        sources = self._CreateSources()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "hashes.db")
+
+            for expected_number_of_hits in (0, 2):
+                hash_store = deduplication.HashStore(path)
+                self.assertTrue(hash_store.Open())
+                try:
+                    batch_collector = deduplication.DeduplicatingBatchCollector(
+                        hash_store=hash_store
+                    )
+                    document_results = list(batch_collector.Collect(sources))
+                finally:
+                    hash_store.Close()
+
+                self.assertEqual(len(document_results), 7)
+                self.assertEqual(
+                    batch_collector.number_of_hash_store_hits,
+                    expected_number_of_hits,
+                )
+
+        # The second run only parses the document with an error, which is not
+        # stored.
+        self.assertEqual(batch_collector.number_of_duplicates, 6)
+        self.assertEqual(document_results[0].duplicate_of, "document1.doc")
+        self.assertEqual(document_results[0].source, "document1.doc")
+
+
+if __name__ == "__main__":
+    unittest.main()
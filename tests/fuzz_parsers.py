@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for the stream parser fuzzer."""
+
+import unittest
+
+from utils import fuzz_parsers
+
+from tests import test_lib
+
+
+def _CreateSeed(number_of_entries):
+    """Creates seed data of which the first byte is a count.
+
+    Args:
+      number_of_entries (int): number of entries.
+
+    Returns:
+      tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and struct
+          formats of its integer fields.
+    """
+    return bytes([number_of_entries]) + bytes(4 * number_of_entries), [(0, "<B")]
+
+
+def _ParseQuadratic(data):
+    """Parses data at a cost that is quadratic when the first byte is 0xff.
+
+    Args:
+      data (bytes): input data.
+    """
+    if data and data[0] == 0xFF:
+        for _ in data:
+            for _ in data:
+                pass
+
+
+class ParserFuzzerTest(test_lib.BaseTestCase):
+    """Tests for the parser fuzzer."""
+
+    def testCheckInput(self):
+        """Tests the CheckInput function with valid seeds."""
+        fuzzer = fuzz_parsers.ParserFuzzer(
+            maximum_input_size=4096, memory_budget=False, time_factor=1000.0
+        )
+
+        for target_name in sorted(fuzz_parsers.FUZZ_TARGETS.keys()):
+            fuzz_target = fuzz_parsers.FUZZ_TARGETS[target_name]
+            seed_data, field_offsets = fuzz_target.CreateSeed(4)
+            self.assertTrue(field_offsets)
+
+            # A valid seed is within its budgets.
+            self.assertIsNone(fuzzer.CheckInput(fuzz_target, seed_data))
+
+    def testCheckInputQuadratic(self):
+        """Tests the CheckInput and Minimize functions with a quadratic parser."""
+        fuzz_target = fuzz_parsers.FuzzTarget("quadratic", _CreateSeed, _ParseQuadratic)
+        fuzzer = fuzz_parsers.ParserFuzzer(
+            maximum_input_size=16384, memory_budget=False
+        )
+
+        data = b"\xff" + bytes(16383)
+        finding = fuzzer.CheckInput(fuzz_target, data)
+        self.assertIsNotNone(finding)
+        self.assertEqual(finding.kind, "time")
+
+        # The reproducer is minimized but keeps its quadratic trigger.
+        finding = fuzzer.Minimize(fuzz_target, finding)
+        self.assertLess(len(finding.data), len(data))
+        self.assertEqual(finding.data[0], 0xFF)
+
+
+if __name__ == "__main__":
+    unittest.main()
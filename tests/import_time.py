@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the import time (cold start) cost of olecfrc."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+import olecfrc
+
+from tests import test_lib
+
+
+class ImportTimeTest(test_lib.BaseTestCase):
+    """Tests for the import time (cold start) cost of olecfrc."""
+
+    # Modules that should only be imported on first use.
+    _DEFERRED_MODULES = frozenset(
+        [
+            "dfdatetime",
+            "dtfabric",
+            "multiprocessing",
+            "pyolecf",
+            "sqlite3",
+            "uuid",
+            "yaml",
+        ]
+    )
+
+    # Maximum number of modules imported by the vba script, in addition to
+    # the modules imported on interpreter startup. This budget does not depend
+    # on the speed of the host, unlike the import time.
+    _MAXIMUM_NUMBER_OF_IMPORTED_MODULES = 120
+
+    _NUMBER_OF_RUNS = 3
+
+    def _GetImportTimes(self, module_name):
+        """Retrieves the import times reported by "python -X importtime".
+
+        Args:
+          module_name (str): name of the module to import.
+
+        Returns:
+          dict[str, int]: cumulative import time in microseconds per imported
+              module.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.path.dirname(
+            os.path.dirname(os.path.abspath(olecfrc.__file__))
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module_name:s}"],
+            capture_output=True,
+            check=True,
+            env=environment,
+            text=True,
+        )
+
+        import_times = {}
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+
+            _, _, values = line.partition(":")
+            _, cumulative_time, imported_module_name = values.split("|")
+            try:
+                import_times[imported_module_name.strip()] = int(cumulative_time)
+            except ValueError:
+                # Skip the header line.
+                pass
+
+        return import_times
+
+    def testVBAScriptDeferredImports(self):
+        """Tests that the vba script defers importing heavy modules."""
+        import_times = self._GetImportTimes("olecfrc.scripts.vba")
+        self.assertIn("olecfrc.scripts.vba", import_times)
+
+        top_level_module_names = set(
+            module_name.split(".")[0] for module_name in import_times
+        )
+        self.assertFalse(top_level_module_names & self._DEFERRED_MODULES)
+
+    def testVBAScriptImportBudget(self):
+        """Tests the number of modules imported by the vba script."""
+        startup_import_times = self._GetImportTimes("sys")
+        import_times = self._GetImportTimes("olecfrc.scripts.vba")
+
+        imported_module_names = set(import_times) - set(startup_import_times)
+        self.assertLessEqual(
+            len(imported_module_names), self._MAXIMUM_NUMBER_OF_IMPORTED_MODULES
+        )
+
+    # The maximum cumulative import time of the vba script in microseconds is
+    # read from the environment, since it depends on the speed of the host.
+    @unittest.skipUnless(
+        os.environ.get("OLECFRC_MAXIMUM_IMPORT_TIME", None),
+        "requires OLECFRC_MAXIMUM_IMPORT_TIME",
+    )
+    def testVBAScriptImportTime(self):
+        """Tests the import time of the vba script."""
+        maximum_import_time = int(os.environ["OLECFRC_MAXIMUM_IMPORT_TIME"], 10)
+        cumulative_times = [
+            self._GetImportTimes("olecfrc.scripts.vba")["olecfrc.scripts.vba"]
+            for _ in range(self._NUMBER_OF_RUNS)
+        ]
+        self.assertLess(min(cumulative_times), maximum_import_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
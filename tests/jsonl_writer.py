@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for the JSON Lines writer of VBA collection results."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from olecfrc import batch
+from olecfrc import jsonl_writer
+from olecfrc import sharding
+
+from tests import test_lib
+
+
+class JSONLWriterTest(test_lib.BaseTestCase):
+    """Tests for the JSON Lines writer of VBA collection results."""
+
+    def testWriteDocumentResult(self):
+        """Tests the WriteDocumentResult function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+        document_result = batch.CollectDocument(("document.doc", document_data))
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.jsonl")
+
+            results_writer = jsonl_writer.JSONLWriter(
+                path, shards=[sharding.Shard(2, 4)]
+            )
+            self.assertTrue(results_writer.Open())
+            results_writer.WriteDocumentResult(document_result)
+            results_writer.Close()
+
+            with open(path, "r", encoding="utf-8") as file_object:
+                records = [json.loads(line) for line in file_object]
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["record_type"], "header")
+        self.assertEqual(records[0]["format"], batch.RESULTS_FORMAT)
+        self.assertEqual(records[0]["shards"], ["2/4"])
+
+        self.assertEqual(records[1]["record_type"], "document")
+        self.assertEqual(records[1]["source"], "document.doc")
+        self.assertTrue(records[1]["stream_found"])
+
+    def testWriteDocumentResultWithAppend(self):
+        """Tests the WriteDocumentResult function when appending."""
+        document_result = batch.DocumentResult("document2.doc")
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.jsonl")
+
+            results_writer = jsonl_writer.JSONLWriter(path)
+            self.assertTrue(results_writer.Open())
+            results_writer.WriteDocumentResult(batch.DocumentResult("document1.doc"))
+            results_writer.Close()
+
+            # Simulate a scan that was interrupted while writing a record.
+            with open(path, "a", encoding="utf-8") as file_object:
+                file_object.write('{"record_type": "document", "sou')
+
+            results_writer = jsonl_writer.JSONLWriter(path, append=True)
+            self.assertTrue(results_writer.Open())
+            results_writer.WriteDocumentResult(document_result)
+            results_writer.Close()
+
+            with open(path, "r", encoding="utf-8") as file_object:
+                records = [json.loads(line) for line in file_object]
+
+        self.assertEqual(
+            [record.get("source", None) for record in records],
+            [None, "document1.doc", "document2.doc"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
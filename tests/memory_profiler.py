@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tests for the memory profiling of the collection of VBA."""
+
+import tracemalloc
+import unittest
+
+from olecfrc import memory_profiler
+
+from tests import test_lib
+
+
+class MemoryProfilerTest(test_lib.BaseTestCase):
+    """Tests for the memory profiler."""
+
+    def testProfileStage(self):
+        """Tests the ProfileStage function."""
+        profiler = memory_profiler.MemoryProfiler()
+        profiler.Start()
+        try:
+            with profiler.ProfileStage("outer") as outer_stage:
+                with profiler.ProfileStage("inner") as inner_stage:
+                    data = bytearray(1024 * 1024)
+                    del data
+
+                retained_data = bytearray(64 * 1024)
+
+        finally:
+            profiler.Stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(
+            [stage_memory_usage.name for stage_memory_usage in profiler.stages],
+            ["inner", "outer"],
+        )
+
+        self.assertGreaterEqual(inner_stage.peak_size, 1024 * 1024)
+        self.assertLess(inner_stage.size, 64 * 1024)
+
+        # The peak of the outer stage includes that of the inner stage.
+        self.assertGreaterEqual(outer_stage.peak_size, inner_stage.peak_size)
+        self.assertGreaterEqual(outer_stage.size, len(retained_data))
+
+        location, size = outer_stage.top_allocations[0]
+        self.assertIn("memory_profiler.py:", location)
+        self.assertGreaterEqual(size, len(retained_data))
+
+    def testGetOutliers(self):
+        """Tests the GetOutliers function."""
+        memory_usages = []
+        for index, peak_size in enumerate((100, 120, 110, 1000, 90)):
+            stage_memory_usage = memory_profiler.StageMemoryUsage("document")
+            stage_memory_usage.peak_size = peak_size
+            memory_usages.append((f"document{index:d}.doc", [stage_memory_usage]))
+
+        outliers = memory_profiler.GetOutliers(memory_usages)
+        self.assertEqual(len(outliers), 1)
+        self.assertEqual(outliers[0][0], "document3.doc")
+        self.assertEqual(outliers[0][1].peak_size, 1000)
+
+        outliers = memory_profiler.GetOutliers(memory_usages, factor=0.0)
+        self.assertEqual(
+            [source for source, _ in outliers],
+            [
+                "document3.doc",
+                "document1.doc",
+                "document2.doc",
+                "document0.doc",
+                "document4.doc",
+            ],
+        )
+
+        self.assertEqual(memory_profiler.GetOutliers([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
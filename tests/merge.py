@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for the merging of the results of the shards of a scan."""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from olecfrc import batch
+from olecfrc import errors
+from olecfrc import jsonl_writer
+from olecfrc import merge
+from olecfrc import sharding
+from olecfrc import sqlite_writer
+
+from tests import test_lib
+
+
+class ResultsMergerTest(test_lib.BaseTestCase):
+    """Tests for the results merger."""
+
+    def _WriteShards(self, temporary_directory, writer_class, extension):
+        """Writes the results of 2 shards for testing.
+
+        The first shard contains document1.doc and document2.doc and the second
+        shard document2.doc and document3.doc.
+
+        Args:
+          temporary_directory (str): path of the temporary directory.
+          writer_class (type): results writer class.
+          extension (str): extension of the results files.
+
+        Returns:
+          list[str]: paths of the results files.
+        """
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        paths = []
+        for index, sources in enumerate(
+            (
+                ("document1.doc", "document2.doc"),
+                ("document2.doc", "document3.doc"),
+            )
+        ):
+            path = os.path.join(temporary_directory, f"shard{index:d}.{extension:s}")
+            results_writer = writer_class(path, shards=[sharding.Shard(index + 1, 3)])
+            self.assertTrue(results_writer.Open())
+            for source in sources:
+                document_result = batch.CollectDocument((source, document_data))
+                results_writer.WriteDocumentResult(document_result)
+            results_writer.Close()
+
+            paths.append(path)
+
+        return paths
+
+    def testMergeJSONL(self):
+        """Tests the Merge function with JSON Lines results."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            paths = self._WriteShards(
+                temporary_directory, jsonl_writer.JSONLWriter, "jsonl"
+            )
+            output_path = os.path.join(temporary_directory, "merged.jsonl")
+
+            results_merger = merge.ResultsMerger()
+            results_merger.Merge(paths, output_path)
+
+            with open(output_path, "r", encoding="utf-8") as file_object:
+                records = [json.loads(line) for line in file_object]
+
+        self.assertEqual(results_merger.number_of_documents, 3)
+        self.assertEqual(results_merger.number_of_duplicates, 1)
+        self.assertEqual(
+            results_merger.shards, [sharding.Shard(1, 3), sharding.Shard(2, 3)]
+        )
+
+        self.assertEqual(records[0]["record_type"], "header")
+        self.assertEqual(records[0]["shards"], ["1/3", "2/3"])
+        self.assertEqual(
+            [record["source"] for record in records[1:]],
+            ["document1.doc", "document2.doc", "document3.doc"],
+        )
+        self.assertEqual(
+            records[3]["project_roots"][0]["modules"][0]["name"], "Module1"
+        )
+
+    def testMergeSQLite(self):
+        """Tests the Merge function with SQLite results."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            paths = self._WriteShards(
+                temporary_directory, sqlite_writer.SQLiteWriter, "db"
+            )
+            output_path = os.path.join(temporary_directory, "merged.db")
+
+            results_merger = merge.ResultsMerger()
+            results_merger.Merge(paths, output_path)
+
+            connection = sqlite3.connect(output_path)
+            try:
+                sources = connection.execute(
+                    "SELECT source FROM documents ORDER BY id"
+                ).fetchall()
+                modules = connection.execute(
+                    "SELECT documents.source, modules.name FROM modules "
+                    "JOIN project_roots ON project_roots.id = modules.project_root_id "
+                    "JOIN documents ON documents.id = project_roots.document_id "
+                    "ORDER BY documents.id"
+                ).fetchall()
+                shards = connection.execute(
+                    "SELECT value FROM metadata WHERE key = 'shards'"
+                ).fetchone()[0]
+            finally:
+                connection.close()
+
+        self.assertEqual(results_merger.number_of_documents, 3)
+        self.assertEqual(results_merger.number_of_duplicates, 1)
+
+        self.assertEqual(
+            sources, [("document1.doc",), ("document2.doc",), ("document3.doc",)]
+        )
+        self.assertEqual(
+            modules,
+            [
+                ("document1.doc", "Module1"),
+                ("document2.doc", "Module1"),
+                ("document3.doc", "Module1"),
+            ],
+        )
+        self.assertEqual(shards, "1/3,2/3")
+
+    def testMergeWithDifferentFormats(self):
+        """Tests the Merge function with results of different formats."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            jsonl_paths = self._WriteShards(
+                temporary_directory, jsonl_writer.JSONLWriter, "jsonl"
+            )
+            sqlite_paths = self._WriteShards(
+                temporary_directory, sqlite_writer.SQLiteWriter, "db"
+            )
+            output_path = os.path.join(temporary_directory, "merged.jsonl")
+
+            results_merger = merge.ResultsMerger()
+            with self.assertRaises(errors.ParseError):
+                results_merger.Merge(jsonl_paths[:1] + sqlite_paths[1:], output_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
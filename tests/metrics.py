@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the metrics of the collection."""
+
+import os
+import tempfile
+import unittest
+
+from olecfrc import metrics
+
+from tests import test_lib
+
+
+class CounterTest(test_lib.BaseTestCase):
+    """Tests for the counter."""
+
+    def testGetSamples(self):
+        """Tests the GetSamples function."""
+        counter = metrics.Counter("test_total", "Test.")
+        self.assertEqual(list(counter.GetSamples()), ["test_total 0"])
+
+        counter.Increment()
+        counter.Increment(value=2)
+        self.assertEqual(list(counter.GetSamples()), ["test_total 3"])
+
+        counter = metrics.Counter("test_total", "Test.", label_names=("type",))
+        self.assertEqual(list(counter.GetSamples()), [])
+
+        counter.Increment(label_values=('Parse"Error',))
+        counter.Increment(label_values=("OSError",))
+        self.assertEqual(
+            list(counter.GetSamples()),
+            ['test_total{type="OSError"} 1', 'test_total{type="Parse\\"Error"} 1'],
+        )
+
+
+class HistogramTest(test_lib.BaseTestCase):
+    """Tests for the histogram."""
+
+    def testGetSamples(self):
+        """Tests the GetSamples function."""
+        histogram = metrics.Histogram(
+            "test_seconds", "Test.", (0.1, 1.0), label_names=("stage",)
+        )
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.Observe(value, label_values=("modules",))
+
+        self.assertEqual(
+            list(histogram.GetSamples()),
+            [
+                'test_seconds_bucket{stage="modules",le="0.1"} 2',
+                'test_seconds_bucket{stage="modules",le="1"} 3',
+                'test_seconds_bucket{stage="modules",le="+Inf"} 4',
+                'test_seconds_sum{stage="modules"} 2.65',
+                'test_seconds_count{stage="modules"} 4',
+            ],
+        )
+
+
+class CollectorMetricsTest(test_lib.BaseTestCase):
+    """Tests for the collector metrics."""
+
+    def testGetTextFormat(self):
+        """Tests the GetTextFormat function."""
+        collector_metrics = metrics.CollectorMetrics()
+        collector_metrics.RecordDocument(
+            1024, stage_durations=[("modules", 0.002)], stream_found=True
+        )
+        collector_metrics.RecordDocument(16, error_type="ParseError")
+
+        text = collector_metrics.GetTextFormat()
+        lines = text.split("\n")
+
+        self.assertEqual(
+            lines[:3],
+            [
+                (
+                    "# HELP olecfrc_bytes_read_total Number of bytes of the documents "
+                    "read."
+                ),
+                "# TYPE olecfrc_bytes_read_total counter",
+                "olecfrc_bytes_read_total 1040",
+            ],
+        )
+        self.assertIn("olecfrc_documents_scanned_total 2", lines)
+        self.assertIn("olecfrc_documents_with_vba_total 1", lines)
+        self.assertIn('olecfrc_errors_total{error_type="ParseError"} 1', lines)
+        self.assertIn("# TYPE olecfrc_stage_duration_seconds histogram", lines)
+        self.assertIn(
+            'olecfrc_stage_duration_seconds_bucket{stage="modules",le="0.001"} 0', lines
+        )
+        self.assertIn(
+            'olecfrc_stage_duration_seconds_bucket{stage="modules",le="0.005"} 1', lines
+        )
+        self.assertTrue(text.endswith("\n"))
+
+    def testWriteFile(self):
+        """Tests the WriteFile function."""
+        collector_metrics = metrics.CollectorMetrics()
+        collector_metrics.RecordDocument(1024)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "olecfrc.prom")
+            collector_metrics.WriteFile(path)
+            collector_metrics.WriteFile(path)
+
+            self.assertEqual(os.listdir(temporary_directory), ["olecfrc.prom"])
+            with open(path, encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), collector_metrics.GetTextFormat())
+
+
+if __name__ == "__main__":
+    unittest.main()
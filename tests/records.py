@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for the compact record types of parsed stream entries."""
+
+import unittest
+
+from dtfabric.runtime import data_maps as dtfabric_data_maps
+
+from olecfrc import errors
+from olecfrc import records
+from olecfrc import vba
+
+from tests import test_lib
+
+
+class StreamRecordTest(test_lib.BaseTestCase):
+    """Tests for the stream record interface."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        project_string = records.ProjectString(offset=34, string="Module1")
+        self.assertEqual(project_string.offset, 34)
+        self.assertEqual(project_string.string, "Module1")
+        self.assertIsNone(project_string.unknown1)
+
+        self.assertFalse(hasattr(project_string, "__dict__"))
+
+    def testEqual(self):
+        """Tests the __eq__ function."""
+        project_string1 = records.ProjectString(offset=34, string="Module1")
+        project_string2 = records.ProjectString(offset=34, string="Module1")
+        project_string3 = records.ProjectString(offset=34, string="Module2")
+
+        self.assertEqual(project_string1, project_string2)
+        self.assertNotEqual(project_string1, project_string3)
+
+
+class ColumnarRecordsTest(test_lib.BaseTestCase):
+    """Tests for the columnar container of stream records."""
+
+    def testAppendAndGetItem(self):
+        """Tests the append and __getitem__ functions."""
+        columnar_records = records.ColumnarRecords(records.OStreamEntry)
+        self.assertEqual(len(columnar_records), 0)
+
+        o_stream_entries = [
+            records.OStreamEntry(
+                caption="Label1",
+                font_name="Tahoma",
+                height=600,
+                offset=0,
+                size=56,
+                width=2400,
+            ),
+            records.OStreamEntry(
+                font_name="Arial",
+                height=0,
+                offset=56,
+                size=48,
+                value="",
+                width=0,
+            ),
+        ]
+        for o_stream_entry in o_stream_entries:
+            columnar_records.append(o_stream_entry)
+
+        self.assertEqual(len(columnar_records), 2)
+        self.assertEqual(columnar_records[0], o_stream_entries[0])
+        self.assertEqual(columnar_records[-1], o_stream_entries[1])
+        self.assertEqual(list(columnar_records), o_stream_entries)
+
+        self.assertEqual(columnar_records.GetInteger(1, "offset"), 56)
+        self.assertEqual(columnar_records.GetString(0, "font_name"), "Tahoma")
+
+        with self.assertRaises(IndexError):
+            columnar_records[2]  # pylint: disable=pointless-statement
+
+    def testAppendWithNoneValues(self):
+        """Tests the append function with values that are None."""
+        columnar_records = records.ColumnarRecords(records.FStreamEntry)
+
+        f_stream_entries = [
+            records.FStreamEntry(
+                clsid_cache_index=0,
+                name="",
+                o_stream_entry_index=0,
+                o_stream_entry_size=56,
+                offset=32,
+                property_mask=0x000001E5,
+                size=44,
+                version=0,
+            ),
+            records.FStreamEntry(offset=80, property_mask=0x000001C4, size=20),
+        ]
+        for f_stream_entry in f_stream_entries:
+            columnar_records.append(f_stream_entry)
+
+        self.assertEqual(list(columnar_records), f_stream_entries)
+
+        self.assertEqual(columnar_records.GetInteger(0, "o_stream_entry_index"), 0)
+        self.assertIsNone(columnar_records.GetInteger(1, "o_stream_entry_index"))
+        self.assertEqual(columnar_records.GetString(0, "name"), "")
+        self.assertIsNone(columnar_records.GetString(1, "name"))
+
+
+class ProjectStringTableTest(test_lib.BaseTestCase):
+    """Tests for the _VBA_PROJECT stream string table."""
+
+    def testReadData(self):
+        """Tests the ReadData function."""
+        # The string table follows the 34 bytes of the stream header.
+        stream_data = self._CreateVBAProjectStreamData(["ThisDocument", "Module1"])
+
+        string_table = records.ProjectStringTable()
+        stream_offset = string_table.ReadData(stream_data, 34, 2)
+        self.assertEqual(stream_offset, len(stream_data))
+
+        self.assertEqual(len(string_table), 2)
+        self.assertEqual(string_table.GetString(1), "Module1")
+        self.assertEqual(
+            string_table[0],
+            records.ProjectString(
+                offset=34, string="ThisDocument", unknown1=1, unknown2=2, unknown3=3
+            ),
+        )
+        self.assertEqual(
+            [project_string.string for project_string in string_table],
+            ["ThisDocument", "Module1"],
+        )
+
+        with self.assertRaises(IndexError):
+            string_table.GetString(2)
+
+        # Strings decoded from different tables are interned.
+        other_string_table = records.ProjectStringTable()
+        other_string_table.ReadData(stream_data, 34, 2)
+        self.assertIs(string_table.GetString(1), other_string_table.GetString(1))
+
+        with self.assertRaises(errors.ParseError):
+            string_table.ReadData(stream_data[:-1], 34, 2)
+
+    def testReadDataWithDataTypeMap(self):
+        """Tests the ReadData function against the dtFabric data type map."""
+        # pylint: disable=protected-access
+        stream_data = self._CreateVBAProjectStreamData(["ThisDocument", "", "Modulé"])
+
+        string_table = records.ProjectStringTable()
+        stream_offset = string_table.ReadData(stream_data, 34, 3)
+
+        vba_project_stream = vba.VBAProjectStream(use_generated_parsers=False)
+        data_type_map = vba_project_stream._GetDataTypeMap("project_stream_string")
+
+        expected_stream_offset = 34
+        for project_string in string_table:
+            context = dtfabric_data_maps.DataTypeMapContext()
+            string_struct = data_type_map.MapByteStream(
+                stream_data[expected_stream_offset:], context=context
+            )
+
+            self.assertEqual(project_string.offset, expected_stream_offset)
+            self.assertEqual(
+                project_string.string, string_struct.string.decode("utf-16-le")
+            )
+            self.assertEqual(project_string.unknown1, string_struct.unknown1)
+            self.assertEqual(project_string.unknown2, string_struct.unknown2)
+            self.assertEqual(project_string.unknown3, string_struct.unknown3)
+
+            expected_stream_offset += context.byte_size
+
+        self.assertEqual(stream_offset, expected_stream_offset)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Tests for the scanning service."""
+
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from olecfrc import errors
+from olecfrc import service
+
+from tests import test_lib
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket for testing."""
+
+    def __init__(self, socket_path):
+        """Initializes a HTTP connection.
+
+        Args:
+          socket_path (str): path of the Unix domain socket.
+        """
+        super().__init__("localhost")
+        self._socket_path = socket_path
+
+    def connect(self):
+        """Connects to the Unix domain socket."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._socket_path)
+
+
+class ScanServiceTest(test_lib.BaseTestCase):
+    """Tests for the scanning service."""
+
+    def testScan(self):
+        """Tests the Scan function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        for number_of_workers in (0, 2):
+            scan_service = service.ScanService(number_of_workers=number_of_workers)
+            scan_service.Start()
+            try:
+                document_result = scan_service.Scan(("document.doc", document_data))
+                self.assertTrue(document_result["stream_found"])
+                self.assertEqual(
+                    document_result["project_roots"][0]["modules"][0]["name"],
+                    "Module1",
+                )
+
+                document_result = scan_service.Scan(("unsupported.txt", b"text"))
+                self.assertIsNotNone(document_result["error"])
+
+                statistics = scan_service.GetStatistics()
+                self.assertEqual(statistics["number_of_documents_with_vba"], 1)
+                self.assertEqual(statistics["number_of_errors"], 1)
+                self.assertEqual(statistics["number_of_queued_requests"], 0)
+                self.assertEqual(statistics["number_of_requests"], 2)
+
+            finally:
+                scan_service.Stop()
+
+    def testScanWithException(self):
+        """Tests the Scan function with an error not handled by the collection."""
+        scan_service = service.ScanService(number_of_workers=0)
+
+        document_result = scan_service.Scan(("document.doc", 5))
+        self.assertEqual(document_result["error_type"], "AttributeError")
+
+        statistics = scan_service.GetStatistics()
+        self.assertEqual(statistics["number_of_errors"], 1)
+        self.assertEqual(statistics["number_of_queued_requests"], 0)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "requires named pipes")
+    def testScanWithTimeout(self):
+        """Tests the Scan function with a scan that does not complete in time."""
+        scan_service = service.ScanService(
+            maximum_queue_size=1, number_of_workers=1, timeout=0.1
+        )
+        scan_service.Start()
+        try:
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                # Opening the named pipe blocks the worker until it is written.
+                path = os.path.join(temporary_directory, "document.doc")
+                os.mkfifo(path)
+
+                with self.assertRaises(TimeoutError):
+                    scan_service.Scan(path)
+
+                # The slot is held while the worker is still scanning.
+                with self.assertRaises(errors.BackpressureError):
+                    scan_service.Scan(("document.doc", b""))
+
+                # The worker opens the document more than once, where every open
+                # is served with the data of an unsupported document.
+                for _ in range(100):
+                    statistics = scan_service.GetStatistics()
+                    if statistics["number_of_queued_requests"] == 0:
+                        break
+
+                    try:
+                        file_descriptor = os.open(path, os.O_NONBLOCK | os.O_WRONLY)
+                    except OSError:
+                        time.sleep(0.1)
+                        continue
+
+                    try:
+                        os.write(file_descriptor, b"text")
+                    finally:
+                        os.close(file_descriptor)
+                    time.sleep(0.1)
+
+                self.assertEqual(statistics["number_of_queued_requests"], 0)
+                self.assertEqual(statistics["number_of_timeouts"], 1)
+
+        finally:
+            scan_service.Stop()
+
+    def testScanWithFullQueue(self):
+        """Tests the Scan function with a full queue."""
+        scan_service = service.ScanService(maximum_queue_size=0, number_of_workers=0)
+
+        with self.assertRaises(errors.BackpressureError):
+            scan_service.Scan(("document.doc", b""))
+
+        statistics = scan_service.GetStatistics()
+        self.assertEqual(statistics["number_of_rejected_requests"], 1)
+
+
+class ScanServerTest(test_lib.BaseTestCase):
+    """Tests for the scanning service servers."""
+
+    def _Request(self, connection, method, path, body=None, headers=None):
+        """Sends a request and reads the JSON response.
+
+        Args:
+          connection (http.client.HTTPConnection): connection.
+          method (str): HTTP method.
+          path (str): path of the request.
+          body (Optional[bytes]): request body.
+          headers (Optional[dict[str, str]]): request headers.
+
+        Returns:
+          tuple[int, object]: HTTP status code and JSON response.
+        """
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def _TestServer(self, server, connection):
+        """Tests the requests supported by a server.
+
+        Args:
+          server (socketserver.BaseServer): server.
+          connection (http.client.HTTPConnection): connection to the server.
+        """
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+        )
+
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+        try:
+            status, response = self._Request(connection, "GET", "/health")
+            self.assertEqual(status, 200)
+            self.assertEqual(response, {"status": "ok"})
+
+            status, response = self._Request(
+                connection, "POST", "/scan?name=document.doc", body=document_data
+            )
+            self.assertEqual(status, 200)
+            self.assertEqual(response["source"], "document.doc")
+            self.assertTrue(response["stream_found"])
+
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                path = os.path.join(temporary_directory, "document.doc")
+                with open(path, "wb") as file_object:
+                    file_object.write(document_data)
+
+                status, response = self._Request(
+                    connection,
+                    "POST",
+                    "/scan",
+                    body=json.dumps({"path": path}).encode("utf-8"),
+                    headers={"Content-Type": "application/json"},
+                )
+                self.assertEqual(status, 200)
+                self.assertEqual(response["source"], path)
+                self.assertTrue(response["stream_found"])
+
+            status, _ = self._Request(
+                connection,
+                "POST",
+                "/scan",
+                body=b"[]",
+                headers={"Content-Type": "application/json"},
+            )
+            self.assertEqual(status, 400)
+
+            status, _ = self._Request(connection, "GET", "/unsupported")
+            self.assertEqual(status, 404)
+
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertIn(b"olecfrc_documents_with_vba_total 2\n", response.read())
+
+            status, response = self._Request(connection, "GET", "/stats")
+            self.assertEqual(status, 200)
+            self.assertEqual(response["number_of_requests"], 2)
+
+            # The server closes the connection after an invalid Content-Length,
+            # since it cannot skip the request body.
+            for content_length in ("abc", "-1", "1e3"):
+                connection.putrequest("POST", "/scan")
+                connection.putheader("Content-Length", content_length)
+                connection.endheaders()
+                response = connection.getresponse()
+                response.read()
+                self.assertEqual(response.status, 400)
+                connection.close()
+
+            # Only the headers are sent, since the server does not read the body
+            # of a request that is too large.
+            connection.putrequest("POST", "/scan")
+            connection.putheader(
+                "Content-Length", f"{server.maximum_request_size + 1:d}"
+            )
+            connection.endheaders()
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 413)
+
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            server_thread.join()
+
+    def testScanHTTPServer(self):
+        """Tests the ScanHTTPServer."""
+        scan_service = service.ScanService(number_of_workers=0)
+        server = service.ScanHTTPServer(
+            ("127.0.0.1", 0), scan_service, maximum_request_size=1024 * 1024
+        )
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+        self._TestServer(server, connection)
+
+    def testScanUnixHTTPServer(self):
+        """Tests the ScanUnixHTTPServer."""
+        scan_service = service.ScanService(number_of_workers=0)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            socket_path = os.path.join(temporary_directory, "service.sock")
+            server = service.ScanUnixHTTPServer(
+                socket_path, scan_service, maximum_request_size=1024 * 1024
+            )
+            connection = UnixHTTPConnection(socket_path)
+
+            self._TestServer(server, connection)
+
+
+if __name__ == "__main__":
+    unittest.main()
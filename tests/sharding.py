@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for the deterministic sharding of a scan."""
+
+import unittest
+
+from olecfrc import sharding
+
+from tests import test_lib
+
+
+class ShardTest(test_lib.BaseTestCase):
+    """Tests for the shard."""
+
+    def testContainsPath(self):
+        """Tests the ContainsPath function."""
+        paths = [f"/mnt/share/document{index:d}.doc" for index in range(100)]
+        shards = [sharding.Shard(index, 4) for index in range(1, 5)]
+
+        assigned_paths = []
+        for shard in shards:
+            shard_paths = [path for path in paths if shard.ContainsPath(path)]
+            self.assertGreater(len(shard_paths), 0)
+            assigned_paths.extend(shard_paths)
+
+        # Every path is assigned to exactly one shard.
+        self.assertEqual(sorted(assigned_paths), sorted(paths))
+
+        # The assignment is stable.
+        self.assertEqual(sharding.GetShardIndex("/mnt/share/document0.doc", 4), 2)
+        self.assertEqual(
+            sharding.GetShardIndex("/mnt/share/./document0.doc", 4),
+            sharding.GetShardIndex("/mnt/share/document0.doc", 4),
+        )
+
+    def testFromString(self):
+        """Tests the FromString function."""
+        shard = sharding.Shard.FromString("2/4")
+        self.assertEqual(shard.index, 2)
+        self.assertEqual(shard.number_of_shards, 4)
+        self.assertEqual(f"{shard!s}", "2/4")
+        self.assertEqual(shard, sharding.Shard(2, 4))
+
+        for shard_string in ("2", "a/4", "0/4", "5/4", "1/0"):
+            with self.assertRaises(ValueError):
+                sharding.Shard.FromString(shard_string)
+
+
+class ShardingTest(test_lib.BaseTestCase):
+    """Tests for the sharding functions."""
+
+    def testGetMissingShards(self):
+        """Tests the GetMissingShards function."""
+        missing_shards = sharding.GetMissingShards(
+            [sharding.Shard(1, 4), sharding.Shard(3, 4), sharding.Shard(1, 4)]
+        )
+        self.assertEqual(missing_shards, [sharding.Shard(2, 4), sharding.Shard(4, 4)])
+
+        self.assertEqual(sharding.GetMissingShards([]), [])
+
+        with self.assertRaises(ValueError):
+            sharding.GetMissingShards([sharding.Shard(1, 4), sharding.Shard(1, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Tests for the sidecar index files."""
+
+import os
+import tempfile
+import unittest
+
+from olecfrc import errors
+from olecfrc import sidecar_index
+from olecfrc import vba
+
+from tests import test_lib
+
+
+class SidecarIndexTestCase(test_lib.BaseTestCase):
+    """Shared functionality for sidecar index testing."""
+
+    def _WriteDocument(self, directory_path):
+        """Writes a document with VBA for testing.
+
+        Args:
+          directory_path (str): path of the directory to write the document to.
+
+        Returns:
+          str: path of the document.
+        """
+        document_data = self._CreateVBADocumentData(
+            modules={
+                "Module1": "Sub AutoOpen()\r\nEnd Sub\r\n",
+                "Module2": 'Attribute VB_Name = "Module2"\r\n',
+            },
+            forms={
+                "UserForm1": [
+                    ("TextBox1", "payload", "Tahoma"),
+                    ("Label1", "caption", "Arial"),
+                ]
+            },
+            strings=["ThisDocument", "Module1"],
+        )
+
+        path = os.path.join(directory_path, "document.doc")
+        with open(path, "wb") as file_object:
+            file_object.write(document_data)
+
+        return path
+
+
+class SidecarIndexTest(SidecarIndexTestCase):
+    """Tests for the sidecar index."""
+
+    def testBuildAndOpen(self):
+        """Tests the BuildSidecarIndex and Open functions."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = self._WriteDocument(temporary_directory)
+            index_path = sidecar_index.GetSidecarIndexPath(path)
+            self.assertEqual(index_path, f"{path:s}.olecfrc-index")
+
+            sidecar_index.BuildSidecarIndex(path, index_path)
+
+            with sidecar_index.SidecarIndex() as index:
+                index.Open(index_path)
+
+                self.assertEqual(index.document_size, os.path.getsize(path))
+                self.assertTrue(index.IsValid(path))
+
+                self.assertEqual(
+                    index.GetKeys(sidecar_index.TABLE_KIND_PROJECT), ["\\Macros"]
+                )
+                self.assertEqual(
+                    index.GetLabel(
+                        sidecar_index.TABLE_KIND_MODULE, "\\Macros\\Module2"
+                    ),
+                    "Module2",
+                )
+                self.assertEqual(
+                    index.GetNumberOfValues(
+                        sidecar_index.TABLE_KIND_F_STREAM_ENTRIES,
+                        "\\Macros\\UserForm1",
+                    ),
+                    4,
+                )
+                self.assertEqual(
+                    index.GetValue(
+                        sidecar_index.TABLE_KIND_CONTROL, "\\Macros\\UserForm1\\Label1"
+                    ),
+                    1,
+                )
+                self.assertEqual(
+                    len(
+                        index.GetValues(
+                            sidecar_index.TABLE_KIND_STRING_TABLE, "\\Macros"
+                        )
+                    ),
+                    2,
+                )
+                self.assertIsNone(
+                    index.GetValue(sidecar_index.TABLE_KIND_MODULE, "\\Macros\\Bogus")
+                )
+
+                with self.assertRaises(IndexError):
+                    index.GetValue(sidecar_index.TABLE_KIND_PROJECT, "\\Macros", 1)
+
+            # The index no longer matches a modified document.
+            with open(path, "ab") as file_object:
+                file_object.write(b"\x00")
+
+            with sidecar_index.SidecarIndex() as index:
+                index.Open(index_path)
+                self.assertFalse(index.IsValid(path))
+
+    def testHasMatchingStreamSizes(self):
+        """Tests the HasMatchingStreamSizes function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = self._WriteDocument(temporary_directory)
+            index_path = sidecar_index.GetSidecarIndexPath(path)
+            sidecar_index.BuildSidecarIndex(path, index_path)
+
+            other_path = os.path.join(temporary_directory, "other.doc")
+            with open(other_path, "wb") as file_object:
+                file_object.write(
+                    self._CreateVBADocumentData(
+                        modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"}
+                    )
+                )
+
+            with sidecar_index.SidecarIndex() as index:
+                index.Open(index_path)
+
+                olecf_file = vba.OpenOLECFFile(path)
+                try:
+                    self.assertTrue(index.HasMatchingStreamSizes(olecf_file))
+                finally:
+                    olecf_file.close()
+
+                olecf_file = vba.OpenOLECFFile(other_path)
+                try:
+                    self.assertFalse(index.HasMatchingStreamSizes(olecf_file))
+                finally:
+                    olecf_file.close()
+
+    def testOpenUnsupported(self):
+        """Tests the Open function with an unsupported file."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            index_path = os.path.join(temporary_directory, "bogus.olecfrc-index")
+            with open(index_path, "wb") as file_object:
+                file_object.write(b"This is not a sidecar index file." * 4)
+
+            index = sidecar_index.SidecarIndex()
+            with self.assertRaises(errors.ParseError):
+                index.Open(index_path)
+
+
+class IndexedDocumentTest(SidecarIndexTestCase):
+    """Tests for the indexed document."""
+
+    def testQueries(self):
+        """Tests the queries of an indexed document."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = self._WriteDocument(temporary_directory)
+            cache_directory = os.path.join(temporary_directory, "cache")
+
+            with sidecar_index.IndexedDocument(
+                path, cache_directory=cache_directory
+            ) as indexed_document:
+                self.assertTrue(indexed_document.index_built)
+                self.assertTrue(indexed_document.index_path.startswith(cache_directory))
+                self.assertEqual(indexed_document.project_paths, ["\\Macros"])
+
+                self.assertEqual(
+                    indexed_document.GetModuleSourceCode("Module1"),
+                    "Sub AutoOpen()\r\nEnd Sub\r\n",
+                )
+                self.assertIsNone(indexed_document.GetModuleSourceCode("Bogus"))
+
+                vba_form_control = indexed_document.GetFormControl(
+                    "UserForm1", "Label1"
+                )
+                self.assertEqual(vba_form_control.name, "Label1")
+                self.assertEqual(vba_form_control.text, "caption")
+                self.assertEqual(vba_form_control.font_name, "Arial")
+                self.assertIsNone(indexed_document.GetFormControl("UserForm1", "Bogus"))
+
+                self.assertEqual(indexed_document.GetNumberOfStrings(), 2)
+                self.assertEqual(indexed_document.GetString(1), "Module1")
+
+            # The existing index is used when the document is opened again.
+            with sidecar_index.IndexedDocument(
+                path, cache_directory=cache_directory
+            ) as indexed_document:
+                self.assertFalse(indexed_document.index_built)
+                self.assertEqual(indexed_document.GetString(0), "ThisDocument")
+
+            # A change of stream data that preserves the size, modification time
+            # and directory is only detected by verifying the content digest.
+            stat_object = os.stat(path)
+            with open(path, "rb") as file_object:
+                document_data = bytearray(file_object.read())
+            document_data[-1] ^= 0xFF
+            with open(path, "wb") as file_object:
+                file_object.write(document_data)
+            os.utime(path, ns=(stat_object.st_atime_ns, stat_object.st_mtime_ns))
+
+            with sidecar_index.IndexedDocument(
+                path, cache_directory=cache_directory
+            ) as indexed_document:
+                self.assertFalse(indexed_document.index_built)
+
+            with sidecar_index.IndexedDocument(
+                path, cache_directory=cache_directory, verify_digest=True
+            ) as indexed_document:
+                self.assertTrue(indexed_document.index_built)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite writer of VBA collection results."""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from olecfrc import batch
+from olecfrc import records
+from olecfrc import sqlite_writer
+from olecfrc import vba
+
+from tests import test_lib
+
+
+class SQLiteWriterTest(test_lib.BaseTestCase):
+    """Tests for the SQLite writer of VBA collection results."""
+
+    def _CreateDocumentResult(self, source):
+        """Creates a document result for testing.
+
+        Args:
+          source (str): path of the document.
+
+        Returns:
+          DocumentResult: document result.
+        """
+        vba_module = vba.VBAModule(name="Module1")
+        vba_module.source_code = "Sub AutoOpen()\r\nEnd Sub\r\n"
+
+        f_stream_entry = records.FStreamEntry(
+            name="TextBox1", o_stream_entry_index=0, o_stream_entry_size=48
+        )
+        o_stream_entry = records.OStreamEntry(font_name="Tahoma", value="payload")
+
+        vba_form = vba.VBAForm("UserForm1")
+        vba_form.controls = [vba.VBAFormControl(f_stream_entry, o_stream_entry)]
+        vba_form.f_stream_entries = [f_stream_entry]
+
+        project_root = vba.VBAProjectRoot("\\Macros")
+        project_root.forms = [vba_form]
+        project_root.modules = [vba_module]
+        project_root.project_keys = [("Name", '"Project"')]
+        project_root.strings = [records.ProjectString(string="Module1")]
+
+        document_result = batch.DocumentResult(source)
+        document_result.project_roots = [project_root]
+        document_result.stream_found = True
+
+        return document_result
+
+    def testWriteDocumentResult(self):
+        """Tests the WriteDocumentResult function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.db")
+
+            results_writer = sqlite_writer.SQLiteWriter(path, batch_size=2)
+            self.assertTrue(results_writer.Open())
+            for document_index in range(3):
+                document_result = self._CreateDocumentResult(
+                    f"document{document_index:d}.doc"
+                )
+                results_writer.WriteDocumentResult(document_result)
+            results_writer.Close()
+
+            # Test appending to an existing database.
+            results_writer = sqlite_writer.SQLiteWriter(path, append=True)
+            self.assertTrue(results_writer.Open())
+            results_writer.WriteDocumentResult(batch.DocumentResult("document3.doc"))
+            results_writer.Close()
+
+            connection = sqlite3.connect(path)
+            try:
+                cursor = connection.execute("PRAGMA journal_mode")
+                self.assertEqual(cursor.fetchone()[0], "wal")
+
+                cursor = connection.execute("SELECT MAX(id) FROM documents")
+                self.assertEqual(cursor.fetchone()[0], 4)
+
+                cursor = connection.execute(
+                    "SELECT form_controls.name, form_controls.data, "
+                    "form_controls.font_name "
+                    "FROM form_controls JOIN project_roots "
+                    "ON form_controls.project_root_id = project_roots.id "
+                    "WHERE project_roots.document_id = 3"
+                )
+                self.assertEqual(cursor.fetchall(), [("TextBox1", "payload", "Tahoma")])
+
+                cursor = connection.execute("SELECT COUNT(*) FROM project_strings")
+                self.assertEqual(cursor.fetchone()[0], 3)
+
+                cursor = connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+                self.assertIn("modules_name_index", [row[0] for row in cursor])
+
+            finally:
+                connection.close()
+
+            # Test recreating an existing database when not appending.
+            results_writer = sqlite_writer.SQLiteWriter(path)
+            self.assertTrue(results_writer.Open())
+            results_writer.WriteDocumentResult(batch.DocumentResult("document0.doc"))
+            results_writer.Close()
+
+            connection = sqlite3.connect(path)
+            try:
+                cursor = connection.execute("SELECT id, source FROM documents")
+                self.assertEqual(cursor.fetchall(), [(1, "document0.doc")])
+
+                cursor = connection.execute("SELECT COUNT(*) FROM project_roots")
+                self.assertEqual(cursor.fetchone()[0], 0)
+
+            finally:
+                connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the cache of parsed stream results."""
+
+import unittest
+
+from olecfrc import stream_cache
+from olecfrc import vba
+
+from tests import test_lib
+
+
+class StreamCacheTest(test_lib.BaseTestCase):
+    """Tests for the stream cache."""
+
+    def testGetValueAndSetValue(self):
+        """Tests the GetValue and SetValue functions."""
+        test_cache = stream_cache.StreamCache(
+            maximum_number_of_entries=2, maximum_size=1024
+        )
+
+        key1 = test_cache.GetKey("DirStream", b"data1")
+        self.assertIsNone(test_cache.GetValue(key1))
+
+        test_cache.SetValue(key1, "result1", 5)
+        self.assertEqual(test_cache.GetValue(key1), "result1")
+
+        # The same data parsed by another kind of parser is a different entry.
+        key2 = test_cache.GetKey("module", b"data1")
+        self.assertNotEqual(key1, key2)
+        self.assertIsNone(test_cache.GetValue(key2))
+
+        self.assertEqual(
+            test_cache.GetStatistics(), {"DirStream": (1, 1), "module": (0, 1)}
+        )
+
+    def testEviction(self):
+        """Tests that entries are evicted by number and total size."""
+        test_cache = stream_cache.StreamCache(
+            maximum_number_of_entries=2, maximum_size=100
+        )
+
+        keys = [
+            test_cache.GetKey("module", f"data{index:d}".encode("ascii"))
+            for index in range(3)
+        ]
+        test_cache.SetValue(keys[0], "result0", 10)
+        test_cache.SetValue(keys[1], "result1", 10)
+
+        # Using the first entry makes the second the least recently used.
+        self.assertIsNotNone(test_cache.GetValue(keys[0]))
+        test_cache.SetValue(keys[2], "result2", 10)
+        self.assertIsNone(test_cache.GetValue(keys[1]))
+        self.assertIsNotNone(test_cache.GetValue(keys[0]))
+
+        test_cache.SetValue(keys[1], "result1", 95)
+        self.assertIsNone(test_cache.GetValue(keys[0]))
+        self.assertIsNone(test_cache.GetValue(keys[2]))
+        self.assertIsNotNone(test_cache.GetValue(keys[1]))
+
+        # Results larger than the cache are not cached.
+        test_cache.SetValue(keys[0], "result0", 101)
+        self.assertIsNone(test_cache.GetValue(keys[0]))
+        self.assertIsNotNone(test_cache.GetValue(keys[1]))
+
+    def testCollect(self):
+        """Tests collecting documents with shared streams."""
+        document_data = self._CreateVBADocumentData(
+            forms={"UserForm1": [("TextBox1", "text", "Arial")]},
+            modules={"Module1": "Sub AutoOpen()\r\nEnd Sub\r\n"},
+            strings=["Module1"],
+        )
+
+        test_cache = stream_cache.StreamCache()
+        for _ in range(2):
+            collector_object = vba.VBACollector(stream_cache=test_cache)
+            collector_object.Collect(document_data, None)
+
+            project_root = collector_object.project_roots[0]
+            self.assertEqual(
+                project_root.modules[0].source_code, "Sub AutoOpen()\r\nEnd Sub\r\n"
+            )
+            self.assertEqual(project_root.forms[0].controls[0].name, "TextBox1")
+            self.assertEqual(project_root.strings[0].string, "Module1")
+
+        self.assertEqual(
+            test_cache.GetStatistics(),
+            {
+                "DirStream": (1, 1),
+                "FStream": (1, 1),
+                "VBAProjectStream": (1, 1),
+                "module": (1, 1),
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Shared test case."""
 
 import os
+import struct
 import unittest
 
 from olecfrc import output_writers
@@ -28,6 +29,280 @@ class BaseTestCase(unittest.TestCase):
         # and not a list.
         return os.path.join(self._TEST_DATA_PATH, *path_segments)
 
+    def _CompressLiterals(self, data):
+        """Compresses data into a MS-OVBA compressed container for testing.
+
+        The data is stored in uncompressed chunks and, for the last chunk, as
+        literal tokens.
+
+        Args:
+          data (bytes): data of which the last chunk must be smaller than 3640
+              bytes.
+
+        Returns:
+          bytes: compressed container data.
+        """
+        compressed_data = [b"\x01"]
+        data_size = len(data)
+        data_offset = 0
+        while data_size - data_offset >= 4096:
+            compressed_data.append(struct.pack("<H", 0x3FFF))
+            compressed_data.append(data[data_offset : data_offset + 4096])
+            data_offset += 4096
+
+        chunk_data = []
+        while data_offset < data_size:
+            chunk_data.append(b"\x00")
+            chunk_data.append(data[data_offset : data_offset + 8])
+            data_offset += 8
+
+        if chunk_data:
+            chunk_data = b"".join(chunk_data)
+            compressed_data.append(struct.pack("<H", 0xB000 | (len(chunk_data) - 1)))
+            compressed_data.append(chunk_data)
+
+        return b"".join(compressed_data)
+
+    def _CreateDirStreamData(self, project_name, modules):
+        """Creates compressed dir stream data for testing.
+
+        Args:
+          project_name (str): name of the project.
+          modules (list[tuple[str, int]]): name and text offset of every module.
+
+        Returns:
+          bytes: compressed dir stream data.
+        """
+
+        def _CreateRecord(record_type, record_data):
+            return struct.pack("<HI", record_type, len(record_data)) + record_data
+
+        stream_data = [
+            _CreateRecord(0x0001, struct.pack("<I", 1)),
+            _CreateRecord(0x0003, struct.pack("<H", 1252)),
+            _CreateRecord(0x0004, project_name.encode("cp1252")),
+            struct.pack("<HIIH", 0x0009, 4, 1, 2),
+            _CreateRecord(0x000F, struct.pack("<H", len(modules))),
+            _CreateRecord(0x0013, struct.pack("<H", 0xFFFF)),
+        ]
+        for name, text_offset in modules:
+            stream_data.extend(
+                [
+                    _CreateRecord(0x0019, name.encode("cp1252")),
+                    _CreateRecord(0x0047, name.encode("utf-16-le")),
+                    _CreateRecord(0x001A, name.encode("cp1252")),
+                    _CreateRecord(0x0032, name.encode("utf-16-le")),
+                    _CreateRecord(0x0031, struct.pack("<I", text_offset)),
+                    _CreateRecord(0x0021, b""),
+                    _CreateRecord(0x002B, b""),
+                ]
+            )
+
+        stream_data.append(_CreateRecord(0x0010, b""))
+
+        return self._CompressLiterals(b"".join(stream_data))
+
+    def _CreateVBADocumentData(
+        self, path="Macros", modules=None, forms=None, strings=None
+    ):
+        """Creates OLE Compound File data of a document with VBA for testing.
+
+        Args:
+          path (Optional[str]): path of the storage that contains the project,
+              where an empty string represents the root storage.
+          modules (Optional[dict[str, str]]): source code per module name.
+          forms (Optional[dict[str, list[tuple[str, str, str]]]]): variable name,
+              data string and font name of the controls per form name.
+          strings (Optional[list[str]]): _VBA_PROJECT stream strings.
+
+        Returns:
+          bytes: OLE Compound File data.
+        """
+        forms = forms or {}
+        modules = modules or {}
+        path_prefix = f"{path:s}/" if path else ""
+
+        project_lines = ['ID="{00000000-0000-0000-0000-000000000000}"']
+        project_lines.extend(f"Module={name:s}" for name in modules)
+        project_lines.extend(f"BaseClass={name:s}" for name in forms)
+        project_lines.append('Name="Project"')
+
+        streams = {
+            f"{path_prefix:s}PROJECT": "\r\n".join(project_lines).encode("cp1252"),
+            f"{path_prefix:s}VBA/_VBA_PROJECT": self._CreateVBAProjectStreamData(
+                strings or []
+            ),
+            f"{path_prefix:s}VBA/dir": self._CreateDirStreamData(
+                "Project", [(name, 16) for name in modules]
+            ),
+        }
+        for name, source_code in modules.items():
+            streams[f"{path_prefix:s}VBA/{name:s}"] = bytes(
+                16
+            ) + self._CompressLiterals(source_code.encode("cp1252"))
+
+        for name, controls in forms.items():
+            o_stream_entries = [
+                self._CreateOStreamEntryData(data_string, font_name)
+                for _, data_string, font_name in controls
+            ]
+            streams[f"{path_prefix:s}{name:s}/f"] = self._CreateFStreamData(
+                [
+                    (variable_name, 23, len(o_stream_entry))
+                    for (variable_name, _, _), o_stream_entry in zip(
+                        controls, o_stream_entries
+                    )
+                ]
+            )
+            streams[f"{path_prefix:s}{name:s}/o"] = b"".join(o_stream_entries)
+
+        return CreateOLECFData(streams)
+
+    def _CreateFStreamData(self, entries):
+        """Creates f stream data for testing.
+
+        The sites of the controls are positioned at left 120 and top 240.
+
+        Args:
+          entries (list[tuple[str, int, int]]): name, class identifier (CLSID)
+              cache index and object stream size of every control, where
+              an object stream size of 0 indicates the control has no o stream
+              entry.
+
+        Returns:
+          bytes: f stream data.
+        """
+        # The form control stores the next available identifier and boolean
+        # properties, followed by an empty site class information table.
+        stream_data = [
+            struct.pack("<BBHIII", 0, 4, 12, 0x00000048, len(entries) + 1, 0),
+            struct.pack("<H", 0),
+        ]
+
+        site_depths_and_types = b"\x00\x01" * len(entries)
+        padding_size = (4 - (len(site_depths_and_types) % 4)) % 4
+        sites_data = [site_depths_and_types, bytes(padding_size)]
+
+        for identifier, (name, clsid_cache_index, object_stream_size) in enumerate(
+            entries, start=1
+        ):
+            encoded_name = name.encode("cp1252")
+            padding_size = (4 - (len(encoded_name) % 4)) % 4
+
+            # The name, identifier, tab index, class identifier cache index and
+            # position are stored, and the object stream size when not 0.
+            property_mask = 0x000001C5
+            data_block = struct.pack("<Ii", 0x80000000 | len(encoded_name), identifier)
+            if object_stream_size:
+                property_mask |= 0x00000020
+                data_block += struct.pack("<I", object_stream_size)
+            data_block += struct.pack("<hH", identifier - 1, clsid_cache_index)
+
+            extra_data_block = (
+                encoded_name + bytes(padding_size) + struct.pack("<ii", 120, 240)
+            )
+
+            sites_data.append(
+                struct.pack(
+                    "<HHI",
+                    0,
+                    4 + len(data_block) + len(extra_data_block),
+                    property_mask,
+                )
+            )
+            sites_data.extend([data_block, extra_data_block])
+
+        sites_data = b"".join(sites_data)
+        stream_data.append(struct.pack("<II", len(entries), len(sites_data)))
+        stream_data.append(sites_data)
+
+        return b"".join(stream_data)
+
+    def _CreateOStreamData(self, entries):
+        """Creates o stream data of text boxes for testing.
+
+        Args:
+          entries (list[tuple[str, str]]): value and font name of every entry.
+
+        Returns:
+          bytes: o stream data.
+        """
+        return b"".join(
+            self._CreateOStreamEntryData(data_string, font_name)
+            for data_string, font_name in entries
+        )
+
+    def _CreateOStreamEntryData(self, data_string, font_name, clsid_cache_index=23):
+        """Creates o stream entry data for testing.
+
+        The controls are 2400 wide and 600 high.
+
+        Args:
+          data_string (str): caption of a command button or label, or value of
+              a MorphData control, such as a text box.
+          font_name (str): font name.
+          clsid_cache_index (Optional[int]): class identifier (CLSID) cache
+              index of the control.
+
+        Returns:
+          bytes: o stream entry data.
+        """
+        encoded_string = data_string.encode("cp1252")
+        padding_size = (4 - (len(encoded_string) % 4)) % 4
+        encoded_string += bytes(padding_size)
+
+        data_block = struct.pack("<I", 0x80000000 | len(data_string))
+        size = struct.pack("<II", 2400, 600)
+
+        if clsid_cache_index in (17, 21):
+            # The caption and size are stored.
+            property_data = data_block + encoded_string + size
+            entry_data = [
+                struct.pack("<BBHI", 0, 2, 4 + len(property_data), 0x00000028)
+            ]
+        else:
+            # The size and value are stored.
+            property_data = data_block + size + encoded_string
+            entry_data = [
+                struct.pack("<BBHQ", 0, 2, 8 + len(property_data), 0x0000000000400100)
+            ]
+        entry_data.append(property_data)
+
+        # The text properties contain only the font name.
+        encoded_font_name = font_name.encode("cp1252")
+        padding_size = (4 - (len(encoded_font_name) % 4)) % 4
+        property_data = (
+            struct.pack("<I", 0x80000000 | len(encoded_font_name))
+            + encoded_font_name
+            + bytes(padding_size)
+        )
+        entry_data.append(
+            struct.pack("<BBHI", 0, 2, 4 + len(property_data), 0x00000001)
+        )
+        entry_data.append(property_data)
+
+        return b"".join(entry_data)
+
+    def _CreateVBAProjectStreamData(self, strings):
+        """Creates _VBA_PROJECT stream data for testing.
+
+        Args:
+          strings (list[str]): strings.
+
+        Returns:
+          bytes: _VBA_PROJECT stream data.
+        """
+        stream_data = [
+            struct.pack("<IHHIIIIIHHH", 0, 0, 0, 0, 0, 0, 0, 0, 0, len(strings), 0)
+        ]
+        for string in strings:
+            encoded_string = string.encode("utf-16-le")
+            stream_data.append(struct.pack("<H", len(encoded_string)))
+            stream_data.append(encoded_string)
+            stream_data.append(struct.pack("<III", 1, 2, 3))
+
+        return b"".join(stream_data)
+
     def _SkipIfPathNotExists(self, path):
         """Skips the test if the path does not exist.
 
@@ -69,3 +344,248 @@ class TestOutputWriter(output_writers.StdoutOutputWriter):
           text (str): text to write.
         """
         self.output.append(text)
+
+
+class TestOLECFItem:
+    """OLECF item for testing.
+
+    Attributes:
+      name (str): name of the item.
+      size (int): size of the item data.
+    """
+
+    def __init__(self, data, name=None):
+        """Initializes an OLECF item for testing.
+
+        Args:
+          data (bytes): item data.
+          name (Optional[str]): name of the item.
+        """
+        super().__init__()
+        self._data = data
+        self.name = name
+        self.size = len(data)
+
+    # The following methods are part of the pyolecf.item interface.
+    # pylint: disable=invalid-name
+
+    def read(self, size=None):
+        """Reads the item data.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where None represents
+              all the data.
+
+        Returns:
+          bytes: item data.
+        """
+        if size is None:
+            return self._data
+        return self._data[:size]
+
+
+class _TestOLECFDirectoryEntry:
+    """OLECF directory entry for testing.
+
+    Attributes:
+      children (dict[str, _TestOLECFDirectoryEntry]): sub entries per name.
+      data (bytes): stream data.
+      entry_type (int): directory entry type.
+      identifier (int): directory entry identifier.
+      name (str): name.
+      right_sibling (int): directory entry identifier of the right sibling.
+      start_sector (int): start (mini) sector of the stream data.
+    """
+
+    def __init__(self, name, entry_type, data=b""):
+        """Initializes an OLECF directory entry for testing.
+
+        Args:
+          name (str): name.
+          entry_type (int): directory entry type.
+          data (Optional[bytes]): stream data.
+        """
+        super().__init__()
+        self.children = {}
+        self.data = data
+        self.entry_type = entry_type
+        self.identifier = 0
+        self.name = name
+        self.right_sibling = 0xFFFFFFFF
+        self.start_sector = 0xFFFFFFFE
+
+
+def CreateOLECFData(streams):
+    """Creates OLE Compound File (version 3) data for testing.
+
+    Args:
+      streams (dict[str, bytes]): stream data per path, where the path segments
+          are separated by "/".
+
+    Returns:
+      bytes: OLE Compound File data.
+    """
+    end_of_chain = 0xFFFFFFFE
+    no_stream = 0xFFFFFFFF
+
+    root_entry = _TestOLECFDirectoryEntry("Root Entry", 5)
+    for path, data in streams.items():
+        path_segments = path.split("/")
+        parent_entry = root_entry
+        for path_segment in path_segments[:-1]:
+            parent_entry = parent_entry.children.setdefault(
+                path_segment, _TestOLECFDirectoryEntry(path_segment, 1)
+            )
+        parent_entry.children[path_segments[-1]] = _TestOLECFDirectoryEntry(
+            path_segments[-1], 2, data=data
+        )
+
+    directory_entries = [root_entry]
+    entry_index = 0
+    while entry_index < len(directory_entries):
+        for child_entry in directory_entries[entry_index].children.values():
+            child_entry.identifier = len(directory_entries)
+            directory_entries.append(child_entry)
+        entry_index += 1
+
+    mini_fat = []
+    mini_stream = bytearray()
+    large_streams = []
+    for directory_entry in directory_entries:
+        data_size = len(directory_entry.data)
+        if directory_entry.entry_type != 2 or not data_size:
+            continue
+
+        if data_size >= 4096:
+            large_streams.append(directory_entry)
+            continue
+
+        number_of_mini_sectors, remainder = divmod(data_size, 64)
+        if remainder:
+            number_of_mini_sectors += 1
+
+        directory_entry.start_sector = len(mini_fat)
+        mini_fat.extend(
+            range(len(mini_fat) + 1, len(mini_fat) + number_of_mini_sectors)
+        )
+        mini_fat.append(end_of_chain)
+        mini_stream.extend(directory_entry.data)
+        mini_stream.extend(bytes(number_of_mini_sectors * 64 - data_size))
+
+    def _GetNumberOfSectors(data_size):
+        number_of_sectors, remainder = divmod(data_size, 512)
+        return number_of_sectors + (1 if remainder else 0)
+
+    number_of_directory_sectors = _GetNumberOfSectors(len(directory_entries) * 128)
+    number_of_mini_fat_sectors = _GetNumberOfSectors(len(mini_fat) * 4)
+    number_of_mini_stream_sectors = _GetNumberOfSectors(len(mini_stream))
+    number_of_stream_sectors = [
+        _GetNumberOfSectors(len(directory_entry.data))
+        for directory_entry in large_streams
+    ]
+
+    number_of_sectors = (
+        number_of_directory_sectors
+        + number_of_mini_fat_sectors
+        + number_of_mini_stream_sectors
+        + sum(number_of_stream_sectors)
+    )
+    number_of_fat_sectors = 1
+    while number_of_fat_sectors * 128 < number_of_sectors + number_of_fat_sectors:
+        number_of_fat_sectors += 1
+
+    fat = [0xFFFFFFFD] * number_of_fat_sectors
+
+    def _AllocateChain(number_of_chain_sectors):
+        if not number_of_chain_sectors:
+            return end_of_chain
+
+        start_sector = len(fat)
+        fat.extend(range(start_sector + 1, start_sector + number_of_chain_sectors))
+        fat.append(end_of_chain)
+        return start_sector
+
+    first_directory_sector = _AllocateChain(number_of_directory_sectors)
+    first_mini_fat_sector = _AllocateChain(number_of_mini_fat_sectors)
+    root_entry.start_sector = _AllocateChain(number_of_mini_stream_sectors)
+    root_entry.data = mini_stream
+    for directory_entry, number_of_chain_sectors in zip(
+        large_streams, number_of_stream_sectors
+    ):
+        directory_entry.start_sector = _AllocateChain(number_of_chain_sectors)
+
+    fat.extend([no_stream] * (number_of_fat_sectors * 128 - len(fat)))
+
+    directory_data = bytearray()
+    for directory_entry in directory_entries:
+        # Chain the sub entries, sorted as required, by their right sibling.
+        child_entries = sorted(
+            directory_entry.children.values(),
+            key=lambda entry: (len(entry.name), entry.name.upper()),
+        )
+        child_identifier = no_stream
+        if child_entries:
+            child_identifier = child_entries[0].identifier
+
+        for entry_index, child_entry in enumerate(child_entries[:-1]):
+            child_entry.right_sibling = child_entries[entry_index + 1].identifier
+
+        encoded_name = directory_entry.name.encode("utf-16-le")
+        directory_data.extend(encoded_name + bytes(64 - len(encoded_name)))
+        directory_data.extend(
+            struct.pack(
+                "<HBBIII16sIQQIII",
+                len(encoded_name) + 2,
+                directory_entry.entry_type,
+                1,
+                no_stream,
+                directory_entry.right_sibling,
+                child_identifier,
+                bytes(16),
+                0,
+                0,
+                0,
+                directory_entry.start_sector,
+                len(directory_entry.data),
+                0,
+            )
+        )
+
+    header_data = struct.pack(
+        "<8s16sHHHHH6sIIIIIIIII",
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",
+        bytes(16),
+        0x003E,
+        3,
+        0xFFFE,
+        9,
+        6,
+        bytes(6),
+        0,
+        number_of_fat_sectors,
+        first_directory_sector,
+        0,
+        4096,
+        first_mini_fat_sector if mini_fat else end_of_chain,
+        number_of_mini_fat_sectors,
+        end_of_chain,
+        0,
+    )
+    difat = list(range(number_of_fat_sectors))
+    difat.extend([no_stream] * (109 - len(difat)))
+    header_data += struct.pack("<109I", *difat)
+
+    def _PadToSector(data):
+        remainder = len(data) % 512
+        if remainder:
+            data += bytes(512 - remainder)
+        return data
+
+    olecf_data = [header_data, struct.pack(f"<{len(fat):d}I", *fat)]
+    olecf_data.append(_PadToSector(bytes(directory_data)))
+    olecf_data.append(_PadToSector(struct.pack(f"<{len(mini_fat):d}I", *mini_fat)))
+    olecf_data.append(_PadToSector(bytes(mini_stream)))
+    for directory_entry in large_streams:
+        olecf_data.append(_PadToSector(directory_entry.data))
+
+    return b"".join(olecf_data)
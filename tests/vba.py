@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""Tests for the Visual Basic for Applications (VBA) collector."""
+
+import contextlib
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+from olecfrc import decompression_pool
+from olecfrc import errors
+from olecfrc import records
+from olecfrc import vba
+
+from tests import test_lib
+
+
+class DirStreamTest(test_lib.BaseTestCase):
+    """Tests for the dir stream."""
+
+    def testRead(self):
+        """Tests the Read function."""
+        stream_data = self._CreateDirStreamData(
+            "Project", [("ThisDocument", 16), ("Module1", 32)]
+        )
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        dir_stream = vba.DirStream()
+        result = dir_stream.Read(olecf_item)
+        self.assertTrue(result)
+
+        self.assertEqual(dir_stream.code_page, 1252)
+        self.assertEqual(dir_stream.project_name, "Project")
+        self.assertEqual(len(dir_stream.modules), 2)
+        self.assertEqual(dir_stream.modules[1].name, "Module1")
+        self.assertEqual(dir_stream.modules[1].module_type, "procedural")
+        self.assertEqual(dir_stream.modules[1].stream_name, "Module1")
+        self.assertEqual(dir_stream.modules[1].text_offset, 32)
+
+
+class FStreamTest(test_lib.BaseTestCase):
+    """Tests for the f stream."""
+
+    def testRead(self):
+        """Tests the Read function."""
+        stream_data = self._CreateFStreamData(
+            [("TextBox1", 23, 56), ("Frame1", 14, 0), ("Label1", 21, 48)]
+        )
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        f_stream = vba.FStream()
+        result = f_stream.Read(olecf_item)
+        self.assertTrue(result)
+
+        self.assertEqual(f_stream.number_of_sites, 3)
+        self.assertEqual(len(f_stream.entries), 3)
+        self.assertIsInstance(f_stream.entries[0], records.FStreamEntry)
+        self.assertEqual(f_stream.entries[0].name, "TextBox1")
+        self.assertEqual(f_stream.entries[0].offset, 34)
+        self.assertEqual(f_stream.entries[0].clsid_cache_index, 23)
+        self.assertIsNone(f_stream.entries[1].o_stream_entry_index)
+        self.assertIsNone(f_stream.entries[1].o_stream_entry_size)
+        self.assertEqual(f_stream.entries[2].o_stream_entry_index, 1)
+        self.assertEqual(f_stream.entries[2].o_stream_entry_size, 48)
+
+        f_stream = vba.FStream(columnar=True)
+        f_stream.Read(olecf_item)
+
+        self.assertIsInstance(f_stream.entries, records.ColumnarRecords)
+        self.assertEqual(len(f_stream.entries), 3)
+        self.assertIsNone(f_stream.entries[1].o_stream_entry_index)
+        self.assertEqual(f_stream.entries[2].o_stream_entry_index, 1)
+
+    def testReadDataWithUserForm(self):
+        """Tests the ReadData function with the f stream of a user form."""
+        test_file_path = self._GetTestFilePath(["userforms.bin"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        olecf_file = vba.OpenOLECFFile(test_file_path)
+        try:
+            olecf_item = olecf_file.get_item_by_path("\\UserFormTEST1\\f")
+            stream_data = olecf_item.read()
+        finally:
+            olecf_file.close()
+
+        f_stream = vba.FStream()
+        f_stream.ReadData(stream_data)
+
+        self.assertEqual(f_stream.number_of_sites, 14)
+        self.assertEqual(len(f_stream.entries), 14)
+
+        names = [f_stream_entry.name for f_stream_entry in f_stream.entries]
+        self.assertEqual(names[:3], ["Label1", "TextBox1", "ComboBox1"])
+        self.assertEqual(names[-1], "ListBox1")
+
+        f_stream_entry = f_stream.entries[0]
+        self.assertEqual(f_stream_entry.clsid_cache_index, 21)
+        self.assertEqual(f_stream_entry.o_stream_entry_index, 0)
+        self.assertEqual(f_stream_entry.o_stream_entry_size, 64)
+
+        # Frame1 stores its controls in a separate storage and has no o stream
+        # entry.
+        f_stream_entry = f_stream.entries[6]
+        self.assertEqual(f_stream_entry.name, "Frame1")
+        self.assertEqual(f_stream_entry.clsid_cache_index, 14)
+        self.assertIsNone(f_stream_entry.o_stream_entry_index)
+
+        f_stream_entry = f_stream.entries[13]
+        self.assertEqual(f_stream_entry.o_stream_entry_index, 11)
+
+        # The sizes of the o stream entries add up to the size of the o stream.
+        o_stream_size = sum(
+            f_stream_entry.o_stream_entry_size or 0
+            for f_stream_entry in f_stream.entries
+        )
+        self.assertEqual(o_stream_size, 772)
+
+        expected_f_stream = vba.FStream(use_generated_parsers=False)
+        expected_f_stream.ReadData(stream_data)
+        self.assertEqual(f_stream.entries, expected_f_stream.entries)
+
+    def testReadHeader(self):
+        """Tests the ReadHeader function."""
+        # The entries are truncated, which only affects reading the full stream.
+        stream_data = self._CreateFStreamData([("TextBox1", 23, 56)])
+        olecf_item = test_lib.TestOLECFItem(stream_data[:-4])
+
+        f_stream = vba.FStream()
+        header_struct = f_stream.ReadHeader(olecf_item)
+        self.assertEqual(header_struct.major_version, 4)
+        self.assertEqual(f_stream.number_of_sites, 1)
+        self.assertEqual(f_stream.entries, [])
+
+        with self.assertRaises(errors.ParseError):
+            f_stream.Read(olecf_item)
+
+        olecf_item = test_lib.TestOLECFItem(stream_data[:24])
+        with self.assertRaises(errors.ParseError):
+            f_stream.ReadHeader(olecf_item)
+
+        # A form control of an unsupported version.
+        olecf_item = test_lib.TestOLECFItem(b"\x00\x03" + stream_data[2:])
+        with self.assertRaises(errors.ParseError):
+            f_stream.ReadHeader(olecf_item)
+
+
+class OStreamTest(test_lib.BaseTestCase):
+    """Tests for the o stream."""
+
+    def _ReadUserFormStreams(self, form_path):
+        """Reads the f and o stream of a user form in the test file.
+
+        Args:
+          form_path (str): path of the storage of the user form.
+
+        Returns:
+          tuple[FStream, OStream]: f and o stream.
+        """
+        test_file_path = self._GetTestFilePath(["userforms.bin"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        olecf_file = vba.OpenOLECFFile(test_file_path)
+        try:
+            f_stream = vba.FStream()
+            f_stream.Read(olecf_file.get_item_by_path(f"{form_path:s}\\f"))
+
+            entry_sizes = [
+                f_stream_entry.o_stream_entry_size
+                for f_stream_entry in f_stream.entries
+                if f_stream_entry.o_stream_entry_index is not None
+            ]
+            o_stream = vba.OStream()
+            o_stream.Read(olecf_file.get_item_by_path(f"{form_path:s}\\o"), entry_sizes)
+        finally:
+            olecf_file.close()
+
+        return f_stream, o_stream
+
+    def testRead(self):
+        """Tests the Read function."""
+        entries_data = [
+            self._CreateOStreamEntryData("Text", "Tahoma"),
+            self._CreateOStreamEntryData("Label", "Arial", clsid_cache_index=21),
+        ]
+        entry_sizes = [len(entry_data) for entry_data in entries_data]
+        olecf_item = test_lib.TestOLECFItem(b"".join(entries_data))
+
+        o_stream = vba.OStream()
+        result = o_stream.Read(olecf_item, entry_sizes)
+        self.assertTrue(result)
+
+        self.assertEqual(list(o_stream.entry_offsets), [0, entry_sizes[0]])
+        self.assertEqual(list(o_stream.entry_sizes), entry_sizes)
+
+        o_stream_entry = o_stream.GetEntryByIndex(0, 23)
+        self.assertIsNone(o_stream_entry.caption)
+        self.assertEqual(o_stream_entry.font_name, "Tahoma")
+        self.assertEqual(o_stream_entry.value, "Text")
+        self.assertEqual((o_stream_entry.width, o_stream_entry.height), (2400, 600))
+
+        o_stream_entry = o_stream.GetEntryByIndex(1, 21)
+        self.assertEqual(o_stream_entry.offset, entry_sizes[0])
+        self.assertEqual(o_stream_entry.size, entry_sizes[1])
+        self.assertEqual(o_stream_entry.caption, "Label")
+        self.assertEqual(o_stream_entry.font_name, "Arial")
+        self.assertIsNone(o_stream_entry.value)
+        self.assertEqual((o_stream_entry.width, o_stream_entry.height), (2400, 600))
+
+        self.assertIsNone(o_stream.GetEntryByIndex(2, 23))
+
+        # The properties of an image are not read.
+        o_stream_entry = o_stream.GetEntryByIndex(0, 12)
+        self.assertEqual(o_stream_entry.size, entry_sizes[0])
+        self.assertIsNone(o_stream_entry.font_name)
+
+        # The entries are only read on access.
+        olecf_item = test_lib.TestOLECFItem(b"\xff" * sum(entry_sizes))
+        o_stream.Read(olecf_item, entry_sizes)
+
+        with self.assertRaises(errors.ParseError):
+            o_stream.GetEntryByIndex(0, 23)
+
+        # An entry of which the text properties exceed its size.
+        olecf_item = test_lib.TestOLECFItem(entries_data[0])
+        o_stream.Read(olecf_item, [entry_sizes[0] - 4])
+
+        with self.assertRaises(errors.ParseError):
+            o_stream.GetEntryByIndex(0, 23)
+
+        # Entry sizes that exceed the stream.
+        with self.assertRaises(errors.ParseError):
+            o_stream.Read(olecf_item, entry_sizes)
+
+    def testReadWithUserForm(self):
+        """Tests the Read function with the o stream of a user form."""
+        f_stream, o_stream = self._ReadUserFormStreams("\\UserFormTEST1")
+
+        o_stream_entries = {
+            f_stream_entry.name: o_stream.GetEntryByIndex(
+                f_stream_entry.o_stream_entry_index, f_stream_entry.clsid_cache_index
+            )
+            for f_stream_entry in f_stream.entries
+            if f_stream_entry.o_stream_entry_index is not None
+        }
+        self.assertEqual(len(o_stream_entries), 12)
+
+        o_stream_entry = o_stream_entries["Label1"]
+        self.assertEqual(o_stream_entry.caption, "Label1-test")
+        self.assertEqual(o_stream_entry.font_name, "Tahoma")
+        self.assertEqual((o_stream_entry.width, o_stream_entry.height), (1482, 635))
+
+        o_stream_entry = o_stream_entries["TextBox1"]
+        self.assertEqual(o_stream_entry.value, "heyhey")
+        self.assertEqual((o_stream_entry.width, o_stream_entry.height), (1561, 556))
+
+        self.assertEqual(o_stream_entries["ComboBox1"].value, "none dd")
+
+        o_stream_entry = o_stream_entries["CheckBox1"]
+        self.assertEqual(o_stream_entry.caption, "mouahaha")
+        self.assertEqual(o_stream_entry.value, "1")
+
+        o_stream_entry = o_stream_entries["OptionButton1"]
+        self.assertEqual(o_stream_entry.caption, "OptionButton1")
+        self.assertEqual(o_stream_entry.value, "0")
+
+        o_stream_entry = o_stream_entries["CommandButton1"]
+        self.assertEqual(o_stream_entry.caption, "CommandButton1")
+        self.assertEqual((o_stream_entry.width, o_stream_entry.height), (635, 423))
+
+        # A list box without a value.
+        o_stream_entry = o_stream_entries["ListBox1"]
+        self.assertIsNone(o_stream_entry.value)
+        self.assertEqual(o_stream_entry.font_name, "Tahoma")
+
+        # The properties of a tab strip are not read.
+        o_stream_entry = o_stream_entries["TabStrip1"]
+        self.assertEqual(o_stream_entry.size, 140)
+        self.assertIsNone(o_stream_entry.caption)
+
+        expected_o_stream = vba.OStream(use_generated_parsers=False)
+        expected_o_stream.ReadData(o_stream.stream_data, o_stream.entry_sizes)
+        for f_stream_entry in f_stream.entries:
+            if f_stream_entry.o_stream_entry_index is not None:
+                self.assertEqual(
+                    expected_o_stream.GetEntryByIndex(
+                        f_stream_entry.o_stream_entry_index,
+                        f_stream_entry.clsid_cache_index,
+                    ),
+                    o_stream_entries[f_stream_entry.name],
+                )
+
+    def testReadWithUserFormStrings(self):
+        """Tests the Read function with strings stored in a single byte."""
+        f_stream, o_stream = self._ReadUserFormStreams("\\UserFormTest2")
+
+        f_stream_entry = f_stream.entries[2]
+        self.assertEqual(f_stream_entry.name, "TextBox1")
+
+        o_stream_entry = o_stream.GetEntryByIndex(
+            f_stream_entry.o_stream_entry_index, f_stream_entry.clsid_cache_index
+        )
+        self.assertEqual(o_stream_entry.value, "&\u00e9\"'")
+
+
+class VBAFormControlTest(test_lib.BaseTestCase):
+    """Tests for the form control."""
+
+    def testProperties(self):
+        """Tests the properties."""
+        stream_data = self._CreateFStreamData([("Label1", 21, 48)])
+        f_stream = vba.FStream()
+        f_stream.ReadData(stream_data)
+        f_stream_entry = f_stream.entries[0]
+        o_stream_entry = records.OStreamEntry(
+            caption="Enter the code", font_name="Tahoma", height=600, width=2400
+        )
+
+        vba_form_control = vba.VBAFormControl(
+            f_stream_entry, o_stream_entry=o_stream_entry, f_stream_data=stream_data
+        )
+        self.assertFalse(vba_form_control._decoded)  # pylint: disable=protected-access
+
+        self.assertEqual(vba_form_control.name, "Label1")
+        self.assertEqual(vba_form_control.size, (2400, 600))
+        self.assertEqual(vba_form_control.text, "Enter the code")
+        self.assertEqual(vba_form_control.caption, "Enter the code")
+        self.assertIsNone(vba_form_control.value)
+        self.assertFalse(vba_form_control._decoded)  # pylint: disable=protected-access
+
+        self.assertEqual(vba_form_control.control_type, "Label")
+        self.assertTrue(vba_form_control._decoded)  # pylint: disable=protected-access
+        self.assertEqual(vba_form_control.position, (120, 240))
+        self.assertIsNone(vba_form_control.tag)
+        self.assertIsNone(vba_form_control.control_tip_text)
+
+        vba_form_control = vba.VBAFormControl(f_stream_entry)
+        self.assertIsNone(vba_form_control.caption)
+        self.assertIsNone(vba_form_control.font_name)
+        self.assertIsNone(vba_form_control.position)
+        self.assertIsNone(vba_form_control.size)
+
+    def testPropertiesWithOStream(self):
+        """Tests the properties with an o stream that is read on access."""
+        o_stream_data = self._CreateOStreamEntryData(
+            "Enter the code", "Tahoma", clsid_cache_index=21
+        )
+        stream_data = self._CreateFStreamData(
+            [("Frame1", 14, 0), ("Label1", 21, len(o_stream_data))]
+        )
+        f_stream = vba.FStream()
+        f_stream.ReadData(stream_data)
+
+        o_stream = vba.OStream()
+        o_stream.ReadData(o_stream_data, [len(o_stream_data)])
+
+        vba_form_control = vba.VBAFormControl(
+            f_stream.entries[1], f_stream_data=stream_data, o_stream=o_stream
+        )
+        self.assertEqual(vba_form_control.caption, "Enter the code")
+        self.assertEqual(vba_form_control.font_name, "Tahoma")
+        self.assertEqual(vba_form_control.size, (2400, 600))
+
+        vba_form_control = vba.VBAFormControl(
+            f_stream.entries[0], f_stream_data=stream_data, o_stream=o_stream
+        )
+        self.assertIsNone(vba_form_control.o_stream_entry)
+        self.assertEqual(vba_form_control.control_type, "Frame")
+
+    def testPropertiesWithUserForm(self):
+        """Tests the properties with the sites of a user form."""
+        test_file_path = self._GetTestFilePath(["userforms.bin"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        olecf_file = vba.OpenOLECFFile(test_file_path)
+        try:
+            stream_data = olecf_file.get_item_by_path("\\UserFormTest2\\f").read()
+            tag_stream_data = olecf_file.get_item_by_path("\\UserFormTEST1\\f").read()
+        finally:
+            olecf_file.close()
+
+        f_stream = vba.FStream()
+        f_stream.ReadData(stream_data)
+
+        positions = [
+            vba.VBAFormControl(f_stream_entry, f_stream_data=stream_data).position
+            for f_stream_entry in f_stream.entries
+        ]
+        # The labels are positioned at the same left, one above the other.
+        self.assertEqual(positions[0][0], positions[1][0])
+        self.assertLess(positions[0][1], positions[1][1])
+
+        f_stream.ReadData(tag_stream_data)
+
+        vba_form_control = vba.VBAFormControl(
+            f_stream.entries[0], f_stream_data=tag_stream_data
+        )
+        self.assertEqual(vba_form_control.name, "Label1")
+        self.assertEqual(vba_form_control.tag, "sdfff")
+
+
+class VBAProjectTest(test_lib.BaseTestCase):
+    """Tests for the VBA project that reads its streams on demand."""
+
+    def testProperties(self):
+        """Tests that the properties read their streams on first access."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": 'Attribute VB_Name = "Module1"\r\n'},
+            forms={"UserForm1": [("TextBox1", "payload", "Tahoma")]},
+            strings=["Module1"],
+        )
+
+        stage_names = []
+
+        def _ProfileStage(name):
+            stage_names.append(name)
+            return contextlib.nullcontext()
+
+        with vba.VBAProject(document_data, profile_stage=_ProfileStage) as vba_project:
+            self.assertEqual(vba_project.path, "\\Macros")
+            self.assertTrue(vba_project.stream_found)
+            self.assertEqual(stage_names, [])
+
+            self.assertEqual(
+                vba_project.modules[0].source_code, 'Attribute VB_Name = "Module1"\r\n'
+            )
+            self.assertEqual(stage_names, ["DirStream", "modules"])
+
+            # The result is memoized.
+            self.assertIs(vba_project.modules, vba_project.modules)
+            self.assertEqual(stage_names, ["DirStream", "modules"])
+
+            self.assertEqual(vba_project.project_info.project_name, "Project")
+            self.assertEqual(vba_project.forms[0].controls[0].name, "TextBox1")
+            self.assertEqual(
+                stage_names, ["DirStream", "modules", "FStream", "OStream"]
+            )
+
+        # Memoized results remain available after the project is closed.
+        self.assertEqual(len(vba_project.forms), 1)
+
+        with self.assertRaises(IOError):
+            _ = vba_project.performance_cache
+
+    def testOpen(self):
+        """Tests the Open function."""
+        vba_project = vba.VBAProject(test_lib.CreateOLECFData({"WordDocument": b"0"}))
+
+        with self.assertRaises(errors.ParseError):
+            vba_project.Open()
+
+
+class VBAProjectStreamTest(test_lib.BaseTestCase):
+    """Tests for the _VBA_PROJECT stream."""
+
+    def testRead(self):
+        """Tests the Read function."""
+        stream_data = self._CreateVBAProjectStreamData(["ThisDocument", "Module1"])
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        vba_project_stream = vba.VBAProjectStream()
+        result = vba_project_stream.Read(olecf_item)
+        self.assertTrue(result)
+
+        self.assertEqual(len(vba_project_stream.strings), 2)
+        self.assertEqual(vba_project_stream.strings[0].offset, 34)
+        self.assertEqual(vba_project_stream.strings[0].string, "ThisDocument")
+        self.assertEqual(vba_project_stream.strings[1].string, "Module1")
+        self.assertEqual(vba_project_stream.strings[1].unknown3, 3)
+
+        vba_project_stream = vba.VBAProjectStream(columnar=True)
+        vba_project_stream.Read(olecf_item)
+
+        self.assertEqual(len(vba_project_stream.strings), 2)
+        self.assertEqual(vba_project_stream.strings[1].string, "Module1")
+
+    def testReadHeader(self):
+        """Tests the ReadHeader function."""
+        # The header of a stream of version 0x00b2 of which the 2 strings are
+        # missing, which only affects reading the full stream.
+        stream_data = struct.pack(
+            "<IHHIIIIIHHH", 0x00B261CC, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0
+        )
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        vba_project_stream = vba.VBAProjectStream()
+        header_struct = vba_project_stream.ReadHeader(olecf_item)
+        self.assertEqual(header_struct.number_of_strings, 2)
+        self.assertEqual(vba_project_stream.version, 0x00B2)
+        self.assertEqual(len(vba_project_stream.strings), 0)
+
+        with self.assertRaises(errors.ParseError):
+            vba_project_stream.Read(olecf_item)
+
+
+class VBACollectorTest(test_lib.BaseTestCase):
+    """Tests for the VBA collector."""
+
+    def testCollect(self):
+        """Tests the Collect function."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": 'Attribute VB_Name = "Module1"\r\n'},
+            forms={"UserForm1": [("TextBox1", "payload", "Tahoma")]},
+            strings=["Module1"],
+        )
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "document.doc")
+            with open(path, "wb") as file_object:
+                file_object.write(document_data)
+
+            collector_object = vba.VBACollector()
+            collector_object.Collect(path, None)
+
+        self.assertTrue(collector_object.stream_found)
+        self.assertEqual(len(collector_object.project_roots), 1)
+
+        project_root = collector_object.project_roots[0]
+        self.assertEqual(project_root.path, "\\Macros")
+        self.assertEqual(project_root.project_name, "Project")
+        self.assertIn(("Name", '"Project"'), project_root.project_keys)
+
+        self.assertEqual(len(project_root.modules), 1)
+        self.assertEqual(
+            project_root.modules[0].source_code, 'Attribute VB_Name = "Module1"\r\n'
+        )
+
+        self.assertEqual(len(project_root.forms), 1)
+        self.assertEqual(project_root.forms[0].name, "UserForm1")
+        self.assertEqual(len(project_root.forms[0].f_stream_entries), 1)
+        self.assertEqual(
+            project_root.forms[0].o_stream.GetEntryByIndex(0, 23).value, "payload"
+        )
+
+        vba_form_control = project_root.forms[0].controls[0]
+        self.assertEqual(vba_form_control.name, "TextBox1")
+        self.assertEqual(vba_form_control.control_type, "TextBox")
+        self.assertEqual(vba_form_control.value, "payload")
+        self.assertEqual(vba_form_control.position, (120, 240))
+        self.assertEqual(vba_form_control.font_name, "Tahoma")
+
+        self.assertEqual(len(project_root.strings), 1)
+
+    def testCollectWithTriage(self):
+        """Tests the Collect function with triage."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": 'Attribute VB_Name = "Module1"\r\n'},
+            forms={"UserForm1": [("TextBox1", "payload", "Tahoma")]},
+            strings=["Module1"],
+        )
+
+        collector_object = vba.VBACollector(triage=True)
+        collector_object.Collect(document_data, None)
+
+        self.assertTrue(collector_object.stream_found)
+        self.assertEqual(len(collector_object.project_roots), 1)
+
+        project_root = collector_object.project_roots[0]
+        self.assertEqual(project_root.version, 0)
+        self.assertEqual(project_root.modules, [])
+        self.assertEqual(len(project_root.strings), 0)
+        self.assertEqual(len(project_root.forms), 1)
+        self.assertEqual(project_root.forms[0].name, "UserForm1")
+        self.assertEqual(project_root.forms[0].number_of_controls, 1)
+        self.assertEqual(project_root.forms[0].controls, [])
+
+    def testCollectFromMemory(self):
+        """Tests the Collect function with in-memory data."""
+        document_data = self._CreateVBADocumentData(
+            modules={"Module1": 'Attribute VB_Name = "Module1"\r\n'}
+        )
+
+        for source in (
+            document_data,
+            memoryview(document_data),
+            io.BytesIO(document_data),
+        ):
+            collector_object = vba.VBACollector()
+            collector_object.Collect(source, None)
+
+            self.assertTrue(collector_object.stream_found)
+            project_root = collector_object.project_roots[0]
+            self.assertEqual(project_root.modules[0].name, "Module1")
+
+    def testCollectWithDecompressionPool(self):
+        """Tests the Collect function with a decompression pool."""
+        modules = {}
+        for module_index in range(4):
+            name = f"Module{module_index:d}"
+            modules[name] = f'Attribute VB_Name = "{name:s}"\r\n'
+
+        document_data = self._CreateVBADocumentData(modules=modules)
+
+        pool = decompression_pool.DecompressionPool(number_of_workers=2, threshold=1)
+        try:
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                path = os.path.join(temporary_directory, "document.doc")
+                with open(path, "wb") as file_object:
+                    file_object.write(document_data)
+
+                collector_object = vba.VBACollector(decompression_pool=pool)
+                collector_object.Collect(path, None)
+
+        finally:
+            pool.Close()
+
+        project_root = collector_object.project_roots[0]
+        self.assertEqual(
+            [vba_module.source_code for vba_module in project_root.modules],
+            list(modules.values()),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
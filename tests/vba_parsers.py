@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for the generated VBA structure parsers."""
+
+import os
+import unittest
+
+from dtfabric.runtime import data_maps as dtfabric_data_maps
+
+from olecfrc import errors
+from olecfrc import vba
+from olecfrc import vba_parsers
+
+from tests import test_lib
+
+from utils import generate_parsers
+
+
+class VBAParsersTest(test_lib.BaseTestCase):
+    """Tests for the generated VBA structure parsers."""
+
+    _DEFINITION_PATH = os.path.join(os.path.dirname(vba_parsers.__file__), "vba.yaml")
+
+    def _CompareWithDataTypeMap(self, name, byte_stream, byte_offset):
+        """Compares a generated parser with the corresponding data type map.
+
+        Args:
+          name (str): name of the data type.
+          byte_stream (bytes): byte stream.
+          byte_offset (int): offset of the structure in the byte stream.
+        """
+        vba_stream = vba.FStream(use_generated_parsers=False)
+        data_type_map = vba_stream._GetDataTypeMap(  # pylint: disable=protected-access
+            name
+        )
+        context = dtfabric_data_maps.DataTypeMapContext()
+        expected_values = data_type_map.MapByteStream(
+            byte_stream[byte_offset:], context=context
+        )
+
+        structure_values, structure_size = vba_parsers.STRUCTURE_PARSERS[name](
+            byte_stream, byte_offset
+        )
+        self.assertEqual(structure_size, context.byte_size)
+
+        for attribute_name in structure_values.__slots__:
+            self.assertEqual(
+                getattr(structure_values, attribute_name),
+                getattr(expected_values, attribute_name),
+            )
+
+    def testGeneratedModuleIsUpToDate(self):
+        """Tests that the generated module matches the definition file."""
+        generator = generate_parsers.ParserGenerator(self._DEFINITION_PATH)
+        module_source = generator.GenerateModule()
+
+        with open(vba_parsers.__file__, "r", encoding="utf-8") as file_object:
+            self.assertEqual(file_object.read(), module_source)
+
+    def testParsers(self):
+        """Tests the parsers against the dtFabric data type maps."""
+        # The form control header is followed by the site class information
+        # table header, the sites header, the site depths and types and the site.
+        stream_data = self._CreateFStreamData([("TextBox1", 23, 56)])
+        self._CompareWithDataTypeMap("control_header", stream_data, 0)
+        self._CompareWithDataTypeMap("class_table_header", stream_data, 16)
+        self._CompareWithDataTypeMap("f_stream_sites_header", stream_data, 18)
+        self._CompareWithDataTypeMap("f_stream_entry", stream_data, 30)
+
+        self._CompareWithDataTypeMap(
+            "std_font", b"\x01\x00\x00\x00\x90\x01\xa5\x00\x00\x00\x06Tahoma", 0
+        )
+        self._CompareWithDataTypeMap(
+            "guid_and_picture_header", bytes(16) + b"lt\x00\x00\x04\x00\x00\x00", 0
+        )
+        self._CompareWithDataTypeMap("site_class_info_header", b"\x00\x00\x10\x00", 0)
+
+        # The MorphData control is followed by the text properties.
+        stream_data = self._CreateOStreamData([("Caption", "Tahoma")])
+        self._CompareWithDataTypeMap("morph_data_control_header", stream_data, 0)
+        self._CompareWithDataTypeMap("control_header", stream_data, 32)
+
+        stream_data = self._CreateVBAProjectStreamData(["first", "second"])
+        self._CompareWithDataTypeMap("project_stream_header", stream_data, 0)
+        self._CompareWithDataTypeMap("project_stream_string", stream_data, 34)
+
+        self._CompareWithDataTypeMap(
+            "dir_stream_record_header", b"\x01\x00\x04\x00\x00\x00", 0
+        )
+
+    def testParsersWithTruncatedData(self):
+        """Tests the parsers with truncated data."""
+        stream_data = self._CreateFStreamData([("TextBox1", 23, 56)])
+        with self.assertRaises(errors.ParseError):
+            vba_parsers.ParseFStreamEntry(stream_data[:-4], 30)
+
+        with self.assertRaises(errors.ParseError):
+            vba_parsers.ParseStdFont(
+                b"\x01\x00\x00\x00\x90\x01\xa5\x00\x00\x00\x06Ta", 0
+            )
+
+        stream_data = self._CreateOStreamData([("Caption", "Tahoma")])
+        with self.assertRaises(errors.ParseError):
+            vba_parsers.ParseMorphDataControlHeader(stream_data[:8], 0)
+
+        stream_data = self._CreateVBAProjectStreamData(["first"])
+        with self.assertRaises(errors.ParseError):
+            vba_parsers.ParseProjectStreamString(stream_data[:40], 34)
+
+    def testReadWithoutGeneratedParsers(self):
+        """Tests reading streams with and without the generated parsers."""
+        stream_data = self._CreateFStreamData(
+            [("TextBox1", 23, 56), ("Frame1", 14, 0), ("Label1", 21, 48)]
+        )
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        f_stream = vba.FStream()
+        f_stream.Read(olecf_item)
+
+        expected_f_stream = vba.FStream(use_generated_parsers=False)
+        expected_f_stream.Read(olecf_item)
+
+        self.assertEqual(f_stream.entries, expected_f_stream.entries)
+
+        entries_data = [
+            self._CreateOStreamEntryData("Caption", "Tahoma"),
+            self._CreateOStreamEntryData("", "Arial", clsid_cache_index=21),
+        ]
+        entry_sizes = [len(entry_data) for entry_data in entries_data]
+        olecf_item = test_lib.TestOLECFItem(b"".join(entries_data))
+
+        o_stream = vba.OStream()
+        o_stream.Read(olecf_item, entry_sizes)
+
+        expected_o_stream = vba.OStream(use_generated_parsers=False)
+        expected_o_stream.Read(olecf_item, entry_sizes)
+
+        self.assertEqual(o_stream.entry_offsets, expected_o_stream.entry_offsets)
+        for entry_index, clsid_cache_index in enumerate([23, 21]):
+            self.assertEqual(
+                o_stream.GetEntryByIndex(entry_index, clsid_cache_index),
+                expected_o_stream.GetEntryByIndex(entry_index, clsid_cache_index),
+            )
+
+        stream_data = self._CreateVBAProjectStreamData(["first", "second"])
+        olecf_item = test_lib.TestOLECFItem(stream_data)
+
+        vba_project_stream = vba.VBAProjectStream()
+        vba_project_stream.Read(olecf_item)
+
+        expected_vba_project_stream = vba.VBAProjectStream(use_generated_parsers=False)
+        expected_vba_project_stream.Read(olecf_item)
+
+        self.assertEqual(
+            list(vba_project_stream.strings), list(expected_vba_project_stream.strings)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
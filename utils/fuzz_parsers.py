@@ -0,0 +1,816 @@
+#!/usr/bin/env python3
+"""Script to fuzz the stream parsers for algorithmic complexity."""
+
+import argparse
+import os
+import random
+import signal
+import struct
+import sys
+import time
+import tracemalloc
+
+# Change PYTHONPATH to include olecfrc.
+sys.path.insert(0, ".")
+
+# pylint: disable=wrong-import-position
+from olecfrc import compression
+from olecfrc import errors
+from olecfrc import hexdump
+from olecfrc import vba
+
+
+class FuzzFinding:
+    """Input of which the parsing exceeded its budget or failed unexpectedly.
+
+    Attributes:
+      budget (float): budget that was exceeded, in seconds or bytes, or None
+          if the parsing failed unexpectedly.
+      data (bytes): (minimized) input data.
+      kind (str): kind of finding, such as "time", "memory" or the name of
+          the unexpected exception.
+      target_name (str): name of the fuzz target.
+      value (float): measured time in seconds or peak memory in bytes, or None
+          if the parsing failed unexpectedly.
+    """
+
+    def __init__(self, target_name, kind, data, budget=None, value=None):
+        """Initializes a finding.
+
+        Args:
+          target_name (str): name of the fuzz target.
+          kind (str): kind of finding.
+          data (bytes): input data.
+          budget (Optional[float]): budget that was exceeded.
+          value (Optional[float]): measured time or peak memory.
+        """
+        super().__init__()
+        self.budget = budget
+        self.data = data
+        self.kind = kind
+        self.target_name = target_name
+        self.value = value
+
+
+class FuzzTarget:
+    """Stream parser that is fuzzed.
+
+    Attributes:
+      memory_factor (int): maximum number of bytes the parser is expected to
+          allocate per input byte.
+      name (str): name of the fuzz target, such as "f".
+    """
+
+    def __init__(self, name, create_seed, parse, memory_factor=64):
+        """Initializes a fuzz target.
+
+        Args:
+          name (str): name of the fuzz target.
+          create_seed (function): function that is called with a number of
+              entries and returns the seed data and the offsets and struct
+              formats of its size, count and other integer fields.
+          parse (function): function that parses input data.
+          memory_factor (Optional[int]): maximum number of bytes the parser is
+              expected to allocate per input byte.
+        """
+        super().__init__()
+        self._create_seed = create_seed
+        self._parse = parse
+        self.memory_factor = memory_factor
+        self.name = name
+
+    def CreateSeed(self, number_of_entries):
+        """Creates seed data.
+
+        Args:
+          number_of_entries (int): number of entries, strings or chunks.
+
+        Returns:
+          tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and
+              struct formats of its integer fields.
+        """
+        return self._create_seed(number_of_entries)
+
+    def Parse(self, data):
+        """Parses input data.
+
+        Args:
+          data (bytes): input data.
+
+        Raises:
+          ParseError: if the input data could not be parsed.
+        """
+        self._parse(data)
+
+
+def _CreateCompressedSeed(number_of_entries):
+    """Creates compressed container seed data.
+
+    Args:
+      number_of_entries (int): number of chunks.
+
+    Returns:
+      tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and struct
+          formats of its chunk headers.
+    """
+    random_generator = random.Random(number_of_entries)
+
+    lines = [
+        b'Attribute VB_Name = "Module1"\r\n',
+        b"Sub AutoOpen()\r\n",
+        b"    value = value & Chr(Asc(Mid(data, index, 1)) Xor 42)\r\n",
+        b"End Sub\r\n",
+    ]
+    source_code = bytearray()
+    while len(source_code) < 4096 * number_of_entries:
+        source_code.extend(random_generator.choice(lines))
+
+    data = compression.Compress(bytes(source_code[: 4096 * number_of_entries]))
+
+    field_offsets = []
+    data_offset = 1
+    while data_offset + 2 <= len(data):
+        field_offsets.append((data_offset, "<H"))
+        (chunk_header,) = struct.unpack_from("<H", data, data_offset)
+        data_offset += (chunk_header & 0x0FFF) + 3
+
+    return data, field_offsets
+
+
+def _CreateFStreamSeed(number_of_entries):
+    """Creates f stream seed data.
+
+    Args:
+      number_of_entries (int): number of entries.
+
+    Returns:
+      tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and struct
+          formats of its size, count and index fields.
+    """
+    data = bytearray(
+        struct.pack("<BBHIII", 0, 4, 12, 0x00000048, number_of_entries + 1, 0)
+    )
+    data.extend(struct.pack("<H", 0))
+
+    field_offsets = [(2, "<H"), (16, "<H"), (18, "<I"), (22, "<I")]
+    data.extend(struct.pack("<II", number_of_entries, 0))
+
+    sites_data_offset = len(data)
+    for _ in range(number_of_entries):
+        field_offsets.append((len(data) + 1, "<B"))
+        data.extend(b"\x00\x01")
+    padding_size = (4 - ((len(data) - sites_data_offset) % 4)) % 4
+    data.extend(bytes(padding_size))
+
+    for entry_index in range(number_of_entries):
+        encoded_name = f"TextBox{entry_index:d}".encode("cp1252")
+        padding_size = (4 - (len(encoded_name) % 4)) % 4
+        data_block = struct.pack(
+            "<IiIhH",
+            0x80000000 | len(encoded_name),
+            entry_index + 1,
+            32,
+            entry_index,
+            23,
+        )
+        extra_data_block = (
+            encoded_name + bytes(padding_size) + struct.pack("<ii", 120, 240)
+        )
+
+        field_offsets.extend(
+            [
+                (len(data) + 2, "<H"),
+                (len(data) + 4, "<I"),
+                (len(data) + 8, "<I"),
+                (len(data) + 16, "<I"),
+                (len(data) + 22, "<H"),
+            ]
+        )
+        data.extend(
+            struct.pack(
+                "<HHI", 0, 4 + len(data_block) + len(extra_data_block), 0x000001E5
+            )
+        )
+        data.extend(data_block)
+        data.extend(extra_data_block)
+
+    struct.pack_into("<I", data, 22, len(data) - sites_data_offset)
+
+    return bytes(data), field_offsets
+
+
+def _CreateOStreamSeed(number_of_entries):
+    """Creates o stream seed data.
+
+    Since the o stream entries are delimited by the f stream, the seed consists
+    of a single text box entry, of which the value grows with the number of
+    entries.
+
+    Args:
+      number_of_entries (int): number of strings in the value.
+
+    Returns:
+      tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and struct
+          formats of its size fields.
+    """
+    value = "".join(
+        f"value{entry_index:d}" for entry_index in range(number_of_entries)
+    ).encode("cp1252")
+    padding_size = (4 - (len(value) % 4)) % 4
+
+    # The MorphData control stores the size and value.
+    property_data = (
+        struct.pack("<III", 0x80000000 | len(value), 2400, 600)
+        + value
+        + bytes(padding_size)
+    )
+    data = bytearray(
+        struct.pack("<BBHQ", 0, 2, 8 + len(property_data), 0x0000000000400100)
+    )
+    data.extend(property_data)
+
+    field_offsets = [(2, "<H"), (12, "<I"), (len(data) + 2, "<H")]
+
+    # The text properties store the font name.
+    field_offsets.append((len(data) + 8, "<I"))
+    data.extend(struct.pack("<BBHII", 0, 2, 16, 0x00000001, 0x80000006))
+    data.extend(b"Tahoma\x00\x00")
+
+    return bytes(data), field_offsets
+
+
+def _CreateVBAProjectStreamSeed(number_of_entries):
+    """Creates _VBA_PROJECT stream seed data.
+
+    Args:
+      number_of_entries (int): number of strings.
+
+    Returns:
+      tuple[bytes, list[tuple[int, str]]]: seed data and the offsets and struct
+          formats of its count and size fields.
+    """
+    data = bytearray(
+        struct.pack("<IHHIIIIIHHH", 0, 0, 0, 0, 0, 0, 0, 0, 0, number_of_entries, 0)
+    )
+    field_offsets = [(30, "<H")]
+    for string_index in range(number_of_entries):
+        encoded_string = f"Identifier{string_index:d}".encode("utf-16-le")
+
+        field_offsets.append((len(data), "<H"))
+        data.extend(struct.pack("<H", len(encoded_string)))
+        data.extend(encoded_string)
+        data.extend(struct.pack("<III", 1, 2, 3))
+
+    return bytes(data), field_offsets
+
+
+def _ParseVBAProjectStream(data):
+    """Parses _VBA_PROJECT stream data, including decoding all its strings.
+
+    Args:
+      data (bytes): input data.
+
+    Raises:
+      ParseError: if the input data could not be parsed.
+    """
+    vba_project_stream = vba.VBAProjectStream()
+    vba_project_stream.ReadData(data)
+    for string_index in range(len(vba_project_stream.strings)):
+        vba_project_stream.strings.GetString(string_index)
+
+
+def _ParseFStream(data):
+    """Parses f stream data, including decoding the properties of its controls.
+
+    Args:
+      data (bytes): input data.
+
+    Raises:
+      ParseError: if the input data could not be parsed.
+    """
+    f_stream = vba.FStream()
+    f_stream.ReadData(data)
+    for f_stream_entry in f_stream.entries:
+        vba_form_control = vba.VBAFormControl(
+            f_stream_entry, f_stream_data=f_stream.stream_data
+        )
+        _ = vba_form_control.position
+
+
+def _ParseOStream(data):
+    """Parses o stream data, including decoding the properties of its text box.
+
+    Args:
+      data (bytes): input data.
+
+    Raises:
+      ParseError: if the input data could not be parsed.
+    """
+    o_stream = vba.OStream()
+    o_stream.ReadData(data, [len(data)])
+    o_stream.GetEntryByIndex(0, 23)
+
+
+FUZZ_TARGETS = {
+    # A compressed chunk of at least 19 bytes decompresses into at most 4096
+    # bytes, hence the larger memory factor.
+    "compressed": FuzzTarget(
+        "compressed", _CreateCompressedSeed, compression.Decompress, 1024
+    ),
+    "f": FuzzTarget("f", _CreateFStreamSeed, _ParseFStream),
+    "o": FuzzTarget("o", _CreateOStreamSeed, _ParseOStream),
+    "_VBA_PROJECT": FuzzTarget(
+        "_VBA_PROJECT", _CreateVBAProjectStreamSeed, _ParseVBAProjectStream
+    ),
+}
+
+
+# Errors of which the parsers document that they are raised on unsupported
+# input data, such as ValueError for empty input data.
+_EXPECTED_ERRORS = (errors.ParseError, ValueError)
+
+
+class _TimeoutError(Exception):
+    """Error that is raised when a parser call exceeds its hard time limit."""
+
+
+class ParserFuzzer:
+    """Fuzzes the stream parsers with mutations of synthetic streams.
+
+    Size, count and index fields, terminators and the length of the input are
+    mutated, after which every parser call is checked against a time and
+    memory budget that scales linearly with the size of the input. Inputs that
+    exceed a budget, which indicates a superlinear cost, or raise an error other
+    than the expected errors are minimized before they are reported.
+    """
+
+    # Boundary values of the integer fields.
+    _BOUNDARY_VALUES = (0, 1, 2, 3, 4, 0x7F, 0x80, 0xFF, 0x7FFF, 0x8000, 0xFFFF)
+
+    # Boundary values of the 32-bit integer fields.
+    _BOUNDARY_VALUES_32BIT = (0x7FFFFFFF, 0x80000000, 0xFFFFFFFF)
+
+    # Minimum size of the inputs the per-byte time budget applies to, such
+    # that the fixed cost of a call does not dominate the budget.
+    _MINIMUM_BUDGET_SIZE = 256
+
+    # Number of repeated measurements of which the fastest is used, to reduce
+    # the effect of scheduling noise.
+    _NUMBER_OF_MEASUREMENTS = 3
+
+    def __init__(
+        self,
+        maximum_input_size=65536,
+        maximum_number_of_minimization_steps=2000,
+        memory_budget=True,
+        random_seed=0,
+        time_factor=20.0,
+    ):
+        """Initializes a parser fuzzer.
+
+        Args:
+          maximum_input_size (Optional[int]): maximum size of a mutated input.
+          maximum_number_of_minimization_steps (Optional[int]): maximum number of
+              inputs tried when minimizing a finding.
+          memory_budget (Optional[bool]): True if the peak memory of parser calls
+              should be checked, which requires an additional traced call.
+          random_seed (Optional[int]): seed of the random number generator, such
+              that a fuzzing run can be repeated.
+          time_factor (Optional[float]): factor by which the time of a call may
+              exceed the calibrated time of a valid input of the same size.
+        """
+        super().__init__()
+        self._maximum_input_size = maximum_input_size
+        self._maximum_number_of_minimization_steps = (
+            maximum_number_of_minimization_steps
+        )
+        self._memory_budget = memory_budget
+        self._random = random.Random(random_seed)
+        self._time_budgets = {}
+        self._time_factor = time_factor
+
+    def _Calibrate(self, fuzz_target):
+        """Calibrates the time budget of a fuzz target on valid seeds.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+
+        Returns:
+          tuple[float, float]: fixed time in seconds and time in seconds per
+              byte of a call.
+        """
+        small_data, _ = fuzz_target.CreateSeed(1)
+        large_data, _ = fuzz_target.CreateSeed(64)
+
+        small_time = self._MeasureTime(fuzz_target, small_data, None)
+        large_time = self._MeasureTime(fuzz_target, large_data, None)
+
+        time_per_byte = max(large_time - small_time, 0.0) / (
+            len(large_data) - len(small_data)
+        )
+        time_per_byte = max(time_per_byte, large_time / len(large_data))
+
+        return small_time, time_per_byte
+
+    def _GetTimeBudget(self, fuzz_target, data_size):
+        """Retrieves the time budget of a call.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          data_size (int): size of the input data.
+
+        Returns:
+          float: time budget in seconds.
+        """
+        time_budget = self._time_budgets.get(fuzz_target.name, None)
+        if not time_budget:
+            time_budget = self._Calibrate(fuzz_target)
+            self._time_budgets[fuzz_target.name] = time_budget
+
+        fixed_time, time_per_byte = time_budget
+        data_size = max(data_size, self._MINIMUM_BUDGET_SIZE)
+        return self._time_factor * (fixed_time + time_per_byte * data_size)
+
+    def _MeasurePeakMemory(self, fuzz_target, data):
+        """Measures the peak memory of a call.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          data (bytes): input data.
+
+        Returns:
+          int: peak number of bytes allocated by the call.
+        """
+        tracemalloc.start()
+        try:
+            fuzz_target.Parse(data)
+        except _EXPECTED_ERRORS:
+            pass
+        finally:
+            _, peak_size = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        return peak_size
+
+    def _MeasureTime(self, fuzz_target, data, time_limit):
+        """Measures the time of a call.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          data (bytes): input data.
+          time_limit (float): hard time limit of the call in seconds, which is
+              only enforced on platforms that support interval timers, or None
+              if not limited.
+
+        Returns:
+          float: fastest time of the repeated calls in seconds.
+
+        Raises:
+          _TimeoutError: if a call exceeded the hard time limit.
+        """
+
+        def _RaiseTimeoutError(unused_signal_number, unused_frame):
+            raise _TimeoutError()
+
+        use_timer = time_limit is not None and hasattr(signal, "setitimer")
+        if use_timer:
+            signal_handler = signal.signal(signal.SIGALRM, _RaiseTimeoutError)
+
+        try:
+            elapsed_times = []
+            for _ in range(self._NUMBER_OF_MEASUREMENTS):
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, max(time_limit, 0.001))
+
+                start_time = time.perf_counter()
+                try:
+                    fuzz_target.Parse(data)
+                except _EXPECTED_ERRORS:
+                    pass
+                finally:
+                    if use_timer:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+
+                elapsed_times.append(time.perf_counter() - start_time)
+
+        finally:
+            if use_timer:
+                signal.signal(signal.SIGALRM, signal_handler)
+
+        return min(elapsed_times)
+
+    def _Mutate(self, data, field_offsets):
+        """Mutates input data.
+
+        Args:
+          data (bytes): input data.
+          field_offsets (list[tuple[int, str]]): offsets and struct formats of
+              the integer fields of the input data.
+
+        Returns:
+          bytes: mutated input data.
+        """
+        data = bytearray(data)
+
+        for _ in range(self._random.randint(1, 3)):
+            mutation = self._random.choice(
+                ["field", "integer", "terminator", "truncate", "repeat"]
+            )
+            if mutation == "field" and field_offsets:
+                field_offset, field_format = self._random.choice(field_offsets)
+                self._MutateInteger(data, field_offset, field_format)
+
+            elif mutation == "integer" and len(data) >= 4:
+                field_format = self._random.choice(["<H", "<I"])
+                field_offset = self._random.randrange(0, len(data) - 3) & ~1
+                self._MutateInteger(data, field_offset, field_format)
+
+            elif mutation == "terminator":
+                terminator_offsets = [
+                    data_offset
+                    for data_offset, byte_value in enumerate(data)
+                    if not byte_value
+                ]
+                if terminator_offsets:
+                    data_offset = self._random.choice(terminator_offsets)
+                    if self._random.random() < 0.5:
+                        data[data_offset] = 0x41
+                    else:
+                        del data[data_offset]
+
+            elif mutation == "truncate" and data:
+                del data[self._random.randrange(0, len(data)) :]
+
+            elif mutation == "repeat" and data:
+                range_offset = self._random.randrange(0, len(data))
+                range_end = self._random.randint(range_offset + 1, len(data))
+                number_of_repeats = self._random.randint(2, 64)
+                data[range_offset:range_end] = (
+                    data[range_offset:range_end] * number_of_repeats
+                )
+
+        return bytes(data[: self._maximum_input_size])
+
+    def _MutateInteger(self, data, field_offset, field_format):
+        """Mutates an integer field.
+
+        Args:
+          data (bytearray): input data.
+          field_offset (int): offset of the field.
+          field_format (str): struct format of the field.
+        """
+        field_size = struct.calcsize(field_format)
+        if field_offset + field_size > len(data):
+            return
+
+        (value,) = struct.unpack_from(field_format, data, field_offset)
+
+        boundary_values = list(self._BOUNDARY_VALUES)
+        if field_size == 4:
+            boundary_values.extend(self._BOUNDARY_VALUES_32BIT)
+        boundary_values.extend([len(data), value - 1, value + 1, value * 2])
+
+        maximum_value = (1 << (8 * field_size)) - 1
+        value = self._random.choice(boundary_values) & maximum_value
+        struct.pack_into(field_format, data, field_offset, value)
+
+    def CheckInput(self, fuzz_target, data):
+        """Checks an input against the budgets of a fuzz target.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          data (bytes): input data.
+
+        Returns:
+          FuzzFinding: finding or None if the input is within the budgets.
+        """
+        time_budget = self._GetTimeBudget(fuzz_target, len(data))
+        try:
+            elapsed_time = self._MeasureTime(fuzz_target, data, 10.0 * time_budget)
+        except _TimeoutError:
+            return FuzzFinding(
+                fuzz_target.name, "time", data, budget=time_budget, value=None
+            )
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            return FuzzFinding(fuzz_target.name, type(exception).__name__, data)
+
+        if elapsed_time > time_budget:
+            return FuzzFinding(
+                fuzz_target.name, "time", data, budget=time_budget, value=elapsed_time
+            )
+
+        if self._memory_budget:
+            memory_budget = fuzz_target.memory_factor * max(
+                len(data), self._MINIMUM_BUDGET_SIZE
+            )
+            peak_size = self._MeasurePeakMemory(fuzz_target, data)
+            if peak_size > memory_budget:
+                return FuzzFinding(
+                    fuzz_target.name,
+                    "memory",
+                    data,
+                    budget=memory_budget,
+                    value=peak_size,
+                )
+
+        return None
+
+    def Fuzz(self, fuzz_target, number_of_iterations):
+        """Fuzzes a target.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          number_of_iterations (int): number of mutated inputs to check.
+
+        Returns:
+          list[FuzzFinding]: minimized findings, at most one per kind.
+        """
+        seeds = [
+            fuzz_target.CreateSeed(number_of_entries)
+            for number_of_entries in (1, 4, 16)
+        ]
+
+        findings = {}
+        for _ in range(number_of_iterations):
+            seed_data, field_offsets = self._random.choice(seeds)
+            data = self._Mutate(seed_data, field_offsets)
+
+            finding = self.CheckInput(fuzz_target, data)
+            if finding and finding.kind not in findings:
+                findings[finding.kind] = self.Minimize(fuzz_target, finding)
+
+        return list(findings.values())
+
+    def Minimize(self, fuzz_target, finding):
+        """Minimizes the input of a finding.
+
+        Ranges of bytes are removed from the input for as long as the smaller
+        input still results in a finding of the same kind, starting with large
+        ranges.
+
+        Args:
+          fuzz_target (FuzzTarget): fuzz target.
+          finding (FuzzFinding): finding.
+
+        Returns:
+          FuzzFinding: finding with the minimized input.
+        """
+        number_of_steps = 0
+        range_size = len(finding.data) // 2
+        while range_size >= 1:
+            range_offset = 0
+            while range_offset < len(finding.data):
+                if number_of_steps >= self._maximum_number_of_minimization_steps:
+                    return finding
+
+                number_of_steps += 1
+
+                data = (
+                    finding.data[:range_offset]
+                    + finding.data[range_offset + range_size :]
+                )
+                smaller_finding = self.CheckInput(fuzz_target, data)
+                if smaller_finding and smaller_finding.kind == finding.kind:
+                    finding = smaller_finding
+                else:
+                    range_offset += range_size
+
+            range_size //= 2
+
+        return finding
+
+
+def Main():
+    """Entry point of the fuzzer.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Fuzzes the stream parsers and reports inputs of which the parsing "
+            "time or memory grows superlinearly with their size."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-i",
+        "--iterations",
+        dest="number_of_iterations",
+        type=int,
+        default=1000,
+        help="number of mutated inputs to check per target.",
+    )
+
+    argument_parser.add_argument(
+        "--no-memory-budget",
+        dest="memory_budget",
+        action="store_false",
+        default=True,
+        help="do not check the peak memory of parser calls, which is faster.",
+    )
+
+    argument_parser.add_argument(
+        "-o",
+        "--output",
+        dest="output_directory",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the directory to write the minimized reproducers to.",
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--seed",
+        dest="random_seed",
+        type=int,
+        default=0,
+        help="seed of the random number generator.",
+    )
+
+    argument_parser.add_argument(
+        "--size",
+        dest="maximum_input_size",
+        type=int,
+        default=65536,
+        help="maximum size of a mutated input.",
+    )
+
+    argument_parser.add_argument(
+        "-t",
+        "--time_factor",
+        dest="time_factor",
+        type=float,
+        default=20.0,
+        help=(
+            "factor by which the time of a call may exceed the calibrated time "
+            "of a valid input of the same size."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "targets",
+        nargs="*",
+        action="store",
+        metavar="TARGET",
+        default=None,
+        help=(
+            f"names of the parsers to fuzz, where all are fuzzed if none are "
+            f"specified: {', '.join(sorted(FUZZ_TARGETS.keys())):s}."
+        ),
+    )
+
+    options = argument_parser.parse_args()
+
+    target_names = options.targets or sorted(FUZZ_TARGETS.keys())
+    for target_name in target_names:
+        if target_name not in FUZZ_TARGETS:
+            print(f"Unsupported target: {target_name:s}")
+            print("")
+            return 1
+
+    fuzzer = ParserFuzzer(
+        maximum_input_size=options.maximum_input_size,
+        memory_budget=options.memory_budget,
+        random_seed=options.random_seed,
+        time_factor=options.time_factor,
+    )
+
+    if options.output_directory:
+        os.makedirs(options.output_directory, exist_ok=True)
+
+    number_of_findings = 0
+    for target_name in target_names:
+        findings = fuzzer.Fuzz(FUZZ_TARGETS[target_name], options.number_of_iterations)
+        print(f"{target_name:s}\t: {len(findings):d} findings")
+
+        for finding_index, finding in enumerate(findings):
+            description = f"{finding.kind:s}, {len(finding.data):d} bytes"
+            if finding.kind == "time":
+                value = "timeout" if finding.value is None else f"{finding.value:.6f}s"
+                description = f"{description:s}, {value:s} of {finding.budget:.6f}s"
+            elif finding.kind == "memory":
+                description = (
+                    f"{description:s}, {finding.value:d} of {finding.budget:d} bytes"
+                )
+            print(f"\t{description:s}")
+
+            if options.output_directory:
+                path = os.path.join(
+                    options.output_directory,
+                    f"{target_name:s}-{finding.kind:s}-{finding_index:d}.bin",
+                )
+                with open(path, "wb") as file_object:
+                    file_object.write(finding.data)
+                print(f"\treproducer: {path:s}")
+            else:
+                print(hexdump.Hexdump(finding.data))
+
+        number_of_findings += len(findings)
+
+    return 1 if number_of_findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""Script to generate Python structure parsers from a dtFabric definition file."""
+
+import argparse
+import difflib
+import hashlib
+import io
+import os
+import re
+import sys
+
+from dtfabric import data_types as dtfabric_data_types
+from dtfabric import reader as dtfabric_reader
+from dtfabric import registry as dtfabric_registry
+
+
+class ParserGenerator:
+    """Generates Python structure parsers from a dtFabric definition file.
+
+    The generated parsers map structures with struct.unpack_from at fixed
+    offsets and inline the handling of terminated strings and members of which
+    the size depends on preceding members, instead of interpreting the dtFabric
+    definitions at run-time.
+    """
+
+    _BYTE_ORDERS = {"big-endian": ">", "little-endian": "<"}
+
+    # Maximum line length of the generated code, which matches that of black.
+    _MAXIMUM_LINE_LENGTH = 88
+
+    _INTEGER_FORMATS = {
+        (1, "signed"): "b",
+        (1, "unsigned"): "B",
+        (2, "signed"): "h",
+        (2, "unsigned"): "H",
+        (4, "signed"): "i",
+        (4, "unsigned"): "I",
+        (8, "signed"): "q",
+        (8, "unsigned"): "Q",
+    }
+
+    def __init__(self, definition_path):
+        """Initializes a parser generator.
+
+        Args:
+          definition_path (str): path of the dtFabric definition file.
+        """
+        super().__init__()
+        self._definition_path = definition_path
+
+    def _GetCamelCaseName(self, name):
+        """Retrieves the camel case name of a data type.
+
+        Args:
+          name (str): name of the data type, such as "f_stream_entry".
+
+        Returns:
+          str: camel case name, such as "FStreamEntry".
+        """
+        return "".join(name_part.capitalize() for name_part in name.split("_"))
+
+    def _GetMemberSegments(self, structure_definition):
+        """Retrieves the segments of the members of a structure.
+
+        Consecutive fixed-size members are combined into a single segment that is
+        mapped with one struct format.
+
+        Args:
+          structure_definition (dtfabric.StructureDefinition): structure
+              definition.
+
+        Returns:
+          list[tuple[str, object]]: segments, where a segment is either
+              ("fixed", list[tuple[str, str]]) with the member names and struct
+              format characters or ("variable", member definition).
+
+        Raises:
+          RuntimeError: if a member is not supported.
+        """
+        segments = []
+        fixed_members = []
+        for member_definition in structure_definition.members:
+            member_format = self._GetStructFormat(member_definition)
+            if member_format:
+                fixed_members.append((member_definition.name, member_format))
+                continue
+
+            if fixed_members:
+                segments.append(("fixed", fixed_members))
+                fixed_members = []
+
+            segments.append(("variable", member_definition))
+
+        if fixed_members:
+            segments.append(("fixed", fixed_members))
+
+        return segments
+
+    def _GetStructFormat(self, member_definition):
+        """Retrieves the struct format character(s) of a fixed-size member.
+
+        Args:
+          member_definition (dtfabric.DataTypeDefinition): member definition.
+
+        Returns:
+          str: struct format of the member or None if the member is not of
+              a fixed size.
+
+        Raises:
+          RuntimeError: if a member is not supported.
+        """
+        data_type_definition = getattr(
+            member_definition, "member_data_type_definition", None
+        )
+        if data_type_definition is None:
+            data_type_definition = member_definition
+
+        if isinstance(data_type_definition, dtfabric_data_types.IntegerDefinition):
+            lookup_key = (data_type_definition.size, data_type_definition.format)
+            integer_format = self._INTEGER_FORMATS.get(lookup_key, None)
+            if not integer_format:
+                raise RuntimeError(
+                    f"Unsupported integer member: {member_definition.name:s}"
+                )
+            return integer_format
+
+        if isinstance(data_type_definition, dtfabric_data_types.StreamDefinition):
+            if data_type_definition.elements_data_size is not None:
+                return f"{data_type_definition.elements_data_size:d}s"
+            return None
+
+        if isinstance(data_type_definition, dtfabric_data_types.StringDefinition):
+            return None
+
+        raise RuntimeError(f"Unsupported member: {member_definition.name:s}")
+
+    def _GenerateFixedSegment(self, structure_name, segment_index, members):
+        """Generates the code of a fixed-size segment.
+
+        Args:
+          structure_name (str): name of the structure.
+          segment_index (int): index of the segment.
+          members (list[tuple[str, str]]): member names and struct formats.
+
+        Returns:
+          list[str]: lines of code.
+        """
+        struct_name = self._GetStructName(structure_name, segment_index)
+
+        lines = []
+        if len(members) == 1:
+            line = (
+                f"        (structure_values.{members[0][0]:s},) = "
+                f"{struct_name:s}.unpack_from("
+            )
+            if len(line) <= self._MAXIMUM_LINE_LENGTH:
+                lines.extend(
+                    [line, "            byte_stream, data_offset", "        )"]
+                )
+            else:
+                lines.extend(
+                    [
+                        f"        (structure_values.{members[0][0]:s},) = (",
+                        (
+                            f"            {struct_name:s}.unpack_from("
+                            f"byte_stream, data_offset)"
+                        ),
+                        "        )",
+                    ]
+                )
+        else:
+            lines.append("        (")
+            for member_name, _ in members:
+                lines.append(f"            structure_values.{member_name:s},")
+            lines.append(
+                f"        ) = {struct_name:s}.unpack_from(byte_stream, data_offset)"
+            )
+
+        lines.append(f"        data_offset += {struct_name:s}.size")
+        return lines
+
+    def _GenerateVariableSegment(self, structure_name, member_definition):
+        """Generates the code of a variable-size member.
+
+        Args:
+          structure_name (str): name of the structure.
+          member_definition (dtfabric.DataTypeDefinition): member definition.
+
+        Returns:
+          list[str]: lines of code.
+
+        Raises:
+          RuntimeError: if the member is not supported.
+        """
+        member_name = member_definition.name
+        data_type_definition = getattr(
+            member_definition, "member_data_type_definition", None
+        )
+        if data_type_definition is None:
+            data_type_definition = member_definition
+
+        if isinstance(data_type_definition, dtfabric_data_types.StringDefinition):
+            element_data_type_definition = (
+                data_type_definition.element_data_type_definition
+            )
+            terminator = data_type_definition.elements_terminator
+            if (
+                not terminator
+                or element_data_type_definition.GetByteSize() != 1
+                or len(terminator) != 1
+            ):
+                raise RuntimeError(f"Unsupported string member: {member_name:s}")
+
+            terminator = "".join(f"\\x{byte_value:02x}" for byte_value in terminator)
+            decode_line = (
+                f"        structure_values.{member_name:s} = "
+                f'byte_stream[data_offset:end_offset].decode("'
+                f'{data_type_definition.encoding:s}")'
+            )
+            if len(decode_line) <= self._MAXIMUM_LINE_LENGTH:
+                decode_lines = [decode_line]
+            else:
+                decode_lines = [
+                    (
+                        f"        structure_values.{member_name:s} = "
+                        f"byte_stream[data_offset:end_offset].decode("
+                    ),
+                    f'            "{data_type_definition.encoding:s}"',
+                    "        )",
+                ]
+
+            return [
+                (
+                    f'        end_offset = byte_stream.find(b"{terminator:s}", '
+                    f"data_offset)"
+                ),
+                "        if end_offset == -1:",
+                "            raise errors.ParseError(",
+                (
+                    f'                f"Unterminated {structure_name:s}.'
+                    f'{member_name:s} at offset: {{data_offset:d}}"'
+                ),
+                "            )",
+                *decode_lines,
+                "        data_offset = end_offset + 1",
+            ]
+
+        expression = data_type_definition.elements_data_size_expression
+        if not expression:
+            raise RuntimeError(f"Unsupported stream member: {member_name:s}")
+
+        expression = re.sub(rf"\b{structure_name:s}\.", "structure_values.", expression)
+        return [
+            f"        data_size = {expression:s}",
+            "        if data_size < 0 or data_offset + data_size > len(byte_stream):",
+            "            raise errors.ParseError(",
+            (
+                f'                f"Invalid {structure_name:s}.{member_name:s} size: '
+                f'{{data_size:d}} at offset: "'
+            ),
+            '                f"{data_offset:d}"',
+            "            )",
+            (
+                f"        structure_values.{member_name:s} = "
+                f"byte_stream[data_offset : data_offset + data_size]"
+            ),
+            "        data_offset += data_size",
+        ]
+
+    def _GetStructName(self, structure_name, segment_index):
+        """Retrieves the name of the struct of a fixed-size segment.
+
+        Args:
+          structure_name (str): name of the structure.
+          segment_index (int): index of the segment.
+
+        Returns:
+          str: name of the struct.
+        """
+        return f"_{structure_name.upper():s}_STRUCT{segment_index:d}"
+
+    def _ReadStructureDefinitions(self):
+        """Reads the structure definitions from the definition file.
+
+        Returns:
+          list[dtfabric.StructureDefinition]: structure definitions in order of
+              the definition file.
+        """
+        with open(self._definition_path, "rb") as file_object:
+            definition = file_object.read()
+
+        definitions_registry = dtfabric_registry.DataTypeDefinitionsRegistry()
+        definitions_reader = dtfabric_reader.YAMLDataTypeDefinitionsFileReader()
+        definitions_reader.ReadFileObject(definitions_registry, io.BytesIO(definition))
+
+        return [
+            data_type_definition
+            for data_type_definition in definitions_registry.GetDefinitions()
+            if isinstance(data_type_definition, dtfabric_data_types.StructureDefinition)
+        ]
+
+    def GenerateModule(self):
+        """Generates the Python module with the structure parsers.
+
+        Returns:
+          str: source code of the module.
+
+        Raises:
+          RuntimeError: if a structure is not supported.
+        """
+        definition_filename = os.path.basename(self._definition_path)
+
+        with open(self._definition_path, "rb") as file_object:
+            definition_digest = hashlib.sha256(file_object.read()).hexdigest()
+
+        lines = [
+            (
+                f'"""Structure parsers generated from {definition_filename:s}, '
+                f'do not edit."""'
+            ),
+            "",
+            "# This file is generated by utils/generate_parsers.py, regenerate it",
+            "# when the definition file changes.",
+            "",
+            "# pylint: disable=attribute-defined-outside-init",
+            "",
+            "import struct",
+            "",
+            "from olecfrc import errors",
+            "",
+            "# SHA-256 digest of the definition file the parsers are generated from.",
+            f'DEFINITION_DIGEST = "{definition_digest:s}"',
+            "",
+        ]
+
+        structure_definitions = self._ReadStructureDefinitions()
+
+        struct_lines = []
+        for structure_definition in structure_definitions:
+            structure_name = structure_definition.name
+            byte_order = self._BYTE_ORDERS.get(structure_definition.byte_order, "=")
+
+            segments = self._GetMemberSegments(structure_definition)
+            for segment_index, (segment_type, segment) in enumerate(segments):
+                if segment_type == "fixed":
+                    struct_format = "".join(
+                        member_format for _, member_format in segment
+                    )
+                    struct_name = self._GetStructName(structure_name, segment_index)
+                    struct_lines.append(
+                        f'{struct_name:s} = struct.Struct("{byte_order:s}'
+                        f'{struct_format:s}")'
+                    )
+
+        lines.extend(struct_lines)
+
+        for structure_definition in structure_definitions:
+            lines.extend(["", ""])
+            lines.extend(self._GenerateStructure(structure_definition))
+
+        lines.extend(["", "", "STRUCTURE_PARSERS = {"])
+        for structure_definition in structure_definitions:
+            function_name = self._GetCamelCaseName(structure_definition.name)
+            lines.append(
+                f'    "{structure_definition.name:s}": Parse{function_name:s},'
+            )
+        lines.extend(["}", ""])
+
+        return "\n".join(lines)
+
+    def _GenerateStructure(self, structure_definition):
+        """Generates the code of a structure.
+
+        Args:
+          structure_definition (dtfabric.StructureDefinition): structure
+              definition.
+
+        Returns:
+          list[str]: lines of code.
+
+        Raises:
+          RuntimeError: if the structure is not supported.
+        """
+        structure_name = structure_definition.name
+        camel_case_name = self._GetCamelCaseName(structure_name)
+        class_name = f"{camel_case_name:s}Structure"
+
+        lines = [
+            f"class {class_name:s}:",
+            f'    """{structure_name:s} structure values."""',
+            "",
+        ]
+        # A single element tuple is formatted on one line, like black does.
+        if len(structure_definition.members) == 1:
+            lines.append(
+                f'    __slots__ = ("{structure_definition.members[0].name:s}",)'
+            )
+        else:
+            lines.append("    __slots__ = (")
+            for member_definition in structure_definition.members:
+                lines.append(f'        "{member_definition.name:s}",')
+            lines.append("    )")
+        lines.extend(
+            [
+                "",
+                "",
+                f"def Parse{camel_case_name:s}(byte_stream, byte_offset=0):",
+                f'    """Parses a {structure_name:s} structure.',
+                "",
+                "    Args:",
+                "      byte_stream (bytes): byte stream.",
+                (
+                    "      byte_offset (Optional[int]): offset of the structure "
+                    "in the byte stream."
+                ),
+                "",
+                "    Returns:",
+                f"      tuple[{class_name:s}, int]: structure values and size",
+                "          of the structure.",
+                "",
+                "    Raises:",
+                "      ParseError: if the structure cannot be parsed.",
+                '    """',
+                f"    structure_values = {class_name:s}()",
+                "    data_offset = byte_offset",
+                "    try:",
+            ]
+        )
+
+        segments = self._GetMemberSegments(structure_definition)
+        for segment_index, (segment_type, segment) in enumerate(segments):
+            if segment_index:
+                lines.append("")
+
+            if segment_type == "fixed":
+                lines.extend(
+                    self._GenerateFixedSegment(structure_name, segment_index, segment)
+                )
+            else:
+                lines.extend(self._GenerateVariableSegment(structure_name, segment))
+
+        lines.extend(
+            [
+                "",
+                "    except (UnicodeDecodeError, struct.error) as exception:",
+                "        raise errors.ParseError(",
+                f'            "Unable to parse {structure_name:s} at offset: "',
+                '            f"{byte_offset:d} with error: {exception!s}"',
+                "        )",
+                "",
+                "    return structure_values, data_offset - byte_offset",
+            ]
+        )
+        return lines
+
+
+def Main():
+    """Entry point of the script to generate structure parsers.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Generates Python structure parsers from a dtFabric definition."
+    )
+
+    argument_parser.add_argument(
+        "--check",
+        dest="check",
+        action="store_true",
+        default=False,
+        help=("check that the generated module is up to date instead of writing it."),
+    )
+
+    argument_parser.add_argument(
+        "definition_path",
+        nargs="?",
+        action="store",
+        metavar="PATH",
+        default=os.path.join("olecfrc", "vba.yaml"),
+        help="path of the dtFabric definition file.",
+    )
+
+    argument_parser.add_argument(
+        "module_path",
+        nargs="?",
+        action="store",
+        metavar="PATH",
+        default=os.path.join("olecfrc", "vba_parsers.py"),
+        help="path of the generated Python module.",
+    )
+
+    options = argument_parser.parse_args()
+
+    generator = ParserGenerator(options.definition_path)
+    module_source = generator.GenerateModule()
+
+    if options.check:
+        with open(options.module_path, "r", encoding="utf-8") as file_object:
+            current_module_source = file_object.read()
+
+        if current_module_source != module_source:
+            sys.stdout.writelines(
+                difflib.unified_diff(
+                    current_module_source.splitlines(keepends=True),
+                    module_source.splitlines(keepends=True),
+                    fromfile=options.module_path,
+                    tofile="generated",
+                )
+            )
+            return 1
+
+        return 0
+
+    with open(options.module_path, "w", encoding="utf-8") as file_object:
+        file_object.write(module_source)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())